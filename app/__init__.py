@@ -37,8 +37,10 @@ def create_app(config_name='development'):
     from app.utils.logger import setup_logging
     setup_logging(app, log_dir=config.LOG_DIR, log_level=config.LOG_LEVEL)
     
-    # 확장 초기화
+    # 확장 초기화 (파일 SQLite는 WAL/busy_timeout 등 성능 설정 후 엔진 생성)
     from app.extensions import db
+    from app.utils.sqlite_tuning import init_sqlite_tuning
+    init_sqlite_tuning(app)
     db.init_app(app)
     
     # Blueprint 등록
@@ -48,6 +50,7 @@ def create_app(config_name='development'):
     from app.routes.news import news_bp
     from app.routes.settings import settings_bp
     from app.routes.admin import admin_bp
+    from app.routes.metrics import metrics_bp
     
     app.register_blueprint(auth_bp)
     app.register_blueprint(main_bp)
@@ -55,6 +58,11 @@ def create_app(config_name='development'):
     app.register_blueprint(news_bp)
     app.register_blueprint(settings_bp)
     app.register_blueprint(admin_bp)
+    app.register_blueprint(metrics_bp)
+    
+    # 요청 지연 시간 추적 (엔드포인트별 히스토그램, DB/ES 호출 집계, Server-Timing)
+    from app.utils.request_tracing import init_request_tracing
+    init_request_tracing(app)
     
     # 보안 헤더 추가
     @app.after_request
@@ -101,22 +109,29 @@ def create_app(config_name='development'):
     with app.app_context():
         # 테이블 생성
         db.create_all()
+        
+        # 기존 DB에 새로 선언된 컬럼/인덱스 추가
+        from app.utils.db_migrations import ensure_columns, ensure_indexes
+        ensure_columns(db.engine)
+        ensure_indexes(db.engine)
+        
+        # 종목 자동완성 인덱스 (stock_master 메모리 적재)
+        from app.services.stock_search import init_stock_search
+        init_stock_search(app)
     
-    # 스케줄러 초기화 (Gunicorn preload 또는 단일 프로세스에서만)
-    # 환경변수로 스케줄러 활성화 여부 결정
+    # 스케줄러 초기화
+    # - 운영: 별도 워커 프로세스(python -m app.worker)에서 실행하고 웹은 ENABLE_SCHEDULER=false
+    # - 여러 프로세스에서 켜져도 DB 리더 리스(scheduler_locks)를 가진 1개만 작업 실행
+    from app.services.scheduler import SchedulerService
     if os.environ.get('ENABLE_SCHEDULER', 'true').lower() == 'true':
-        # Gunicorn 워커가 아닌 경우에만 스케줄러 시작
-        # (Gunicorn은 --preload 옵션과 함께 사용하거나 별도 프로세스로 실행)
-        is_gunicorn = 'gunicorn' in os.environ.get('SERVER_SOFTWARE', '')
-        is_main_process = os.environ.get('SCHEDULER_MAIN', 'false').lower() == 'true'
-        
-        if not is_gunicorn or is_main_process:
-            try:
-                from app.services.scheduler import SchedulerService
-                scheduler_service = SchedulerService()
-                scheduler_service.init_app(app)
-                app.logger.info("✓ Scheduler initialized successfully")
-            except Exception as e:
-                app.logger.warning(f"Scheduler initialization skipped: {e}")
+        try:
+            scheduler_service = SchedulerService()
+            scheduler_service.init_app(app)
+            app.logger.info("✓ Scheduler initialized successfully")
+        except Exception as e:
+            app.logger.warning(f"Scheduler initialization skipped: {e}")
+    else:
+        # 관리자 수동 크롤링/메일 발송은 웹 프로세스에서도 가능하도록 앱만 연결
+        SchedulerService().bind_app(app)
     
     return app
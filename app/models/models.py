@@ -54,6 +54,10 @@ class User(db.Model):
 class UserSetting(db.Model):
     """사용자 설정 테이블 (SRS 7.1.2)"""
     __tablename__ = 'user_settings'
+    __table_args__ = (
+        # 메일 발송 대상 조회 (is_notification_enabled + notification_time)
+        db.Index('ix_user_settings_notification', 'is_notification_enabled', 'notification_time'),
+    )
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, unique=True)
@@ -116,6 +120,7 @@ class UserStock(db.Model):
     __tablename__ = 'user_stocks'
     __table_args__ = (
         db.UniqueConstraint('user_id', 'ticker_symbol', name='unique_user_stock'),
+        db.Index('ix_user_stocks_user_created_at', 'user_id', 'created_at'),  # 종목 관리 목록 (최신순)
     )
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
@@ -144,6 +149,10 @@ class UserStock(db.Model):
 class EmailLog(db.Model):
     """이메일 발송 로그 테이블 (SRS 7.1.5)"""
     __tablename__ = 'email_logs'
+    __table_args__ = (
+        db.Index('ix_email_logs_sent_at', 'sent_at'),  # 최근 발송 조회, 보관 기간 삭제
+        db.Index('ix_email_logs_user_sent_at', 'user_id', 'sent_at'),  # 사용자별 이력
+    )
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
@@ -173,6 +182,10 @@ class EmailLog(db.Model):
 class CrawlLog(db.Model):
     """크롤링 로그 테이블 (SRS 7.1.6)"""
     __tablename__ = 'crawl_logs'
+    __table_args__ = (
+        db.Index('ix_crawl_logs_crawled_at', 'crawled_at'),  # 최근 실행 조회, 보관 기간 삭제
+        db.Index('ix_crawl_logs_ticker_crawled_at', 'ticker_symbol', 'crawled_at'),  # 적응형 스케줄
+    )
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     ticker_symbol = db.Column(db.String(10))
@@ -194,3 +207,191 @@ class CrawlLog(db.Model):
     
     def __repr__(self):
         return f'<CrawlLog ticker={self.ticker_symbol} status={self.status}>'
+
+
+class CrawlStageTiming(db.Model):
+    """크롤링 단계별 소요 시간 테이블 (크롤링 파이프라인 계측)"""
+    __tablename__ = 'crawl_stage_timings'
+    
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    run_id = db.Column(db.String(32), nullable=False, index=True)  # 티커 1회 실행 단위
+    ticker_symbol = db.Column(db.String(10), nullable=False, index=True)
+    stage = db.Column(db.String(30), nullable=False)  # init_driver, page_load, parse, analyze, ...
+    duration_ms = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String(20))  # 실행 결과 (SUCCESS / PARTIAL / FAILED)
+    recorded_at = db.Column(db.DateTime, default=lambda: datetime.now(KST), nullable=False, index=True)
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'run_id': self.run_id,
+            'ticker_symbol': self.ticker_symbol,
+            'stage': self.stage,
+            'duration_ms': self.duration_ms,
+            'status': self.status,
+            'recorded_at': self.recorded_at.isoformat()
+        }
+    
+    def __repr__(self):
+        return f'<CrawlStageTiming ticker={self.ticker_symbol} stage={self.stage} {self.duration_ms}ms>'
+
+
+class SchedulerLock(db.Model):
+    """스케줄러 리더 리스 테이블 (여러 프로세스 중 1개만 작업 실행)"""
+    __tablename__ = 'scheduler_locks'
+    
+    name = db.Column(db.String(50), primary_key=True)  # 잠금 이름 (예: scheduler)
+    owner_id = db.Column(db.String(100), nullable=False)  # host:pid:random
+    acquired_at = db.Column(db.DateTime, default=lambda: datetime.now(KST), nullable=False)
+    heartbeat_at = db.Column(db.DateTime, default=lambda: datetime.now(KST), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'name': self.name,
+            'owner_id': self.owner_id,
+            'acquired_at': self.acquired_at.isoformat(),
+            'heartbeat_at': self.heartbeat_at.isoformat(),
+            'expires_at': self.expires_at.isoformat()
+        }
+    
+    def __repr__(self):
+        return f'<SchedulerLock name={self.name} owner={self.owner_id}>'
+
+
+class BackfillCheckpoint(db.Model):
+    """과거 뉴스 백필 진행 상태 (티커별, 중단 후 next_page부터 재개)"""
+    __tablename__ = 'backfill_checkpoints'
+    
+    ticker_symbol = db.Column(db.String(10), primary_key=True)
+    target_date = db.Column(db.DateTime, nullable=False)  # 이 시각(KST)까지 거슬러 올라가 수집
+    next_page = db.Column(db.Integer, default=1, nullable=False)  # 다음에 읽을 목록 페이지
+    pages_crawled = db.Column(db.Integer, default=0, nullable=False)
+    articles_found = db.Column(db.Integer, default=0, nullable=False)
+    articles_saved = db.Column(db.Integer, default=0, nullable=False)
+    oldest_seen = db.Column(db.DateTime)  # 지금까지 수집한 가장 오래된 기사 시각 (KST)
+    status = db.Column(db.String(20), default='RUNNING', nullable=False)  # RUNNING, COMPLETED, FAILED
+    error_message = db.Column(db.Text)
+    failure_count = db.Column(db.Integer, default=0, nullable=False)  # 연속 실패 횟수 (페이지 수집 성공 시 0)
+    started_at = db.Column(db.DateTime, default=lambda: datetime.now(KST), nullable=False)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(KST), onupdate=lambda: datetime.now(KST), nullable=False)
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'ticker_symbol': self.ticker_symbol,
+            'target_date': self.target_date.isoformat(),
+            'next_page': self.next_page,
+            'pages_crawled': self.pages_crawled,
+            'articles_found': self.articles_found,
+            'articles_saved': self.articles_saved,
+            'oldest_seen': self.oldest_seen.isoformat() if self.oldest_seen else None,
+            'status': self.status,
+            'error_message': self.error_message,
+            'failure_count': self.failure_count,
+            'started_at': self.started_at.isoformat(),
+            'updated_at': self.updated_at.isoformat()
+        }
+    
+    def __repr__(self):
+        return f'<BackfillCheckpoint {self.ticker_symbol} page={self.next_page} status={self.status}>'
+
+
+class TickerSlug(db.Model):
+    """티커 -> investing.com 뉴스 경로 (한 번 찾은 정식 URL 재사용, 404 시 무효화)"""
+    __tablename__ = 'ticker_slugs'
+    
+    ticker_symbol = db.Column(db.String(10), primary_key=True)
+    news_path = db.Column(db.String(255))  # 예: /equities/tesla-motors-news (None이면 미해결/무효화)
+    source = db.Column(db.String(20), nullable=False)  # static, search, invalidated
+    resolved_at = db.Column(db.DateTime, default=lambda: datetime.now(KST), nullable=False)  # 마지막 해결 시도 시각
+    failure_count = db.Column(db.Integer, default=0, nullable=False)  # 연속 해결 실패 횟수
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'ticker_symbol': self.ticker_symbol,
+            'news_path': self.news_path,
+            'source': self.source,
+            'resolved_at': self.resolved_at.isoformat(),
+            'failure_count': self.failure_count
+        }
+    
+    def __repr__(self):
+        return f'<TickerSlug {self.ticker_symbol} -> {self.news_path}>'
+
+
+class FeedState(db.Model):
+    """RSS/Atom 피드 조건부 요청 상태 (ETag/Last-Modified 재사용 -> 변경 없으면 304)"""
+    __tablename__ = 'feed_states'
+
+    feed_url = db.Column(db.String(500), primary_key=True)
+    ticker_symbol = db.Column(db.String(10), nullable=False, index=True)
+    etag = db.Column(db.String(255))
+    last_modified = db.Column(db.String(64))  # 서버가 보낸 Last-Modified 문자열 그대로
+    last_polled_at = db.Column(db.DateTime, default=lambda: datetime.now(KST), nullable=False)
+    last_status = db.Column(db.Integer)  # 마지막 HTTP 상태 코드 (200, 304 ...)
+    failure_count = db.Column(db.Integer, default=0, nullable=False)  # 연속 실패 횟수
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'feed_url': self.feed_url,
+            'ticker_symbol': self.ticker_symbol,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'last_polled_at': self.last_polled_at.isoformat(),
+            'last_status': self.last_status,
+            'failure_count': self.failure_count
+        }
+
+    def __repr__(self):
+        return f'<FeedState {self.ticker_symbol} {self.feed_url} status={self.last_status}>'
+
+
+class BackgroundJob(db.Model):
+    """웹 요청에서 분리해 실행하는 작업 (수동 이메일 발송 등) 진행 상태"""
+    __tablename__ = 'background_jobs'
+    
+    id = db.Column(db.String(32), primary_key=True)  # uuid4 hex
+    job_type = db.Column(db.String(50), nullable=False)  # email_all, test_email
+    status = db.Column(db.String(20), default='PENDING', nullable=False, index=True)  # PENDING, RUNNING, COMPLETED, FAILED
+    total = db.Column(db.Integer, default=0, nullable=False)  # 처리 대상 수 (사용자 수)
+    sent = db.Column(db.Integer, default=0, nullable=False)
+    failed = db.Column(db.Integer, default=0, nullable=False)
+    skipped = db.Column(db.Integer, default=0, nullable=False)  # 관심 종목 없음 등
+    message = db.Column(db.Text)
+    error_message = db.Column(db.Text)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'))  # 요청한 사용자 (관리자 포함)
+    dedup_key = db.Column(db.String(100))  # 중복 실행 확인 키 (테스트 메일 수신자 등, 없으면 작업 종류 단위)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(KST), nullable=False)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    
+    @property
+    def remaining(self):
+        """남은 처리 대상 수"""
+        return max(self.total - self.sent - self.failed - self.skipped, 0)
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'job_type': self.job_type,
+            'status': self.status,
+            'total': self.total,
+            'sent': self.sent,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'remaining': self.remaining,
+            'message': self.message,
+            'error_message': self.error_message,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+    
+    def __repr__(self):
+        return f'<BackgroundJob {self.id} {self.job_type} {self.status}>'
@@ -11,6 +11,7 @@ from app.extensions import db
 from app.models.models import User, UserSetting, UserStock, EmailLog, CrawlLog
 from app.routes.auth import login_required, admin_required
 from app.utils.elasticsearch_client import get_es_client
+from app.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +69,39 @@ def system_status():
     return render_template('admin/system_status.html')
 
 
+@admin_bp.route('/crawl-metrics')
+@login_required
+@admin_required
+def crawl_metrics():
+    """
+    크롤링 단계별 소요 시간 페이지
+    """
+    from app.services.crawl_metrics import get_stage_summary, get_recent_runs, TOTAL_STAGE
+
+    days = request.args.get('days', 7, type=int)
+    days = max(1, min(days, 90))
+
+    try:
+        summary = get_stage_summary(days=days)
+        recent_runs = get_recent_runs(limit=20)
+
+        # 최근 실행 표의 컬럼 순서는 요약 표와 동일하게 (total 제외)
+        stages = [item['stage'] for item in summary if item['stage'] != TOTAL_STAGE]
+
+        return render_template(
+            'admin/crawl_metrics.html',
+            days=days,
+            summary=summary,
+            recent_runs=recent_runs,
+            stages=stages,
+            total_stage=TOTAL_STAGE
+        )
+    except Exception as e:
+        logger.error(f"Error loading crawl metrics page: {e}")
+        flash('크롤링 메트릭을 불러오는 중 오류가 발생했습니다.', 'danger')
+        return redirect(url_for('admin.system_status'))
+
+
 # ==================== API 엔드포인트 ====================
 
 @admin_bp.route('/api/users', methods=['GET'])
@@ -225,16 +259,19 @@ def api_update_user(user_id):
 @admin_required
 def api_test_email():
     """
-    테스트 이메일 발송 API
+    테스트 이메일 발송 API (백그라운드 작업으로 실행, 작업 ID 반환)
     SRS 8.5: POST /api/admin/test-email
     """
     try:
-        data = request.get_json() or {}
+        from flask import current_app
+        from app.services.background_jobs import get_job_runner, make_test_email_job, test_email_dedup_key
+        
+        data = request.get_json(silent=True) or {}
         user_id = data.get('user_id')
+        current_user = get_current_user()
         
         # user_id가 없으면 현재 관리자에게 발송
         if not user_id:
-            current_user = get_current_user()
             user_id = current_user.id
         
         user = db.session.get(User, user_id)
@@ -244,23 +281,22 @@ def api_test_email():
                 'error': '사용자를 찾을 수 없습니다.'
             }), 404
         
-        # 이메일 발송
-        from app.services.email_sender import EmailSender
-        
-        email_sender = EmailSender()
-        success, error = email_sender.send_test_email(user)
+        # 요청한 관리자를 기록하고, 중복은 수신자 기준으로 확인 (같은 사용자에게 진행 중인 테스트 메일이 있으면 재사용)
+        job, _ = get_job_runner().enqueue(
+            current_app._get_current_object(),
+            'test_email',
+            make_test_email_job(user.id),
+            created_by=current_user.id,
+            dedup_key=test_email_dedup_key(user.id)
+        )
         
-        if success:
-            logger.info(f"Test email sent to {user.email} by admin {session.get('username')}")
-            return jsonify({
-                'success': True,
-                'message': f'{user.email}로 테스트 이메일을 발송했습니다.'
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': error or '이메일 발송에 실패했습니다.'
-            }), 500
+        logger.info(f"Test email to {user.email} queued by admin {session.get('username')} (job {job.id})")
+        return jsonify({
+            'success': True,
+            'message': f'{user.email}로 테스트 이메일 발송을 시작했습니다.',
+            'job_id': job.id,
+            'job': job.to_dict()
+        }), 202
             
     except Exception as e:
         logger.error(f"Error sending test email: {e}")
@@ -319,30 +355,44 @@ def api_trigger_crawl():
 def api_trigger_email():
     """
     수동 이메일 발송 트리거 API
-    모든 활성 사용자에게 즉시 발송
+    모든 활성 사용자에게 즉시 발송 (백그라운드 작업으로 실행, 진행 상황은 /api/jobs/<job_id>)
     """
     try:
+        from app.services.background_jobs import get_job_runner
         from app.services.scheduler import SchedulerService
-        from flask import current_app
-        from threading import Thread
         
-        if SchedulerService._scheduler is None:
+        if SchedulerService._app is None:
             return jsonify({
                 'success': False,
                 'error': '스케줄러가 초기화되지 않았습니다.'
             }), 500
         
         scheduler = SchedulerService()
+        current_user = get_current_user()
+        
+        # 사용자 수만큼 SMTP 발송(실패 시 재시도 대기 포함)이 걸리므로 요청 스레드에서 분리
+        job, created = get_job_runner().enqueue(
+            SchedulerService._app,
+            'email_all',
+            scheduler.send_email_now,
+            created_by=current_user.id if current_user else None
+        )
         
-        # 즉시 발송 (시간 체크 없이)
-        result = scheduler.send_email_now()
+        if not created:
+            return jsonify({
+                'success': True,
+                'message': '이미 진행 중인 이메일 발송 작업이 있습니다.',
+                'job_id': job.id,
+                'job': job.to_dict()
+            })
         
-        if result.get('success'):
-            logger.info(f"Manual email sent by admin {session.get('username')}: {result.get('sent')} sent, {result.get('failed')} failed")
-            return jsonify(result)
-        else:
-            logger.error(f"Manual email send failed: {result.get('error')}")
-            return jsonify(result), 500
+        logger.info(f"Manual email job {job.id} queued by admin {session.get('username')}")
+        return jsonify({
+            'success': True,
+            'message': '이메일 발송을 시작했습니다.',
+            'job_id': job.id,
+            'job': job.to_dict()
+        }), 202
             
     except Exception as e:
         logger.error(f"Error triggering email: {e}")
@@ -352,6 +402,28 @@ def api_trigger_email():
         }), 500
 
 
+@admin_bp.route('/api/jobs/<job_id>', methods=['GET'])
+@login_required
+@admin_required
+def api_job_status(job_id):
+    """
+    백그라운드 작업 진행 상황 조회 API (전체/발송/실패/남은 수)
+    """
+    from app.services.background_jobs import get_job
+    
+    job = get_job(job_id)
+    if not job:
+        return jsonify({
+            'success': False,
+            'error': '작업을 찾을 수 없습니다.'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'job': job.to_dict()
+    })
+
+
 @admin_bp.route('/api/system-status', methods=['GET'])
 @login_required
 @admin_required
@@ -385,7 +457,9 @@ def api_system_status():
 # ==================== 헬퍼 함수 ====================
 
 def _get_elasticsearch_status():
-    """ElasticSearch 상태 조회"""
+    """뉴스 저장소 상태 조회 (ElasticSearch, NEWS_STORAGE_BACKEND=sqlite면 SQLite 파일)"""
+    if Config.NEWS_STORAGE_BACKEND == 'sqlite':
+        return _get_sqlite_storage_status()
     try:
         es = get_es_client()
         
@@ -415,6 +489,26 @@ def _get_elasticsearch_status():
         }
 
 
+def _get_sqlite_storage_status():
+    """SQLite 뉴스 저장소 상태 조회"""
+    try:
+        from app.services.sqlite_news_storage import get_sqlite_news_storage
+        storage = get_sqlite_news_storage()
+        return {
+            'status': 'connected',
+            'documents': storage.document_count(),
+            'index': storage.path
+        }
+    except Exception as e:
+        logger.error(f"Error checking SQLite news storage status: {e}")
+        return {
+            'status': 'error',
+            'error': str(e),
+            'documents': 0,
+            'index': Config.NEWS_SQLITE_PATH
+        }
+
+
 def _get_crawler_status():
     """크롤러 상태 조회"""
     try:
@@ -483,13 +577,20 @@ def _get_scheduler_status():
     try:
         # SchedulerService 클래스에서 직접 스케줄러 가져오기
         from app.services.scheduler import SchedulerService
+        from app.services.scheduler_lock import get_lock_status
+        from app.utils.config import Config
         
         scheduler = SchedulerService._scheduler
         
+        # 리더 리스 (별도 워커 프로세스가 작업을 실행 중인지 확인)
+        leader = get_lock_status(db.session)
+        
         if scheduler is None:
             return {
-                'status': 'not_configured',
-                'jobs': []
+                'status': 'external' if leader and leader['active'] else 'not_configured',
+                'jobs': [],
+                'crawl_mode': Config.CRAWL_SCHEDULE_MODE,
+                'leader': leader
             }
         
         # 실행 중인 작업 목록
@@ -503,7 +604,11 @@ def _get_scheduler_status():
         
         return {
             'status': 'running' if scheduler.running else 'stopped',
-            'jobs': jobs
+            'jobs': jobs,
+            'crawl_mode': Config.CRAWL_SCHEDULE_MODE,
+            'adaptive_schedule': SchedulerService().get_adaptive_schedule(),
+            'is_leader': SchedulerService().is_leader(),
+            'leader': leader
         }
     except Exception as e:
         logger.error(f"Error checking scheduler status: {e}")
@@ -9,7 +9,7 @@ import logging
 
 from app.routes.auth import login_required
 from app.models.models import User, UserStock, StockMaster
-from app.services.news_storage import NewsStorageAdapter
+from app.services.news_storage import create_news_storage
 from app.extensions import db
 
 logger = logging.getLogger(__name__)
@@ -39,7 +39,7 @@ def dashboard():
         .all()
     
     # ElasticSearch에서 최신 뉴스 조회
-    storage = NewsStorageAdapter()
+    storage = create_news_storage()
     recent_news = []
     stats = {
         'total': 0,
@@ -54,6 +54,7 @@ def dashboard():
         from_date = datetime.now(timezone.utc) - timedelta(days=30)
         ticker_list = [us.ticker_symbol for us, _ in user_stocks]
         ticker_company = {us.ticker_symbol: stock.company_name for us, stock in user_stocks}
+        language = user.settings.language if user and user.settings else 'ko'
 
         if ticker_list:
             result = storage.search_news(
@@ -76,11 +77,17 @@ def dashboard():
                     stats['neutral'] = stats.get('neutral', 0) + 1
 
                 ticker = item.get('ticker_symbol') or item.get('ticker')
+                # 사용자 언어 요약 우선 (분석 시 생성하지 않은 언어면 다른 언어 요약, 없으면 본문)
+                summary_data = item.get('summary') or {}
+                summary = (
+                    summary_data.get(language) or item.get('summary_ko') or summary_data.get('ko')
+                    or next((text for text in summary_data.values() if text), '')
+                )
                 recent_news.append({
                     'ticker': ticker,
                     'company_name': ticker_company.get(ticker, ''),
                     'title': item.get('title', 'N/A'),
-                    'summary': item.get('summary_ko', item.get('summary', {}).get('ko', '')) or item.get('content', ''),
+                    'summary': summary or item.get('content', ''),
                     'url': item.get('source_url') or item.get('url', '#'),
                     'published_date': published,
                     'sentiment_score': sentiment_data.get('score', 0),
@@ -0,0 +1,67 @@
+"""
+메트릭 라우트
+- Prometheus 텍스트 포맷 /metrics 엔드포인트
+- METRICS_TOKEN이 있으면 Bearer 토큰, 없으면 METRICS_ALLOWED_IPS(기본 루프백)에서 온 요청만 허용
+"""
+
+from flask import Blueprint, Response, request
+import hmac
+import ipaddress
+import logging
+
+from app.services.crawl_metrics import collect_stage_histograms
+from app.utils.config import Config
+from app.utils.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+metrics_bp = Blueprint('metrics', __name__)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+get_metrics_registry().register_collector(collect_stage_histograms)
+
+
+def _is_allowed_address(address: str) -> bool:
+    """요청 주소가 METRICS_ALLOWED_IPS(IP 또는 CIDR 목록)에 포함되는지 확인"""
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    for entry in Config.METRICS_ALLOWED_IPS.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            if ip in ipaddress.ip_network(entry, strict=False):
+                return True
+        except ValueError:
+            logger.warning(f"Invalid METRICS_ALLOWED_IPS entry: {entry}")
+    return False
+
+
+def _is_authorized() -> bool:
+    """METRICS_TOKEN이 설정된 경우 Bearer 토큰, 아니면 허용 주소 확인 (둘 다 없으면 거부)"""
+    token = Config.METRICS_TOKEN
+    if not token:
+        return _is_allowed_address(request.remote_addr or '')
+
+    auth_header = request.headers.get('Authorization', '')
+    if not auth_header.startswith('Bearer '):
+        return False
+    return hmac.compare_digest(auth_header[len('Bearer '):].strip(), token)
+
+
+@metrics_bp.route('/metrics')
+def metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    if not _is_authorized():
+        return Response('Unauthorized\n', status=401, mimetype='text/plain')
+
+    try:
+        body = get_metrics_registry().render()
+    except Exception as e:
+        logger.error(f"Failed to render metrics: {e}")
+        return Response('Failed to render metrics\n', status=500, mimetype='text/plain')
+
+    return Response(body, content_type=PROMETHEUS_CONTENT_TYPE)
@@ -9,8 +9,9 @@ from datetime import datetime, timedelta
 import logging
 
 from app.routes.auth import login_required
-from app.models.models import UserStock, StockMaster
-from app.services.news_storage import NewsStorageAdapter
+from app.models.models import UserSetting, UserStock, StockMaster
+from app.services.news_analyzer import SUMMARY_LANGUAGES, fill_missing_summaries
+from app.services.news_storage import create_news_storage
 from app.extensions import db
 
 logger = logging.getLogger(__name__)
@@ -44,7 +45,7 @@ def news_page():
     # 사용자 관심 종목 조회
     user_stocks = UserStock.query.filter_by(user_id=user_id).all()
     
-    storage = NewsStorageAdapter()
+    storage = create_news_storage()
     
     # 검색할 종목 결정
     if ticker:
@@ -137,7 +138,7 @@ def get_latest():
     ticker = request.args.get('ticker', '').upper()
     limit = int(request.args.get('limit', 10))
     
-    storage = NewsStorageAdapter()
+    storage = create_news_storage()
     
     try:
         # 티커 지정 시 해당 종목만, 없으면 전체
@@ -180,7 +181,7 @@ def get_latest():
             'source_name': item.get('source_name', 'Unknown'),
             'published_date': item.get('published_date') or item.get('date') or item.get('crawled_date'),
             'sentiment': item.get('sentiment', {})
-        } for item in news]
+        } for item in news['hits']]
         
         return jsonify({'news': results})
         
@@ -203,7 +204,7 @@ def get_history():
     page = int(request.args.get('page', 1))
     per_page = int(request.args.get('per_page', 20))
     
-    storage = NewsStorageAdapter()
+    storage = create_news_storage()
     
     try:
         # 사용자 관심 종목 확인
@@ -249,7 +250,7 @@ def get_history():
             'source_name': item.get('source_name', 'Unknown'),
             'published_date': item.get('published_date'),
             'sentiment': item.get('sentiment', {})
-        } for item in news]
+        } for item in news['hits']]
         
         return jsonify({
             'news': results,
@@ -267,7 +268,7 @@ def get_history():
 @login_required
 def detail(news_id):
     """뉴스 상세 페이지"""
-    storage = NewsStorageAdapter()
+    storage = create_news_storage()
     
     try:
         news_data = storage.get_news_by_id(news_id)
@@ -275,6 +276,11 @@ def detail(news_id):
         if not news_data:
             return render_template('errors/404.html'), 404
         
+        # 사용자 언어 요약이 없으면 생성 후 문서에 저장 (나머지 언어 탭은 선택 시 API로 로드)
+        language = _user_language(session['user_id'])
+        news_data.setdefault('_id', news_id)
+        fill_missing_summaries([news_data], [language], storage)
+        
         # 템플릿 필드명 통일
         sentiment_data = news_data.get('sentiment', {})
         if sentiment_data:
@@ -302,7 +308,7 @@ def detail(news_id):
         crawled_date = news_data.get('crawled_date') or news_data.get('collected_at')
         news_data['collected_at'] = crawled_date
         
-        return render_template('news/detail.html', news=news_data)
+        return render_template('news/detail.html', news=news_data, news_id=news_id, summary_language=language)
         
     except Exception as e:
         logger.error(f"Failed to fetch news detail: {e}", exc_info=True)
@@ -313,7 +319,7 @@ def detail(news_id):
 @login_required
 def get_detail(news_id):
     """뉴스 상세 조회 API"""
-    storage = NewsStorageAdapter()
+    storage = create_news_storage()
     
     try:
         news = storage.get_news_by_id(news_id)
@@ -342,6 +348,41 @@ def get_detail(news_id):
         return jsonify({'error': '뉴스 조회에 실패했습니다.'}), 500
 
 
+@news_bp.route('/api/<news_id>/summary/<language>', methods=['GET'])
+@login_required
+def get_summary(news_id, language):
+    """언어별 요약 조회 API (없으면 생성 후 문서에 저장)"""
+    if language not in SUMMARY_LANGUAGES:
+        return jsonify({'error': '지원하지 않는 언어입니다.'}), 400
+    
+    storage = create_news_storage()
+    
+    try:
+        news = storage.get_news_by_id(news_id)
+        
+        if not news:
+            return jsonify({'error': '뉴스를 찾을 수 없습니다.'}), 404
+        
+        news.setdefault('_id', news_id)
+        fill_missing_summaries([news], [language], storage)
+        
+        return jsonify({
+            'news_id': news_id,
+            'language': language,
+            'summary': (news.get('summary') or {}).get(language, '')
+        })
+        
+    except Exception as e:
+        logger.error(f"Failed to fetch news summary: {e}", exc_info=True)
+        return jsonify({'error': '요약 조회에 실패했습니다.'}), 500
+
+
+def _user_language(user_id: int) -> str:
+    """사용자 요약 언어 (설정이 없으면 ko)"""
+    setting = UserSetting.query.filter_by(user_id=user_id).first()
+    return setting.language if setting and setting.language else 'ko'
+
+
 @news_bp.route('/statistics')
 @login_required
 def statistics_page():
@@ -422,7 +463,7 @@ def api_statistics():
         ticker = None
     
     try:
-        storage = NewsStorageAdapter()
+        storage = create_news_storage()
         
         # ES 집계 쿼리 (종목별)
         ticker_stats = []
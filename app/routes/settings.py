@@ -134,7 +134,7 @@ def update_settings():
 @login_required
 def send_test_email():
     """
-    테스트 이메일 발송
+    테스트 이메일 발송 (백그라운드 작업으로 실행, 결과는 /api/jobs/<job_id>)
     FR-054: 테스트 메일 발송 버튼
     """
     current_user = get_current_user()
@@ -142,21 +142,23 @@ def send_test_email():
         return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
     
     try:
-        from app.services.email_sender import EmailSender
+        from flask import current_app
+        from app.services.background_jobs import get_job_runner, make_test_email_job, test_email_dedup_key
         
-        email_sender = EmailSender()
-        success, error = email_sender.send_test_email(current_user)
+        job, _ = get_job_runner().enqueue(
+            current_app._get_current_object(),
+            'test_email',
+            make_test_email_job(current_user.id),
+            created_by=current_user.id,
+            dedup_key=test_email_dedup_key(current_user.id)
+        )
         
-        if success:
-            return jsonify({
-                'success': True,
-                'message': f'테스트 이메일이 {current_user.email}로 발송되었습니다.'
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'message': f'이메일 발송 실패: {error}'
-            }), 500
+        return jsonify({
+            'success': True,
+            'message': f'테스트 이메일을 {current_user.email}로 발송하고 있습니다.',
+            'job_id': job.id,
+            'job': job.to_dict()
+        }), 202
             
     except Exception as e:
         logger.error(f"Error sending test email: {e}")
@@ -166,6 +168,25 @@ def send_test_email():
         }), 500
 
 
+@settings_bp.route('/api/jobs/<job_id>')
+@login_required
+def get_job_status(job_id):
+    """
+    본인이 요청한 백그라운드 작업 진행 상황 조회
+    """
+    current_user = get_current_user()
+    if not current_user:
+        return jsonify({'error': 'Unauthorized'}), 401
+    
+    from app.services.background_jobs import get_job
+    
+    job = get_job(job_id)
+    if not job or job.created_by != current_user.id:
+        return jsonify({'success': False, 'message': '작업을 찾을 수 없습니다.'}), 404
+    
+    return jsonify({'success': True, 'job': job.to_dict()})
+
+
 @settings_bp.route('/api/status')
 @login_required
 def get_status():
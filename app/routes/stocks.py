@@ -10,6 +10,7 @@ import logging
 from app.routes.auth import login_required
 from app.models.models import UserStock, StockMaster
 from app.extensions import db
+from app.services.stock_search import get_stock_search_index
 
 logger = logging.getLogger(__name__)
 
@@ -150,7 +151,7 @@ def search_stocks():
     """종목 검색 API (FR-009-1 ~ FR-009-5)
     
     실시간 자동완성을 위한 종목 검색
-    - 티커 심볼과 회사명으로 검색 (대소문자 무시)
+    - 티커 심볼 접두사, 회사명(영문/한국어) 단어 접두사로 검색 (대소문자 무시, 메모리 인덱스)
     - 최대 20개 결과 반환
     - 이미 관심종목인 항목 표시
     """
@@ -166,23 +167,8 @@ def search_stocks():
         return jsonify({'error': '검색어가 너무 깁니다.'}), 400
     
     try:
-        # 티커 심볼, 영문 회사명, 한국어 회사명으로 검색 (대소문자 무시)
-        search_pattern = f'%{query}%'
-        stocks = StockMaster.query.filter(
-            db.or_(
-                StockMaster.ticker_symbol.ilike(search_pattern),
-                StockMaster.company_name.ilike(search_pattern),
-                StockMaster.company_name_ko.ilike(search_pattern)
-            )
-        ).order_by(
-            # 정확히 일치하는 티커를 우선 표시
-            db.case(
-                (StockMaster.ticker_symbol.ilike(query), 0),
-                (StockMaster.ticker_symbol.ilike(f'{query}%'), 1),
-                else_=2
-            ),
-            StockMaster.ticker_symbol
-        ).limit(20).all()
+        # 티커 접두사, 영문/한국어 회사명 토큰 접두사 검색 (메모리 인덱스, 정확히 일치하는 티커 우선)
+        stocks = get_stock_search_index().search(query, limit=20)
         
         # 현재 사용자의 관심종목 목록
         user_watchlist = set([
@@ -191,12 +177,8 @@ def search_stocks():
         ])
         
         results = [{
-            'ticker': s.ticker_symbol,
-            'name': s.company_name,
-            'name_ko': s.company_name_ko,
-            'exchange': s.exchange,
-            'sector': s.sector,
-            'is_watchlist': s.ticker_symbol in user_watchlist
+            **s,
+            'is_watchlist': s['ticker'] in user_watchlist
         } for s in stocks]
         
         return jsonify({'stocks': results})
@@ -1,6 +1,6 @@
 """
 비즈니스 로직 서비스 모듈
 """
-from .news_storage import NewsStorageAdapter, get_news_storage
+from .news_storage import NewsStorageAdapter, NewsStorageBackend, create_news_storage, get_news_storage
 
-__all__ = ['NewsStorageAdapter', 'get_news_storage']
+__all__ = ['NewsStorageAdapter', 'NewsStorageBackend', 'create_news_storage', 'get_news_storage']
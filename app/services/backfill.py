@@ -0,0 +1,396 @@
+"""
+과거 뉴스 백필 서비스
+- investing.com 뉴스 목록을 페이지 단위({news_url}/2, /3, ...)로 목표 날짜까지 거슬러 수집
+- 페이지마다 중복 체크 -> 분석 -> bulk 저장 후 backfill_checkpoints에 진행 상태 커밋
+  (프로세스가 중단되어도 다음 실행에서 next_page부터 재개)
+- 티커 단위로 스레드 병렬 실행, 동시 브라우저 수는 BACKFILL_MAX_CONCURRENCY로 제한
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from flask import Flask
+
+from app.extensions import db
+from app.models.models import BackfillCheckpoint, StockMaster, KST
+from app.services.crawler import CrawlBlockedError, InvestingCrawler, USER_AGENTS
+from app.services.proxy_pool import get_proxy_pool
+from app.services.slug_resolver import get_slug_resolver
+from app.services.snapshot_store import get_snapshot_store
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+# 목록 페이지는 시간 필터 없이 전부 파싱 후 목표 날짜로 나눔
+_NO_CUTOFF = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MAX_ARTICLES_PER_PAGE = 200
+
+
+class SeleniumPageFetcher:
+    """InvestingCrawler(Chrome) 기반 페이지 로더 (운영 기본값, 워커 스레드마다 1개, 프록시 풀 사용)"""
+
+    def __init__(self, settle_seconds: float = 3):
+        self.settle_seconds = settle_seconds
+        self._crawler: Optional[InvestingCrawler] = None
+        self._lease = None
+
+    def __enter__(self):
+        self._lease = get_proxy_pool().acquire()
+        try:
+            self._crawler = InvestingCrawler(proxy=self._lease.proxy).__enter__()
+        except Exception:
+            self._lease.failure()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._crawler is not None:
+            self._crawler.__exit__(exc_type, exc_val, exc_tb)
+            self._crawler = None
+        if self._lease is not None:
+            self._lease.__exit__(exc_type, exc_val, exc_tb)
+            self._lease = None
+
+    def fetch(self, url: str) -> str:
+        """페이지 HTML 반환 (봇 확인 페이지면 프록시 격리 후 CrawlBlockedError)"""
+        try:
+            return self._crawler.fetch_page_source(url, settle_seconds=self.settle_seconds)
+        except CrawlBlockedError:
+            self._lease.blocked()
+            raise
+
+
+class HttpPageFetcher:
+    """requests 기반 페이지 로더 (로컬 fixture 사이트 / 봇 차단 없는 미러용)"""
+
+    def __init__(self, timeout: int = 30):
+        self.timeout = timeout
+        self._session: Optional[requests.Session] = None
+
+    def __enter__(self):
+        self._session = requests.Session()
+        self._session.headers['User-Agent'] = Config.USER_AGENT or USER_AGENTS[0]
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def fetch(self, url: str) -> str:
+        """페이지 HTML 반환 (HTTP 오류는 예외)"""
+        response = self._session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+
+def _to_kst_naive(value: datetime) -> datetime:
+    """DB 저장/비교용 naive KST로 변환"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(KST).replace(tzinfo=None)
+
+
+def _article_date(item: Dict[str, Any]) -> Optional[datetime]:
+    """파싱된 기사 dict의 date(ISO 문자열) -> naive KST"""
+    try:
+        return _to_kst_naive(datetime.fromisoformat(item['date']))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class BackfillService:
+    """과거 뉴스 백필 실행기"""
+
+    def __init__(
+        self,
+        app: Flask,
+        news_storage=None,
+        news_analyzer=None,
+        fetcher_factory: Optional[Callable[[], Any]] = None,
+        base_url: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        page_delay: Optional[float] = None
+    ):
+        """
+        초기화
+
+        Args:
+            app: Flask 애플리케이션 (워커 스레드마다 앱 컨텍스트 생성)
+            news_storage: NewsStorageBackend (None이면 티커마다 create_news_storage()로 생성)
+            news_analyzer: NewsAnalyzer (None이면 CrawlerService 기본값)
+            fetcher_factory: 페이지 로더 생성 함수, 반환값은 fetch(url)를 가진 context manager
+                             (기본: SeleniumPageFetcher)
+            base_url: investing.com 대신 사용할 사이트 주소 (로컬 fixture 사이트 등)
+            max_pages: 티커당 최대 페이지 수 (기본: Config.BACKFILL_MAX_PAGES)
+            page_delay: 페이지 간 대기 시간 (기본: Config.BACKFILL_PAGE_DELAY_SECONDS)
+        """
+        self.app = app
+        self.storage = news_storage
+        self.analyzer = news_analyzer
+        self.fetcher_factory = fetcher_factory or SeleniumPageFetcher
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.max_pages = max_pages if max_pages is not None else Config.BACKFILL_MAX_PAGES
+        self.page_delay = page_delay if page_delay is not None else Config.BACKFILL_PAGE_DELAY_SECONDS
+
+    def backfill(
+        self,
+        tickers: List[str],
+        days: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 티커를 병렬로 백필
+
+        Args:
+            tickers: 티커 목록
+            days: 최근 N일까지 수집 (기본: Config.BACKFILL_DAYS)
+            max_workers: 동시 실행 티커 수 (기본: Config.BACKFILL_MAX_CONCURRENCY)
+
+        Returns:
+            {ticker: 결과 딕셔너리}
+        """
+        tickers = sorted(set(t.upper() for t in tickers))
+        if not tickers:
+            return {}
+
+        days = days if days is not None else Config.BACKFILL_DAYS
+        target_date = datetime.now(KST) - timedelta(days=days)
+        max_workers = max(1, min(max_workers or Config.BACKFILL_MAX_CONCURRENCY, len(tickers)))
+        logger.info(f"Starting backfill for {len(tickers)} tickers back to {target_date:%Y-%m-%d} (workers={max_workers})")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.backfill_ticker, ticker, target_date): ticker
+                for ticker in tickers
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    results[ticker] = future.result()
+                except Exception as e:
+                    logger.error(f"[{ticker}] Backfill failed: {e}", exc_info=True)
+                    results[ticker] = {'status': 'FAILED', 'saved': 0, 'error': str(e)}
+
+        total_saved = sum(r.get('saved', 0) for r in results.values())
+        logger.info(f"Backfill completed: {total_saved} news items saved for {len(results)} tickers")
+        return results
+
+    def get_pending_tickers(self, tickers: List[str], target_date: datetime) -> List[str]:
+        """
+        target_date까지 백필이 끝나지 않은 티커 (앱 컨텍스트 필요)
+
+        실패한 티커는 재시도 대기 시간(BACKFILL_RETRY_HOURS, 실패마다 2배)이 지난 경우만,
+        BACKFILL_MAX_ATTEMPTS번 연속 실패한 티커는 제외 (scripts/backfill_news.py로 직접 실행하면 재시도)
+
+        Args:
+            tickers: 티커 목록
+            target_date: 목표 날짜
+
+        Returns:
+            백필이 필요한 티커 목록
+        """
+        target = _to_kst_naive(target_date)
+        now = _to_kst_naive(datetime.now(KST))
+        skip = set()
+        for cp in BackfillCheckpoint.query.filter(BackfillCheckpoint.ticker_symbol.in_(tickers)):
+            if cp.status == 'COMPLETED' and cp.target_date <= target:
+                skip.add(cp.ticker_symbol)
+            elif cp.status == 'FAILED' and not self._retry_due(cp, now):
+                skip.add(cp.ticker_symbol)
+        return [t for t in tickers if t not in skip]
+
+    @staticmethod
+    def _retry_due(checkpoint: BackfillCheckpoint, now: datetime) -> bool:
+        """실패한 티커의 재시도 시각 도래 여부"""
+        failures = checkpoint.failure_count or 0
+        if failures >= Config.BACKFILL_MAX_ATTEMPTS:
+            return False
+        delay = timedelta(hours=Config.BACKFILL_RETRY_HOURS * 2 ** max(failures - 1, 0))
+        return checkpoint.updated_at + delay <= now
+
+    def backfill_ticker(self, ticker: str, target_date: datetime) -> Dict[str, Any]:
+        """
+        단일 티커 백필 (워커 스레드용, 자체 앱 컨텍스트 사용)
+
+        Args:
+            ticker: 티커 심볼
+            target_date: 이 시각까지 거슬러 수집
+
+        Returns:
+            {'status': COMPLETED/FAILED/SKIPPED, 'pages': ..., 'saved': ..., 'error': ...}
+        """
+        with self.app.app_context():
+            try:
+                return self._backfill_ticker(ticker.upper(), _to_kst_naive(target_date))
+            finally:
+                db.session.remove()
+
+    def _backfill_ticker(self, ticker: str, target: datetime) -> Dict[str, Any]:
+        """backfill_ticker 본문"""
+        from app.services.crawler_service import CrawlerService, NewsSaveError
+        from app.services.news_storage import create_news_storage
+
+        stock = db.session.query(StockMaster).filter_by(ticker_symbol=ticker).first()
+        if not stock:
+            error_msg = f"Ticker {ticker} not found in stock_master"
+            logger.error(error_msg)
+            return {'status': 'FAILED', 'pages': 0, 'saved': 0, 'error': error_msg}
+
+        checkpoint = self._load_checkpoint(ticker, target)
+        if checkpoint is None:
+            logger.info(f"[{ticker}] Backfill already completed to {target:%Y-%m-%d}")
+            return {'status': 'SKIPPED', 'pages': 0, 'saved': 0, 'error': None}
+
+        parser = InvestingCrawler()
+        if self.base_url:
+            parser.BASE_URL = self.base_url
+        saver = CrawlerService(
+            db_session=db.session,
+            news_storage=self.storage or create_news_storage(),
+            news_analyzer=self.analyzer
+        )
+
+        pages = saved = 0
+        logger.info(f"[{ticker}] Backfill from page {checkpoint.next_page} back to {target:%Y-%m-%d}")
+
+        with self.fetcher_factory() as fetcher:
+            # 매핑 없는 티커는 검색 페이지에서 정식 뉴스 URL을 먼저 찾음 (검색 URL은 페이지 구분 없음)
+            resolver = get_slug_resolver()
+            if resolver.needs_resolution(ticker):
+                resolver.resolve(ticker, fetcher.fetch, parser.BASE_URL)
+
+            while checkpoint.status == 'RUNNING':
+                page = checkpoint.next_page
+                url = parser.get_news_page_url(ticker, page)
+                if url is None or page > self.max_pages:
+                    # 페이지 구분 없는 검색 URL / 페이지 상한 도달
+                    self._finish(checkpoint, 'COMPLETED')
+                    break
+
+                if pages and self.page_delay > 0:
+                    time.sleep(self.page_delay)
+
+                try:
+                    html = fetcher.fetch(url)
+                except requests.HTTPError as e:
+                    if page == 1 and e.response is not None and e.response.status_code == 404:
+                        resolver.invalidate(ticker)
+                    logger.warning(f"[{ticker}] Backfill page {page} failed: {e}")
+                    self._finish(checkpoint, 'FAILED', f"page {page}: {e}")
+                    break
+                except Exception as e:
+                    logger.warning(f"[{ticker}] Backfill page {page} failed: {e}")
+                    self._finish(checkpoint, 'FAILED', f"page {page}: {e}")
+                    break
+
+                items = parser._parse_news_articles_bs4(
+                    html, ticker, stock.company_name, _NO_CUTOFF, _MAX_ARTICLES_PER_PAGE
+                )
+                pages += 1
+                if Config.SNAPSHOT_ENABLED:
+                    get_snapshot_store().save(
+                        ticker, url, html, stock.company_name, 'ok' if items else 'empty', len(items)
+                    )
+                if not items:
+                    if page == 1:
+                        self._finish(checkpoint, 'FAILED', 'No articles on first page')
+                    else:
+                        # 목록 끝
+                        self._finish(checkpoint, 'COMPLETED')
+                    break
+
+                dated = [(item, _article_date(item)) for item in items]
+                in_range = [item for item, date in dated if date is None or date >= target]
+                reached_target = len(in_range) < len(items)
+
+                try:
+                    page_saved = saver.save_news_items(ticker, in_range, stock.company_name) if in_range else 0
+                except NewsSaveError as e:
+                    # 같은 페이지부터 다시 (재시도 대기/횟수는 get_pending_tickers에서)
+                    logger.warning(f"[{ticker}] Backfill page {page} not saved: {e}")
+                    self._finish(checkpoint, 'FAILED', f"page {page}: {e}")
+                    break
+                saved += page_saved
+
+                oldest = min((date for _, date in dated if date is not None and date >= target), default=None)
+                if oldest and (checkpoint.oldest_seen is None or oldest < checkpoint.oldest_seen):
+                    checkpoint.oldest_seen = oldest
+                checkpoint.pages_crawled += 1
+                checkpoint.articles_found += len(in_range)
+                checkpoint.articles_saved += page_saved
+                checkpoint.failure_count = 0
+
+                if reached_target:
+                    # 목표를 더 과거로 늘리면 이 페이지부터 다시 읽음 (중복은 URL 체크로 제외)
+                    self._finish(checkpoint, 'COMPLETED')
+                else:
+                    checkpoint.next_page = page + 1
+                    db.session.commit()
+
+                logger.debug(f"[{ticker}] Backfill page {page}: {len(in_range)} in range, {page_saved} saved")
+
+        logger.info(
+            f"[{ticker}] Backfill {checkpoint.status}: {pages} pages, {saved} saved, "
+            f"oldest={checkpoint.oldest_seen}"
+        )
+        return {
+            'status': checkpoint.status,
+            'pages': pages,
+            'saved': saved,
+            'error': checkpoint.error_message
+        }
+
+    def _load_checkpoint(self, ticker: str, target: datetime) -> Optional[BackfillCheckpoint]:
+        """
+        진행 상태 조회/생성 (이미 target까지 완료된 경우 None)
+
+        - 새 티커: 1페이지부터
+        - RUNNING/FAILED: 중단된 next_page부터 재개
+        - COMPLETED인데 더 과거까지 요청: 마지막 페이지부터 이어서 수집
+        """
+        checkpoint = db.session.get(BackfillCheckpoint, ticker)
+        if checkpoint is None:
+            checkpoint = BackfillCheckpoint(ticker_symbol=ticker, target_date=target, next_page=1,
+                                            pages_crawled=0, articles_found=0, articles_saved=0, failure_count=0)
+            db.session.add(checkpoint)
+        elif checkpoint.status == 'COMPLETED' and checkpoint.target_date <= target:
+            return None
+        else:
+            checkpoint.target_date = min(checkpoint.target_date, target)
+
+        checkpoint.status = 'RUNNING'
+        checkpoint.error_message = None
+        db.session.commit()
+        return checkpoint
+
+    def _finish(self, checkpoint: BackfillCheckpoint, status: str, error: Optional[str] = None) -> None:
+        checkpoint.status = status
+        checkpoint.error_message = error[:500] if error else None
+        if status == 'FAILED':
+            checkpoint.failure_count = (checkpoint.failure_count or 0) + 1
+        else:
+            checkpoint.failure_count = 0
+        db.session.commit()
+
+
+def get_backfill_status(db_session, tickers: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    백필 진행 상태 목록
+
+    Args:
+        db_session: SQLAlchemy 세션
+        tickers: 조회할 티커 (None이면 전체)
+
+    Returns:
+        BackfillCheckpoint.to_dict() 목록
+    """
+    query = db_session.query(BackfillCheckpoint)
+    if tickers:
+        query = query.filter(BackfillCheckpoint.ticker_symbol.in_([t.upper() for t in tickers]))
+    return [cp.to_dict() for cp in query.order_by(BackfillCheckpoint.ticker_symbol)]
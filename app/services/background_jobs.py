@@ -0,0 +1,231 @@
+"""
+백그라운드 작업 실행기
+- 관리자/사용자가 웹에서 실행하는 오래 걸리는 작업(전체 이메일 발송, 테스트 메일)을
+  요청 스레드에서 분리해 스레드 풀에서 실행하고 즉시 작업 ID 반환
+- 진행 상황(전체/발송/실패/건너뜀)은 background_jobs 테이블에 기록 -> 상태 API로 조회
+"""
+
+import logging
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Tuple
+
+from flask import Flask
+
+from app.extensions import db
+from app.models.models import BackgroundJob, KST
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ('PENDING', 'RUNNING')
+
+
+class JobProgress:
+    """작업 함수에 전달되는 진행 상황 기록기 (갱신마다 커밋 -> 다른 프로세스의 상태 API에서도 조회)"""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+
+    def set_total(self, total: int) -> None:
+        """처리 대상 수 설정"""
+        self._update(total=total)
+
+    def sent(self, count: int = 1) -> None:
+        self._increment('sent', count)
+
+    def failed(self, count: int = 1) -> None:
+        self._increment('failed', count)
+
+    def skipped(self, count: int = 1) -> None:
+        self._increment('skipped', count)
+
+    def _increment(self, field: str, count: int) -> None:
+        try:
+            db.session.query(BackgroundJob).filter(BackgroundJob.id == self.job_id).update(
+                {field: getattr(BackgroundJob, field) + count}, synchronize_session=False
+            )
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Failed to update job progress {self.job_id}: {e}")
+            db.session.rollback()
+
+    def _update(self, **changes) -> None:
+        _update_job(self.job_id, **changes)
+
+
+class BackgroundJobRunner:
+    """스레드 풀 작업 실행기"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        초기화
+
+        Args:
+            max_workers: 동시 실행 작업 수 (기본: Config.BACKGROUND_JOB_WORKERS)
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or Config.BACKGROUND_JOB_WORKERS,
+            thread_name_prefix='background-job'
+        )
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def enqueue(
+        self,
+        app: Flask,
+        job_type: str,
+        func: Callable[[JobProgress], Optional[Dict]],
+        created_by: Optional[int] = None,
+        dedup_key: Optional[str] = None
+    ) -> Tuple[BackgroundJob, bool]:
+        """
+        작업 등록 (같은 종류의 작업이 실행 중이면 새로 만들지 않고 기존 작업 반환)
+
+        Args:
+            app: Flask 앱 (작업 스레드에서 앱 컨텍스트 생성)
+            job_type: 작업 종류
+            func: progress를 받아 결과 딕셔너리({'success', 'message', 'error'})를 반환하는 함수
+            created_by: 요청한 사용자 ID (감사/상태 조회 권한)
+            dedup_key: 중복 확인 키 (같은 종류 + 같은 키의 작업만 재사용, 예: 테스트 메일 수신자)
+
+        Returns:
+            (작업, 새로 생성 여부)
+        """
+        with self._lock:
+            existing = self._find_active(job_type, dedup_key)
+            if existing is not None:
+                return existing, False
+
+            job = BackgroundJob(
+                id=uuid.uuid4().hex, job_type=job_type, status='PENDING',
+                created_by=created_by, dedup_key=dedup_key, created_at=_now()
+            )
+            db.session.add(job)
+            db.session.commit()
+
+            self._futures[job.id] = self._executor.submit(self._run, app, job.id, func)
+        logger.info(f"Background job {job.id} ({job_type}) queued by user {created_by}")
+        return job, True
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> None:
+        """작업 종료 대기 (스크립트/테스트용)"""
+        future = self._futures.get(job_id)
+        if future is not None:
+            future.result(timeout=timeout)
+
+    def _find_active(self, job_type: str, dedup_key: Optional[str]) -> Optional[BackgroundJob]:
+        query = BackgroundJob.query.filter(
+            BackgroundJob.job_type == job_type,
+            BackgroundJob.status.in_(ACTIVE_STATUSES)
+        )
+        if dedup_key is not None:
+            query = query.filter(BackgroundJob.dedup_key == dedup_key)
+
+        # 프로세스 재시작 등으로 끝나지 못한 작업은 실패 처리 (새 작업을 막지 않도록)
+        stale_before = _now() - timedelta(minutes=Config.BACKGROUND_JOB_STALE_MINUTES)
+        for job in query.order_by(BackgroundJob.created_at.desc()).all():
+            if job.created_at < stale_before:
+                job.status = 'FAILED'
+                job.error_message = 'Job did not finish (worker restarted?)'
+                job.finished_at = _now()
+                db.session.commit()
+                continue
+            return job
+        return None
+
+    def _run(self, app: Flask, job_id: str, func: Callable[[JobProgress], Optional[Dict]]) -> None:
+        with app.app_context():
+            try:
+                _update_job(job_id, status='RUNNING', started_at=_now())
+                result = func(JobProgress(job_id)) or {}
+                if result.get('success', True):
+                    _update_job(job_id, status='COMPLETED', message=result.get('message'), finished_at=_now())
+                else:
+                    _update_job(job_id, status='FAILED', error_message=result.get('error'), finished_at=_now())
+                logger.info(f"Background job {job_id} finished: {result.get('message') or result.get('error')}")
+            except Exception as e:
+                logger.error(f"Background job {job_id} failed: {e}", exc_info=True)
+                db.session.rollback()
+                _update_job(job_id, status='FAILED', error_message=str(e), finished_at=_now())
+            finally:
+                db.session.remove()
+                with self._lock:
+                    self._futures.pop(job_id, None)
+
+
+def _now() -> datetime:
+    return datetime.now(KST).replace(tzinfo=None)
+
+
+def _update_job(job_id: str, **changes) -> None:
+    try:
+        db.session.query(BackgroundJob).filter(BackgroundJob.id == job_id).update(
+            changes, synchronize_session=False
+        )
+        db.session.commit()
+    except Exception as e:
+        logger.error(f"Failed to update job {job_id}: {e}")
+        db.session.rollback()
+
+
+def get_job(job_id: str) -> Optional[BackgroundJob]:
+    """
+    작업 조회
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        BackgroundJob 또는 None
+    """
+    return db.session.get(BackgroundJob, job_id)
+
+
+def test_email_dedup_key(user_id: int) -> str:
+    """테스트 메일 중복 확인 키 (수신자 기준)"""
+    return f'test_email:user:{user_id}'
+
+
+def make_test_email_job(user_id: int) -> Callable[[JobProgress], Dict]:
+    """
+    테스트 메일 발송 작업 함수 생성
+
+    Args:
+        user_id: 수신 사용자 ID
+
+    Returns:
+        BackgroundJobRunner.enqueue에 넘길 함수
+    """
+    def run(progress: JobProgress) -> Dict:
+        from app.models.models import User
+        from app.services.email_sender import EmailSender
+
+        user = db.session.get(User, user_id)
+        if user is None:
+            return {'success': False, 'error': f'User {user_id} not found'}
+
+        progress.set_total(1)
+        success, error = EmailSender().send_test_email(user)
+        (progress.sent if success else progress.failed)()
+        if success:
+            return {'success': True, 'message': f'테스트 이메일이 {user.email}로 발송되었습니다.'}
+        return {'success': False, 'error': error or '이메일 발송에 실패했습니다.'}
+
+    return run
+
+
+_job_runner: Optional[BackgroundJobRunner] = None
+_job_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> BackgroundJobRunner:
+    """BackgroundJobRunner 싱글톤 반환"""
+    global _job_runner
+    if _job_runner is None:
+        with _job_runner_lock:
+            if _job_runner is None:
+                _job_runner = BackgroundJobRunner()
+    return _job_runner
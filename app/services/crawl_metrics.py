@@ -0,0 +1,274 @@
+"""
+크롤링 파이프라인 계측
+- 티커 1회 실행 단위의 단계별 소요 시간(span) 기록
+- crawl_stage_timings 테이블 저장
+- 단계별 히스토그램 집계 (/metrics, 관리자 페이지)
+"""
+
+import logging
+import math
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func
+
+from app.extensions import db
+from app.models.models import CrawlStageTiming, KST
+from app.utils.metrics import render_histogram
+
+logger = logging.getLogger(__name__)
+
+# 크롤링 단계 히스토그램 버킷 (초)
+STAGE_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0, 60.0, 120.0)
+
+# 전체 실행 시간을 나타내는 단계명
+TOTAL_STAGE = 'total'
+
+_local = threading.local()
+
+
+class CrawlTrace:
+    """티커 1회 크롤링 실행의 단계별 소요 시간"""
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+        self.run_id = uuid.uuid4().hex
+        self.started = time.perf_counter()
+        self.spans: List[Tuple[str, float]] = []
+
+    def add(self, stage: str, seconds: float) -> None:
+        """단계 소요 시간 추가"""
+        self.spans.append((stage, seconds))
+
+    def elapsed(self) -> float:
+        """시작 이후 경과 시간 (초)"""
+        return time.perf_counter() - self.started
+
+    def totals(self) -> Dict[str, float]:
+        """단계별 합계 (재시도 등으로 같은 단계가 여러 번 기록된 경우 합산)"""
+        result: Dict[str, float] = {}
+        for stage, seconds in self.spans:
+            result[stage] = result.get(stage, 0.0) + seconds
+        return result
+
+
+def current_trace() -> Optional[CrawlTrace]:
+    """현재 스레드의 활성 trace"""
+    return getattr(_local, 'trace', None)
+
+
+@contextmanager
+def crawl_trace(ticker: str):
+    """
+    현재 스레드에서 티커 크롤링 trace 시작
+
+    Usage:
+        with crawl_trace('TSLA') as trace:
+            ...
+    """
+    previous = current_trace()
+    trace = CrawlTrace(ticker)
+    _local.trace = trace
+    try:
+        yield trace
+    finally:
+        _local.trace = previous
+
+
+@contextmanager
+def use_trace(trace: Optional[CrawlTrace]):
+    """
+    다른 스레드에서 시작된 trace를 현재 스레드에 연결 (소스 워커 스레드의 단계도 같은 실행에 기록)
+
+    Usage:
+        trace = current_trace()
+        executor.submit(lambda: ...)  # 워커에서: with use_trace(trace): ...
+    """
+    previous = current_trace()
+    _local.trace = trace
+    try:
+        yield trace
+    finally:
+        _local.trace = previous
+
+
+@contextmanager
+def crawl_stage(stage: str):
+    """
+    단계 소요 시간 측정 (활성 trace가 없으면 아무것도 기록하지 않음)
+
+    Usage:
+        with crawl_stage('page_load'):
+            driver.get(url)
+    """
+    trace = current_trace()
+    if trace is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(stage, time.perf_counter() - start)
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """이미 측정된 소요 시간을 활성 trace에 추가 (예: sleep 시간)"""
+    trace = current_trace()
+    if trace is not None:
+        trace.add(stage, seconds)
+
+
+def save_trace(db_session, trace: CrawlTrace, status: str) -> None:
+    """
+    trace를 crawl_stage_timings 테이블에 저장
+
+    Args:
+        db_session: SQLAlchemy 세션
+        trace: CrawlTrace
+        status: 실행 결과 (SUCCESS / PARTIAL / FAILED)
+    """
+    try:
+        now = datetime.now(KST)
+        stages = trace.totals()
+        stages[TOTAL_STAGE] = trace.elapsed()
+
+        for stage, seconds in stages.items():
+            db_session.add(CrawlStageTiming(
+                run_id=trace.run_id,
+                ticker_symbol=trace.ticker,
+                stage=stage,
+                duration_ms=int(round(seconds * 1000)),
+                status=status,
+                recorded_at=now
+            ))
+        db_session.commit()
+
+        logger.debug(
+            f"Crawl timings for {trace.ticker}: "
+            + ', '.join(f"{stage}={seconds:.2f}s" for stage, seconds in stages.items())
+        )
+    except Exception as e:
+        logger.error(f"Failed to save crawl timings: {e}")
+        db_session.rollback()
+
+
+def collect_stage_histograms() -> List[str]:
+    """
+    crawl_stage_timings 테이블을 단계별 히스토그램으로 집계 (Prometheus collector)
+
+    웹/워커 프로세스가 분리되어도 같은 값을 보도록 DB에서 직접 집계한다.
+
+    Returns:
+        Prometheus 텍스트 라인 리스트
+    """
+    name = 'crawl_stage_duration_seconds'
+    lines = [
+        f"# HELP {name} Crawl pipeline stage duration per ticker run",
+        f"# TYPE {name} histogram"
+    ]
+
+    try:
+        bucket_columns = [
+            func.sum(case((CrawlStageTiming.duration_ms <= int(bound * 1000), 1), else_=0))
+            for bound in STAGE_BUCKETS
+        ]
+        rows = db.session.query(
+            CrawlStageTiming.stage,
+            func.count(CrawlStageTiming.id),
+            func.coalesce(func.sum(CrawlStageTiming.duration_ms), 0),
+            *bucket_columns
+        ).group_by(CrawlStageTiming.stage).order_by(CrawlStageTiming.stage).all()
+    except Exception as e:
+        logger.error(f"Failed to aggregate crawl timings: {e}")
+        return lines
+
+    for row in rows:
+        stage, count, total_ms = row[0], row[1], row[2]
+        cumulative = [int(value or 0) for value in row[3:]]
+        lines.extend(render_histogram(
+            name, {'stage': stage}, STAGE_BUCKETS, cumulative, total_ms / 1000.0, count
+        ))
+    return lines
+
+
+def _percentile(sorted_values: List[int], pct: float) -> int:
+    """정렬된 리스트의 백분위 값 (nearest-rank)"""
+    if not sorted_values:
+        return 0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def get_stage_summary(days: int = 7) -> List[Dict]:
+    """
+    단계별 소요 시간 요약 (관리자 페이지용)
+
+    Args:
+        days: 조회 기간 (일)
+
+    Returns:
+        [{'stage', 'count', 'avg_ms', 'p50_ms', 'p95_ms', 'max_ms', 'total_ms'}, ...]
+        (총 소요 시간 내림차순)
+    """
+    cutoff = datetime.now(KST) - timedelta(days=days)
+    rows = db.session.query(CrawlStageTiming.stage, CrawlStageTiming.duration_ms).filter(
+        CrawlStageTiming.recorded_at >= cutoff
+    ).all()
+
+    by_stage: Dict[str, List[int]] = {}
+    for stage, duration_ms in rows:
+        by_stage.setdefault(stage, []).append(duration_ms)
+
+    summary = []
+    for stage, values in by_stage.items():
+        values.sort()
+        summary.append({
+            'stage': stage,
+            'count': len(values),
+            'avg_ms': int(sum(values) / len(values)),
+            'p50_ms': _percentile(values, 50),
+            'p95_ms': _percentile(values, 95),
+            'max_ms': values[-1],
+            'total_ms': sum(values)
+        })
+
+    summary.sort(key=lambda s: (s['stage'] != TOTAL_STAGE, -s['total_ms']))
+    return summary
+
+
+def get_recent_runs(limit: int = 20) -> List[Dict]:
+    """
+    최근 티커 실행별 단계 소요 시간
+
+    Args:
+        limit: 조회할 실행 수
+
+    Returns:
+        [{'run_id', 'ticker', 'status', 'recorded_at', 'stages': {stage: ms}}, ...]
+    """
+    run_ids = [
+        row[0] for row in db.session.query(CrawlStageTiming.run_id).filter(
+            CrawlStageTiming.stage == TOTAL_STAGE
+        ).order_by(CrawlStageTiming.recorded_at.desc()).limit(limit).all()
+    ]
+    if not run_ids:
+        return []
+
+    runs: Dict[str, Dict] = {}
+    for timing in CrawlStageTiming.query.filter(CrawlStageTiming.run_id.in_(run_ids)).all():
+        run = runs.setdefault(timing.run_id, {
+            'run_id': timing.run_id,
+            'ticker': timing.ticker_symbol,
+            'status': timing.status,
+            'recorded_at': timing.recorded_at.isoformat(),
+            'stages': {}
+        })
+        run['stages'][timing.stage] = timing.duration_ms
+
+    return [runs[run_id] for run_id in run_ids if run_id in runs]
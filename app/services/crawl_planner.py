@@ -0,0 +1,221 @@
+"""
+적응형 크롤링 스케줄러 (티커별 주기 계산)
+- CrawlLog / ES 이력으로 티커별 뉴스 발행 속도(velocity) 계산
+- 속도에 반비례하는 다음 크롤링 시각 결정 (최소/최대 주기 범위 내)
+- CRAWL_SCHEDULE_MODE=adaptive 일 때 SchedulerService에서 사용
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.models import CrawlLog, KST
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def _now_kst() -> datetime:
+    """CrawlLog.crawled_at과 비교 가능한 KST 기준 naive datetime"""
+    return datetime.now(KST).replace(tzinfo=None)
+
+
+class AdaptiveCrawlPlanner:
+    """
+    티커별 적응형 크롤링 주기 계산기
+
+    - velocity: 시간당 신규 뉴스 수 (CrawlLog 저장 건수, ES 발행 건수 중 큰 값)
+    - interval: 목표 기사 수 / velocity, [min_interval, max_interval]로 제한
+    - 다음 실행 시각은 프로세스 메모리에 보관하고, 처음 보는 티커는
+      마지막 CrawlLog 기록으로부터 복원한다.
+    """
+
+    def __init__(
+        self,
+        min_interval: Optional[timedelta] = None,
+        max_interval: Optional[timedelta] = None,
+        window_hours: Optional[int] = None,
+        target_articles: Optional[float] = None
+    ):
+        """
+        초기화
+
+        Args:
+            min_interval: 최소 크롤링 주기 (기본: CRAWL_MIN_INTERVAL_MINUTES)
+            max_interval: 최대 크롤링 주기 (기본: CRAWL_MAX_INTERVAL_HOURS)
+            window_hours: velocity 계산 기간 (기본: CRAWL_VELOCITY_WINDOW_HOURS)
+            target_articles: 1회 크롤링당 목표 신규 기사 수
+        """
+        self.min_interval = min_interval or timedelta(minutes=max(Config.CRAWL_MIN_INTERVAL_MINUTES, 1))
+        self.max_interval = max_interval or timedelta(hours=max(Config.CRAWL_MAX_INTERVAL_HOURS, 1))
+        if self.max_interval < self.min_interval:
+            self.max_interval = self.min_interval
+        self.window_hours = max(window_hours or Config.CRAWL_VELOCITY_WINDOW_HOURS, 1)
+        self.target_articles = target_articles or Config.CRAWL_TARGET_ARTICLES_PER_RUN
+
+        self._next_run: Dict[str, datetime] = {}
+        self._intervals: Dict[str, timedelta] = {}
+        self._velocities: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get_velocity(
+        self,
+        db_session: Session,
+        ticker: str,
+        news_storage: Optional[Any] = None,
+        now: Optional[datetime] = None
+    ) -> float:
+        """
+        티커별 뉴스 발행 속도 (건/시간)
+
+        Args:
+            db_session: SQLAlchemy 세션
+            ticker: 티커 심볼
+            news_storage: NewsStorageBackend (없으면 CrawlLog만 사용)
+            now: 기준 시각 (KST naive)
+
+        Returns:
+            시간당 뉴스 수
+        """
+        now = now or _now_kst()
+        window_start = now - timedelta(hours=self.window_hours)
+
+        # 1. CrawlLog: 실제로 새로 저장된 기사 수 (티커 단위 로그만)
+        saved = db_session.query(func.coalesce(func.sum(CrawlLog.news_count), 0)).filter(
+            CrawlLog.ticker_symbol == ticker,
+            CrawlLog.crawled_at >= window_start,
+            CrawlLog.status.in_(['SUCCESS', 'PARTIAL'])
+        ).scalar() or 0
+        log_rate = saved / self.window_hours
+
+        # 2. ES: 발행일 기준 기사 수
+        es_rate = 0.0
+        if news_storage is not None:
+            try:
+                from_date = (datetime.now(timezone.utc) - timedelta(hours=self.window_hours)).isoformat()
+                published = news_storage.count_news(ticker_symbols=[ticker], from_date=from_date)
+                es_rate = published / self.window_hours
+            except Exception as e:
+                logger.debug(f"ES velocity lookup failed for {ticker}: {e}")
+
+        return max(log_rate, es_rate)
+
+    def compute_interval(self, velocity: float) -> timedelta:
+        """
+        velocity로부터 다음 크롤링까지의 주기 계산
+
+        Args:
+            velocity: 시간당 뉴스 수
+
+        Returns:
+            [min_interval, max_interval] 범위의 주기
+        """
+        if velocity <= 0:
+            return self.max_interval
+
+        interval = timedelta(hours=self.target_articles / velocity)
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def _restore_next_run(self, db_session: Session, ticker: str, now: datetime) -> datetime:
+        """마지막 CrawlLog 기록으로 다음 실행 시각 복원 (기록 없으면 즉시 실행)"""
+        last_crawled = db_session.query(func.max(CrawlLog.crawled_at)).filter(
+            CrawlLog.ticker_symbol == ticker
+        ).scalar()
+
+        if last_crawled is None:
+            return datetime.min
+
+        if last_crawled.tzinfo is not None:
+            last_crawled = last_crawled.astimezone(KST).replace(tzinfo=None)
+        velocity = self.get_velocity(db_session, ticker, None, now)
+        self._velocities[ticker] = velocity
+        self._intervals[ticker] = self.compute_interval(velocity)
+        return last_crawled + self._intervals[ticker]
+
+    def get_due_tickers(
+        self,
+        db_session: Session,
+        tickers: List[str],
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        크롤링 시각이 도래한 티커 목록 (가장 오래 밀린 순)
+
+        Args:
+            db_session: SQLAlchemy 세션
+            tickers: 후보 티커 리스트
+            now: 기준 시각 (KST naive)
+
+        Returns:
+            실행 대상 티커 리스트
+        """
+        now = now or _now_kst()
+        due = []
+
+        with self._lock:
+            for ticker in tickers:
+                if ticker not in self._next_run:
+                    self._next_run[ticker] = self._restore_next_run(db_session, ticker, now)
+                if self._next_run[ticker] <= now:
+                    due.append(ticker)
+
+            due.sort(key=lambda t: self._next_run[t])
+
+        return due
+
+    def mark_crawled(
+        self,
+        db_session: Session,
+        ticker: str,
+        news_storage: Optional[Any] = None,
+        now: Optional[datetime] = None
+    ) -> timedelta:
+        """
+        크롤링 완료 후 velocity를 다시 계산하여 다음 실행 시각 갱신
+
+        Args:
+            db_session: SQLAlchemy 세션
+            ticker: 티커 심볼
+            news_storage: NewsStorageBackend (옵션)
+            now: 기준 시각 (KST naive)
+
+        Returns:
+            적용된 주기
+        """
+        now = now or _now_kst()
+        velocity = self.get_velocity(db_session, ticker, news_storage, now)
+        interval = self.compute_interval(velocity)
+
+        with self._lock:
+            self._velocities[ticker] = velocity
+            self._intervals[ticker] = interval
+            self._next_run[ticker] = now + interval
+
+        logger.info(
+            f"Adaptive schedule for {ticker}: {velocity:.2f} news/h -> "
+            f"next crawl in {interval.total_seconds() / 60:.0f} min"
+        )
+        return interval
+
+    def get_schedule(self) -> List[Dict[str, Any]]:
+        """
+        현재 티커별 스케줄 조회 (상태 API용)
+
+        Returns:
+            [{'ticker', 'next_run', 'interval_minutes', 'velocity'}, ...]
+        """
+        with self._lock:
+            return [
+                {
+                    'ticker': ticker,
+                    'next_run': next_run.isoformat() if next_run != datetime.min else None,
+                    'interval_minutes': round(self._intervals[ticker].total_seconds() / 60)
+                    if ticker in self._intervals else None,
+                    'velocity': round(self._velocities.get(ticker, 0.0), 3)
+                }
+                for ticker, next_run in sorted(self._next_run.items(), key=lambda kv: kv[1])
+            ]
@@ -7,11 +7,10 @@
 
 import logging
 import time
-import re
 import random
+import re
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Tuple
-from dateutil import parser as date_parser
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
@@ -28,7 +27,13 @@ from selenium.common.exceptions import (
     StaleElementReferenceException
 )
 
+from app.services.crawl_metrics import crawl_stage, record_stage
+from app.services.resource_blocking import (
+    apply_resource_blocking, build_blocked_patterns, collect_page_stats, record_page_stats
+)
+from app.services.snapshot_store import get_snapshot_store
 from app.utils.config import Config
+from app.utils.date_parser import parse_date
 
 logger = logging.getLogger(__name__)
 
@@ -55,9 +60,131 @@ PROXY_LIST = [
     # 'socks5://proxy3.example.com:1080',
 ]
 
-# 프록시 로테이션을 위한 락
-proxy_lock = threading.Lock()
-proxy_index = 0
+# 페이지 분류 (로딩 직후 DOM/제목으로 판별, fetch_news 조기 중단용)
+PAGE_NORMAL = 'normal'          # 기사 목록 있음
+PAGE_CHALLENGE = 'challenge'    # 캡차/봇 확인 (차단)
+PAGE_CONSENT = 'consent'        # 쿠키/개인정보 동의 화면만 있음
+PAGE_NOT_FOUND = 'not_found'    # 404
+PAGE_EMPTY = 'empty'            # 기사 목록 없음 (아직 렌더링 전이거나 레이아웃 변경)
+
+# 캡차/봇 확인 페이지 표시 (Cloudflare 등)
+CHALLENGE_TITLES = ('just a moment', 'attention required', 'access denied', 'are you a robot', 'security check')
+CHALLENGE_MARKERS = (
+    'challenge-running',
+    'challenge-error-title',
+    'cf-challenge',
+    'cf-turnstile',
+    'g-recaptcha',
+    'h-captcha',
+    'checking if the site connection is secure',
+)
+CONSENT_MARKERS = ('onetrust-banner', 'onetrust-consent', 'consent-accept', 'cookie-consent', 'js-accept-cookies')
+ARTICLE_MARKERS = ('data-test="article-item"', 'articleitem', '<article')
+
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+
+class CrawlBlockedError(Exception):
+    """봇 확인/캡차 페이지로 차단됨 (재시도하지 말고 프록시/요청 간격 백오프)"""
+
+    def __init__(self, message: str, proxy: Optional[str] = None):
+        super().__init__(message)
+        self.proxy = proxy
+
+
+def classify_page(html: Optional[str], title: Optional[str] = None) -> str:
+    """
+    로딩된 페이지 분류
+
+    Args:
+        html: 페이지 HTML
+        title: 문서 제목 (없으면 HTML의 <title>)
+
+    Returns:
+        PAGE_NORMAL / PAGE_CHALLENGE / PAGE_CONSENT / PAGE_NOT_FOUND / PAGE_EMPTY
+    """
+    text = (html or '')[:200000].lower()
+    if title is None:
+        match = _TITLE_RE.search(text[:5000])
+        title = match.group(1) if match else ''
+    title = (title or '').strip().lower()
+
+    if any(marker in title for marker in CHALLENGE_TITLES):
+        return PAGE_CHALLENGE
+    if '404' in title or 'page not found' in title:
+        return PAGE_NOT_FOUND
+    # 정상 페이지에도 로그인용 reCAPTCHA 스크립트가 있을 수 있어 기사 목록을 먼저 확인
+    if any(marker in text for marker in ARTICLE_MARKERS):
+        return PAGE_NORMAL
+    if any(marker in text for marker in CHALLENGE_MARKERS):
+        return PAGE_CHALLENGE
+    if any(marker in text for marker in CONSENT_MARKERS):
+        return PAGE_CONSENT
+    return PAGE_EMPTY
+
+
+def is_challenge_html(html: Optional[str]) -> bool:
+    """
+    봇 확인(캡차) 페이지 여부
+
+    Args:
+        html: 페이지 HTML
+
+    Returns:
+        캡차/봇 확인 페이지이면 True
+    """
+    return bool(html) and classify_page(html) == PAGE_CHALLENGE
+
+
+class BlockBackoff:
+    """
+    차단 감지 후 같은 연결(프록시/직접)로의 요청을 지수 백오프 동안 중단
+
+    ProxyPool은 프록시 선택을, BlockBackoff는 프록시 풀을 거치지 않는
+    CrawlerService 경로(직접 연결)를 포함한 모든 fetch_news 호출을 제한한다.
+    """
+
+    def __init__(self, base_seconds: Optional[float] = None, max_seconds: Optional[float] = None,
+                 clock=time.monotonic):
+        """
+        초기화
+
+        Args:
+            base_seconds: 첫 차단 후 대기 시간 (차단마다 2배, 기본: Config.CRAWL_BLOCK_BACKOFF_SECONDS)
+            max_seconds: 최대 대기 시간 (기본: Config.CRAWL_BLOCK_MAX_BACKOFF_SECONDS)
+            clock: 시간 함수 (테스트용)
+        """
+        self.base_seconds = base_seconds if base_seconds is not None else Config.CRAWL_BLOCK_BACKOFF_SECONDS
+        self.max_seconds = max_seconds if max_seconds is not None else Config.CRAWL_BLOCK_MAX_BACKOFF_SECONDS
+        self.clock = clock
+        self._strikes: Dict[str, int] = {}
+        self._until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record_block(self, proxy: Optional[str]) -> float:
+        """차단 기록, 대기 시간(초) 반환"""
+        key = proxy or 'direct'
+        with self._lock:
+            strikes = self._strikes.get(key, 0) + 1
+            self._strikes[key] = strikes
+            seconds = min(self.base_seconds * 2 ** (strikes - 1), self.max_seconds)
+            self._until[key] = self.clock() + seconds
+        return seconds
+
+    def record_success(self, proxy: Optional[str]) -> None:
+        """정상 페이지 수신 시 백오프 초기화"""
+        key = proxy or 'direct'
+        with self._lock:
+            self._strikes.pop(key, None)
+            self._until.pop(key, None)
+
+    def remaining(self, proxy: Optional[str]) -> float:
+        """남은 대기 시간 (초)"""
+        with self._lock:
+            return max(self._until.get(proxy or 'direct', 0) - self.clock(), 0.0)
+
+
+block_backoff = BlockBackoff()
 
 
 # Investing.com 티커 매핑 (티커 심볼 -> investing.com URL 슬러그)
@@ -155,7 +282,8 @@ class InvestingCrawler:
         headless: bool = True,
         timeout: int = 30,
         user_agent: Optional[str] = None,
-        proxy: Optional[str] = None
+        proxy: Optional[str] = None,
+        block_resources: Optional[bool] = None
     ):
         """
         크롤러 초기화
@@ -165,14 +293,20 @@ class InvestingCrawler:
             timeout: 페이지 로딩 타임아웃 (초)
             user_agent: User-Agent 문자열
             proxy: 프록시 서버 (None이면 사용 안 함)
+            block_resources: 폰트/미디어/광고/트래커 요청 차단 (None이면 Config.CRAWL_RESOURCE_BLOCKING)
         """
         self.headless = headless if Config.HEADLESS is None else Config.HEADLESS
         self.timeout = timeout if Config.CRAWL_TIMEOUT is None else Config.CRAWL_TIMEOUT
         # User-Agent 로테이션 (매번 랜덤 선택)
         self.user_agent = user_agent or Config.USER_AGENT or random.choice(USER_AGENTS)
         self.proxy = proxy
+        self.block_resources = Config.CRAWL_RESOURCE_BLOCKING if block_resources is None else block_resources
         self.driver: Optional[webdriver.Chrome] = None
         self.request_count = 0  # 요청 카운터 (딜레이 조절용)
+        # 마지막 fetch_news 페이지 상태: ok / empty(기사 목록 없음) / blocked(캡차, CrawlBlockedError) / error
+        self.last_page_status: Optional[str] = None
+        # 마지막 페이지의 요청 수/전송량/로딩 시간 (app.services.resource_blocking 참조)
+        self.last_page_stats: Optional[Dict[str, int]] = None
         
         proxy_info = f", proxy={proxy}" if proxy else ""
         logger.info(
@@ -244,6 +378,10 @@ class InvestingCrawler:
                 '''
             })
             
+            # 기사 목록에 필요 없는 리소스 요청 차단 (폰트/미디어/광고/트래커)
+            if self.block_resources:
+                apply_resource_blocking(self.driver, build_blocked_patterns())
+            
             logger.debug("Chrome WebDriver initialized for investing.com")
             
         except WebDriverException as e:
@@ -263,16 +401,19 @@ class InvestingCrawler:
 
     def __enter__(self):
         """Context manager 진입"""
-        self._init_driver()
+        with crawl_stage('init_driver'):
+            self._init_driver()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager 종료"""
-        self._close_driver()
+        with crawl_stage('close_driver'):
+            self._close_driver()
 
     def get_news_url(self, ticker: str) -> str:
         """
         티커에 해당하는 investing.com 뉴스 URL 생성
+        (해석된 경로 -> 정적 매핑 순, 둘 다 없으면 검색 URL - app.services.slug_resolver 참조)
         
         Args:
             ticker: 티커 심볼 (예: TSLA)
@@ -280,28 +421,127 @@ class InvestingCrawler:
         Returns:
             investing.com 뉴스 URL
         """
-        ticker_upper = ticker.upper()
-        
-        # 주식 매핑 확인
-        slug = TICKER_TO_INVESTING_SLUG.get(ticker_upper)
-        if slug:
-            url = f"{self.BASE_URL}/equities/{slug}-news"
+        from app.services.slug_resolver import get_slug_resolver
+
+        news_path = get_slug_resolver().lookup(ticker)
+        if news_path:
+            url = f"{self.BASE_URL}{news_path}"
             logger.debug(f"News URL for {ticker}: {url}")
             return url
         
-        # ETF 매핑 확인
-        etf_slug = TICKER_TO_ETF_SLUG.get(ticker_upper)
-        if etf_slug:
-            url = f"{self.BASE_URL}/etfs/{etf_slug}-news"
-            logger.debug(f"ETF News URL for {ticker}: {url}")
-            return url
-        
         # 매핑이 없는 경우 검색 URL 사용
         url = f"{self.BASE_URL}/search/?q={ticker}&tab=news"
         
         logger.debug(f"News URL for {ticker}: {url}")
         return url
 
+    def resolve_news_url(self, ticker: str) -> Optional[str]:
+        """
+        매핑이 없는 티커의 정식 뉴스 URL을 검색 페이지에서 찾아 저장 (티커당 1회, 실패 시 백오프)
+        
+        Args:
+            ticker: 티커 심볼
+        
+        Returns:
+            뉴스 URL 또는 None
+        """
+        from app.services.slug_resolver import get_slug_resolver
+
+        resolver = get_slug_resolver()
+        if not resolver.needs_resolution(ticker):
+            return None
+        with crawl_stage('resolve_slug'):
+            news_path = resolver.resolve(
+                ticker,
+                lambda url: self.fetch_page_source(url, settle_seconds=2),
+                self.BASE_URL
+            )
+        return f"{self.BASE_URL}{news_path}" if news_path else None
+
+    def classify_current_page(self) -> str:
+        """현재 로딩된 페이지 분류 (classify_page 참조)"""
+        try:
+            title = self.driver.title
+            html = self.driver.page_source
+        except Exception:
+            return PAGE_EMPTY
+        return classify_page(
+            html if isinstance(html, str) else '',
+            title if isinstance(title, str) else None
+        )
+
+    def _check_block_backoff(self) -> None:
+        """차단 후 백오프 중이면 페이지를 열지 않고 중단"""
+        remaining = block_backoff.remaining(self.proxy)
+        if remaining > 0:
+            self.last_page_status = 'blocked'
+            raise CrawlBlockedError(
+                f"Backing off after block ({remaining:.0f}s left, proxy={self.proxy or 'direct'})",
+                proxy=self.proxy
+            )
+
+    def _abort_blocked(self, url: str) -> None:
+        """봇 확인 페이지 수신: 백오프 기록 후 즉시 중단"""
+        self.last_page_status = 'blocked'
+        seconds = block_backoff.record_block(self.proxy)
+        logger.warning(
+            f"Bot challenge page at {url} (proxy={self.proxy or 'direct'}), "
+            f"backing off {seconds:.0f}s"
+        )
+        raise CrawlBlockedError(f"Blocked by bot challenge (proxy={self.proxy or 'direct'})", proxy=self.proxy)
+
+    def get_news_page_url(self, ticker: str, page: int = 1) -> Optional[str]:
+        """
+        뉴스 목록의 N번째 페이지 URL (investing.com: {news_url}/2, /3, ...)
+
+        Args:
+            ticker: 티커 심볼
+            page: 페이지 번호 (1부터)
+
+        Returns:
+            페이지 URL, 페이지 구분이 없는 검색 URL의 2페이지 이후는 None
+        """
+        url = self.get_news_url(ticker)
+        if page <= 1:
+            return url
+        if '/search/' in url:
+            return None
+        return f"{url}/{page}"
+
+    def fetch_page_source(self, url: str, settle_seconds: float = 3) -> str:
+        """
+        URL을 로딩해 HTML 반환 (백필 등 목록 페이지 순회용)
+
+        Args:
+            url: 페이지 URL
+            settle_seconds: 동적 컨텐츠 로딩 대기 시간 (초)
+
+        Returns:
+            페이지 HTML
+        """
+        if not self.driver:
+            raise RuntimeError("WebDriver not initialized. Use context manager.")
+        self._check_block_backoff()
+
+        with crawl_stage('page_load'):
+            self.driver.get(url)
+            WebDriverWait(self.driver, self.timeout).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+
+        if self.classify_current_page() == PAGE_CHALLENGE:
+            self._abort_blocked(url)
+
+        with crawl_stage('settle_wait'):
+            time.sleep(settle_seconds)
+            self._handle_cookie_popup()
+
+        html = self.driver.page_source
+        if classify_page(html) == PAGE_CHALLENGE:
+            self._abort_blocked(url)
+        block_backoff.record_success(self.proxy)
+        return html
+
     def fetch_news(
         self,
         ticker: str,
@@ -326,15 +566,22 @@ class InvestingCrawler:
         if not self.driver:
             raise RuntimeError("WebDriver not initialized. Use context manager.")
         
+        # 차단 후 백오프 중이면 딜레이/페이지 로딩 없이 중단
+        self._check_block_backoff()
+        
         # 요청 전 랜덤 딜레이 (봇 차단 방지)
         if add_delay and self.request_count > 0:
             delay = random.uniform(10, 15)  # 10-15초 랜덤 딜레이
             logger.info(f"Waiting {delay:.1f}s before next request (anti-bot)...")
             time.sleep(delay)
+            record_stage('throttle_wait', delay)
         
         self.request_count += 1
+        self.last_page_status = 'error'
         
         url = self.get_news_url(ticker)
+        if '/search/' in url:
+            url = self.resolve_news_url(ticker) or url
         # hours_ago가 0이면 시간 필터 무시 (아주 오래 전 시간으로 설정)
         if hours_ago <= 0:
             cutoff_time = datetime(1970, 1, 1, tzinfo=timezone.utc)
@@ -345,54 +592,93 @@ class InvestingCrawler:
             logger.info(f"Fetching news for {ticker} from {url}")
             
             # 페이지 로딩
-            try:
-                self.driver.get(url)
-            except Exception as e:
-                logger.warning(f"Page load error for {ticker}: {e}")
-                return []
+            with crawl_stage('page_load'):
+                try:
+                    self.driver.get(url)
+                except Exception as e:
+                    logger.warning(f"Page load error for {ticker}: {e}")
+                    return []
+                
+                # 페이지 로딩 대기 (더 긴 시간)
+                try:
+                    WebDriverWait(self.driver, self.timeout).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "body"))
+                    )
+                except TimeoutException:
+                    logger.warning(f"Timeout waiting for body element: {ticker}")
+                    return []
+
+            # 로딩 직후 페이지 분류 - 차단 페이지면 대기/파싱 없이 즉시 중단
+            page_type = self.classify_current_page()
+            if page_type == PAGE_CHALLENGE:
+                self._abort_blocked(url)
             
-            # 페이지 로딩 대기 (더 긴 시간)
-            try:
-                WebDriverWait(self.driver, self.timeout).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-            except TimeoutException:
-                logger.warning(f"Timeout waiting for body element: {ticker}")
+            # 종목 페이지가 옮겨진 경우 저장된 URL 무효화 (다음 크롤링에서 다시 해석)
+            if page_type == PAGE_NOT_FOUND and '/search/' not in url:
+                from app.services.slug_resolver import get_slug_resolver
+                logger.warning(f"News page not found for {ticker}: {url}")
+                get_slug_resolver().invalidate(ticker)
+                self.last_page_status = 'empty'
                 return []
             
-            # 동적 컨텐츠 로딩 대기 (더 긴 시간)
-            time.sleep(5)
-            
-            # 쿠키 동의 팝업 처리
-            self._handle_cookie_popup()
+            with crawl_stage('settle_wait'):
+                # 동적 컨텐츠 로딩 대기 (더 긴 시간)
+                time.sleep(5)
+                
+                # 쿠키 동의 팝업 처리
+                self._handle_cookie_popup()
+                
+                # 추가 대기 (봇 감지 방지)
+                time.sleep(2)
             
-            # 추가 대기 (봇 감지 방지)
-            time.sleep(2)
+            self._record_page_stats()
             
             # 뉴스 아이템 파싱
-            news_items = self._parse_news_articles(ticker, company_name, cutoff_time, max_articles)
-            if not news_items:
-                # Selenium 셀렉터가 실패하면 HTML 기반 파싱으로 재시도
-                news_items = self._parse_news_articles_bs4(
-                    self.driver.page_source,
-                    ticker,
-                    company_name,
-                    cutoff_time,
-                    max_articles
-                )
-            if not news_items:
-                # 마지막으로 JS DOM 기반 파싱 시도 (ETF 페이지 등 data-test 없는 케이스)
-                news_items = self._parse_news_articles_js(
-                    ticker,
-                    company_name,
-                    cutoff_time,
-                    max_articles
+            with crawl_stage('parse'):
+                news_items = self._parse_news_articles(ticker, company_name, cutoff_time, max_articles)
+                if not news_items:
+                    # Selenium 셀렉터가 실패하면 HTML 기반 파싱으로 재시도
+                    news_items = self._parse_news_articles_bs4(
+                        self.driver.page_source,
+                        ticker,
+                        company_name,
+                        cutoff_time,
+                        max_articles
+                    )
+                if not news_items:
+                    # 마지막으로 JS DOM 기반 파싱 시도 (ETF 페이지 등 data-test 없는 케이스)
+                    news_items = self._parse_news_articles_js(
+                        ticker,
+                        company_name,
+                        cutoff_time,
+                        max_articles
+                    )
+            
+            if news_items:
+                self.last_page_status = 'ok'
+            else:
+                # 대기 중 JS로 봇 확인 화면이 뜬 경우 포함
+                page_type = self.classify_current_page()
+                if page_type == PAGE_CHALLENGE:
+                    self._abort_blocked(url)
+                # 기사는 있으나 모두 기간 밖이면 정상
+                self.last_page_status = 'ok' if page_type == PAGE_NORMAL else 'empty'
+            if self.last_page_status == 'ok':
+                block_backoff.record_success(self.proxy)
+            
+            # 원본 HTML 보관 (파서 수정 후 재크롤링 없이 재파싱 - scripts/replay_snapshots.py)
+            if Config.SNAPSHOT_ENABLED:
+                get_snapshot_store().save(
+                    ticker, url, self.driver.page_source, company_name,
+                    self.last_page_status, len(news_items)
                 )
             
             logger.info(f"Collected {len(news_items)} news items for {ticker} from investing.com")
             
             return news_items
             
+        except CrawlBlockedError:
+            raise
         except TimeoutException:
             logger.error(f"Timeout loading page: {url}")
             return []
@@ -400,6 +686,17 @@ class InvestingCrawler:
             logger.error(f"Error fetching news for {ticker}: {e}", exc_info=True)
             return []
 
+    def _record_page_stats(self) -> None:
+        """현재 페이지 전송량/로딩 시간 기록 (리소스 차단 절감 효과 측정용)"""
+        self.last_page_stats = collect_page_stats(self.driver)
+        if self.last_page_stats:
+            record_page_stats(self.last_page_stats, self.block_resources)
+            logger.debug(
+                f"Page stats: {self.last_page_stats['requests']} requests, "
+                f"{self.last_page_stats['transfer_bytes'] / 1024:.0f} KB, "
+                f"load {self.last_page_stats['load_ms']} ms (resource blocking {'on' if self.block_resources else 'off'})"
+            )
+
     def _handle_cookie_popup(self) -> None:
         """쿠키 동의 팝업 처리"""
         try:
@@ -749,6 +1046,7 @@ class InvestingCrawler:
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """
         날짜 문자열 파싱
+        (ISO/알려진 형식 우선, 상대 시간 정규식, 그 외는 dateutil - app.utils.date_parser 참조)
         
         Args:
             date_str: 날짜 문자열
@@ -759,49 +1057,10 @@ class InvestingCrawler:
         if not date_str:
             return None
         
-        # dateutil.parser 사용
-        try:
-            parsed = date_parser.parse(date_str)
-            # timezone-naive인 경우 UTC로 가정
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            return parsed
-        except (ValueError, TypeError):
-            pass
-        
-        # 상대 시간 파싱 ("2 hours ago", "1 day ago", "Just now")
-        date_str_lower = date_str.lower()
-        
-        if 'just now' in date_str_lower or 'moments ago' in date_str_lower:
-            return datetime.now(timezone.utc)
-        
-        if 'ago' in date_str_lower:
-            try:
-                # 숫자 추출
-                numbers = re.findall(r'\d+', date_str)
-                if not numbers:
-                    return datetime.now(timezone.utc)
-                
-                value = int(numbers[0])
-                
-                if 'second' in date_str_lower:
-                    return datetime.now(timezone.utc) - timedelta(seconds=value)
-                elif 'minute' in date_str_lower:
-                    return datetime.now(timezone.utc) - timedelta(minutes=value)
-                elif 'hour' in date_str_lower:
-                    return datetime.now(timezone.utc) - timedelta(hours=value)
-                elif 'day' in date_str_lower:
-                    return datetime.now(timezone.utc) - timedelta(days=value)
-                elif 'week' in date_str_lower:
-                    return datetime.now(timezone.utc) - timedelta(weeks=value)
-                elif 'month' in date_str_lower:
-                    return datetime.now(timezone.utc) - timedelta(days=value * 30)
-                    
-            except (ValueError, AttributeError):
-                pass
-        
-        logger.debug(f"Could not parse date: {date_str}")
-        return None
+        parsed = parse_date(date_str, source=self.BASE_URL)
+        if parsed is None:
+            logger.debug(f"Could not parse date: {date_str}")
+        return parsed
 
     def crawl_with_retry(
         self,
@@ -847,7 +1106,12 @@ class InvestingCrawler:
                     retry_wait = retry_delay + random.uniform(0, 5)  # 랜덤 추가 딜레이
                     logger.debug(f"Waiting {retry_wait:.1f}s before retry...")
                     time.sleep(retry_wait)
+                    record_stage('retry_wait', retry_wait)
                     
+            except CrawlBlockedError as e:
+                # 차단은 같은 연결로 재시도해도 실패 - 대기 없이 종료 (백오프는 block_backoff가 관리)
+                logger.warning(f"Crawl blocked for {ticker}, not retrying: {e}")
+                return [], str(e)
             except Exception as e:
                 last_error = str(e)
                 logger.warning(
@@ -857,6 +1121,7 @@ class InvestingCrawler:
                 if attempt < max_retries:
                     retry_wait = retry_delay + random.uniform(0, 5)
                     time.sleep(retry_wait)
+                    record_stage('retry_wait', retry_wait)
         
         # 모든 재시도 실패
         error_msg = last_error or "No news found after all retries"
@@ -867,20 +1132,14 @@ class InvestingCrawler:
 
 def get_next_proxy() -> Optional[str]:
     """
-    프록시 로테이션 (스레드 안전)
+    상태 점수 기반 프록시 선택 (사용권 없이 조회만, app.services.proxy_pool 참조)
     
     Returns:
         다음 프록시 주소 또는 None
     """
-    global proxy_index
-    
-    if not PROXY_LIST:
-        return None
-    
-    with proxy_lock:
-        proxy = PROXY_LIST[proxy_index % len(PROXY_LIST)]
-        proxy_index += 1
-        return proxy
+    from app.services.proxy_pool import get_proxy_pool
+
+    return get_proxy_pool().choose()
 
 
 def crawl_single_stock(
@@ -892,6 +1151,7 @@ def crawl_single_stock(
 ) -> Tuple[str, List[Dict[str, str]], Optional[str]]:
     """
     단일 종목 크롤링 (멀티스레드용)
+    - use_proxy이면 프록시 풀에서 사용권을 받아 실행하고 결과(성공/차단/실패)를 기록
     
     Args:
         ticker: 티커 심볼
@@ -903,9 +1163,14 @@ def crawl_single_stock(
     Returns:
         (티커, 뉴스 리스트, 에러 메시지)
     """
-    proxy = get_next_proxy() if use_proxy else None
-    
+    from app.services.proxy_pool import get_proxy_pool
+
+    lease = None
     try:
+        if use_proxy:
+            lease = get_proxy_pool().acquire()
+        proxy = lease.proxy if lease else None
+
         with InvestingCrawler(proxy=proxy) as crawler:
             articles = crawler.fetch_news(
                 ticker, 
@@ -914,17 +1179,32 @@ def crawl_single_stock(
                 max_articles=max_articles,
                 add_delay=False  # 멀티스레드에서는 딜레이 불필요
             )
+            page_status = crawler.last_page_status
+
+        if lease:
+            if page_status in ('empty', 'error'):
+                lease.failure()
+            else:
+                lease.success()
+
+        # 메타데이터 추가
+        for article in articles:
+            article['symbol'] = ticker
+            article['ticker'] = ticker
+            article['company_name'] = company_name
+        
+        logger.info(f"[{ticker}] Successfully crawled {len(articles)} articles")
+        return ticker, articles, None
             
-            # 메타데이터 추가
-            for article in articles:
-                article['symbol'] = ticker
-                article['ticker'] = ticker
-                article['company_name'] = company_name
-            
-            logger.info(f"[{ticker}] Successfully crawled {len(articles)} articles")
-            return ticker, articles, None
-            
+    except CrawlBlockedError as e:
+        # 프록시 격리 (다른 스레드는 다른 프록시로)
+        if lease:
+            lease.blocked()
+        logger.warning(f"[{ticker}] Crawling blocked: {e}")
+        return ticker, [], str(e)
     except Exception as e:
+        if lease:
+            lease.failure()
         error_msg = str(e)
         logger.error(f"[{ticker}] Crawling failed: {error_msg}")
         return ticker, [], error_msg
@@ -993,6 +1273,14 @@ def batch_crawl_parallel(
         f"from {len([r for r in results.values() if r])} successful stocks"
     )
     
+    if use_proxy:
+        from app.services.proxy_pool import get_proxy_pool
+        for state in get_proxy_pool().snapshot():
+            logger.info(
+                f"Proxy {state['proxy']}: health={state['health']}, success={state['successes']}, "
+                f"failed={state['failures']}, blocked={state['blocks']}, quarantine={state['quarantined_seconds']}s"
+            )
+    
     return results
 
 
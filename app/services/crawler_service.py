@@ -1,8 +1,9 @@
 """
 크롤링 오케스트레이션 서비스
-- 크롤러 실행 조율
+- 크롤러 실행 조율 (SourceCoordinator: 소스별 동시 실행 예산, 소스 간 URL 중복 제거)
 - 중복 체크 및 ES 저장
 - crawl_logs 기록
+- 단계별 소요 시간 계측 (crawl_stage_timings)
 """
 
 import logging
@@ -12,33 +13,41 @@ from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 
 from app.models.models import CrawlLog, StockMaster
-from app.services.crawler import InvestingCrawler
-from app.services.news_storage import NewsStorageAdapter
+from app.services.crawl_metrics import crawl_trace, crawl_stage, save_trace
+from app.services.news_storage import NewsStorageBackend
 from app.services.news_analyzer import NewsAnalyzer
+from app.services.news_sources import SourceCoordinator, get_source_coordinator
 
 logger = logging.getLogger(__name__)
 
 
+class NewsSaveError(Exception):
+    """저장소가 배치 전체를 저장하지 못함 (소스 상태를 반영하지 않고 다음 수집에서 다시 받음)"""
+
+
 class CrawlerService:
     """크롤링 오케스트레이션 서비스"""
 
     def __init__(
         self,
         db_session: Session,
-        news_storage: NewsStorageAdapter,
-        news_analyzer: Optional[NewsAnalyzer] = None
+        news_storage: NewsStorageBackend,
+        news_analyzer: Optional[NewsAnalyzer] = None,
+        coordinator: Optional[SourceCoordinator] = None
     ):
         """
         초기화
         
         Args:
             db_session: SQLAlchemy 세션
-            news_storage: NewsStorageAdapter 인스턴스
+            news_storage: 뉴스 저장소 (NewsStorageAdapter / SQLiteNewsStorage)
             news_analyzer: NewsAnalyzer 인스턴스 (옵션)
+            coordinator: 소스 코디네이터 (옵션, 기본: get_source_coordinator())
         """
         self.db = db_session
         self.storage = news_storage
         self.analyzer = news_analyzer or NewsAnalyzer()
+        self.coordinator = coordinator or get_source_coordinator()
         logger.info("CrawlerService initialized with analyzer")
 
     def crawl_ticker(
@@ -58,6 +67,18 @@ class CrawlerService:
         Returns:
             결과 딕셔너리 {'status': ..., 'count': ..., 'error': ...}
         """
+        with crawl_trace(ticker) as trace:
+            result = self._crawl_ticker(ticker, hours_ago, max_retries)
+            save_trace(self.db, trace, result.get('status'))
+        return result
+
+    def _crawl_ticker(
+        self,
+        ticker: str,
+        hours_ago: int,
+        max_retries: int
+    ) -> Dict[str, any]:
+        """crawl_ticker 본문 (계측 trace 내부에서 실행)"""
         # stock_master에서 회사명 조회
         stock = self.db.query(StockMaster).filter_by(
             ticker_symbol=ticker
@@ -73,34 +94,46 @@ class CrawlerService:
         logger.info(f"Starting crawl for {ticker} ({company_name})")
         
         try:
-            # Investing.com에서 뉴스 수집
-            with InvestingCrawler() as crawler:
-                news_items, error = crawler.crawl_with_retry(
-                    ticker=ticker,
-                    company_name=company_name,
-                    hours_ago=hours_ago,
-                    max_retries=max_retries
-                )
+            # 활성 소스 동시 수집 (Investing.com 브라우저, RSS/Atom 피드 ...)
+            collected = self.coordinator.collect(
+                ticker=ticker,
+                company_name=company_name,
+                hours_ago=hours_ago,
+                max_retries=max_retries
+            )
+            news_items = collected['items']
+            error = '; '.join(
+                f"{name}: {message}" for name, message in collected['errors'].items()
+            ) or None
             
             if error:
                 logger.warning(
                     f"Crawl completed with errors for {ticker}: {error}"
                 )
-                self._save_crawl_log(ticker, 'PARTIAL', len(news_items), error)
+                # 실패한 소스가 있어도 다른 소스의 기사는 저장
+                count = (
+                    self.save_news_items(ticker, news_items, company_name)
+                    if news_items else 0
+                )
+                self.coordinator.commit(ticker)
+                self._save_crawl_log(ticker, 'PARTIAL', count, error)
                 return {
                     'status': 'PARTIAL',
-                    'count': len(news_items),
+                    'count': count,
                     'error': error
                 }
             
             # 빈 결과
             if not news_items:
                 logger.info(f"No news found for {ticker}")
+                self.coordinator.commit(ticker)
                 self._save_crawl_log(ticker, 'SUCCESS', 0, None)
                 return {'status': 'SUCCESS', 'count': 0, 'error': None}
             
             # 중복 제거 및 저장
-            saved_count = self._save_news_items(ticker, news_items, company_name)
+            saved_count = self.save_news_items(ticker, news_items, company_name)
+            # 저장 성공 후에만 소스 상태(피드 ETag 등) 반영
+            self.coordinator.commit(ticker)
             
             logger.info(
                 f"Crawl completed for {ticker}: "
@@ -173,7 +206,7 @@ class CrawlerService:
         
         return results
 
-    def _save_news_items(
+    def save_news_items(
         self,
         ticker: str,
         news_items: List[Dict[str, str]],
@@ -189,6 +222,9 @@ class CrawlerService:
         
         Returns:
             저장된 개수
+
+        Raises:
+            NewsSaveError: 저장소가 배치 전체를 저장하지 못한 경우
         """
         if not news_items:
             return 0
@@ -202,7 +238,8 @@ class CrawlerService:
                 urls.append(src)
         
         if urls:
-            existing_urls = self.storage.check_duplicates(urls, ticker)
+            with crawl_stage('dedup'):
+                existing_urls = self.storage.check_duplicates(urls, ticker)
             logger.debug(
                 f"Found {len(existing_urls)} existing URLs out of {len(urls)}"
             )
@@ -235,19 +272,23 @@ class CrawlerService:
         
         # Phase 4: 뉴스 분석 (다국어 요약 + 감성 분석)
         logger.info(f"Analyzing {len(unique_items)} news items for {ticker}")
-        analyzed_items = self.analyzer.batch_analyze(unique_items)
+        with crawl_stage('analyze'):
+            analyzed_items = self.analyzer.batch_analyze(unique_items)
         
         if not analyzed_items:
             logger.warning(f"No items analyzed successfully for {ticker}")
             return 0
         
         # bulk 저장
-        result = self.storage.bulk_save_news(analyzed_items)
+        with crawl_stage('store'):
+            result = self.storage.bulk_save_news(analyzed_items)
         saved_count = result.get('success', 0)
+        if result.get('failed') and not saved_count:
+            raise NewsSaveError(f"Failed to save {result['failed']} news items: {result.get('errors')}")
         
         logger.info(
             f"Saved {saved_count}/{len(news_items)} news items for {ticker} "
-            f"({len(news_items) - saved_count} duplicates or failed analysis)"
+            f"({len(news_items) - saved_count} duplicates, skipped by triage or failed analysis)"
         )
         
         return saved_count
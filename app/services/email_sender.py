@@ -16,6 +16,7 @@ from flask import render_template
 
 from app.utils.config import Config
 from app.models.models import User, UserSetting, EmailLog, KST
+from app.services.news_analyzer import fill_missing_summaries
 from app.extensions import db
 
 logger = logging.getLogger(__name__)
@@ -32,7 +33,8 @@ class EmailSender:
         smtp_server: Optional[str] = None,
         smtp_port: Optional[int] = None,
         username: Optional[str] = None,
-        password: Optional[str] = None
+        password: Optional[str] = None,
+        use_tls: Optional[bool] = None
     ):
         """
         초기화
@@ -42,11 +44,13 @@ class EmailSender:
             smtp_port: SMTP 포트
             username: Gmail 사용자명
             password: Gmail 앱 비밀번호
+            use_tls: STARTTLS 사용 여부 (기본: GMAIL_SMTP_USE_TLS)
         """
         self.smtp_server = smtp_server or Config.GMAIL_SMTP_SERVER
         self.smtp_port = smtp_port or Config.GMAIL_SMTP_PORT
         self.username = username or Config.GMAIL_USERNAME
         self.password = password or Config.GMAIL_APP_PASSWORD
+        self.use_tls = Config.GMAIL_SMTP_USE_TLS if use_tls is None else use_tls
         
         if not self.username or not self.password:
             logger.warning("Gmail credentials not configured")
@@ -98,8 +102,9 @@ class EmailSender:
                 # SMTP 연결 및 발송
                 with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
                     server.ehlo()
-                    server.starttls()
-                    server.ehlo()
+                    if self.use_tls:
+                        server.starttls()
+                        server.ehlo()
                     server.login(self.username, self.password)
                     server.sendmail(
                         self.username,
@@ -183,6 +188,12 @@ class EmailSender:
                     else:
                         neutral_count += 1
             
+            # 분석 시 생성하지 않은 언어 요약은 발송 전에 생성 (저장소 문서에 캐시)
+            fill_missing_summaries(
+                [news for news_list in news_by_stock.values() for news in news_list],
+                [language]
+            )
+            
             # HTML 렌더링
             html_content = self._render_report_template(
                 user=user,
@@ -309,10 +320,13 @@ class EmailSender:
                     color = '#999'
                     label = '중립'
                 
-                # 언어별 요약 가져오기
+                # 언어별 요약 가져오기 (사용자 언어 -> ko -> 있는 요약, report.html과 같은 순서)
                 summary = news.get('summary', {})
                 if isinstance(summary, dict):
-                    summary_text = summary.get(language, summary.get('ko', '요약 없음'))
+                    summary_text = (
+                        summary.get(language) or summary.get('ko')
+                        or next((text for text in summary.values() if text), '요약 없음')
+                    )
                 else:
                     summary_text = str(summary)
                 
@@ -0,0 +1,373 @@
+"""
+RSS/Atom 피드 뉴스 수집
+- 티커별 피드 URL(Config.NEWS_FEED_URLS 템플릿)을 연결 풀을 유지하는 HTTP 세션으로 조회
+- ETag/Last-Modified를 저장해 조건부 요청 (변경 없는 피드는 304 응답, 본문 전송/파싱 없음)
+  새 검증자는 항목 저장 성공 후(commit)에만 반영 -> 저장 실패 시 다음 수집에서 본문을 다시 받음
+- 항목을 InvestingCrawler와 같은 딕셔너리 형태로 정규화 -> CrawlerService.save_news_items로 저장
+  (브라우저 페이지 로드 수십 초 대신 요청 1회 수십 ms)
+- SourceCoordinator의 HTTP 비용 소스('feed')로 실행
+"""
+
+import calendar
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import feedparser
+import requests
+from bs4 import BeautifulSoup
+from flask import has_app_context
+from requests.adapters import HTTPAdapter
+
+from app.extensions import db
+from app.models.models import FeedState, KST
+from app.services.crawl_metrics import crawl_stage
+from app.services.news_sources import COST_HTTP, NewsSource
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def parse_feed_entries(
+    content: bytes,
+    ticker: str,
+    company_name: Optional[str] = None,
+    cutoff_time: Optional[datetime] = None,
+    max_entries: int = 100
+) -> List[Dict[str, str]]:
+    """
+    RSS/Atom 본문을 뉴스 딕셔너리 리스트로 변환
+
+    Args:
+        content: 피드 원문 (bytes - 문자열을 넘기면 feedparser가 URL로 해석할 수 있음)
+        ticker: 티커 심볼
+        company_name: 회사명 (기본: 티커)
+        cutoff_time: 이 시각(aware) 이전 항목 제외
+        max_entries: 최대 항목 수
+
+    Returns:
+        [{'title', 'content', 'source_url', 'source_name', 'date', 'ticker', 'company_name'}, ...]
+    """
+    if not content:
+        return []
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    parsed = feedparser.parse(content)
+    if parsed.bozo and not parsed.entries:
+        logger.warning(f"Malformed feed for {ticker}: {parsed.get('bozo_exception')}")
+        return []
+
+    feed_title = (parsed.feed.get('title') or '').strip()
+    news_items: List[Dict[str, str]] = []
+    seen_urls = set()
+
+    for entry in parsed.entries:
+        if len(news_items) >= max_entries:
+            break
+
+        title = _strip_html(entry.get('title', ''))
+        url = (entry.get('link') or '').strip()
+        if not title or not url or url in seen_urls:
+            continue
+
+        # feedparser는 published/updated를 UTC struct_time으로 정규화
+        published = entry.get('published_parsed') or entry.get('updated_parsed')
+        parsed_date = (
+            datetime.fromtimestamp(calendar.timegm(published), tz=timezone.utc) if published else None
+        )
+        if parsed_date and cutoff_time and parsed_date < cutoff_time:
+            continue
+
+        source = entry.get('source') or {}
+        seen_urls.add(url)
+        news_items.append({
+            'title': title,
+            'content': _strip_html(entry.get('summary', '')),
+            'source_url': url,
+            'source_name': (source.get('title') or feed_title or 'RSS').strip(),
+            'date': (parsed_date or datetime.now(timezone.utc)).isoformat(),
+            'ticker': ticker,
+            'company_name': company_name or ticker
+        })
+
+    return news_items
+
+
+def _strip_html(text: str) -> str:
+    """요약의 HTML 태그/엔티티 제거"""
+    if not text:
+        return ''
+    if '<' not in text and '&' not in text:
+        return text.strip()
+    return BeautifulSoup(text, 'lxml').get_text(' ', strip=True)
+
+
+class FeedNewsSource(NewsSource):
+    """티커별 RSS/Atom 피드 조건부 조회 (스레드 안전)"""
+
+    name = 'feed'
+    cost_class = COST_HTTP
+
+    def __init__(
+        self,
+        feed_urls: Optional[List[str]] = None,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[float] = None,
+        pool_size: Optional[int] = None
+    ):
+        """
+        초기화
+
+        Args:
+            feed_urls: 피드 URL 템플릿 목록 ({ticker} 치환, 기본: Config.NEWS_FEED_URLS)
+            session: HTTP 세션 (기본: 연결 풀 세션 생성)
+            timeout: 요청 타임아웃 초 (기본: Config.NEWS_FEED_TIMEOUT)
+            pool_size: 호스트별 연결 풀 크기 (기본: Config.NEWS_FEED_POOL_SIZE)
+        """
+        if feed_urls is None:
+            feed_urls = [u.strip() for u in Config.NEWS_FEED_URLS.split(',') if u.strip()]
+        self.feed_url_templates = feed_urls
+        self.timeout = timeout or Config.NEWS_FEED_TIMEOUT
+        self.session = session or self._create_session(pool_size or Config.NEWS_FEED_POOL_SIZE)
+        self.min_interval = Config.NEWS_FEED_MIN_INTERVAL
+        # 앱 컨텍스트 밖(단독 실행)에서도 같은 프로세스 안에서는 조건부 요청 유지
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # 200 응답의 새 검증자 (티커 -> URL -> (ETag, Last-Modified)), commit 전까지 보류
+        self._pending: Dict[str, Dict[str, Tuple[Optional[str], Optional[str]]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': Config.USER_AGENT,
+            'Accept': 'application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8'
+        })
+        return session
+
+    def feed_urls(self, ticker: str) -> List[str]:
+        """
+        티커의 피드 URL 목록
+
+        Args:
+            ticker: 티커 심볼
+
+        Returns:
+            URL 리스트
+        """
+        return [template.format(ticker=ticker.upper()) for template in self.feed_url_templates]
+
+    def enabled(self) -> bool:
+        """NEWS_FEED_ENABLED일 때만 실행"""
+        return Config.NEWS_FEED_ENABLED
+
+    def fetch(self, ticker: str, company_name: str, hours_ago: int, max_retries: int = 1) -> List[bytes]:
+        """
+        티커의 모든 피드 본문 조회 (변경 없는 피드는 304로 건너뜀)
+
+        Args:
+            ticker: 티커 심볼
+            company_name: 회사명
+            hours_ago: 최근 N시간
+            max_retries: 사용하지 않음 (다음 수집 주기에 다시 조회)
+
+        Returns:
+            새로 받은 피드 본문 리스트
+        """
+        # 이전 수집의 저장이 실패해 commit되지 않은 검증자는 버림
+        with self._lock:
+            self._pending.pop(ticker.upper(), None)
+        contents = []
+        for url in self.feed_urls(ticker):
+            content = self.fetch_feed(url, ticker.upper())
+            if content:
+                contents.append(content)
+        return contents
+
+    def parse(self, raw: List[bytes], ticker: str, company_name: str, hours_ago: int) -> List[Dict[str, str]]:
+        """
+        피드 본문들을 뉴스 딕셔너리로 변환 (피드 간 URL 중복 제거)
+
+        Args:
+            raw: fetch 결과
+            ticker: 티커 심볼
+            company_name: 회사명
+            hours_ago: 최근 N시간 항목만
+
+        Returns:
+            뉴스 딕셔너리 리스트
+        """
+        ticker = ticker.upper()
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+        news_items: List[Dict[str, str]] = []
+        seen_urls = set()
+
+        for content in raw:
+            with crawl_stage('feed_parse'):
+                entries = parse_feed_entries(content, ticker, company_name, cutoff_time)
+            for item in entries:
+                if item['source_url'] not in seen_urls:
+                    seen_urls.add(item['source_url'])
+                    news_items.append(item)
+
+        logger.info(f"Feed poll for {ticker}: {len(news_items)} entries")
+        return news_items
+
+    def poll(
+        self,
+        ticker: str,
+        company_name: Optional[str] = None,
+        hours_ago: int = 6
+    ) -> List[Dict[str, str]]:
+        """
+        피드 조회 + 정규화 + 검증자 반영 (단독 실행/스크립트용, 항목 저장은 호출자 책임)
+
+        Args:
+            ticker: 티커 심볼
+            company_name: 회사명
+            hours_ago: 최근 N시간 항목만
+
+        Returns:
+            뉴스 딕셔너리 리스트
+        """
+        items = self.collect(ticker, company_name, hours_ago)
+        self.commit(ticker)
+        return items
+
+    def fetch_feed(self, url: str, ticker: str) -> Optional[bytes]:
+        """
+        조건부 GET으로 피드 원문 조회 (200 응답의 새 검증자는 commit 때 반영)
+
+        Args:
+            url: 피드 URL
+            ticker: 티커 심볼
+
+        Returns:
+            피드 본문 (304/오류 시 None)
+        """
+        etag, last_modified = self._get_validators(url)
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        try:
+            with crawl_stage('feed_fetch'):
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.warning(f"Feed request failed for {ticker} ({url}): {e}")
+            self._save_state(url, ticker, None, etag, last_modified, failed=True)
+            return None
+
+        if response.status_code == 304:
+            logger.debug(f"Feed not modified for {ticker}: {url}")
+            self._save_state(url, ticker, 304, etag, last_modified)
+            return None
+
+        if response.status_code != 200:
+            logger.warning(f"Feed returned HTTP {response.status_code} for {ticker}: {url}")
+            self._save_state(url, ticker, response.status_code, etag, last_modified, failed=True)
+            return None
+
+        # 항목 저장 전까지는 이전 검증자 유지 (저장 실패 시 다음 조회에서 본문을 다시 받음)
+        self._save_state(url, ticker, 200, etag, last_modified)
+        with self._lock:
+            self._pending.setdefault(ticker, {})[url] = (
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
+            )
+        return response.content
+
+    def commit(self, ticker: str) -> None:
+        """
+        항목 저장 성공 후 보류 중인 검증자 반영 (메모리 + feed_states)
+
+        Args:
+            ticker: 티커 심볼
+        """
+        ticker = ticker.upper()
+        with self._lock:
+            pending = self._pending.pop(ticker, {})
+            self._validators.update(pending)
+        if not pending or not has_app_context():
+            return
+        try:
+            for url, (etag, last_modified) in pending.items():
+                row = db.session.get(FeedState, url)
+                if row is None:
+                    row = FeedState(feed_url=url, ticker_symbol=ticker, failure_count=0)
+                    db.session.add(row)
+                row.etag = etag
+                row.last_modified = last_modified
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Failed to save feed validators for {ticker}: {e}")
+            db.session.rollback()
+
+    def close(self) -> None:
+        """HTTP 세션 종료 (연결 풀 반환)"""
+        self.session.close()
+
+    def _get_validators(self, url: str) -> Tuple[Optional[str], Optional[str]]:
+        cached = self._validators.get(url)
+        if cached is not None:
+            return cached
+
+        if has_app_context():
+            try:
+                row = db.session.get(FeedState, url)
+                if row is not None:
+                    validators = (row.etag, row.last_modified)
+                    with self._lock:
+                        self._validators[url] = validators
+                    return validators
+            except Exception as e:
+                logger.debug(f"feed_states lookup failed for {url}: {e}")
+                db.session.rollback()
+        return None, None
+
+    def _save_state(
+        self,
+        url: str,
+        ticker: str,
+        status: Optional[int],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        failed: bool = False
+    ) -> None:
+        with self._lock:
+            self._validators[url] = (etag, last_modified)
+
+        if not has_app_context():
+            return
+        try:
+            row = db.session.get(FeedState, url)
+            if row is None:
+                row = FeedState(feed_url=url, ticker_symbol=ticker, failure_count=0)
+                db.session.add(row)
+            row.etag = etag
+            row.last_modified = last_modified
+            row.last_status = status
+            row.last_polled_at = datetime.now(KST).replace(tzinfo=None)
+            row.failure_count = row.failure_count + 1 if failed else 0
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Failed to save feed state for {url}: {e}")
+            db.session.rollback()
+
+
+_feed_source: Optional[FeedNewsSource] = None
+
+
+def get_feed_source() -> FeedNewsSource:
+    """FeedNewsSource 싱글톤 반환"""
+    global _feed_source
+    if _feed_source is None:
+        _feed_source = FeedNewsSource()
+    return _feed_source
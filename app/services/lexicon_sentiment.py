@@ -0,0 +1,251 @@
+"""
+렉시콘 기반 오프라인 감성 분석
+- 금융 뉴스용 가중치 사전(단어/구)을 첫 토큰 기준 구 사전으로 컴파일해 토큰 단위 최장 일치로 한 번에 매칭
+  (토큰 단위라 'cut'이 'execute'에 매칭되지 않음)
+- 부정어(not, no, fails to ...) 뒤 NEGATION_WINDOW 토큰 안의 용어는 극성 반전 (문장 부호/but에서 초기화)
+- 제목 매칭은 TITLE_WEIGHT배 가중
+- score_batch: 여러 기사의 매칭 결과를 평탄한 배열로 모아 NumPy bincount/벡터 연산으로 한 번에 집계
+- OpenAI 실패 시 fallback, API 키가 없을 때의 감성 분석, 분석 전 사전 필터에 사용
+"""
+
+import logging
+import math
+import re
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 용어 -> 가중치 (양수: 호재, 음수: 악재). 구는 단어보다 먼저 매칭됨
+FINANCIAL_LEXICON: Dict[str, float] = {
+    # 실적/가이던스
+    'beat': 2.0, 'beats': 2.0, 'topped': 2.0, 'tops': 2.0,
+    'beat estimates': 3.0, 'beats estimates': 3.0, 'beat expectations': 3.0, 'beats expectations': 3.0,
+    'better than expected': 2.5, 'better-than-expected': 2.5,
+    'miss': -2.0, 'misses': -2.0, 'missed': -2.0,
+    'missed estimates': -3.0, 'misses estimates': -3.0, 'missed expectations': -3.0, 'misses expectations': -3.0,
+    'worse than expected': -2.5, 'worse-than-expected': -2.5,
+    'raises guidance': 3.0, 'raised guidance': 3.0, 'raises outlook': 3.0, 'raised outlook': 3.0,
+    'raises forecast': 3.0, 'raised forecast': 3.0,
+    'cuts guidance': -3.0, 'cut guidance': -3.0, 'lowers guidance': -3.0, 'lowered guidance': -3.0,
+    'cuts forecast': -3.0, 'cut forecast': -3.0, 'lowers forecast': -3.0, 'lowered forecast': -3.0,
+    'cuts outlook': -3.0, 'lowers outlook': -3.0, 'profit warning': -3.0,
+    'record revenue': 2.5, 'record profit': 2.5, 'record quarter': 2.0,
+    'profit': 1.0, 'profitable': 1.5, 'growth': 1.5, 'grew': 1.0, 'strong': 1.5, 'robust': 1.5, 'solid': 1.0,
+    'loss': -1.5, 'losses': -1.5, 'net loss': -2.0, 'weak': -1.5, 'weaker': -1.5, 'weakness': -1.5,
+    'shortfall': -2.0, 'slowdown': -1.5, 'headwinds': -1.5,
+    # 주가 움직임
+    'surge': 2.0, 'surges': 2.0, 'surged': 2.0, 'soar': 2.5, 'soars': 2.5, 'soared': 2.5,
+    'jump': 2.0, 'jumps': 2.0, 'jumped': 2.0, 'rally': 2.0, 'rallies': 2.0, 'rallied': 2.0,
+    'rise': 1.0, 'rises': 1.0, 'rose': 1.0, 'gain': 1.0, 'gains': 1.0, 'gained': 1.0,
+    'climb': 1.0, 'climbs': 1.0, 'climbed': 1.0, 'rebound': 1.5, 'rebounds': 1.5, 'rebounded': 1.5,
+    'record high': 2.5, 'all-time high': 2.5, '52-week high': 2.0,
+    'plunge': -2.5, 'plunges': -2.5, 'plunged': -2.5, 'tumble': -2.0, 'tumbles': -2.0, 'tumbled': -2.0,
+    'slump': -2.0, 'slumps': -2.0, 'slumped': -2.0, 'sink': -2.0, 'sinks': -2.0, 'sank': -2.0,
+    'crash': -3.0, 'crashes': -3.0, 'crashed': -3.0, 'sell-off': -2.0, 'selloff': -2.0,
+    'fall': -1.0, 'falls': -1.0, 'fell': -1.0, 'drop': -1.0, 'drops': -1.0, 'dropped': -1.0,
+    'decline': -1.0, 'declines': -1.0, 'declined': -1.0, 'slide': -1.0, 'slides': -1.0, 'slid': -1.0,
+    'record low': -2.5, '52-week low': -2.0,
+    # 애널리스트
+    'upgrade': 2.0, 'upgrades': 2.0, 'upgraded': 2.0, 'outperform': 1.5, 'overweight': 1.5,
+    'buy rating': 1.5, 'price target raised': 2.0, 'raises price target': 2.0, 'raised price target': 2.0,
+    'downgrade': -2.0, 'downgrades': -2.0, 'downgraded': -2.0, 'underperform': -1.5, 'underweight': -1.5,
+    'sell rating': -1.5, 'price target cut': -2.0, 'cuts price target': -2.0, 'lowers price target': -2.0,
+    # 기업 이벤트
+    'buyback': 1.5, 'share repurchase': 1.5, 'dividend increase': 2.0, 'raises dividend': 2.0,
+    'dividend cut': -2.5, 'cuts dividend': -2.5, 'suspends dividend': -2.5,
+    'approval': 1.5, 'approved': 1.5, 'wins': 1.5, 'won': 1.0, 'partnership': 1.0, 'expands': 1.0,
+    'breakthrough': 2.0, 'boost': 1.5, 'boosts': 1.5, 'boosted': 1.5,
+    'layoffs': -2.0, 'job cuts': -2.0, 'cuts jobs': -2.0, 'recall': -2.0, 'recalls': -2.0,
+    'lawsuit': -2.0, 'sued': -2.0, 'probe': -1.5, 'investigation': -1.5, 'fraud': -3.0, 'fine': -1.0,
+    'fined': -2.0, 'penalty': -1.5, 'bankruptcy': -3.5, 'chapter 11': -3.5, 'default': -2.5,
+    'going concern': -3.0, 'delisting': -3.0, 'halted': -1.5, 'scandal': -2.5, 'resigns': -1.0,
+    'warns': -1.5, 'warning': -1.5, 'concerns': -1.0, 'risk': -0.5, 'risks': -0.5,
+    'delay': -1.0, 'delays': -1.0, 'delayed': -1.0,
+}
+
+# 뒤따르는 용어의 극성을 뒤집는 부정어
+NEGATIONS = (
+    'not', 'no', 'never', 'without', 'neither', 'nor', 'cannot', "can't", "won't", "isn't", "aren't",
+    "wasn't", "weren't", "doesn't", "don't", "didn't", 'fails to', 'failed to', 'fail to', 'unable to',
+    'lack of', 'hardly',
+)
+# 부정 범위를 끝내는 토큰
+CLAUSE_BREAKS = ('.', ';', ':', '!', '?', 'but', 'however', 'although', 'though')
+_CLAUSE_BREAKS = frozenset(CLAUSE_BREAKS)
+
+NEGATION_WINDOW = 3  # 부정어 뒤 몇 토큰까지 반전할지
+NEGATION_FACTOR = -0.75  # 부정된 용어 가중치 배수
+TITLE_WEIGHT = 2.0  # 제목 매칭 가중치 배수
+NORMALIZATION_ALPHA = 15.0  # raw / sqrt(raw^2 + alpha) -> -1 ~ 1
+NEUTRAL_THRESHOLD = 0.1  # |compound| 미만이면 neutral
+
+
+# 토큰: 단어(하이픈/아포스트로피 포함) 또는 절 구분 문장 부호
+_TOKEN_RE = re.compile(r"[\w'-]+|[.;:!?]")
+
+_TERM = 'term'
+_NEGATION = 'neg'
+
+
+class LexiconSentimentAnalyzer:
+    """가중치 사전 기반 감성 분석기 (스레드 안전 - 컴파일 후 상태 없음)"""
+
+    def __init__(
+        self,
+        lexicon: Optional[Dict[str, float]] = None,
+        negation_window: int = NEGATION_WINDOW,
+        use_numpy: Optional[bool] = None
+    ):
+        """
+        초기화
+
+        Args:
+            lexicon: 용어 -> 가중치 (기본: FINANCIAL_LEXICON)
+            negation_window: 부정어 뒤 반전 범위 (토큰 수)
+            use_numpy: 배치 집계에 NumPy 사용 여부 (False면 순수 파이썬 - 결과 비교용)
+        """
+        lexicon = FINANCIAL_LEXICON if lexicon is None else lexicon
+        self.terms: List[str] = sorted({' '.join(term.lower().split()) for term in lexicon})
+        self._term_ids = {term: index for index, term in enumerate(self.terms)}
+        self.weights: List[float] = [0.0] * len(self.terms)
+        for term, weight in lexicon.items():
+            self.weights[self._term_ids[' '.join(term.lower().split())]] = float(weight)
+        self.negation_window = negation_window
+        self.use_numpy = True if use_numpy is None else use_numpy
+        self._weight_array = np.asarray(self.weights, dtype=np.float64) if self.use_numpy else None
+        self._phrases = self._compile()
+
+    def _compile(self) -> Dict[str, List[Tuple[Tuple[str, ...], str, int]]]:
+        """
+        용어/부정어를 첫 토큰 기준 구 사전으로 컴파일 (토큰 단위 최장 일치 - 텍스트를 한 번만 훑음)
+
+        Returns:
+            첫 토큰 -> [(구 토큰 튜플, 종류, 용어 id), ...] (긴 구 우선)
+        """
+        phrases: Dict[str, List[Tuple[Tuple[str, ...], str, int]]] = {}
+        entries = [(tuple(term.split()), _TERM, term_id) for term, term_id in self._term_ids.items()]
+        entries += [(tuple(negation.split()), _NEGATION, -1) for negation in NEGATIONS]
+        for tokens, kind, term_id in entries:
+            phrases.setdefault(tokens[0], []).append((tokens, kind, term_id))
+        for candidates in phrases.values():
+            candidates.sort(key=lambda candidate: len(candidate[0]), reverse=True)
+        return phrases
+
+    def _scan(self, text: str) -> List[Tuple[int, float]]:
+        """
+        텍스트의 매칭 용어 목록
+
+        Returns:
+            [(용어 id, 배수), ...] - 배수는 부정 시 NEGATION_FACTOR, 아니면 1
+        """
+        tokens = _TOKEN_RE.findall(text.lower().replace('\u2019', "'"))
+        hits = []
+        negated_until = -1
+        position = 0
+        while position < len(tokens):
+            token = tokens[position]
+            matched = None
+            for candidate in self._phrases.get(token, ()):
+                length = len(candidate[0])
+                if length == 1 or tuple(tokens[position:position + length]) == candidate[0]:
+                    matched = candidate
+                    break
+            if matched is None:
+                if token in _CLAUSE_BREAKS:
+                    negated_until = -1
+                position += 1
+                continue
+
+            phrase, kind, term_id = matched
+            if kind == _NEGATION:
+                negated_until = position + len(phrase) - 1 + self.negation_window
+            else:
+                hits.append((term_id, NEGATION_FACTOR if position <= negated_until else 1.0))
+            position += len(phrase)
+        return hits
+
+    def _classify(self, compound: float) -> Dict:
+        if compound >= NEUTRAL_THRESHOLD:
+            classification = 'positive'
+        elif compound <= -NEUTRAL_THRESHOLD:
+            classification = 'negative'
+        else:
+            classification = 'neutral'
+        return {
+            'classification': classification,
+            'score': int(max(-10, min(10, round(compound * 10)))),
+            'compound': compound
+        }
+
+    def score_batch(self, titles: Sequence[str], contents: Optional[Sequence[str]] = None) -> List[Dict]:
+        """
+        여러 기사 감성 점수
+
+        Args:
+            titles: 제목 리스트
+            contents: 본문 리스트 (titles와 같은 길이, 없으면 제목만)
+
+        Returns:
+            [{'classification': 'positive'|'negative'|'neutral', 'score': -10~10, 'compound': -1.0~1.0}, ...]
+        """
+        count = len(titles)
+        if contents is not None and len(contents) != count:
+            raise ValueError("titles and contents must have the same length")
+
+        doc_ids: List[int] = []
+        term_ids: List[int] = []
+        factors: List[float] = []
+        for index in range(count):
+            for text, weight in ((titles[index], TITLE_WEIGHT), (contents[index] if contents else None, 1.0)):
+                if not text:
+                    continue
+                for term_id, factor in self._scan(text):
+                    doc_ids.append(index)
+                    term_ids.append(term_id)
+                    factors.append(factor * weight)
+
+        if self.use_numpy:
+            contributions = self._weight_array[np.asarray(term_ids, dtype=np.int64)] * np.asarray(factors)
+            raw = np.bincount(np.asarray(doc_ids, dtype=np.int64), weights=contributions, minlength=count)
+            compounds = (raw / np.sqrt(raw * raw + NORMALIZATION_ALPHA)).tolist()
+        else:
+            raw = [0.0] * count
+            for doc_id, term_id, factor in zip(doc_ids, term_ids, factors):
+                raw[doc_id] += self.weights[term_id] * factor
+            compounds = [value / math.sqrt(value * value + NORMALIZATION_ALPHA) for value in raw]
+
+        return [self._classify(compound) for compound in compounds]
+
+    def score(self, title: str, content: Optional[str] = None) -> Dict:
+        """
+        단일 기사 감성 점수
+
+        Args:
+            title: 제목
+            content: 본문
+
+        Returns:
+            score_batch 항목과 같은 형식
+        """
+        return self.score_batch([title or ''], [content or ''])[0]
+
+    def matched_terms(self, text: str) -> List[Tuple[str, float]]:
+        """디버깅용: 매칭된 (용어, 적용 가중치) 목록"""
+        return [(self.terms[term_id], self.weights[term_id] * factor) for term_id, factor in self._scan(text or '')]
+
+
+_lexicon_analyzer: Optional[LexiconSentimentAnalyzer] = None
+_lexicon_lock = threading.Lock()
+
+
+def get_lexicon_sentiment() -> LexiconSentimentAnalyzer:
+    """LexiconSentimentAnalyzer 싱글톤 반환 (정규식 컴파일은 한 번만)"""
+    global _lexicon_analyzer
+    if _lexicon_analyzer is None:
+        with _lexicon_lock:
+            if _lexicon_analyzer is None:
+                _lexicon_analyzer = LexiconSentimentAnalyzer()
+    return _lexicon_analyzer
@@ -4,22 +4,105 @@
 - 호재/악재 감성 분석
 - FR-018~020 구현
 - SRS v1.1: analyzed_date, metadata 필드 추가
+- 요약 언어: 분석 시 종목 구독자 언어만 생성, 나머지는 fill_missing_summaries로 조회 시 생성
 """
 
+import copy
 import logging
 import json
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
 from datetime import datetime, timezone
 
+from flask import has_app_context
+
 try:
     from openai import OpenAI
 except ImportError:
     OpenAI = None
 
+from app.extensions import db
+from app.services.lexicon_sentiment import get_lexicon_sentiment
+from app.services.news_dedup import (
+    NearDuplicateIndex, cluster_fingerprints, fingerprint_item, get_near_duplicate_index
+)
+from app.services.news_storage import get_news_storage
+from app.services.news_triage import ROUTE_FULL, ROUTE_LIGHT, ROUTE_SKIP, RelevanceTriage
 from app.utils.config import Config
+from app.utils.metrics import get_metrics_registry
 
 logger = logging.getLogger(__name__)
 
+# 요약 언어 (UserSetting.language 값)
+SUMMARY_LANGUAGES = ('ko', 'en', 'es', 'ja')
+LANGUAGE_NAMES = {'ko': 'Korean', 'en': 'English', 'es': 'Spanish', 'ja': 'Japanese'}
+LANGUAGE_LABELS = {
+    'ko': 'Korean (한국어)',
+    'en': 'English',
+    'es': 'Spanish (Español)',
+    'ja': 'Japanese (日本語)',
+}
+
+# 출력 토큰 예산 (감성 JSON / 언어당 2~3문장 요약)
+SENTIMENT_COMPLETION_TOKENS = 160
+SUMMARY_COMPLETION_TOKENS = 160
+
+
+def normalize_languages(languages: Optional[Iterable[str]] = None) -> tuple:
+    """
+    요약 언어 정규화 (지원 언어만, SUMMARY_LANGUAGES 순서)
+    
+    Args:
+        languages: 언어 코드 목록 (None이면 전체 언어)
+    
+    Returns:
+        언어 코드 튜플
+    """
+    if languages is None:
+        return SUMMARY_LANGUAGES
+    requested = {language for language in languages if language}
+    return tuple(language for language in SUMMARY_LANGUAGES if language in requested)
+
+
+def get_subscriber_languages(tickers: Iterable[str]) -> Dict[str, tuple]:
+    """
+    종목별 구독자(활성 사용자) 요약 언어
+    
+    NEWS_SUMMARY_LAZY_ENABLED가 꺼져 있거나 DB를 조회할 수 없으면 전체 언어,
+    구독자가 없는 종목은 NEWS_SUMMARY_DEFAULT_LANGUAGE만 반환한다.
+    
+    Args:
+        tickers: 티커 목록
+    
+    Returns:
+        티커 -> 언어 코드 튜플
+    """
+    tickers = sorted({ticker for ticker in tickers if ticker})
+    if not Config.NEWS_SUMMARY_LAZY_ENABLED or not has_app_context():
+        return {ticker: SUMMARY_LANGUAGES for ticker in tickers}
+    
+    from app.models.models import User, UserSetting, UserStock
+    
+    try:
+        rows = (
+            db.session.query(UserStock.ticker_symbol, UserSetting.language)
+            .join(User, User.id == UserStock.user_id)
+            .outerjoin(UserSetting, UserSetting.user_id == UserStock.user_id)
+            .filter(UserStock.ticker_symbol.in_(tickers), User.is_active.is_(True))
+            .distinct()
+            .all()
+        )
+    except Exception as e:
+        logger.error(f"Failed to load subscriber languages: {e}")
+        db.session.rollback()
+        return {ticker: SUMMARY_LANGUAGES for ticker in tickers}
+    
+    subscribed = {ticker: set() for ticker in tickers}
+    for ticker, language in rows:
+        # 설정이 없는 사용자는 기본 언어(ko)
+        subscribed[ticker].add(language or 'ko')
+    default = normalize_languages([Config.NEWS_SUMMARY_DEFAULT_LANGUAGE]) or ('ko',)
+    return {ticker: normalize_languages(languages) or default for ticker, languages in subscribed.items()}
+
 
 class NewsAnalyzer:
     """
@@ -27,14 +110,27 @@ class NewsAnalyzer:
     ChatGPT API를 사용한 다국어 요약 및 감성 분석
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        dedup_index: Optional[NearDuplicateIndex] = None,
+        triage: Optional[RelevanceTriage] = None
+    ):
         """
         초기화
         
         Args:
             api_key: OpenAI API 키 (없으면 환경변수에서 로드)
+            dedup_index: 유사 중복 클러스터 인덱스 (기본: NEWS_DEDUP_ENABLED면 프로세스 공용 인덱스)
+            triage: 관련도 분류기 (기본: NEWS_TRIAGE_ENABLED면 Config 임계값으로 생성)
         """
         self.api_key = api_key or Config.OPENAI_API_KEY
+        self.dedup_index = dedup_index
+        if self.dedup_index is None and Config.NEWS_DEDUP_ENABLED:
+            self.dedup_index = get_near_duplicate_index()
+        self.triage = triage
+        if self.triage is None and Config.NEWS_TRIAGE_ENABLED:
+            self.triage = RelevanceTriage()
         self.model = Config.OPENAI_MODEL or "gpt-4o-mini"
         # gpt-5 계열은 빈 응답 사례가 있어 기본 모델로 강제
         if self.model.startswith("gpt-5"):
@@ -49,7 +145,7 @@ class NewsAnalyzer:
             self.client = None
         else:
             try:
-                self.client = OpenAI(api_key=self.api_key)
+                self.client = OpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL or None)
                 logger.info("NewsAnalyzer initialized with OpenAI client")
             except Exception as e:
                 logger.error(f"Failed to initialize OpenAI client: {e}")
@@ -60,7 +156,9 @@ class NewsAnalyzer:
         title: str,
         content: str,
         ticker: str,
-        company_name: Optional[str] = None
+        company_name: Optional[str] = None,
+        languages: Optional[Iterable[str]] = None,
+        fallback: bool = True
     ) -> Optional[Dict]:
         """
         뉴스 분석 수행
@@ -70,9 +168,12 @@ class NewsAnalyzer:
             content: 뉴스 본문
             ticker: 티커 심볼
             company_name: 회사명 (옵션)
+            languages: 생성할 요약 언어 (기본: 전체 - ko/en/es/ja)
+            fallback: API 미사용/실패 시 기본 분석 반환 (False면 None 반환)
         
         Returns:
-            분석 결과 딕셔너리:
+            분석 결과 딕셔너리 (summary에는 요청한 언어만, API 미사용/실패 시 원문 언어 en만
+            또는 fallback=False면 None):
             {
                 'summary': {
                     'ko': '한국어 요약',
@@ -87,11 +188,12 @@ class NewsAnalyzer:
             }
         """
         if not self.client:
-            logger.error("OpenAI client not available")
-            return self._generate_fallback_analysis(title, content)
+            logger.debug("OpenAI client not available - using lexicon sentiment")
+            return self._generate_fallback_analysis(title, content) if fallback else None
         
+        languages = normalize_languages(languages)
         try:
-            prompt = self._build_prompt(title, content, ticker, company_name)
+            prompt = self._build_prompt(title, content, ticker, company_name, languages)
             
             logger.debug(f"Analyzing news for {ticker}: {title[:50]}...")
             
@@ -107,7 +209,8 @@ class NewsAnalyzer:
                         "content": prompt
                     }
                 ],
-                max_completion_tokens=800   # 4개 언어 요약 + 감성
+                # 출력 토큰이 지연/비용을 좌우하므로 요청 언어 수만큼만
+                max_completion_tokens=SENTIMENT_COMPLETION_TOKENS + SUMMARY_COMPLETION_TOKENS * len(languages)
             )
             
             # 응답 파싱
@@ -124,21 +227,12 @@ class NewsAnalyzer:
                 logger.warning(
                     f"Empty response from ChatGPT (model={response.model}, finish_reason={finish_reason}, usage={usage})"
                 )
-                return self._generate_fallback_analysis(title, content)
+                return self._generate_fallback_analysis(title, content) if fallback else None
             
-            # 마크다운 코드 블록 제거 (```json ... ```)
-            result_text = result_text.strip()
-            if result_text.startswith('```'):
-                # 첫 번째 줄 제거 (```json)
-                lines = result_text.split('\n')
-                if len(lines) > 2:
-                    # 마지막 줄 제거 (```)
-                    result_text = '\n'.join(lines[1:-1])
-            
-            result = json.loads(result_text)
+            result = json.loads(self._strip_code_fence(result_text))
             
             # 검증
-            validated = self._validate_result(result)
+            validated = self._validate_result(result, languages)
             
             if validated:
                 logger.info(
@@ -149,21 +243,97 @@ class NewsAnalyzer:
                 return validated
             else:
                 logger.warning(f"Invalid analysis result for {ticker}")
-                return self._generate_fallback_analysis(title, content)
+                return self._generate_fallback_analysis(title, content) if fallback else None
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse ChatGPT response: {e}")
-            return self._generate_fallback_analysis(title, content)
+            return self._generate_fallback_analysis(title, content) if fallback else None
         except Exception as e:
             logger.error(f"Analysis failed for {ticker}: {e}", exc_info=True)
-            return self._generate_fallback_analysis(title, content)
+            return self._generate_fallback_analysis(title, content) if fallback else None
+
+    @staticmethod
+    def _strip_code_fence(text: str) -> str:
+        """마크다운 코드 블록 제거 (```json ... ```)"""
+        text = text.strip()
+        if text.startswith('```'):
+            # 첫 번째 줄 제거 (```json)
+            lines = text.split('\n')
+            if len(lines) > 2:
+                # 마지막 줄 제거 (```)
+                text = '\n'.join(lines[1:-1])
+        return text
+
+    def summarize(
+        self,
+        title: str,
+        content: str,
+        ticker: str,
+        company_name: Optional[str] = None,
+        languages: Optional[Iterable[str]] = None
+    ) -> Dict[str, str]:
+        """
+        요약만 생성 (감성 분석 없음 - 분석 시 생성하지 않은 언어를 조회 시 채울 때 사용)
+        
+        Args:
+            title: 뉴스 제목
+            content: 뉴스 본문
+            ticker: 티커 심볼
+            company_name: 회사명 (옵션)
+            languages: 생성할 요약 언어
+        
+        Returns:
+            {언어: 요약} (API 미설정/실패 시 빈 딕셔너리)
+        """
+        languages = normalize_languages(languages)
+        if not self.client or not languages:
+            return {}
+        
+        stock_info = f"{ticker} ({company_name})" if company_name else f"{ticker}"
+        content = content or ''
+        if len(content) > 2000:
+            content = content[:2000] + "..."
+        summary_keys = ',\n'.join(f'  "summary_{language}": "..."' for language in languages)
+        prompt = f"""You are a professional stock market analyst. Summarize the following news article:
+
+{self._summary_instructions(languages)}
+
+News Article:
+Title: {title}
+Content: {content}
+Stock: {stock_info}
+
+Please provide the response in JSON format:
+{{
+{summary_keys}
+}}"""
+        
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": "You are a professional stock market analyst."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_completion_tokens=SUMMARY_COMPLETION_TOKENS * len(languages)
+            )
+            result = json.loads(self._strip_code_fence(response.choices[0].message.content or ''))
+            summary = {
+                language: (result.get(f'summary_{language}') or '').strip()
+                for language in languages
+            }
+            return {language: text for language, text in summary.items() if text}
+        except Exception as e:
+            logger.error(f"Summary generation failed for {ticker} ({', '.join(languages)}): {e}")
+            return {}
 
     def _build_prompt(
         self,
         title: str,
         content: str,
         ticker: str,
-        company_name: Optional[str]
+        company_name: Optional[str],
+        languages: Optional[Iterable[str]] = None
     ) -> str:
         """
         ChatGPT 프롬프트 생성 (FR-020)
@@ -173,10 +343,12 @@ class NewsAnalyzer:
             content: 뉴스 본문
             ticker: 티커 심볼
             company_name: 회사명
+            languages: 요약 언어 (기본: 전체)
         
         Returns:
             프롬프트 문자열
         """
+        languages = normalize_languages(languages)
         stock_info = f"{ticker}"
         if company_name:
             stock_info += f" ({company_name})"
@@ -186,13 +358,13 @@ class NewsAnalyzer:
         if len(content) > max_content_length:
             content = content[:max_content_length] + "..."
         
+        summary_items = self._summary_instructions(languages)
+        summary_keys = ''.join(f'  "summary_{language}": "...",\n' for language in languages)
+        
         prompt = f"""You are a professional stock market analyst. Analyze the following news article and provide:
 
-1. Summary in Korean (한국어): A natural and fluent summary in Korean (2-3 sentences)
-2. Summary in English: A natural and fluent summary in English (2-3 sentences)
-3. Summary in Spanish (Español): A natural and fluent summary in Spanish (2-3 sentences)
-4. Summary in Japanese (日本語): A natural and fluent summary in Japanese (2-3 sentences)
-5. Sentiment Analysis:
+{summary_items}
+{len(languages) + 1}. Sentiment Analysis:
    - Classification: Positive (호재) / Negative (악재) / Neutral (중립)
    - Score: -10 to +10 (-10: very negative, 0: neutral, +10: very positive)
 
@@ -203,11 +375,7 @@ Stock: {stock_info}
 
 Please provide the response in JSON format:
 {{
-  "summary_ko": "...",
-  "summary_en": "...",
-  "summary_es": "...",
-  "summary_ja": "...",
-  "sentiment": {{
+{summary_keys}  "sentiment": {{
     "classification": "Positive/Negative/Neutral",
     "score": 0
   }}
@@ -215,29 +383,39 @@ Please provide the response in JSON format:
         
         return prompt
 
-    def _validate_result(self, result: Dict) -> Optional[Dict]:
+    @staticmethod
+    def _summary_instructions(languages: tuple) -> str:
+        """요약 언어별 번호 목록"""
+        return '\n'.join(
+            f"{number}. Summary in {LANGUAGE_LABELS[language]}: "
+            f"A natural and fluent summary in {LANGUAGE_NAMES[language]} (2-3 sentences)"
+            for number, language in enumerate(languages, 1)
+        )
+
+    def _validate_result(self, result: Dict, languages: Optional[Iterable[str]] = None) -> Optional[Dict]:
         """
         분석 결과 검증
         
         Args:
             result: ChatGPT 응답
+            languages: 요청한 요약 언어 (기본: 전체)
         
         Returns:
             검증된 결과 또는 None
         """
         try:
             # 필수 필드 확인
-            summary_ko = result.get('summary_ko', '').strip()
-            summary_en = result.get('summary_en', '').strip()
-            summary_es = result.get('summary_es', '').strip()
-            summary_ja = result.get('summary_ja', '').strip()
+            summary = {
+                language: (result.get(f'summary_{language}') or '').strip()
+                for language in normalize_languages(languages)
+            }
             
             sentiment = result.get('sentiment', {})
             classification = sentiment.get('classification', '').strip()
             score = sentiment.get('score')
             
             # 검증
-            if not all([summary_ko, summary_en, summary_es, summary_ja]):
+            if not all(summary.values()):
                 logger.warning("Missing summary in one or more languages")
                 return None
             
@@ -259,12 +437,7 @@ Please provide the response in JSON format:
                 score = 0
             
             return {
-                'summary': {
-                    'ko': summary_ko,
-                    'en': summary_en,
-                    'es': summary_es,
-                    'ja': summary_ja
-                },
+                'summary': summary,
                 'sentiment': {
                     'classification': classification,
                     'score': score
@@ -281,7 +454,10 @@ Please provide the response in JSON format:
         content: str
     ) -> Dict:
         """
-        API 실패 시 기본 분석 생성
+        API 실패/API 키 미설정 시 기본 분석 생성 (요약: 제목 + 첫 문장, 감성: 렉시콘)
+        
+        요약은 원문 언어(en)로만 기록한다 - 다른 언어 키에 영어 원문을 넣으면 fill_missing_summaries가
+        번역 요약이 있는 것으로 보고 생성하지 않는다.
         
         Args:
             title: 뉴스 제목
@@ -300,34 +476,16 @@ Please provide the response in JSON format:
         
         logger.debug("Using fallback analysis")
         
-        # 간단한 키워드 기반 감성 (제목+본문)
-        text_lower = f"{title} {content}".lower()
-        positive_keywords = ['beat', 'growth', 'surge', 'gain', 'soar', 'strong', 'record', 'upgrade', 'outperform', 'buy']
-        negative_keywords = ['miss', 'drop', 'fall', 'decline', 'loss', 'down', 'weak', 'cut', 'downgrade', 'sell', 'bankruptcy']
-        score = 0
-        for kw in positive_keywords:
-            if kw in text_lower:
-                score += 1
-        for kw in negative_keywords:
-            if kw in text_lower:
-                score -= 1
-        if score > 0:
-            classification = 'positive'
-        elif score < 0:
-            classification = 'negative'
-        else:
-            classification = 'neutral'
+        # 렉시콘 기반 감성 (제목 가중, 부정어 반영)
+        sentiment = get_lexicon_sentiment().score(title, content)
 
         return {
             'summary': {
-                'ko': fallback_summary,
-                'en': fallback_summary,
-                'es': fallback_summary,
-                'ja': fallback_summary
+                'en': fallback_summary
             },
             'sentiment': {
-                'classification': classification,
-                'score': score
+                'classification': sentiment['classification'],
+                'score': sentiment['score']
             }
         }
 
@@ -338,6 +496,13 @@ Please provide the response in JSON format:
         """
         뉴스 배치 분석
         
+        관련도 분류(NEWS_TRIAGE_ENABLED)로 GPT 전체 분석 / 제목 기반 로컬 분석 / 건너뜀을 먼저 나눈다.
+        건너뛴 기사는 결과에 포함되지 않는다 (저장 안 함).
+        
+        유사 중복 기사(통신사 기사가 여러 URL/티커로 수집된 경우)는 클러스터로 묶어 대표 기사 1건만 분석하고
+        요약/감성을 나머지 기사에 복사한다. 지문을 만들 수 있는 기사(단어 NEWS_DEDUP_MIN_TOKENS개 이상)에는
+        cluster_id를 기록한다 (UI에서 같은 기사 묶어 표시).
+        
         Args:
             news_items: 뉴스 리스트
                 [{
@@ -350,57 +515,206 @@ Please provide the response in JSON format:
                 }, ...]
         
         Returns:
-            분석 결과가 추가된 뉴스 리스트 (SRS v1.1 필드 포함)
+            분석 결과가 추가된 뉴스 리스트 (SRS v1.1 필드 포함, 입력 순서 유지)
         """
         if not news_items:
             return []
         
         logger.info(f"Batch analyzing {len(news_items)} news items")
         
-        analyzed = []
+        routes = {ROUTE_FULL: [], ROUTE_LIGHT: [], ROUTE_SKIP: []}
+        relevance = {}
+        if self.triage is not None:
+            for index, decision in enumerate(self.triage.route_batch(news_items)):
+                routes[decision['route']].append(index)
+                relevance[index] = decision['score']
+            counter = get_metrics_registry().counter(
+                'news_triage_items_total',
+                'News items routed by relevance triage before analysis',
+                ('route',)
+            )
+            for route, indexes in routes.items():
+                if indexes:
+                    counter.inc(len(indexes), route=route)
+        else:
+            routes[ROUTE_FULL] = list(range(len(news_items)))
+        
+        analyzed_ids = self._analyze_full(news_items, routes[ROUTE_FULL], relevance)
+        analyzed_ids.update(self._analyze_light(news_items, routes[ROUTE_LIGHT], relevance))
+        
+        analyzed = [item for index, item in enumerate(news_items) if index in analyzed_ids]
+        logger.info(
+            f"Batch analysis completed: {len(analyzed)}/{len(news_items)} successful "
+            f"(triage: {len(routes[ROUTE_FULL])} full, {len(routes[ROUTE_LIGHT])} light, "
+            f"{len(routes[ROUTE_SKIP])} skipped)"
+        )
+        
+        return analyzed
+
+    def _analyze_full(self, news_items: List[Dict], indexes: List[int], relevance: Dict[int, float]) -> set:
+        """
+        GPT 전체 분석 (유사 중복 클러스터당 1회, 요약은 종목 구독자 언어만)
+        
+        Args:
+            news_items: 배치 전체
+            indexes: 전체 분석할 기사 인덱스
+            relevance: 인덱스 -> 관련도 점수
         
-        for item in news_items:
+        Returns:
+            분석에 성공한 인덱스 집합
+        """
+        if not indexes:
+            return set()
+        
+        languages_by_ticker = get_subscriber_languages(news_items[i].get('ticker') for i in indexes)
+        
+        if self.dedup_index is not None:
+            fingerprints = [fingerprint_item(news_items[i]) for i in indexes]
+            clusters = [
+                [indexes[position] for position in members]
+                for members in cluster_fingerprints(fingerprints, self.dedup_index.max_distance)
+            ]
+            fingerprint_of = dict(zip(indexes, fingerprints))
+        else:
+            clusters = [[i] for i in indexes]
+            fingerprint_of = {}
+        
+        analyzed_ids = set()
+        api_calls = 0
+        shared = 0
+        
+        for members in clusters:
+            # 본문이 가장 긴 기사를 대표로 분석
+            representative_index = max(members, key=lambda i: len(news_items[i].get('content') or ''))
+            representative = news_items[representative_index]
+            member_fingerprints = [
+                fingerprint_of[i] for i in [representative_index] + [i for i in members if i != representative_index]
+                if fingerprint_of.get(i) is not None
+            ]
+            
+            # 클러스터 멤버 종목 구독자 언어의 합집합 (나머지 언어는 조회 시 생성)
+            languages = normalize_languages(
+                language
+                for i in members
+                for language in languages_by_ticker.get(news_items[i].get('ticker'), SUMMARY_LANGUAGES)
+            )
+            
+            entry, owner = None, True
+            if member_fingerprints:
+                entry, owner = self.dedup_index.claim(member_fingerprints)
+            
             try:
-                content = item.get('content', '')
-                
-                analysis = self.analyze_news(
-                    title=item.get('title', ''),
-                    content=content,
-                    ticker=item.get('ticker', ''),
-                    company_name=item.get('company_name')
-                )
-                
-                if analysis:
-                    # 분석 결과 추가
-                    item['summary'] = analysis['summary']
-                    item['sentiment'] = analysis['sentiment']
-                    
-                    # SRS v1.1: analyzed_date, metadata 필드 추가
-                    item['analyzed_date'] = datetime.now(timezone.utc).isoformat()
-                    item['metadata'] = {
-                        'word_count': len(content.split()) if content else 0,
-                        'language': 'en',  # 원문 언어 (기본: 영어)
-                        'gpt_model': Config.OPENAI_MODEL
-                    }
-                    
-                    analyzed.append(item)
-                else:
-                    logger.warning(
-                        f"Analysis failed for: {item.get('title', 'N/A')}"
+                analysis = None
+                called = False
+                if not owner:
+                    # 다른 배치/티커 스레드가 분석했거나 분석 중인 기사
+                    analysis = entry.wait(Config.NEWS_DEDUP_WAIT_SECONDS)
+                if analysis is None:
+                    analysis = self.analyze_news(
+                        title=representative.get('title', ''),
+                        content=representative.get('content', ''),
+                        ticker=representative.get('ticker', ''),
+                        company_name=representative.get('company_name'),
+                        languages=languages,
+                        fallback=False
                     )
-                    
+                    api_calls += 1
+                    called = True
+                    if owner and entry is not None:
+                        # 모델 결과만 공유 - 기본 분석을 공유하면 윈도우 동안 같은 기사가 다시 분석되지 않음
+                        if analysis:
+                            entry.resolve(analysis)
+                        else:
+                            self.dedup_index.release(entry)
+                    if not analysis:
+                        analysis = self._generate_fallback_analysis(
+                            representative.get('title', ''), representative.get('content', '')
+                        )
             except Exception as e:
                 logger.error(
                     f"Error analyzing item: {e}",
                     exc_info=True
                 )
+                if owner and entry is not None:
+                    self.dedup_index.release(entry)
                 continue
+            
+            if not analysis:
+                logger.warning(
+                    f"Analysis failed for: {representative.get('title', 'N/A')}"
+                )
+                continue
+            
+            cluster_id = entry.cluster_id if entry is not None else None
+            for index in members:
+                self._apply_analysis(news_items[index], analysis, cluster_id, ROUTE_FULL, relevance.get(index))
+                analyzed_ids.add(index)
+            shared += len(members) - 1 if called else len(members)
         
-        logger.info(
-            f"Batch analysis completed: {len(analyzed)}/{len(news_items)} successful"
+        counter = get_metrics_registry().counter(
+            'news_analysis_items_total',
+            'News items analyzed, by whether the analysis was shared from a near-duplicate',
+            ('result',)
         )
+        counter.inc(len(analyzed_ids) - shared, result='analyzed')
+        if shared:
+            counter.inc(shared, result='shared')
+        logger.debug(f"Full analysis: {api_calls} analyzed, {shared} shared from near-duplicates")
         
-        return analyzed
+        return analyzed_ids
+
+    def _analyze_light(self, news_items: List[Dict], indexes: List[int], relevance: Dict[int, float]) -> set:
+        """
+        제목 기반 로컬 분석 (GPT 호출 없음 - 요약: 제목 + 첫 문장, 감성: 렉시콘 배치 점수)
+        
+        Args:
+            news_items: 배치 전체
+            indexes: 로컬 분석할 기사 인덱스
+            relevance: 인덱스 -> 관련도 점수
+        
+        Returns:
+            분석한 인덱스 집합
+        """
+        if not indexes:
+            return set()
+        
+        sentiments = get_lexicon_sentiment().score_batch([news_items[i].get('title') or '' for i in indexes])
+        for index, sentiment in zip(indexes, sentiments):
+            item = news_items[index]
+            analysis = self._generate_fallback_analysis(item.get('title') or '', item.get('content') or '')
+            analysis['sentiment'] = {
+                'classification': sentiment['classification'],
+                'score': sentiment['score']
+            }
+            self._apply_analysis(item, analysis, None, ROUTE_LIGHT, relevance.get(index))
+        
+        return set(indexes)
+
+    @staticmethod
+    def _apply_analysis(
+        item: Dict,
+        analysis: Dict,
+        cluster_id: Optional[str],
+        mode: str = ROUTE_FULL,
+        relevance: Optional[float] = None
+    ) -> None:
+        """분석 결과를 기사에 기록 (클러스터 멤버끼리 딕셔너리를 공유하지 않도록 복사)"""
+        content = item.get('content', '')
+        item['summary'] = copy.deepcopy(analysis['summary'])
+        item['sentiment'] = copy.deepcopy(analysis['sentiment'])
+        
+        # SRS v1.1: analyzed_date, metadata 필드 추가
+        item['analyzed_date'] = datetime.now(timezone.utc).isoformat()
+        item['metadata'] = {
+            'word_count': len(content.split()) if content else 0,
+            'language': 'en',  # 원문 언어 (기본: 영어)
+            'gpt_model': Config.OPENAI_MODEL if mode == ROUTE_FULL else None,
+            'analysis_mode': mode
+        }
+        if relevance is not None:
+            item['metadata']['relevance'] = relevance
+        if cluster_id:
+            item['cluster_id'] = cluster_id
 
 
 # 싱글톤 인스턴스
@@ -420,3 +734,75 @@ def get_news_analyzer() -> NewsAnalyzer:
         _analyzer = NewsAnalyzer()
     
     return _analyzer
+
+
+def fill_missing_summaries(
+    news_items: List[Dict],
+    languages: Iterable[str],
+    storage=None,
+    analyzer: Optional[NewsAnalyzer] = None
+) -> int:
+    """
+    요약에 없는 언어를 생성해 기사에 채우고 저장소 문서에 캐시 (상세 페이지/이메일 렌더링 전)
+    
+    문서 ID는 '_id'(검색/최근 뉴스 결과) 또는 'news_id'를 사용한다.
+    API를 쓸 수 없거나 생성에 실패하면 기사를 그대로 둔다 (화면/이메일은 다른 언어 요약으로 대체).
+    
+    Args:
+        news_items: 뉴스 리스트 (summary가 제자리에서 갱신됨)
+        languages: 필요한 요약 언어
+        storage: 캐시할 저장소 (기본: 생성한 요약이 있을 때 get_news_storage())
+        analyzer: 요약 생성기 (기본: get_news_analyzer())
+    
+    Returns:
+        요약을 채운 기사 수
+    """
+    languages = normalize_languages(languages)
+    pending = []
+    for item in news_items:
+        summary = item.get('summary') if isinstance(item.get('summary'), dict) else {}
+        missing = tuple(language for language in languages if not summary.get(language))
+        if missing and (item.get('title') or item.get('content')):
+            pending.append((item, missing))
+    if not pending:
+        return 0
+    
+    analyzer = analyzer or get_news_analyzer()
+    if analyzer.client is None:
+        logger.debug(f"OpenAI client not available - {len(pending)} items keep existing summaries")
+        return 0
+    
+    counter = get_metrics_registry().counter(
+        'news_summary_fills_total',
+        'Summaries generated on demand for languages skipped at analysis time',
+        ('language',)
+    )
+    filled = 0
+    for item, missing in pending:
+        generated = analyzer.summarize(
+            title=item.get('title') or '',
+            content=item.get('content') or '',
+            ticker=item.get('ticker_symbol') or item.get('ticker') or '',
+            company_name=item.get('company_name'),
+            languages=missing
+        )
+        if not generated:
+            continue
+        summary = item.get('summary') if isinstance(item.get('summary'), dict) else {}
+        item['summary'] = {**summary, **generated}
+        filled += 1
+        for language in generated:
+            counter.inc(language=language)
+        
+        doc_id = item.get('_id') or item.get('news_id')
+        if not doc_id:
+            continue
+        try:
+            if storage is None:
+                storage = get_news_storage()
+            storage.update_summary(doc_id, generated)
+        except Exception as e:
+            logger.error(f"Failed to cache summary for {doc_id}: {e}")
+    
+    logger.info(f"Filled missing summaries ({', '.join(languages)}) for {filled}/{len(pending)} news items")
+    return filled
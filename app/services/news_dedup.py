@@ -0,0 +1,303 @@
+"""
+유사 중복 기사 클러스터링 (SimHash)
+- 제목 + 설명(본문 앞부분)의 단어/바이그램으로 64비트 SimHash 지문 생성
+- 해밍 거리 NEWS_DEDUP_MAX_DISTANCE 이하면 같은 기사 (통신사 기사가 여러 티커/URL로 수집된 경우)
+- 밴드 분할 버킷으로 후보만 비교 (거리 k 이하면 k+1개 밴드 중 하나는 반드시 일치)
+- NearDuplicateIndex: 최근 NEWS_DEDUP_WINDOW_HOURS 동안 분석한 클러스터를 기억해 다른 배치/티커 스레드와
+  분석 결과 공유 (같은 기사를 동시에 분석 중이면 먼저 시작한 쪽 결과를 기다림)
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+
+# 지문에 사용하는 본문 길이 (설명/첫 문단 - 뒤쪽의 관련 기사 목록 등은 제외)
+MAX_CONTENT_CHARS = 1000
+
+_WORD_RE = re.compile(r'[^\W_]+', re.UNICODE)
+
+
+def extract_features(title: Optional[str], content: Optional[str]) -> List[str]:
+    """
+    지문용 특징 (소문자 단어 + 인접 단어 쌍)
+
+    Args:
+        title: 제목
+        content: 설명/본문
+
+    Returns:
+        특징 문자열 리스트
+    """
+    text = f"{title or ''} {(content or '')[:MAX_CONTENT_CHARS]}"
+    words = _WORD_RE.findall(unicodedata.normalize('NFKC', text).lower())
+    return words + [f'{a} {b}' for a, b in zip(words, words[1:])]
+
+
+def _feature_hash(feature: str) -> int:
+    # 프로세스마다 달라지는 hash() 대신 고정 해시 (지문을 프로세스 간 비교/저장 가능)
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def simhash(features: List[str]) -> int:
+    """
+    64비트 SimHash
+
+    Args:
+        features: extract_features 결과
+
+    Returns:
+        지문 (정수)
+    """
+    weights = [0] * FINGERPRINT_BITS
+    for feature in features:
+        value = _feature_hash(feature)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if (value >> bit) & 1 else -1
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 다른 비트 수"""
+    return bin(a ^ b).count('1')
+
+
+def fingerprint_item(item: Dict, min_tokens: Optional[int] = None) -> Optional[int]:
+    """
+    뉴스 딕셔너리 지문
+
+    Args:
+        item: {'title', 'content', ...}
+        min_tokens: 이보다 단어가 적으면 None (짧은 제목만으로는 오탐이 많음, 기본: Config.NEWS_DEDUP_MIN_TOKENS)
+
+    Returns:
+        지문 (단어가 부족하면 None)
+    """
+    min_tokens = Config.NEWS_DEDUP_MIN_TOKENS if min_tokens is None else min_tokens
+    features = extract_features(item.get('title'), item.get('content') or item.get('description'))
+    words = (len(features) + 1) // 2
+    if not features or words < min_tokens:
+        return None
+    return simhash(features)
+
+
+def _band_masks(max_distance: int) -> List[Tuple[int, int]]:
+    """지문을 max_distance + 1개 밴드로 나눈 (shift, mask) 목록"""
+    bands = max(1, min(max_distance + 1, FINGERPRINT_BITS))
+    masks = []
+    start = 0
+    for index in range(bands):
+        width = FINGERPRINT_BITS // bands + (1 if index < FINGERPRINT_BITS % bands else 0)
+        masks.append((start, (1 << width) - 1))
+        start += width
+    return masks
+
+
+def cluster_fingerprints(fingerprints: List[Optional[int]], max_distance: Optional[int] = None) -> List[List[int]]:
+    """
+    지문 목록을 유사 중복 클러스터로 묶음 (지문이 None이면 단독 클러스터)
+
+    Args:
+        fingerprints: 항목별 지문
+        max_distance: 같은 클러스터로 볼 최대 해밍 거리 (기본: Config.NEWS_DEDUP_MAX_DISTANCE)
+
+    Returns:
+        클러스터별 인덱스 리스트 (첫 항목 순서 유지)
+    """
+    max_distance = Config.NEWS_DEDUP_MAX_DISTANCE if max_distance is None else max_distance
+    parent = list(range(len(fingerprints)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets: Dict[Tuple[int, int], List[int]] = {}
+    masks = _band_masks(max_distance)
+    for i, fingerprint in enumerate(fingerprints):
+        if fingerprint is None:
+            continue
+        for band, (shift, mask) in enumerate(masks):
+            key = (band, (fingerprint >> shift) & mask)
+            for j in buckets.get(key, ()):
+                if find(i) != find(j) and hamming_distance(fingerprint, fingerprints[j]) <= max_distance:
+                    parent[find(i)] = find(j)
+            buckets.setdefault(key, []).append(i)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(fingerprints)):
+        clusters.setdefault(find(i), []).append(i)
+    return sorted(clusters.values(), key=lambda members: members[0])
+
+
+class ClusterEntry:
+    """분석 결과를 공유하는 클러스터 (먼저 등록한 스레드가 분석)"""
+
+    def __init__(self, cluster_id: str):
+        self.cluster_id = cluster_id
+        self.analysis: Optional[Dict] = None
+        self._ready = threading.Event()
+
+    def resolve(self, analysis: Optional[Dict]) -> None:
+        """분석 결과 등록 (None이면 실패 - 기다리던 스레드는 직접 분석)"""
+        self.analysis = analysis
+        self._ready.set()
+
+    def wait(self, timeout: float) -> Optional[Dict]:
+        """분석 결과 대기"""
+        self._ready.wait(timeout)
+        return self.analysis
+
+
+class NearDuplicateIndex:
+    """최근 분석한 클러스터 지문 인덱스 (스레드 안전)"""
+
+    def __init__(
+        self,
+        max_distance: Optional[int] = None,
+        window_hours: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        초기화
+
+        Args:
+            max_distance: 같은 기사로 볼 최대 해밍 거리 (기본: Config.NEWS_DEDUP_MAX_DISTANCE)
+            window_hours: 클러스터 유지 시간 (기본: Config.NEWS_DEDUP_WINDOW_HOURS)
+            max_entries: 최대 지문 수 (초과 시 오래된 것부터 제거, 기본: Config.NEWS_DEDUP_MAX_ENTRIES)
+        """
+        self.max_distance = Config.NEWS_DEDUP_MAX_DISTANCE if max_distance is None else max_distance
+        self.window_seconds = (Config.NEWS_DEDUP_WINDOW_HOURS if window_hours is None else window_hours) * 3600
+        self.max_entries = max_entries or Config.NEWS_DEDUP_MAX_ENTRIES
+        self._masks = _band_masks(self.max_distance)
+        # 지문 id -> (지문, 클러스터, 등록 시각) (삽입 순서 = 오래된 순)
+        self._records: Dict[int, Tuple[int, ClusterEntry, float]] = {}
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        return [(band, (fingerprint >> shift) & mask) for band, (shift, mask) in enumerate(self._masks)]
+
+    def _find_locked(self, fingerprint: int) -> Optional[ClusterEntry]:
+        best = None
+        for key in self._keys(fingerprint):
+            for record_id in self._buckets.get(key, ()):
+                other, entry, _ = self._records[record_id]
+                distance = hamming_distance(fingerprint, other)
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, entry)
+        return best[1] if best else None
+
+    def _add_locked(self, fingerprint: int, entry: ClusterEntry, now: float) -> None:
+        record_id = self._next_id
+        self._next_id += 1
+        self._records[record_id] = (fingerprint, entry, now)
+        for key in self._keys(fingerprint):
+            self._buckets.setdefault(key, []).append(record_id)
+
+    def _remove_locked(self, record_id: int) -> None:
+        fingerprint, _, _ = self._records.pop(record_id)
+        for key in self._keys(fingerprint):
+            bucket = self._buckets.get(key)
+            if bucket:
+                bucket.remove(record_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def _prune_locked(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        for record_id in list(self._records):
+            _, _, added = self._records[record_id]
+            if added >= cutoff and len(self._records) <= self.max_entries:
+                break
+            self._remove_locked(record_id)
+
+    def find(self, fingerprint: int) -> Optional[ClusterEntry]:
+        """
+        지문과 가까운 클러스터 조회
+
+        Args:
+            fingerprint: 지문
+
+        Returns:
+            ClusterEntry (없으면 None)
+        """
+        with self._lock:
+            self._prune_locked(time.monotonic())
+            return self._find_locked(fingerprint)
+
+    def claim(self, fingerprints: List[int]) -> Tuple[ClusterEntry, bool]:
+        """
+        클러스터 조회 또는 새로 등록
+
+        Args:
+            fingerprints: 한 클러스터 멤버들의 지문 (첫 지문이 대표)
+
+        Returns:
+            (ClusterEntry, 새로 등록했는지) - True면 호출자가 분석 후 resolve 해야 함
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._prune_locked(now)
+            for fingerprint in fingerprints:
+                entry = self._find_locked(fingerprint)
+                if entry is not None:
+                    # 새 멤버 지문도 등록 (이후 변형 기사가 이 멤버와만 가까워도 찾을 수 있도록)
+                    for member in fingerprints:
+                        self._add_locked(member, entry, now)
+                    return entry, False
+
+            entry = ClusterEntry(f'{fingerprints[0]:016x}')
+            for fingerprint in fingerprints:
+                self._add_locked(fingerprint, entry, now)
+            return entry, True
+
+    def release(self, entry: ClusterEntry) -> None:
+        """
+        분석에 실패한 클러스터 제거 (다음에 다시 분석)
+
+        Args:
+            entry: claim으로 등록한 클러스터
+        """
+        entry.resolve(None)
+        with self._lock:
+            for record_id in [rid for rid, record in self._records.items() if record[1] is entry]:
+                self._remove_locked(record_id)
+
+    def clear(self) -> None:
+        """전체 초기화"""
+        with self._lock:
+            self._records.clear()
+            self._buckets.clear()
+
+
+_dedup_index: Optional[NearDuplicateIndex] = None
+_dedup_index_lock = threading.Lock()
+
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """NearDuplicateIndex 싱글톤 반환 (티커 스레드/배치 간 공유)"""
+    global _dedup_index
+    if _dedup_index is None:
+        with _dedup_index_lock:
+            if _dedup_index is None:
+                _dedup_index = NearDuplicateIndex()
+    return _dedup_index
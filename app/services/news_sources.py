@@ -0,0 +1,373 @@
+"""
+뉴스 소스 플러그인 / 소스 코디네이터
+- NewsSource: 소스별 수집(fetch) -> 정규화(parse), 비용 등급(http/browser), 동시 실행 예산, 요청 간격
+- SourceCoordinator: 티커 1개에 대해 활성 소스를 동시에 실행하고 소스 간 URL 중복 제거
+  (소스마다 별도 스레드 풀 -> 브라우저 소스는 좁게, HTTP 소스는 넓게. 여러 티커 워커가 공유)
+- 소스 목록/순서는 Config.NEWS_SOURCES (앞 소스의 기사가 중복 URL에서 우선)
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from flask import current_app, has_app_context
+
+from app.services.crawl_metrics import current_trace, record_stage, use_trace
+from app.services.crawler import InvestingCrawler
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+# 비용 등급 (기본 동시 실행 예산 결정)
+COST_HTTP = 'http'  # 요청 1회 수십 ms
+COST_BROWSER = 'browser'  # Chrome 페이지 로드 수십 초, 메모리 수백 MB
+
+# URL 비교 시 제거할 추적용 쿼리 파라미터
+_TRACKING_PARAM_PREFIXES = ('utm_',)
+_TRACKING_PARAMS = {'ncid', 'guccounter', 'guce_referrer', 'guce_referrer_sig', 'fbclid', 'gclid'}
+
+
+class NewsSourceError(Exception):
+    """소스 수집 실패 (다른 소스 결과는 그대로 사용)"""
+
+
+def normalize_url(url: Optional[str]) -> str:
+    """
+    소스 간 중복 비교용 URL 정규화 (scheme/host 소문자, fragment/추적 파라미터/끝 슬래시 제거)
+
+    Args:
+        url: 기사 URL
+
+    Returns:
+        정규화된 URL (없으면 빈 문자열)
+    """
+    if not url:
+        return ''
+    parts = urlsplit(url.strip())
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    ])
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+class NewsSource:
+    """
+    뉴스 소스 플러그인 기본 클래스
+
+    하위 클래스는 name, cost_class를 정하고 fetch/parse를 구현한다.
+    fetch는 원본(응답 본문, 크롤러 결과 등)을, parse는 InvestingCrawler와 같은 딕셔너리
+    ({'title', 'content', 'source_url', 'source_name', 'date', 'ticker', 'company_name'}) 리스트를 반환한다.
+    실패는 예외로 알린다 (코디네이터가 소스별 에러로 기록).
+    수집 항목이 저장된 뒤에만 반영할 상태(피드 ETag 등)가 있으면 commit을 구현한다.
+    """
+
+    name = 'source'
+    cost_class = COST_HTTP
+    min_interval = 0.0  # 같은 소스의 요청 시작 간격 (초)
+
+    @property
+    def max_concurrency(self) -> int:
+        """동시 실행 예산 (기본: 비용 등급별 설정값)"""
+        if self.cost_class == COST_BROWSER:
+            return max(1, Config.CRAWL_MAX_CONCURRENCY)
+        return max(1, Config.NEWS_SOURCE_HTTP_CONCURRENCY)
+
+    def enabled(self) -> bool:
+        """이번 수집에서 실행할지 여부 (설정으로 끌 수 있는 소스용)"""
+        return True
+
+    def fetch(self, ticker: str, company_name: str, hours_ago: int, max_retries: int = 1) -> Any:
+        """원본 수집"""
+        raise NotImplementedError
+
+    def parse(self, raw: Any, ticker: str, company_name: str, hours_ago: int) -> List[Dict[str, str]]:
+        """원본 -> 뉴스 딕셔너리 리스트"""
+        raise NotImplementedError
+
+    def collect(
+        self,
+        ticker: str,
+        company_name: str,
+        hours_ago: int = 6,
+        max_retries: int = 1
+    ) -> List[Dict[str, str]]:
+        """
+        수집 + 정규화
+
+        Args:
+            ticker: 티커 심볼
+            company_name: 회사명
+            hours_ago: 최근 N시간
+            max_retries: 최대 재시도 횟수 (재시도를 지원하는 소스만 사용)
+
+        Returns:
+            뉴스 딕셔너리 리스트
+        """
+        raw = self.fetch(ticker, company_name, hours_ago, max_retries)
+        return self.parse(raw, ticker, company_name, hours_ago)
+
+    def commit(self, ticker: str) -> None:
+        """수집 항목 저장 성공 후 호출 (저장 후에만 반영할 상태가 있는 소스용)"""
+
+    def close(self) -> None:
+        """소스 자원 정리"""
+
+
+class InvestingSource(NewsSource):
+    """Investing.com Selenium 크롤러 소스 (브라우저 비용 -> CRAWL_MAX_CONCURRENCY 예산)"""
+
+    name = 'investing'
+    cost_class = COST_BROWSER
+
+    def fetch(self, ticker: str, company_name: str, hours_ago: int, max_retries: int = 1) -> List[Dict[str, str]]:
+        # 페이지 로드/파싱/재시도/차단 감지는 InvestingCrawler가 담당
+        with InvestingCrawler() as crawler:
+            news_items, error = crawler.crawl_with_retry(
+                ticker=ticker,
+                company_name=company_name,
+                hours_ago=hours_ago,
+                max_retries=max_retries
+            )
+        if error:
+            raise NewsSourceError(error)
+        return news_items
+
+    def parse(self, raw: List[Dict[str, str]], ticker: str, company_name: str, hours_ago: int) -> List[Dict[str, str]]:
+        return raw
+
+
+class SourceBudget:
+    """소스별 실행 예산 (전용 스레드 풀 + 요청 시작 간격)"""
+
+    def __init__(self, name: str, max_concurrency: int, min_interval: float = 0.0):
+        """
+        초기화
+
+        Args:
+            name: 소스 이름
+            max_concurrency: 동시 실행 수
+            min_interval: 요청 시작 간격 (초)
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=f'source-{name}')
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+
+    def wait_turn(self) -> float:
+        """
+        요청 간격만큼 대기
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.min_interval <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def snapshot(self) -> Dict:
+        """예산/실행 현황"""
+        return {
+            'source': self.name,
+            'max_concurrency': self.max_concurrency,
+            'min_interval': self.min_interval,
+            'in_flight': self.in_flight,
+            'completed': self.completed,
+            'failed': self.failed
+        }
+
+
+class SourceCoordinator:
+    """티커별 다중 소스 동시 수집 (스레드 안전, 여러 티커 워커가 하나의 인스턴스 공유)"""
+
+    def __init__(self, sources: List[NewsSource]):
+        """
+        초기화
+
+        Args:
+            sources: 소스 목록 (우선순위 순 - 중복 URL은 앞 소스의 기사 유지)
+        """
+        self.sources = list(sources)
+        self._budgets = {
+            source.name: SourceBudget(source.name, source.max_concurrency, source.min_interval)
+            for source in self.sources
+        }
+        self._lock = threading.Lock()
+
+    def collect(
+        self,
+        ticker: str,
+        company_name: str,
+        hours_ago: int = 6,
+        max_retries: int = 3
+    ) -> Dict[str, Any]:
+        """
+        활성 소스를 동시에 실행하고 결과 병합
+
+        Args:
+            ticker: 티커 심볼
+            company_name: 회사명
+            hours_ago: 최근 N시간
+            max_retries: 재시도를 지원하는 소스의 최대 재시도 횟수
+
+        Returns:
+            {'items': [...], 'errors': {소스: 에러}, 'sources': {소스: {'count', 'duplicates', 'error', 'seconds'}}}
+        """
+        # 워커 스레드에서도 같은 앱 컨텍스트(ticker_slugs, feed_states 조회)와 계측 trace 사용
+        app = current_app._get_current_object() if has_app_context() else None
+        trace = current_trace()
+
+        active = [source for source in self.sources if source.enabled()]
+        futures = [
+            (source, self._budgets[source.name].executor.submit(
+                self._run_source, source, app, trace, ticker, company_name, hours_ago, max_retries
+            ))
+            for source in active
+        ]
+
+        items: List[Dict[str, str]] = []
+        errors: Dict[str, str] = {}
+        sources: Dict[str, Dict] = {}
+        seen_urls = set()
+        for source, future in futures:
+            source_items, error, seconds = future.result()
+            duplicates = 0
+            for item in source_items:
+                key = normalize_url(item.get('source_url') or item.get('url'))
+                if not key:
+                    continue
+                if key in seen_urls:
+                    duplicates += 1
+                    continue
+                seen_urls.add(key)
+                items.append(item)
+            if error:
+                errors[source.name] = error
+            sources[source.name] = {
+                'count': len(source_items),
+                'duplicates': duplicates,
+                'error': error,
+                'seconds': round(seconds, 3)
+            }
+
+        logger.info(
+            f"Sources for {ticker}: "
+            + ', '.join(f"{name}={info['count']}" + (' (error)' if info['error'] else '')
+                        for name, info in sources.items())
+            + f" -> {len(items)} unique"
+        )
+        return {'items': items, 'errors': errors, 'sources': sources}
+
+    def _run_source(
+        self,
+        source: NewsSource,
+        app,
+        trace,
+        ticker: str,
+        company_name: str,
+        hours_ago: int,
+        max_retries: int
+    ):
+        budget = self._budgets[source.name]
+        with use_trace(trace), (app.app_context() if app is not None else nullcontext()):
+            waited = budget.wait_turn()
+            if waited:
+                record_stage(f'{source.name}_rate_wait', waited)
+            with self._lock:
+                budget.in_flight += 1
+            started = time.perf_counter()
+            error = None
+            items: List[Dict[str, str]] = []
+            try:
+                items = source.collect(ticker, company_name, hours_ago, max_retries) or []
+            except Exception as e:
+                error = str(e) or e.__class__.__name__
+                if not isinstance(e, NewsSourceError):
+                    logger.error(f"Source {source.name} failed for {ticker}: {e}", exc_info=True)
+            seconds = time.perf_counter() - started
+            record_stage(f'source_{source.name}', seconds)
+            with self._lock:
+                budget.in_flight -= 1
+                budget.completed += 1
+                if error:
+                    budget.failed += 1
+        return items, error, seconds
+
+    def commit(self, ticker: str) -> None:
+        """
+        수집 항목 저장 성공을 소스에 알림 (저장에 실패하면 호출하지 않음 -> 다음 수집에서 다시 받음)
+
+        Args:
+            ticker: 티커 심볼
+        """
+        for source in self.sources:
+            try:
+                source.commit(ticker)
+            except Exception as e:
+                logger.error(f"Source {source.name} commit failed for {ticker}: {e}")
+
+    def budgets(self) -> List[Dict]:
+        """소스별 예산/실행 현황"""
+        with self._lock:
+            return [budget.snapshot() for budget in self._budgets.values()]
+
+    def shutdown(self) -> None:
+        """스레드 풀 종료"""
+        for budget in self._budgets.values():
+            budget.executor.shutdown(wait=False)
+        for source in self.sources:
+            source.close()
+
+
+def get_default_sources() -> List[NewsSource]:
+    """
+    Config.NEWS_SOURCES 순서대로 소스 생성
+
+    Returns:
+        소스 목록 (알 수 없는 이름은 경고 후 제외)
+    """
+    from app.services.feed_source import get_feed_source
+
+    factories = {
+        InvestingSource.name: InvestingSource,
+        'feed': get_feed_source,
+    }
+    sources = []
+    for name in [n.strip().lower() for n in Config.NEWS_SOURCES.split(',') if n.strip()]:
+        factory = factories.get(name)
+        if factory is None:
+            logger.warning(f"Unknown news source '{name}' in NEWS_SOURCES (available: {', '.join(factories)})")
+            continue
+        sources.append(factory())
+    return sources
+
+
+_source_coordinator: Optional[SourceCoordinator] = None
+_source_coordinator_lock = threading.Lock()
+
+
+def get_source_coordinator() -> SourceCoordinator:
+    """SourceCoordinator 싱글톤 반환 (소스 예산을 프로세스 전체에서 공유)"""
+    global _source_coordinator
+    if _source_coordinator is None:
+        with _source_coordinator_lock:
+            if _source_coordinator is None:
+                _source_coordinator = SourceCoordinator(get_default_sources())
+    return _source_coordinator
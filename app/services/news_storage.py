@@ -2,23 +2,136 @@
 뉴스 저장 어댑터
 Phase 2.3 - News Storage Adapter
 
-ElasticSearch를 사용한 뉴스 데이터 저장 및 조회 서비스
+뉴스 데이터 저장 및 조회 서비스
+- NewsStorageBackend: 저장소 인터페이스 (크롤러/라우트/스케줄러가 사용하는 메서드)
+- NewsStorageAdapter: ElasticSearch 구현
+- SQLiteNewsStorage (sqlite_news_storage.py): SQLite FTS5 구현 (ES 없는 소규모 설치/테스트용)
+- Config.NEWS_STORAGE_BACKEND로 선택 (create_news_storage / get_news_storage)
 """
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import logging
 
+from app.utils.config import Config
 from app.utils.elasticsearch_client import get_es_client
 
 logger = logging.getLogger(__name__)
 
+BACKEND_ELASTICSEARCH = 'elasticsearch'
+BACKEND_SQLITE = 'sqlite'
 
-class NewsStorageAdapter:
+# save_news 필수 필드
+REQUIRED_FIELDS = ('news_id', 'ticker_symbol', 'title', 'content', 'published_date')
+
+
+class NewsStorageBackend:
+    """
+    뉴스 저장소 인터페이스
+
+    반환 형식은 ES 구현(NewsStorageAdapter)을 기준으로 하며, 구현체는 오류 시 예외 대신 기본값을 반환한다.
     """
-    뉴스 데이터 저장/조회 어댑터
+
+    backend_name = ''
+
+    def save_news(self, news_data: Dict) -> bool:
+        """단일 뉴스 저장 (news_id가 같으면 덮어씀)"""
+        raise NotImplementedError
+
+    def bulk_save_news(self, news_list: List[Dict]) -> Dict:
+        """뉴스 벌크 저장 -> {'success', 'failed', 'total', 'errors'}"""
+        raise NotImplementedError
+
+    def get_news(self, news_id: str) -> Optional[Dict]:
+        """뉴스 ID로 단일 뉴스 조회"""
+        raise NotImplementedError
+
+    def get_news_by_id(self, news_id: str) -> Optional[Dict]:
+        """뉴스 ID로 단일 뉴스 조회 (get_news와 같음)"""
+        return self.get_news(news_id)
+
+    def search_news(
+        self,
+        ticker_symbol: Optional[str] = None,
+        ticker_symbols: Optional[List[str]] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        sentiment: Optional[str] = None,
+        keyword: Optional[str] = None,
+        size: int = 20,
+        page: int = 1
+    ) -> Dict:
+        """뉴스 검색 (발행일 내림차순) -> {'total', 'hits', 'page', 'size', 'pages'}"""
+        raise NotImplementedError
+
+    def get_statistics(self, ticker_symbol: str, days: int = 7) -> Dict:
+        """최근 N일 종목 통계 -> {'total', 'sentiment_distribution', 'avg_score'}"""
+        raise NotImplementedError
+
+    def delete_news(self, news_id: str) -> bool:
+        """뉴스 삭제"""
+        raise NotImplementedError
+
+    def get_latest_news(self, ticker_symbol: str, limit: int = 10) -> List[Dict]:
+        """
+        특정 종목의 최신 뉴스 조회
+
+        Args:
+            ticker_symbol (str): 종목 코드
+            limit (int): 조회 개수
+
+        Returns:
+            List[Dict]: 최신 뉴스 리스트
+        """
+        result = self.search_news(
+            ticker_symbol=ticker_symbol,
+            size=limit,
+            page=1
+        )
+        return result['hits']
+
+    def check_duplicates(self, urls: List[str], ticker_symbol: Optional[str] = None) -> set:
+        """이미 저장된 source_url 집합"""
+        raise NotImplementedError
+
+    def get_ticker_statistics(self, ticker: str, from_date: str) -> Optional[Dict]:
+        """종목별 감성 통계 (뉴스가 없으면 None)"""
+        raise NotImplementedError
+
+    def get_date_statistics(self, tickers: List[str], from_date: str) -> List[Dict]:
+        """일별 뉴스 수 (최신 날짜부터) -> [{'date', 'count'}, ...]"""
+        raise NotImplementedError
+
+    def count_news(
+        self,
+        ticker_symbols: Optional[List[str]] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        sentiment: Optional[str] = None
+    ) -> int:
+        """조건에 맞는 뉴스 개수"""
+        raise NotImplementedError
+
+    def get_recent_news(self, ticker_symbol: str, hours: int = 3) -> List[Dict]:
+        """최근 N시간 이내 뉴스 (최대 100건, 최신순, 문서 ID는 '_id')"""
+        raise NotImplementedError
+
+    def update_summary(self, news_id: str, summary: Dict[str, str]) -> bool:
+        """언어별 요약 추가/갱신 (기존 언어 요약은 유지) -> 성공 여부"""
+        raise NotImplementedError
+
+    def delete_old_news(self, cutoff_date: datetime) -> int:
+        """발행일이 cutoff_date 이전인 뉴스 삭제 -> 삭제 건수"""
+        raise NotImplementedError
+
+
+class NewsStorageAdapter(NewsStorageBackend):
+    """
+    뉴스 데이터 저장/조회 어댑터 (ElasticSearch)
     
     Phase 3 크롤러와 통합될 서비스 레이어
     """
+
+    backend_name = BACKEND_ELASTICSEARCH
     
     def __init__(self):
         """어댑터 초기화"""
@@ -57,8 +170,7 @@ class NewsStorageAdapter:
         """
         try:
             # 필수 필드 검증
-            required_fields = ['news_id', 'ticker_symbol', 'title', 'content', 'published_date']
-            for field in required_fields:
+            for field in REQUIRED_FIELDS:
                 if field not in news_data:
                     logger.error(f"Missing required field: {field}")
                     return False
@@ -332,24 +444,29 @@ class NewsStorageAdapter:
             logger.error(f"Error deleting news {news_id}: {e}")
             return False
     
-    def get_latest_news(self, ticker_symbol: str, limit: int = 10) -> List[Dict]:
+    def update_summary(self, news_id: str, summary: Dict[str, str]) -> bool:
         """
-        특정 종목의 최신 뉴스 조회
+        언어별 요약 추가/갱신 (부분 업데이트 - summary 객체 필드는 병합됨)
         
         Args:
-            ticker_symbol (str): 종목 코드
-            limit (int): 조회 개수
+            news_id (str): 뉴스 ID (ES _id)
+            summary (Dict[str, str]): {'en': '...', ...}
         
         Returns:
-            List[Dict]: 최신 뉴스 리스트
+            bool: 성공 여부
         """
-        result = self.search_news(
-            ticker_symbol=ticker_symbol,
-            size=limit,
-            page=1
-        )
-        return result['hits']
-
+        try:
+            self.es_client.client.update(
+                index=self.news_index,
+                id=news_id,
+                doc={'summary': summary}
+            )
+            logger.debug(f"Summary updated for {news_id}: {', '.join(sorted(summary))}")
+            return True
+        except Exception as e:
+            logger.error(f"Error updating summary for {news_id}: {e}")
+            return False
+    
     def check_duplicates(self, urls: List[str], ticker_symbol: Optional[str] = None) -> set:
         """
         URL 목록에서 중복된 뉴스 URL 확인
@@ -590,7 +707,7 @@ class NewsStorageAdapter:
             query = {"bool": {"must": must}} if must else {"match_all": {}}
             
             # Count API 사용
-            result = self.es.count(index=self.news_index, body={"query": query})
+            result = self.es_client.client.count(index=self.news_index, body={"query": query})
             return result.get('count', 0)
             
         except Exception as e:
@@ -634,7 +751,7 @@ class NewsStorageAdapter:
                 size=100
             )
             
-            hits = [hit['_source'] for hit in response['hits']['hits']]
+            hits = [{**hit['_source'], '_id': hit['_id']} for hit in response['hits']['hits']]
             logger.info(f"Found {len(hits)} recent news for {ticker_symbol} in last {hours} hours")
             return hits
             
@@ -675,21 +792,43 @@ class NewsStorageAdapter:
             return 0
 
 
+def create_news_storage(backend: Optional[str] = None) -> NewsStorageBackend:
+    """
+    설정된 저장소 반환
+
+    ES는 호출마다 어댑터를 생성해 연결을 확인하고(실패 시 ConnectionError),
+    SQLite는 프로세스 공용 인스턴스를 반환한다.
+
+    Args:
+        backend: 'elasticsearch' / 'sqlite' (기본: Config.NEWS_STORAGE_BACKEND)
+
+    Returns:
+        NewsStorageBackend: 저장소 인스턴스
+    """
+    backend = (backend or Config.NEWS_STORAGE_BACKEND).lower()
+    if backend == BACKEND_SQLITE:
+        from app.services.sqlite_news_storage import get_sqlite_news_storage
+        return get_sqlite_news_storage()
+    if backend != BACKEND_ELASTICSEARCH:
+        logger.warning(f"Unknown NEWS_STORAGE_BACKEND '{backend}', using elasticsearch")
+    return NewsStorageAdapter()
+
+
 # 싱글톤 인스턴스
-_storage_adapter: Optional[NewsStorageAdapter] = None
+_storage_adapter: Optional[NewsStorageBackend] = None
 
 
-def get_news_storage() -> NewsStorageAdapter:
+def get_news_storage() -> NewsStorageBackend:
     """
-    NewsStorageAdapter 싱글톤 인스턴스 반환
+    설정된 저장소 싱글톤 인스턴스 반환
     
     Returns:
-        NewsStorageAdapter: 저장 어댑터 인스턴스
+        NewsStorageBackend: 저장 어댑터 인스턴스
     """
     global _storage_adapter
     
     if _storage_adapter is None:
-        _storage_adapter = NewsStorageAdapter()
+        _storage_adapter = create_news_storage()
     
     return _storage_adapter
 
@@ -705,7 +844,7 @@ class NewsStorageService:
         """초기화"""
         self._adapter = None
     
-    def _get_adapter(self) -> NewsStorageAdapter:
+    def _get_adapter(self) -> NewsStorageBackend:
         """지연 초기화"""
         if self._adapter is None:
             try:
@@ -723,6 +862,10 @@ class NewsStorageService:
         """오래된 뉴스 삭제"""
         return self._get_adapter().delete_old_news(cutoff_date)
     
+    def update_summary(self, news_id: str, summary: Dict[str, str]) -> bool:
+        """언어별 요약 추가/갱신"""
+        return self._get_adapter().update_summary(news_id, summary)
+    
     def store_news_batch(self, news_list: List[Dict]) -> int:
         """뉴스 배치 저장"""
         result = self._get_adapter().bulk_save_news(news_list)
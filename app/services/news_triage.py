@@ -0,0 +1,218 @@
+"""
+분석 전 관련도 분류 (triage)
+- 티커/회사명 언급(제목, 본문 첫 문단, 본문 전체), 시황/종목 모음 기사 제목 패턴, 본문 길이로 0~1 점수 계산
+- full: GPT 전체 분석 / light: 제목 기반 로컬 분석 (렉시콘 감성, GPT 호출 없음) / skip: 분석/저장 안 함
+- 임계값은 Config.NEWS_TRIAGE_* (본문이 NEWS_TRIAGE_MIN_CONTENT_CHARS 미만이면 점수가 높아도 light)
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional
+
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+ROUTE_FULL = 'full'
+ROUTE_LIGHT = 'light'
+ROUTE_SKIP = 'skip'
+ROUTES = (ROUTE_FULL, ROUTE_LIGHT, ROUTE_SKIP)
+
+# 점수 구성 (티커별 뉴스 페이지/피드에서 수집했으므로 기본 점수에서 시작)
+SOURCE_PRIOR = 0.2
+TITLE_MENTION = 0.4
+LEAD_MENTION = 0.15
+CONTENT_MENTION = 0.05  # 본문 언급 1회당
+CONTENT_MENTION_MAX = 0.25
+ROUNDUP_PENALTY = 0.4
+MULTI_TICKER_PENALTY = 0.2
+MULTI_TICKER_MIN = 3  # 제목/첫 문단에 다른 종목 심볼이 이만큼 이상이면 모음 기사로 간주
+
+LEAD_CHARS = 300
+
+# 시황/종목 모음 기사 제목
+ROUNDUP_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\bstocks? to (?:watch|buy|sell|own)\b',
+    r'\b(?:top|biggest|big) (?:stock )?(?:movers|gainers|losers)\b',
+    r'\bstocks? making (?:the )?(?:biggest|big) moves\b',
+    r'\b(?:premarket|pre-market|midday|after-hours|after hours) (?:movers|stocks)\b',
+    r'\bstock market today\b',
+    r'\bmarkets? (?:wrap|recap|snapshot|roundup)\b',
+    r'\bwall street (?:opens|closes|ends|week ahead)\b',
+    # 지수명만으로는 판단하지 않음 ("Tesla to join S&P 500", Dow Inc. 기사) - 지수 등락 표현일 때만
+    r'\b(?:the dow|dow jones|s&p 500|nasdaq(?: composite)?|stock futures|u\.s\. stocks)\s+(?:futures\s+)?'
+    r'(?:rise|rises|rose|fall|falls|fell|slip|slips|slide|slides|climb|climbs|drop|drops|gain|gains|edges?|'
+    r'rally|rallies|tumble|tumbles|surge|surges|jump|jumps|sink|sinks|close|closes|closed|open|opens|opened|'
+    r'end|ends|ended|mixed|higher|lower)\b',
+    r'\b(?:week|day) ahead\b',
+    r'\bwhat to watch\b',
+    r'\bmorning (?:brief|briefing|bid)\b',
+    r'\bearnings (?:calendar|this week|roundup)\b',
+    r'^\s*\d+\s+(?:\w+\s+){0,2}stocks\b',
+)]
+
+_SYMBOL_RE = re.compile(r'\(([A-Z]{1,5}(?:\.[A-Z])?)\)|\$([A-Z]{1,5})\b|\b(?:NYSE|NASDAQ|Nasdaq):\s?([A-Z]{1,5})\b')
+_COMPANY_SUFFIX_RE = re.compile(
+    r'(?:[,.]?\s+&?\s*(?:inc|incorporated|corp|corporation|co|company|ltd|limited|plc|holdings?|group|'
+    r's\.?a|ag|n\.?v|se|l\.?p|llc|class [a-c]|common stock|ordinary shares|ads|adr)\.?)$',
+    re.IGNORECASE
+)
+_DOMAIN_SUFFIX_RE = re.compile(r'\.(?:com|net|org|io)$', re.IGNORECASE)
+# 첫 단어만으로는 회사를 가리키지 않는 일반 단어 (General Motors, United Airlines 등은 전체 이름으로만 매칭)
+GENERIC_FIRST_WORDS = {
+    'general', 'american', 'united', 'first', 'national', 'international', 'global', 'new', 'bank',
+    'royal', 'western', 'eastern', 'southern', 'northern', 'advanced', 'applied', 'digital', 'energy',
+}
+
+
+def company_aliases(company_name: Optional[str]) -> List[str]:
+    """
+    회사명 매칭용 별칭 ('Tesla, Inc.' -> ['tesla, inc.', 'tesla'], 'Meta Platforms Inc.' -> [..., 'meta platforms', 'meta'])
+    
+    법인 접미사를 뗀 이름, 도메인 접미사를 뗀 이름('Amazon.com' -> 'amazon'), 헤드라인에서 주로 쓰는 첫 단어(브랜드)
+
+    Args:
+        company_name: stock_master 회사명
+
+    Returns:
+        소문자 별칭 리스트 (3자 미만 제외)
+    """
+    if not company_name:
+        return []
+    name = ' '.join(company_name.split())
+    aliases = [name]
+    core = name
+    while True:
+        stripped = _COMPANY_SUFFIX_RE.sub('', core).strip(' ,.')
+        if stripped == core or not stripped:
+            break
+        core = stripped
+    if core.lower().startswith('the '):
+        core = core[4:]
+    aliases.append(core)
+    brand = _DOMAIN_SUFFIX_RE.sub('', core.split()[0]) if core.split() else ''
+    if brand.lower() not in GENERIC_FIRST_WORDS:
+        aliases.append(brand)
+    return [alias.lower() for alias in dict.fromkeys(aliases) if len(alias) >= 3]
+
+
+def _mention_pattern(ticker: Optional[str], company_name: Optional[str]) -> Optional[re.Pattern]:
+    """
+    티커 또는 회사명(대소문자 무시) 언급 패턴
+
+    단독 티커는 대문자만 (NOW, ALL, CAT 등이 일반 단어와 겹침), $TSLA / (TSLA) / NASDAQ: TSLA 표기는 대소문자 무시
+    """
+    parts = []
+    if ticker:
+        symbol = re.escape(ticker.upper())
+        if len(ticker) >= 2:
+            parts.append(rf'(?<![\w$]){symbol}(?!\w)')
+            parts.append(rf'(?i:\${symbol}(?!\w)|\({symbol}\)|\b(?:NYSE|NASDAQ):\s?{symbol}(?!\w))')
+        else:
+            # 한 글자 티커(F, T 등)는 일반 단어와 구분되는 표기만
+            parts.append(rf'\${symbol}\b|\({symbol}\)|\b(?:NYSE|NASDAQ|Nasdaq):\s?{symbol}\b')
+    for alias in company_aliases(company_name):
+        parts.append(rf'(?i:(?<!\w){re.escape(alias)}(?!\w))')
+    if not parts:
+        return None
+    return re.compile('|'.join(parts))
+
+
+class RelevanceTriage:
+    """뉴스 관련도 점수 및 분석 경로 결정"""
+
+    def __init__(
+        self,
+        full_threshold: Optional[float] = None,
+        light_threshold: Optional[float] = None,
+        min_content_chars: Optional[int] = None
+    ):
+        """
+        초기화
+
+        Args:
+            full_threshold: 이 점수 이상이면 GPT 전체 분석 (기본: Config.NEWS_TRIAGE_FULL_THRESHOLD)
+            light_threshold: 이 점수 미만이면 skip (기본: Config.NEWS_TRIAGE_LIGHT_THRESHOLD)
+            min_content_chars: 전체 분석에 필요한 최소 본문 길이 (기본: Config.NEWS_TRIAGE_MIN_CONTENT_CHARS)
+        """
+        self.full_threshold = Config.NEWS_TRIAGE_FULL_THRESHOLD if full_threshold is None else full_threshold
+        self.light_threshold = Config.NEWS_TRIAGE_LIGHT_THRESHOLD if light_threshold is None else light_threshold
+        self.min_content_chars = (
+            Config.NEWS_TRIAGE_MIN_CONTENT_CHARS if min_content_chars is None else min_content_chars
+        )
+        self._patterns: Dict[tuple, Optional[re.Pattern]] = {}
+
+    def _pattern_for(self, ticker: Optional[str], company_name: Optional[str]) -> Optional[re.Pattern]:
+        key = (ticker, company_name)
+        if key not in self._patterns:
+            self._patterns[key] = _mention_pattern(ticker, company_name)
+        return self._patterns[key]
+
+    def score(self, item: Dict) -> Dict:
+        """
+        관련도 점수
+
+        Args:
+            item: {'title', 'content', 'ticker', 'company_name', ...}
+
+        Returns:
+            {'score': 0.0~1.0, 'route': 'full'|'light'|'skip', 'reasons': [...]}
+        """
+        ticker = item.get('ticker') or item.get('ticker_symbol')
+        title = item.get('title') or ''
+        content = item.get('content') or ''
+        lead = content[:LEAD_CHARS]
+        pattern = self._pattern_for(ticker, item.get('company_name'))
+
+        score = SOURCE_PRIOR
+        reasons = []
+        if pattern is not None:
+            if pattern.search(title):
+                score += TITLE_MENTION
+                reasons.append('title_mention')
+            if lead and pattern.search(lead):
+                score += LEAD_MENTION
+                reasons.append('lead_mention')
+            mentions = len(pattern.findall(content))
+            if mentions:
+                score += min(CONTENT_MENTION_MAX, mentions * CONTENT_MENTION)
+                reasons.append(f'content_mentions={mentions}')
+
+        if any(roundup.search(title) for roundup in ROUNDUP_PATTERNS):
+            score -= ROUNDUP_PENALTY
+            reasons.append('roundup_title')
+
+        symbols = {next(group for group in match.groups() if group) for match in _SYMBOL_RE.finditer(f'{title} {lead}')}
+        symbols.discard((ticker or '').upper())
+        if len(symbols) >= MULTI_TICKER_MIN:
+            score -= MULTI_TICKER_PENALTY
+            reasons.append(f'other_tickers={len(symbols)}')
+
+        score = round(max(0.0, min(1.0, score)), 3)
+        if score < self.light_threshold:
+            route = ROUTE_SKIP
+        elif score >= self.full_threshold and len(content.strip()) >= self.min_content_chars:
+            route = ROUTE_FULL
+        else:
+            route = ROUTE_LIGHT
+            if len(content.strip()) < self.min_content_chars:
+                reasons.append('short_content')
+        return {'score': score, 'route': route, 'reasons': reasons}
+
+    def route_batch(self, news_items: List[Dict]) -> List[Dict]:
+        """
+        배치 관련도 점수 (입력 순서)
+
+        Args:
+            news_items: 뉴스 리스트
+
+        Returns:
+            score() 결과 리스트
+        """
+        decisions = [self.score(item) for item in news_items]
+        for item, decision in zip(news_items, decisions):
+            if decision['route'] == ROUTE_SKIP:
+                logger.debug(
+                    f"Triage skip ({decision['score']}, {', '.join(decision['reasons'])}): {item.get('title', 'N/A')}"
+                )
+        return decisions
@@ -0,0 +1,269 @@
+"""
+프록시 풀 (상태 기반 선택)
+- 프록시별 성공률(EWMA), 평균 지연, 차단 감지(캡차/빈 페이지) 횟수 기록
+- 상태 점수에 비례한 가중치로 선택 (느리거나 차단된 프록시에 작업이 몰리지 않도록)
+- 차단/연속 실패 시 지수 백오프로 격리, 프록시별 동시 사용(lease) 수 제한
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+DIRECT = 'direct'  # 프록시 없이 기본 IP 사용
+
+# 성공률/지연 EWMA 가중치
+_EWMA_ALPHA = 0.3
+# 이 지연(초)일 때 점수 절반 (브라우저 페이지 로딩 기준)
+_LATENCY_REF_SECONDS = 15.0
+# 점수 하한 (격리 해제 직후 프록시도 가끔 선택되도록)
+_MIN_HEALTH = 0.05
+
+
+class ProxyUnavailableError(Exception):
+    """사용 가능한 프록시가 없음 (모두 격리 중이거나 동시 사용 한도 초과)"""
+
+
+class ProxyState:
+    """프록시 1개의 상태"""
+
+    def __init__(self, proxy: Optional[str]):
+        self.proxy = proxy
+        self.active = 0
+        self.successes = 0
+        self.failures = 0
+        self.blocks = 0
+        self.success_rate = 1.0
+        self.latency: Optional[float] = None
+        self.consecutive_failures = 0
+        self.strikes = 0  # 연속 격리 횟수 (백오프 지수)
+        self.quarantined_until = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.proxy or DIRECT
+
+    def health(self) -> float:
+        """선택 가중치 (성공률 / 지연 보정)"""
+        score = self.success_rate
+        if self.latency is not None:
+            score /= 1 + self.latency / _LATENCY_REF_SECONDS
+        return max(score, _MIN_HEALTH)
+
+    def to_dict(self, now: float) -> Dict:
+        """딕셔너리로 변환"""
+        return {
+            'proxy': self.name,
+            'active': self.active,
+            'successes': self.successes,
+            'failures': self.failures,
+            'blocks': self.blocks,
+            'success_rate': round(self.success_rate, 3),
+            'latency_seconds': round(self.latency, 2) if self.latency is not None else None,
+            'health': round(self.health(), 3),
+            'quarantined_seconds': round(max(self.quarantined_until - now, 0), 1)
+        }
+
+
+class ProxyLease:
+    """
+    프록시 사용권 (with 블록 종료 시 반납)
+
+    결과를 보고하지 않고 종료하면 예외 여부로 성공/실패 기록
+    """
+
+    def __init__(self, pool: 'ProxyPool', state: ProxyState):
+        self._pool = pool
+        self._state = state
+        self._started = pool.clock()
+        self._released = False
+
+    @property
+    def proxy(self) -> Optional[str]:
+        """InvestingCrawler에 넘길 프록시 주소 (None이면 직접 연결)"""
+        return self._state.proxy
+
+    def success(self, latency: Optional[float] = None) -> None:
+        self._release('success', latency)
+
+    def failure(self) -> None:
+        self._release('failure')
+
+    def blocked(self) -> None:
+        self._release('blocked')
+
+    def _release(self, outcome: str, latency: Optional[float] = None) -> None:
+        if self._released:
+            return
+        self._released = True
+        if latency is None:
+            latency = self._pool.clock() - self._started
+        self._pool.release(self._state, outcome, latency)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.failure()
+        else:
+            self.success()
+
+
+class ProxyPool:
+    """상태 점수 기반 프록시 풀 (스레드 안전)"""
+
+    def __init__(
+        self,
+        proxies: List[Optional[str]],
+        max_leases: Optional[int] = None,
+        quarantine_seconds: Optional[float] = None,
+        max_quarantine_seconds: Optional[float] = None,
+        failure_threshold: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        초기화
+
+        Args:
+            proxies: 프록시 주소 목록 (None은 직접 연결)
+            max_leases: 프록시당 동시 사용 수 (기본: Config.PROXY_MAX_LEASES)
+            quarantine_seconds: 첫 격리 시간 (격리마다 2배, 기본: Config.PROXY_QUARANTINE_SECONDS)
+            max_quarantine_seconds: 최대 격리 시간 (기본: Config.PROXY_MAX_QUARANTINE_SECONDS)
+            failure_threshold: 격리할 연속 실패 횟수 (차단 감지는 즉시 격리)
+            clock: 시간 함수 (테스트용)
+            rng: 난수 생성기 (테스트용)
+        """
+        self.max_leases = max(1, max_leases or Config.PROXY_MAX_LEASES)
+        self.quarantine_seconds = quarantine_seconds if quarantine_seconds is not None else Config.PROXY_QUARANTINE_SECONDS
+        self.max_quarantine_seconds = max_quarantine_seconds if max_quarantine_seconds is not None else Config.PROXY_MAX_QUARANTINE_SECONDS
+        self.failure_threshold = max(1, failure_threshold)
+        self.clock = clock
+        self._rng = rng or random.Random()
+        # 중복 제거, 순서 유지
+        self._states = [ProxyState(proxy) for proxy in dict.fromkeys(proxies or [None])]
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: Optional[float] = None) -> ProxyLease:
+        """
+        프록시 사용권 획득 (가능한 프록시가 없으면 대기)
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 Config.PROXY_ACQUIRE_TIMEOUT)
+
+        Returns:
+            ProxyLease
+
+        Raises:
+            ProxyUnavailableError: timeout 동안 사용 가능한 프록시가 없음
+        """
+        timeout = Config.PROXY_ACQUIRE_TIMEOUT if timeout is None else timeout
+        deadline = self.clock() + timeout
+        with self._cond:
+            while True:
+                now = self.clock()
+                state = self._choose(now)
+                if state is not None:
+                    state.active += 1
+                    return ProxyLease(self, state)
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise ProxyUnavailableError(
+                        f"No proxy available ({len(self._states)} proxies, "
+                        f"{sum(1 for s in self._states if s.quarantined_until > now)} quarantined)"
+                    )
+                # 격리 해제 또는 반납 알림까지 대기
+                release_at = min((s.quarantined_until for s in self._states if s.quarantined_until > now), default=deadline)
+                self._cond.wait(max(min(remaining, release_at - now), 0.01))
+
+    def choose(self) -> Optional[str]:
+        """사용권 없이 현재 가장 적합한 프록시 하나 선택 (없으면 None = 직접 연결)"""
+        with self._cond:
+            state = self._choose(self.clock())
+            return state.proxy if state else None
+
+    def release(self, state: ProxyState, outcome: str, latency: float) -> None:
+        """
+        사용권 반납 및 결과 기록
+
+        Args:
+            state: 프록시 상태
+            outcome: success / failure / blocked
+            latency: 소요 시간 (초)
+        """
+        with self._cond:
+            state.active = max(state.active - 1, 0)
+            ok = outcome == 'success'
+            state.success_rate = state.success_rate * (1 - _EWMA_ALPHA) + (_EWMA_ALPHA if ok else 0)
+
+            if ok:
+                state.successes += 1
+                state.consecutive_failures = 0
+                state.strikes = 0
+                state.latency = latency if state.latency is None else state.latency * (1 - _EWMA_ALPHA) + latency * _EWMA_ALPHA
+            elif outcome == 'blocked':
+                state.blocks += 1
+                self._quarantine(state, 'blocked')
+            else:
+                state.failures += 1
+                state.consecutive_failures += 1
+                if state.consecutive_failures >= self.failure_threshold:
+                    self._quarantine(state, f"{state.consecutive_failures} consecutive failures")
+
+            self._cond.notify_all()
+
+    def snapshot(self) -> List[Dict]:
+        """프록시별 상태 목록 (관리/메트릭용)"""
+        with self._cond:
+            now = self.clock()
+            return [state.to_dict(now) for state in self._states]
+
+    def _choose(self, now: float) -> Optional[ProxyState]:
+        available = [
+            state for state in self._states
+            if state.active < self.max_leases and state.quarantined_until <= now
+        ]
+        if not available:
+            return None
+        weights = [state.health() for state in available]
+        return self._rng.choices(available, weights=weights, k=1)[0]
+
+    def _quarantine(self, state: ProxyState, reason: str) -> None:
+        state.strikes += 1
+        state.consecutive_failures = 0
+        seconds = min(self.quarantine_seconds * 2 ** (state.strikes - 1), self.max_quarantine_seconds)
+        state.quarantined_until = self.clock() + seconds
+        logger.warning(f"Proxy {state.name} quarantined for {seconds:.0f}s ({reason}, strike {state.strikes})")
+
+
+def _configured_proxies() -> List[Optional[str]]:
+    """crawler.PROXY_LIST + PROXY_URLS 환경 변수 (쉼표 구분, 'direct'는 직접 연결)"""
+    from app.services.crawler import PROXY_LIST
+
+    proxies: List[Optional[str]] = list(PROXY_LIST)
+    for item in Config.PROXY_URLS.split(','):
+        item = item.strip()
+        if item:
+            proxies.append(None if item.lower() == DIRECT else item)
+    return proxies
+
+
+_proxy_pool: Optional[ProxyPool] = None
+_proxy_pool_lock = threading.Lock()
+
+
+def get_proxy_pool() -> ProxyPool:
+    """ProxyPool 싱글톤 반환"""
+    global _proxy_pool
+    if _proxy_pool is None:
+        with _proxy_pool_lock:
+            if _proxy_pool is None:
+                _proxy_pool = ProxyPool(_configured_proxies())
+    return _proxy_pool
@@ -0,0 +1,192 @@
+"""
+Chrome 리소스 차단 (CDP Network.setBlockedURLs)
+- 기사 목록 파싱에 필요 없는 폰트/미디어/이미지/광고/트래커 요청을 브라우저 단계에서 차단
+- 차단 범주는 CRAWL_BLOCKED_RESOURCES, 추가 패턴은 CRAWL_BLOCKED_URL_PATTERNS로 설정
+- 페이지별 전송량/요청 수/로딩 시간을 Resource Timing API로 측정해 차단 on/off 히스토그램 기록
+  (scripts/benchmark_resource_blocking.py로 같은 페이지의 절감량 비교)
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from app.utils.config import Config
+from app.utils.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# 범주별 URL 패턴 (setBlockedURLs 와일드카드 '*')
+RESOURCE_PATTERNS: Dict[str, tuple] = {
+    'images': (
+        '*.png', '*.png?*', '*.jpg', '*.jpg?*', '*.jpeg', '*.jpeg?*', '*.gif', '*.gif?*',
+        '*.webp', '*.webp?*', '*.svg', '*.svg?*', '*.ico', '*.avif', '*.avif?*',
+    ),
+    'fonts': ('*.woff', '*.woff?*', '*.woff2', '*.woff2?*', '*.ttf', '*.ttf?*', '*.otf', '*.eot', '*fonts.googleapis.com*', '*fonts.gstatic.com*'),
+    'media': ('*.mp4', '*.mp4?*', '*.webm', '*.m3u8', '*.mp3', '*.m4a'),
+    # CSS는 data-test 셀렉터 파싱에 필요 없지만 화면 표시 여부에 의존하는 셀렉터가 있어 기본 범주에서 제외
+    'stylesheets': ('*.css', '*.css?*'),
+    'trackers': (
+        '*google-analytics.com*', '*googletagmanager.com*', '*analytics.google.com*',
+        '*connect.facebook.net*', '*facebook.com/tr*', '*scorecardresearch.com*', '*quantserve.com*',
+        '*hotjar.com*', '*chartbeat.com*', '*chartbeat.net*', '*newrelic.com*', '*nr-data.net*',
+        '*segment.io*', '*segment.com*', '*mixpanel.com*', '*clarity.ms*', '*bat.bing.com*',
+        '*onesignal.com*', '*permutive.com*',
+    ),
+    'ads': (
+        '*doubleclick.net*', '*googlesyndication.com*', '*googleadservices.com*', '*adservice.google.*',
+        '*amazon-adsystem.com*', '*adnxs.com*', '*criteo.com*', '*criteo.net*', '*taboola.com*',
+        '*outbrain.com*', '*pubmatic.com*', '*rubiconproject.com*', '*openx.net*', '*casalemedia.com*',
+        '*moatads.com*', '*adsafeprotected.com*', '*teads.tv*', '*smartadserver.com*', '*3lift.com*',
+        '*sharethrough.com*', '*.media.net*', '*adform.net*', '*yieldmo.com*', '*gumgum.com*',
+    ),
+}
+
+# 페이지 전송량 히스토그램 버킷 (바이트)
+TRANSFER_BUCKETS = (100_000, 250_000, 500_000, 1_000_000, 2_000_000, 4_000_000, 8_000_000, 16_000_000)
+REQUEST_BUCKETS = (10, 25, 50, 100, 200, 400, 800)
+LOAD_BUCKETS = (0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 12.0, 20.0, 30.0, 60.0)
+
+# Resource Timing 기본 버퍼(250개)를 넘는 페이지도 집계되도록 확장
+_TIMING_BUFFER_SCRIPT = 'performance.setResourceTimingBufferSize(2000);'
+
+_PAGE_STATS_SCRIPT = '''
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let bytes = nav ? (nav.transferSize || 0) : 0;
+for (const entry of resources) { bytes += entry.transferSize || 0; }
+return {
+    requests: resources.length + 1,
+    transfer_bytes: bytes,
+    dom_ms: nav ? Math.round(nav.domContentLoadedEventEnd) : 0,
+    load_ms: nav ? Math.round(nav.loadEventEnd || nav.domContentLoadedEventEnd) : 0
+};
+'''
+
+
+def _split(value: str) -> List[str]:
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+
+def build_blocked_patterns(
+    categories: Optional[Iterable[str]] = None,
+    extra_patterns: Optional[Iterable[str]] = None
+) -> List[str]:
+    """
+    차단할 URL 패턴 목록
+
+    Args:
+        categories: 차단 범주 (None이면 Config.CRAWL_BLOCKED_RESOURCES)
+        extra_patterns: 추가 패턴 (None이면 Config.CRAWL_BLOCKED_URL_PATTERNS)
+
+    Returns:
+        중복 제거된 패턴 리스트
+    """
+    if categories is None:
+        categories = _split(Config.CRAWL_BLOCKED_RESOURCES)
+    if extra_patterns is None:
+        extra_patterns = _split(Config.CRAWL_BLOCKED_URL_PATTERNS)
+
+    patterns: List[str] = []
+    for category in categories:
+        category = category.strip().lower()
+        if category not in RESOURCE_PATTERNS:
+            logger.warning(f"Unknown blocked resource category: {category}")
+            continue
+        patterns.extend(RESOURCE_PATTERNS[category])
+    patterns.extend(extra_patterns)
+    return list(dict.fromkeys(patterns))
+
+
+def apply_resource_blocking(driver, patterns: List[str]) -> bool:
+    """
+    드라이버에 URL 차단 적용 (드라이버 생성 직후 1회)
+
+    Args:
+        driver: Chrome WebDriver
+        patterns: 차단 패턴 (build_blocked_patterns)
+
+    Returns:
+        적용 성공 여부 (실패해도 크롤링은 계속)
+    """
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _TIMING_BUFFER_SCRIPT})
+        if patterns:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        logger.debug(f"Resource blocking enabled ({len(patterns)} patterns)")
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to enable resource blocking: {e}")
+        return False
+
+
+def collect_page_stats(driver) -> Optional[Dict[str, int]]:
+    """
+    현재 페이지의 요청 수/전송량/로딩 시간 (Resource Timing API)
+
+    Args:
+        driver: Chrome WebDriver
+
+    Returns:
+        {'requests', 'transfer_bytes', 'dom_ms', 'load_ms'} 또는 None
+    """
+    try:
+        stats = driver.execute_script(_PAGE_STATS_SCRIPT)
+    except Exception as e:
+        logger.debug(f"Failed to collect page stats: {e}")
+        return None
+    if not isinstance(stats, dict):
+        return None
+    try:
+        return {key: int(stats.get(key) or 0) for key in ('requests', 'transfer_bytes', 'dom_ms', 'load_ms')}
+    except (TypeError, ValueError):
+        return None
+
+
+def record_page_stats(stats: Dict[str, int], blocking: bool) -> None:
+    """
+    페이지 통계를 히스토그램에 기록 (/metrics, resource_blocking 라벨로 on/off 비교)
+
+    Args:
+        stats: collect_page_stats 결과
+        blocking: 리소스 차단 적용 여부
+    """
+    registry = get_metrics_registry()
+    label = 'on' if blocking else 'off'
+    registry.histogram(
+        'crawl_page_transfer_bytes',
+        'Bytes transferred per crawled page',
+        ('resource_blocking',),
+        buckets=TRANSFER_BUCKETS
+    ).observe(stats['transfer_bytes'], resource_blocking=label)
+    registry.histogram(
+        'crawl_page_requests',
+        'Network requests per crawled page',
+        ('resource_blocking',),
+        buckets=REQUEST_BUCKETS
+    ).observe(stats['requests'], resource_blocking=label)
+    registry.histogram(
+        'crawl_page_load_seconds',
+        'Browser load event time per crawled page',
+        ('resource_blocking',),
+        buckets=LOAD_BUCKETS
+    ).observe(stats['load_ms'] / 1000.0, resource_blocking=label)
+
+
+def compare_stats(baseline: List[Dict[str, int]], blocked: List[Dict[str, int]]) -> Dict[str, Dict]:
+    """
+    차단 off/on 페이지 통계 평균 및 절감률
+
+    Args:
+        baseline: 차단 없이 측정한 페이지 통계 목록
+        blocked: 차단 적용 후 측정한 페이지 통계 목록
+
+    Returns:
+        {지표: {'off', 'on', 'saved_pct'}}
+    """
+    result = {}
+    for key in ('transfer_bytes', 'requests', 'dom_ms', 'load_ms'):
+        off = sum(s[key] for s in baseline) / len(baseline) if baseline else 0
+        on = sum(s[key] for s in blocked) / len(blocked) if blocked else 0
+        saved = round((off - on) / off * 100, 1) if off else 0.0
+        result[key] = {'off': round(off), 'on': round(on), 'saved_pct': saved}
+    return result
@@ -4,9 +4,11 @@
 - SRS FR-035~038, plan.md 6.5 구현
 """
 
+import functools
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import atexit
 
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -17,6 +19,8 @@ from flask import Flask
 
 from app.extensions import db
 from app.models.models import User, UserSetting, UserStock, CrawlLog, KST
+from app.services.crawl_planner import AdaptiveCrawlPlanner
+from app.services.scheduler_lock import LeaderElection
 from app.utils.config import Config
 
 logger = logging.getLogger(__name__)
@@ -27,14 +31,19 @@ class SchedulerService:
     백그라운드 작업 스케줄러
     
     Jobs:
-    - crawl_job: 3시간마다 뉴스 크롤링
+    - crawl_job: 3시간마다 뉴스 크롤링 (CRAWL_SCHEDULE_MODE=fixed)
+    - crawl_dispatch_job: 티커별 적응형 크롤링 (CRAWL_SCHEDULE_MODE=adaptive)
     - email_job: 1시간마다 메일 발송 체크
     - cleanup_job: 매일 오래된 데이터 정리
+    - backfill_job: 새 관심 종목의 과거 뉴스 백필 (BACKFILL_ENABLED)
+    - leader_heartbeat_job: DB 리스 갱신 (리스를 가진 프로세스만 위 작업 실행)
     """
 
     _instance: Optional['SchedulerService'] = None
     _scheduler: Optional[BackgroundScheduler] = None
     _app: Optional[Flask] = None
+    _planner: Optional[AdaptiveCrawlPlanner] = None
+    _election: Optional[LeaderElection] = None
 
     def __new__(cls, *args, **kwargs):
         """싱글톤 패턴"""
@@ -76,7 +85,10 @@ class SchedulerService:
         )
 
         # 작업 등록 (앱 컨텍스트에서)
+        # 프로세스가 여러 개 떠도 리더 리스를 가진 1개만 작업 실행
         with app.app_context():
+            SchedulerService._election = LeaderElection(db.session)
+            SchedulerService._election.try_acquire()
             self._register_jobs()
 
         # 스케줄러 시작
@@ -86,26 +98,95 @@ class SchedulerService:
         # 앱 종료 시 스케줄러 정지
         atexit.register(self.shutdown)
 
+    def bind_app(self, app: Flask) -> None:
+        """
+        스케줄러를 시작하지 않고 Flask 앱만 연결
+        (ENABLE_SCHEDULER=false인 웹 프로세스에서 관리자 수동 실행용)
+        
+        Args:
+            app: Flask 애플리케이션 인스턴스
+        """
+        if SchedulerService._scheduler is None:
+            SchedulerService._app = app
+
+    def _leader_only(self, job_func):
+        """리스를 갱신해 리더일 때만 작업을 실행하도록 감싸기"""
+        @functools.wraps(job_func)
+        def wrapper(*args, **kwargs):
+            if not self._renew_leadership():
+                logger.debug(f"Skipping {job_func.__name__}: not the scheduler leader")
+                return None
+            return job_func(*args, **kwargs)
+        return wrapper
+
+    def _renew_leadership(self) -> bool:
+        """
+        리더 리스 획득/갱신
+        
+        Returns:
+            리더 여부 (리스 미사용 시 항상 True)
+        """
+        if SchedulerService._election is None:
+            return True
+        if SchedulerService._app is None:
+            return False
+        with SchedulerService._app.app_context():
+            return SchedulerService._election.try_acquire()
+
+    def is_leader(self) -> bool:
+        """현재 프로세스가 스케줄 작업을 실행하는 리더인지 여부"""
+        if SchedulerService._scheduler is None:
+            return False
+        if SchedulerService._election is None:
+            return True
+        return SchedulerService._election.is_leader
+
     def _register_jobs(self) -> None:
         """작업 등록"""
         if SchedulerService._scheduler is None:
             logger.error("Scheduler not initialized")
             return
 
-        # 1. 크롤링 작업 - 3시간마다 (FR-013)
-        crawl_interval = max(Config.CRAWL_INTERVAL_HOURS, 1)
+        # 0. 리더 리스 갱신 - 리더가 죽으면 TTL 후 대기 중인 프로세스가 인계
+        heartbeat_seconds = max(Config.SCHEDULER_HEARTBEAT_SECONDS, 1)
         SchedulerService._scheduler.add_job(
-            func=self._run_crawl_job,
-            trigger=IntervalTrigger(hours=crawl_interval),
-            id='crawl_job',
-            name='News Crawling Job',
+            func=self._renew_leadership,
+            trigger=IntervalTrigger(seconds=heartbeat_seconds),
+            id='leader_heartbeat_job',
+            name='Scheduler Leader Heartbeat',
             replace_existing=True
         )
-        logger.info(f"Registered crawl_job: every {crawl_interval} hours")
+        logger.info(f"Registered leader_heartbeat_job: every {heartbeat_seconds} seconds")
+
+        # 1. 크롤링 작업 - 3시간마다 (FR-013) 또는 티커별 적응형 주기
+        if Config.CRAWL_SCHEDULE_MODE == 'adaptive':
+            SchedulerService._planner = AdaptiveCrawlPlanner()
+            dispatch_minutes = max(Config.CRAWL_DISPATCH_MINUTES, 1)
+            SchedulerService._scheduler.add_job(
+                func=self._leader_only(self._run_adaptive_crawl_job),
+                trigger=IntervalTrigger(minutes=dispatch_minutes),
+                id='crawl_dispatch_job',
+                name='Adaptive News Crawling Job',
+                replace_existing=True
+            )
+            logger.info(
+                f"Registered crawl_dispatch_job: every {dispatch_minutes} minutes "
+                f"(tickers {Config.CRAWL_TICKER_CONCURRENCY}, browsers {Config.CRAWL_MAX_CONCURRENCY})"
+            )
+        else:
+            crawl_interval = max(Config.CRAWL_INTERVAL_HOURS, 1)
+            SchedulerService._scheduler.add_job(
+                func=self._leader_only(self._run_crawl_job),
+                trigger=IntervalTrigger(hours=crawl_interval),
+                id='crawl_job',
+                name='News Crawling Job',
+                replace_existing=True
+            )
+            logger.info(f"Registered crawl_job: every {crawl_interval} hours")
 
         # 2. 이메일 발송 체크 - 1시간마다 (FR-035)
         SchedulerService._scheduler.add_job(
-            func=self._run_email_job,
+            func=self._leader_only(self._run_email_job),
             trigger=IntervalTrigger(hours=1),
             id='email_job',
             name='Email Sending Job',
@@ -115,7 +196,7 @@ class SchedulerService:
 
         # 3. 데이터 정리 - 매일 새벽 2시 (SRS 9.3)
         SchedulerService._scheduler.add_job(
-            func=self._run_cleanup_job,
+            func=self._leader_only(self._run_cleanup_job),
             trigger=CronTrigger(hour=2, minute=0),
             id='cleanup_job',
             name='Data Cleanup Job',
@@ -123,6 +204,18 @@ class SchedulerService:
         )
         logger.info("Registered cleanup_job: daily at 02:00")
 
+        # 4. 과거 뉴스 백필 - 백필이 끝나지 않은 관심 종목만 (중단 시 체크포인트부터 재개)
+        if Config.BACKFILL_ENABLED:
+            backfill_minutes = max(Config.BACKFILL_INTERVAL_MINUTES, 1)
+            SchedulerService._scheduler.add_job(
+                func=self._leader_only(self._run_backfill_job),
+                trigger=IntervalTrigger(minutes=backfill_minutes),
+                id='backfill_job',
+                name='News Backfill Job',
+                replace_existing=True
+            )
+            logger.info(f"Registered backfill_job: every {backfill_minutes} minutes ({Config.BACKFILL_DAYS} days)")
+
     def _run_crawl_job(self) -> None:
         """
         뉴스 크롤링 작업 실행
@@ -137,10 +230,10 @@ class SchedulerService:
         with SchedulerService._app.app_context():
             try:
                 from app.services.crawler_service import CrawlerService
-                from app.services.news_storage import NewsStorageAdapter
+                from app.services.news_storage import create_news_storage
                 
                 # 서비스 초기화
-                storage = NewsStorageAdapter()
+                storage = create_news_storage()
                 crawler = CrawlerService(
                     db_session=db.session,
                     news_storage=storage
@@ -148,10 +241,7 @@ class SchedulerService:
                 crawl_window_hours = max(Config.CRAWL_LOOKBACK_HOURS, Config.CRAWL_INTERVAL_HOURS * 2)
                 
                 # 모든 관심 종목 조회 (활성 사용자의 종목만)
-                active_users = User.query.filter_by(is_active=True).all()
-                user_ids = [u.id for u in active_users]
-                active_stocks = UserStock.query.filter(UserStock.user_id.in_(user_ids)).all()
-                tickers = list(set([stock.ticker_symbol for stock in active_stocks]))
+                tickers = self._get_active_tickers()
                 
                 if not tickers:
                     logger.info("No active stocks to crawl")
@@ -207,6 +297,148 @@ class SchedulerService:
                 except:
                     pass
 
+    def _get_active_tickers(self) -> List[str]:
+        """활성 사용자의 관심 종목 티커 목록 (중복 제거)"""
+        # 사용자/종목 전체를 로드하지 않고 JOIN + DISTINCT 1회로 조회
+        rows = db.session.query(UserStock.ticker_symbol).join(
+            User, User.id == UserStock.user_id
+        ).filter(
+            User.is_active == True
+        ).distinct().all()
+        return [ticker for ticker, in rows]
+
+    def _get_tickers_by_user(self, user_ids: List[int]) -> Dict[int, List[str]]:
+        """
+        사용자별 관심 종목 티커 (사용자마다 조회하지 않고 1회 조회)
+        
+        Args:
+            user_ids: 사용자 ID 목록
+            
+        Returns:
+            {user_id: [ticker, ...]}
+        """
+        tickers_by_user: Dict[int, List[str]] = {user_id: [] for user_id in user_ids}
+        if not user_ids:
+            return tickers_by_user
+        rows = db.session.query(UserStock.user_id, UserStock.ticker_symbol).filter(
+            UserStock.user_id.in_(user_ids)
+        ).all()
+        for user_id, ticker in rows:
+            tickers_by_user[user_id].append(ticker)
+        return tickers_by_user
+
+    def _run_backfill_job(self) -> None:
+        """
+        과거 뉴스 백필 작업 실행
+        활성 사용자 관심 종목 중 BACKFILL_DAYS까지 수집이 끝나지 않은 티커만 처리
+        """
+        if SchedulerService._app is None:
+            logger.error("Flask app not available")
+            return
+
+        from app.services.backfill import BackfillService
+
+        backfill = BackfillService(SchedulerService._app)
+        target_date = datetime.now(KST) - timedelta(days=Config.BACKFILL_DAYS)
+        with SchedulerService._app.app_context():
+            try:
+                pending = backfill.get_pending_tickers(self._get_active_tickers(), target_date)
+            except Exception as e:
+                logger.error(f"Backfill dispatch failed: {e}")
+                return
+
+        if not pending:
+            logger.debug("No tickers pending backfill")
+            return
+
+        logger.info(f"Backfill job for {len(pending)} tickers: {pending}")
+        backfill.backfill(pending, days=Config.BACKFILL_DAYS)
+
+    def _run_adaptive_crawl_job(self) -> None:
+        """
+        적응형 크롤링 작업 실행
+        크롤링 시각이 도래한 티커만 CRAWL_TICKER_CONCURRENCY 개까지 동시에 수집
+        (브라우저 소스는 SourceCoordinator가 CRAWL_MAX_CONCURRENCY 개로 제한)
+        """
+        if SchedulerService._app is None:
+            logger.error("Flask app not available")
+            return
+
+        if SchedulerService._planner is None:
+            SchedulerService._planner = AdaptiveCrawlPlanner()
+
+        with SchedulerService._app.app_context():
+            try:
+                tickers = self._get_active_tickers()
+                if not tickers:
+                    logger.info("No active stocks to crawl")
+                    return
+
+                due_tickers = SchedulerService._planner.get_due_tickers(db.session, tickers)
+            except Exception as e:
+                logger.error(f"Adaptive crawl dispatch failed: {e}")
+                return
+
+        if not due_tickers:
+            logger.debug("No tickers due for adaptive crawl")
+            return
+
+        crawl_window_hours = max(Config.CRAWL_LOOKBACK_HOURS, Config.CRAWL_INTERVAL_HOURS * 2)
+        max_workers = max(1, min(Config.CRAWL_TICKER_CONCURRENCY, len(due_tickers)))
+        logger.info(f"Adaptive crawl for {len(due_tickers)} due tickers (workers={max_workers}): {due_tickers}")
+
+        total_news = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._crawl_ticker_adaptive, ticker, crawl_window_hours): ticker
+                for ticker in due_tickers
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    result = future.result()
+                    if result.get('status') in ['SUCCESS', 'PARTIAL']:
+                        total_news += result.get('count', 0)
+                    else:
+                        logger.warning(f"Crawl failed for {ticker}: {result.get('error')}")
+                except Exception as e:
+                    logger.error(f"Error crawling {ticker}: {e}")
+
+        logger.info(f"Adaptive crawl completed: {total_news} news items stored")
+
+    def _crawl_ticker_adaptive(self, ticker: str, crawl_window_hours: int) -> Dict[str, Any]:
+        """
+        단일 티커 크롤링 후 다음 실행 시각 갱신 (워커 스레드용, 자체 앱 컨텍스트 사용)
+
+        Args:
+            ticker: 티커 심볼
+            crawl_window_hours: 수집 대상 기간 (시간)
+
+        Returns:
+            CrawlerService.crawl_ticker 결과
+        """
+        with SchedulerService._app.app_context():
+            storage = None
+            try:
+                from app.services.crawler_service import CrawlerService
+                from app.services.news_storage import create_news_storage
+
+                storage = create_news_storage()
+                crawler = CrawlerService(
+                    db_session=db.session,
+                    news_storage=storage
+                )
+                return crawler.crawl_ticker(ticker, hours_ago=crawl_window_hours)
+            except Exception as e:
+                logger.error(f"Error crawling {ticker}: {e}")
+                return {'status': 'FAILED', 'count': 0, 'error': str(e)}
+            finally:
+                # 실패해도 다음 시각은 갱신 (실패 티커의 반복 실행 방지)
+                try:
+                    SchedulerService._planner.mark_crawled(db.session, ticker, storage)
+                except Exception as e:
+                    logger.error(f"Failed to update adaptive schedule for {ticker}: {e}")
+
     def run_crawl_for_user(self, tickers: List[str]) -> None:
         """
         특정 사용자(지정된 티커 리스트)에 대해 뉴스 수집 실행
@@ -220,9 +452,9 @@ class SchedulerService:
         with SchedulerService._app.app_context():
             try:
                 from app.services.crawler_service import CrawlerService
-                from app.services.news_storage import NewsStorageAdapter
+                from app.services.news_storage import create_news_storage
                 
-                storage = NewsStorageAdapter()
+                storage = create_news_storage()
                 crawler = CrawlerService(
                     db_session=db.session,
                     news_storage=storage
@@ -312,19 +544,17 @@ class SchedulerService:
 
                 logger.info(f"Found {len(users_to_notify)} users to notify")
                 
+                tickers_by_user = self._get_tickers_by_user([user.id for user, _ in users_to_notify])
+
                 for user, setting in users_to_notify:
                     try:
                         # 사용자의 관심 종목 조회
-                        user_stocks = UserStock.query.filter_by(
-                            user_id=user.id
-                        ).all()
+                        tickers = tickers_by_user.get(user.id, [])
                         
-                        if not user_stocks:
+                        if not tickers:
                             logger.info(f"No stocks for user {user.username}")
                             continue
                         
-                        tickers = [stock.ticker_symbol for stock in user_stocks]
-                        
                         # 마지막 보고서 발송 이후의 뉴스 조회 (24시간, UTC 기준)
                         # 크롤링 주기가 3시간이지만, 뉴스 발행 시점이 다를 수 있음
                         news_by_stock = {}
@@ -430,6 +660,14 @@ class SchedulerService:
                 # 오래된 크롤링 로그 삭제 (SRS: 1년 이상)
                 self._cleanup_crawl_logs(days=365)
                 
+                # 오래된 크롤링 단계별 소요 시간 삭제
+                self._cleanup_stage_timings(days=Config.CRAWL_TIMING_RETENTION_DAYS)
+                
+                # 보관 기간이 지난 페이지 스냅샷 삭제
+                if Config.SNAPSHOT_ENABLED:
+                    from app.services.snapshot_store import get_snapshot_store
+                    get_snapshot_store().purge(Config.SNAPSHOT_RETENTION_DAYS)
+                
                 logger.info("Cleanup job completed")
 
             except Exception as e:
@@ -475,6 +713,27 @@ class SchedulerService:
             logger.error(f"Error cleaning crawl logs: {e}")
             db.session.rollback()
 
+    def _cleanup_stage_timings(self, days: int = 30) -> None:
+        """
+        오래된 크롤링 단계별 소요 시간 삭제
+        
+        Args:
+            days: 보관 일수
+        """
+        try:
+            from app.models.models import CrawlStageTiming
+            
+            cutoff = datetime.now(KST) - timedelta(days=days)
+            deleted = CrawlStageTiming.query.filter(CrawlStageTiming.recorded_at < cutoff).delete()
+            db.session.commit()
+            
+            if deleted:
+                logger.info(f"Deleted {deleted} old crawl stage timings")
+                
+        except Exception as e:
+            logger.error(f"Error cleaning crawl stage timings: {e}")
+            db.session.rollback()
+
     # ===== 수동 트리거 메서드 =====
 
     def trigger_crawl_now(self) -> bool:
@@ -536,12 +795,10 @@ class SchedulerService:
                         UserSetting.is_notification_enabled == True
                     ).all()
 
+                tickers_by_user = self._get_tickers_by_user([user.id for user, _ in users_to_notify])
+
                 for user, setting in users_to_notify:
-                    user_stocks = UserStock.query.filter_by(
-                        user_id=user.id
-                    ).all()
-                    
-                    tickers = [stock.ticker_symbol for stock in user_stocks]
+                    tickers = tickers_by_user.get(user.id, [])
                     language = setting.language if setting else 'ko'
                     
                     news_by_stock = {}
@@ -582,6 +839,17 @@ class SchedulerService:
                 })
         return jobs
 
+    def get_adaptive_schedule(self) -> List[Dict[str, Any]]:
+        """
+        적응형 크롤링 티커별 스케줄 조회
+
+        Returns:
+            티커별 다음 실행 시각/주기/velocity 목록 (fixed 모드면 빈 리스트)
+        """
+        if SchedulerService._planner is None:
+            return []
+        return SchedulerService._planner.get_schedule()
+
     def is_running(self) -> bool:
         """스케줄러 실행 여부"""
         if SchedulerService._scheduler:
@@ -630,11 +898,14 @@ class SchedulerService:
             logger.error(f"Failed to resume job: {e}")
         return False
 
-    def send_email_now(self) -> Dict[str, Any]:
+    def send_email_now(self, progress=None) -> Dict[str, Any]:
         """
         모든 활성 사용자에게 즉시 이메일 발송 (수동 트리거용)
         시간 체크 없이 알림이 활성화된 모든 사용자에게 발송
         
+        Args:
+            progress: 진행 상황 기록기 (app.services.background_jobs.JobProgress, 백그라운드 작업으로 실행 시)
+        
         Returns:
             발송 결과 딕셔너리
         """
@@ -674,20 +945,22 @@ class SchedulerService:
                     }
 
                 logger.info(f"Found {len(users_to_notify)} users to notify")
+                if progress:
+                    progress.set_total(len(users_to_notify))
                 
+                tickers_by_user = self._get_tickers_by_user([user.id for user, _ in users_to_notify])
+
                 for user, setting in users_to_notify:
                     try:
                         # 사용자의 관심 종목 조회
-                        user_stocks = UserStock.query.filter_by(
-                            user_id=user.id
-                        ).all()
+                        tickers = tickers_by_user.get(user.id, [])
                         
-                        if not user_stocks:
+                        if not tickers:
                             logger.info(f"No stocks for user {user.username}")
+                            if progress:
+                                progress.skipped()
                             continue
                         
-                        tickers = [stock.ticker_symbol for stock in user_stocks]
-                        
                         # 최근 48시간 뉴스 조회
                         news_by_stock = {}
                         for ticker in tickers:
@@ -716,10 +989,14 @@ class SchedulerService:
                         else:
                             failed_count += 1
                             logger.warning(f"Failed to send email to {user.email}: {error}")
+                        if progress:
+                            (progress.sent if success else progress.failed)()
 
                     except Exception as e:
                         failed_count += 1
                         logger.error(f"Error sending email to {user.username}: {e}")
+                        if progress:
+                            progress.failed()
                         continue
 
                 logger.info(f"Manual email send completed: {sent_count} sent, {failed_count} failed")
@@ -744,6 +1021,14 @@ class SchedulerService:
             SchedulerService._scheduler.shutdown(wait=False)
             logger.info("Scheduler shutdown completed")
 
+        # 리스를 바로 넘겨 대기 중인 프로세스가 TTL을 기다리지 않게 함
+        if SchedulerService._election and SchedulerService._election.is_leader and SchedulerService._app:
+            try:
+                with SchedulerService._app.app_context():
+                    SchedulerService._election.release()
+            except Exception as e:
+                logger.error(f"Failed to release scheduler lock: {e}")
+
 
 # 싱글톤 인스턴스
 scheduler_service = SchedulerService()
@@ -0,0 +1,166 @@
+"""
+스케줄러 리더 선출 (DB 리스)
+- scheduler_locks 테이블의 한 행을 만료 시각이 있는 리스로 사용
+- 리스를 가진 프로세스만 스케줄 작업을 실행하고, 나머지는 대기(standby)
+- 리더가 죽으면 리스 만료(SCHEDULER_LOCK_TTL_SECONDS) 후 다른 프로세스가 인계
+"""
+
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import case, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.models import SchedulerLock, KST
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCK_NAME = 'scheduler'
+
+
+def _now_kst() -> datetime:
+    """DB 저장값과 비교 가능한 KST 기준 naive datetime"""
+    return datetime.now(KST).replace(tzinfo=None)
+
+
+def make_owner_id() -> str:
+    """프로세스 식별자 (host:pid:random)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderElection:
+    """
+    DB 리스 기반 리더 선출
+
+    - try_acquire(): 리스가 비었거나 만료됐거나 내 것이면 획득/갱신 (UPDATE ... WHERE 1문장으로 원자적)
+    - release(): 내 리스를 즉시 만료시켜 다른 프로세스가 바로 인계할 수 있게 함
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        name: str = DEFAULT_LOCK_NAME,
+        ttl_seconds: Optional[int] = None,
+        owner_id: Optional[str] = None
+    ):
+        """
+        초기화
+
+        Args:
+            db_session: SQLAlchemy 세션
+            name: 잠금 이름
+            ttl_seconds: 리스 유효 시간 (기본: SCHEDULER_LOCK_TTL_SECONDS)
+            owner_id: 소유자 식별자 (기본: host:pid:random)
+        """
+        self.db = db_session
+        self.name = name
+        self.ttl = timedelta(seconds=max(ttl_seconds or Config.SCHEDULER_LOCK_TTL_SECONDS, 1))
+        self.owner_id = owner_id or make_owner_id()
+        self._leader_until: Optional[datetime] = None
+
+    @property
+    def is_leader(self) -> bool:
+        """마지막으로 확인한 리스가 아직 유효한지 여부"""
+        return self._leader_until is not None and _now_kst() < self._leader_until
+
+    def try_acquire(self) -> bool:
+        """
+        리스 획득 또는 갱신
+
+        Returns:
+            리더 여부
+        """
+        now = _now_kst()
+        expires_at = now + self.ttl
+
+        try:
+            stmt = (
+                update(SchedulerLock)
+                .where(
+                    SchedulerLock.name == self.name,
+                    or_(SchedulerLock.owner_id == self.owner_id, SchedulerLock.expires_at < now)
+                )
+                .values(
+                    owner_id=self.owner_id,
+                    acquired_at=case(
+                        (SchedulerLock.owner_id == self.owner_id, SchedulerLock.acquired_at),
+                        else_=now
+                    ),
+                    heartbeat_at=now,
+                    expires_at=expires_at
+                )
+                .execution_options(synchronize_session=False)
+            )
+            acquired = self.db.execute(stmt).rowcount == 1
+
+            if not acquired and self.db.get(SchedulerLock, self.name) is None:
+                self.db.add(SchedulerLock(
+                    name=self.name,
+                    owner_id=self.owner_id,
+                    acquired_at=now,
+                    heartbeat_at=now,
+                    expires_at=expires_at
+                ))
+                self.db.flush()
+                acquired = True
+
+            self.db.commit()
+        except IntegrityError:
+            # 다른 프로세스가 동시에 첫 행을 생성함
+            self.db.rollback()
+            acquired = False
+        except Exception as e:
+            logger.error(f"Failed to acquire scheduler lock '{self.name}': {e}")
+            self.db.rollback()
+            acquired = False
+
+        was_leader = self.is_leader
+        self._leader_until = expires_at if acquired else None
+
+        if acquired and not was_leader:
+            logger.info(f"Acquired scheduler lock '{self.name}' as {self.owner_id}")
+        elif was_leader and not acquired:
+            logger.warning(f"Lost scheduler lock '{self.name}' ({self.owner_id})")
+        return acquired
+
+    def release(self) -> None:
+        """보유 중인 리스 해제"""
+        self._leader_until = None
+        try:
+            stmt = (
+                update(SchedulerLock)
+                .where(SchedulerLock.name == self.name, SchedulerLock.owner_id == self.owner_id)
+                .values(expires_at=_now_kst())
+                .execution_options(synchronize_session=False)
+            )
+            if self.db.execute(stmt).rowcount:
+                logger.info(f"Released scheduler lock '{self.name}' ({self.owner_id})")
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Failed to release scheduler lock '{self.name}': {e}")
+            self.db.rollback()
+
+
+def get_lock_status(db_session: Session, name: str = DEFAULT_LOCK_NAME) -> Optional[Dict[str, Any]]:
+    """
+    현재 리스 보유 상태 조회 (관리자 화면용)
+
+    Args:
+        db_session: SQLAlchemy 세션
+        name: 잠금 이름
+
+    Returns:
+        리스 정보 + active 여부 (행이 없으면 None)
+    """
+    lock = db_session.get(SchedulerLock, name)
+    if lock is None:
+        return None
+    status = lock.to_dict()
+    status['active'] = lock.expires_at > _now_kst()
+    return status
@@ -0,0 +1,263 @@
+"""
+티커 -> investing.com 뉴스 URL 해석기
+- 정적 매핑(TICKER_TO_INVESTING_SLUG / TICKER_TO_ETF_SLUG)에 없는 티커는 검색 페이지에서
+  정식 종목 경로를 한 번 찾아 ticker_slugs 테이블에 저장 (이후 크롤링은 뉴스 페이지로 바로 이동)
+- 뉴스 페이지가 404이면 무효화 후 다음 크롤링에서 다시 해석
+- 해석 실패는 지수 백오프로 재시도 (매 크롤링마다 검색 페이지를 로딩하지 않도록)
+"""
+
+import logging
+import re
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+from flask import has_app_context
+
+from app.extensions import db
+from app.models.models import StockMaster, TickerSlug, KST
+from app.services.crawler import CrawlBlockedError
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+# 검색 결과의 종목 링크 (/equities/tesla-motors, /etfs/spdr-s-p-500)
+_INSTRUMENT_PATH_RE = re.compile(r'^(?:https?://[^/]+)?(/(?:equities|etfs)/[a-z0-9][a-z0-9-]*)/?$')
+_MAX_RETRY_HOURS = 24 * 7
+
+
+def parse_search_results(html: str, ticker: str) -> Optional[str]:
+    """
+    investing.com 검색 결과에서 티커의 종목 경로 추출
+
+    Args:
+        html: 검색 페이지 HTML
+        ticker: 티커 심볼
+
+    Returns:
+        종목 경로 (예: /equities/tesla-motors) 또는 None (결과 항목에 티커가 없으면 - 다른 종목 경로를 저장하지 않도록)
+    """
+    if not html:
+        return None
+
+    soup = BeautifulSoup(html, 'lxml')
+    symbol = ticker.upper()
+    for link in soup.find_all('a', href=True):
+        match = _INSTRUMENT_PATH_RE.match(link['href'].split('?')[0])
+        if not match:
+            continue
+        path = match.group(1)
+        # 결과 항목 텍스트에 티커가 단어로 있는 종목만 (예: "TSLA | Tesla Inc | NASDAQ")
+        tokens = re.split(r'[^A-Z0-9.]+', link.get_text(' ', strip=True).upper())
+        if symbol in tokens:
+            return path
+
+    return None
+
+
+class SlugResolver:
+    """티커별 뉴스 경로 해석/캐시 (메모리 -> ticker_slugs -> 정적 매핑)"""
+
+    def __init__(self, retry_hours: Optional[int] = None):
+        """
+        초기화
+
+        Args:
+            retry_hours: 해석 실패 후 재시도까지 기본 대기 시간 (실패마다 2배, 최대 7일)
+        """
+        self.retry_hours = retry_hours if retry_hours is not None else Config.SLUG_RETRY_HOURS
+        self._cache: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, ticker: str) -> Optional[str]:
+        """
+        저장된 뉴스 경로 조회 (네트워크 접근 없음)
+
+        Args:
+            ticker: 티커 심볼
+
+        Returns:
+            뉴스 경로 (예: /equities/tesla-motors-news) 또는 None
+        """
+        ticker = ticker.upper()
+        cached = self._cache.get(ticker)
+        if cached:
+            return cached
+
+        row = self._get_row(ticker)
+        if row is not None:
+            # 무효화/해석 실패 기록이 있으면 정적 매핑도 사용하지 않음
+            if row.news_path:
+                self._remember(ticker, row.news_path)
+            return row.news_path
+
+        path = self._static_path(ticker)
+        if path:
+            self._remember(ticker, path)
+        return path
+
+    def needs_resolution(self, ticker: str) -> bool:
+        """
+        검색으로 해석해야 하는지 여부 (저장된 경로가 없고 재시도 대기 중이 아님)
+
+        Args:
+            ticker: 티커 심볼
+
+        Returns:
+            해석 필요 여부
+        """
+        ticker = ticker.upper()
+        if self.lookup(ticker):
+            return False
+        row = self._get_row(ticker)
+        if row is None or row.source == 'invalidated':
+            return True
+        backoff = min(self.retry_hours * 2 ** max(row.failure_count - 1, 0), _MAX_RETRY_HOURS)
+        return row.resolved_at <= self._now() - timedelta(hours=backoff)
+
+    def resolve(self, ticker: str, fetch: Callable[[str], str], base_url: str) -> Optional[str]:
+        """
+        검색 페이지에서 정식 뉴스 경로를 찾아 저장
+
+        Args:
+            ticker: 티커 심볼
+            fetch: URL -> HTML 함수 (Selenium 드라이버 / requests)
+            base_url: 사이트 주소
+
+        Returns:
+            뉴스 경로 또는 None (실패 시 백오프 기록)
+        """
+        ticker = ticker.upper()
+        search_url = f"{base_url.rstrip('/')}/search/?q={ticker}"
+        try:
+            instrument_path = parse_search_results(fetch(search_url), ticker)
+        except CrawlBlockedError:
+            # 차단은 해석 실패로 기록하지 않음 (백오프 후 다시 시도)
+            raise
+        except Exception as e:
+            logger.warning(f"Slug search failed for {ticker}: {e}")
+            instrument_path = None
+
+        if not instrument_path:
+            logger.info(f"Could not resolve investing.com news URL for {ticker}")
+            self._save(ticker, None, 'search', failed=True)
+            return None
+
+        news_path = f"{instrument_path}-news"
+        logger.info(f"Resolved news URL for {ticker}: {news_path}")
+        self._save(ticker, news_path, 'search')
+        self._remember(ticker, news_path)
+        return news_path
+
+    def invalidate(self, ticker: str) -> None:
+        """
+        뉴스 경로 무효화 (404 등), 다음 크롤링에서 다시 해석
+
+        Args:
+            ticker: 티커 심볼
+        """
+        ticker = ticker.upper()
+        with self._lock:
+            self._cache.pop(ticker, None)
+        logger.warning(f"Invalidated news URL for {ticker}")
+        self._save(ticker, None, 'invalidated')
+
+    def resolve_all(
+        self,
+        tickers: Optional[List[str]] = None,
+        fetcher_factory: Optional[Callable] = None,
+        base_url: Optional[str] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        stock_master 전체(또는 지정 티커) 사전 해석 (앱 컨텍스트 필요)
+
+        Args:
+            tickers: 티커 목록 (None이면 stock_master 전체)
+            fetcher_factory: 페이지 로더 생성 함수 (기본: SeleniumPageFetcher)
+            base_url: 사이트 주소 (기본: investing.com)
+
+        Returns:
+            {ticker: 뉴스 경로 또는 None}
+        """
+        from app.services.backfill import SeleniumPageFetcher
+        from app.services.crawler import InvestingCrawler
+
+        if tickers is None:
+            tickers = [row.ticker_symbol for row in db.session.query(StockMaster.ticker_symbol)]
+        tickers = sorted(set(t.upper() for t in tickers))
+        base_url = base_url or InvestingCrawler.BASE_URL
+
+        results = {ticker: self.lookup(ticker) for ticker in tickers}
+        pending = [ticker for ticker in tickers if self.needs_resolution(ticker)]
+        if not pending:
+            return results
+
+        logger.info(f"Resolving news URLs for {len(pending)} tickers")
+        with (fetcher_factory or SeleniumPageFetcher)() as fetcher:
+            for ticker in pending:
+                results[ticker] = self.resolve(ticker, fetcher.fetch, base_url)
+        return results
+
+    def clear_cache(self) -> None:
+        """메모리 캐시 초기화"""
+        with self._lock:
+            self._cache.clear()
+
+    def _remember(self, ticker: str, path: str) -> None:
+        with self._lock:
+            self._cache[ticker] = path
+
+    def _static_path(self, ticker: str) -> Optional[str]:
+        from app.services.crawler import TICKER_TO_INVESTING_SLUG, TICKER_TO_ETF_SLUG
+
+        slug = TICKER_TO_INVESTING_SLUG.get(ticker)
+        if slug:
+            return f"/equities/{slug}-news"
+        etf_slug = TICKER_TO_ETF_SLUG.get(ticker)
+        if etf_slug:
+            return f"/etfs/{etf_slug}-news"
+        return None
+
+    def _get_row(self, ticker: str) -> Optional[TickerSlug]:
+        # 앱 컨텍스트 밖(단독 크롤러 실행)에서는 정적 매핑만 사용
+        if not has_app_context():
+            return None
+        try:
+            return db.session.get(TickerSlug, ticker)
+        except Exception as e:
+            logger.debug(f"ticker_slugs lookup failed for {ticker}: {e}")
+            db.session.rollback()
+            return None
+
+    def _save(self, ticker: str, news_path: Optional[str], source: str, failed: bool = False) -> None:
+        if not has_app_context():
+            return
+        try:
+            row = db.session.get(TickerSlug, ticker)
+            if row is None:
+                row = TickerSlug(ticker_symbol=ticker, failure_count=0)
+                db.session.add(row)
+            row.news_path = news_path
+            row.source = source
+            row.resolved_at = self._now()
+            row.failure_count = row.failure_count + 1 if failed else 0
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Failed to save ticker slug for {ticker}: {e}")
+            db.session.rollback()
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(KST).replace(tzinfo=None)
+
+
+_slug_resolver: Optional[SlugResolver] = None
+
+
+def get_slug_resolver() -> SlugResolver:
+    """SlugResolver 싱글톤 반환"""
+    global _slug_resolver
+    if _slug_resolver is None:
+        _slug_resolver = SlugResolver()
+    return _slug_resolver
@@ -0,0 +1,340 @@
+"""
+크롤링 페이지 스냅샷 저장소
+- fetch_news/백필이 받은 원본 HTML을 gzip 파일로 저장 ({root}/{TICKER}/{YYYYMMDD}/{HHMMSS_ffffff}.html.gz)
+- 같은 디렉터리의 index.sqlite에 티커/시각/URL/파싱 결과 수 기록
+  (크롤링 스레드는 앱 컨텍스트 밖에서 실행되므로 앱 DB가 아닌 독립 SQLite 사용)
+- replay_snapshots: 저장된 페이지를 CPU 코어 수만큼 병렬로 다시 파싱 (파서 수정 검증/벤치마크용)
+"""
+
+import gzip
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.models.models import KST
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = 'index.sqlite'
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker_symbol TEXT NOT NULL,
+    company_name TEXT,
+    url TEXT NOT NULL,
+    captured_at TEXT NOT NULL,
+    path TEXT NOT NULL,
+    page_status TEXT,
+    article_count INTEGER NOT NULL DEFAULT 0,
+    size_bytes INTEGER NOT NULL,
+    compressed_bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_snapshots_ticker_captured ON snapshots (ticker_symbol, captured_at);
+CREATE INDEX IF NOT EXISTS ix_snapshots_captured ON snapshots (captured_at);
+'''
+
+
+class SnapshotStore:
+    """gzip 파일 + SQLite 인덱스 스냅샷 저장소 (스레드 안전)"""
+
+    def __init__(self, root: Optional[str] = None, compress_level: int = 6):
+        """
+        초기화
+
+        Args:
+            root: 저장 디렉터리 (기본: Config.SNAPSHOT_DIR)
+            compress_level: gzip 압축 수준 (1-9)
+        """
+        self.root = Path(root or Config.SNAPSHOT_DIR)
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.root / INDEX_FILENAME), timeout=30)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    def save(
+        self,
+        ticker: str,
+        url: str,
+        html: str,
+        company_name: Optional[str] = None,
+        page_status: Optional[str] = None,
+        article_count: int = 0,
+        captured_at: Optional[datetime] = None
+    ) -> Optional[int]:
+        """
+        페이지 HTML 저장
+
+        Args:
+            ticker: 티커 심볼
+            url: 페이지 URL
+            html: 원본 HTML
+            company_name: 회사명 (재파싱 시 사용)
+            page_status: 페이지 상태 (ok / empty / blocked ...)
+            article_count: 당시 파싱된 기사 수
+            captured_at: 수집 시각 (기본: 현재, naive KST)
+
+        Returns:
+            스냅샷 ID (실패 시 None - 크롤링은 계속)
+        """
+        if not html:
+            return None
+        captured_at = captured_at or datetime.now(KST).replace(tzinfo=None)
+        ticker = ticker.upper()
+        relative = Path(ticker) / captured_at.strftime('%Y%m%d') / f"{captured_at.strftime('%H%M%S_%f')}.html.gz"
+
+        try:
+            path = self.root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            raw = html.encode('utf-8')
+            compressed = gzip.compress(raw, compresslevel=self.compress_level)
+            # 쓰다 만 파일이 남지 않도록 임시 파일에 쓴 뒤 이름 변경
+            tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            tmp_path.write_bytes(compressed)
+            os.replace(tmp_path, path)
+
+            conn = self._connect()
+            try:
+                with conn:
+                    cursor = conn.execute(
+                        'INSERT INTO snapshots (ticker_symbol, company_name, url, captured_at, path, '
+                        'page_status, article_count, size_bytes, compressed_bytes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                        (ticker, company_name, url, captured_at.isoformat(), relative.as_posix(),
+                         page_status, article_count, len(raw), len(compressed))
+                    )
+                return cursor.lastrowid
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"Failed to save page snapshot for {ticker}: {e}")
+            return None
+
+    def load(self, snapshot: Dict) -> str:
+        """
+        스냅샷 HTML 읽기
+
+        Args:
+            snapshot: list_snapshots 항목 (path 필요)
+
+        Returns:
+            원본 HTML
+        """
+        return load_snapshot_html(str(self.root), snapshot['path'])
+
+    def list_snapshots(
+        self,
+        tickers: Optional[List[str]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        스냅샷 목록 (수집 시각 순)
+
+        Args:
+            tickers: 티커 필터
+            since: 이 시각 이후 (naive KST)
+            until: 이 시각 이전
+            limit: 최대 개수
+
+        Returns:
+            [{'id', 'ticker_symbol', 'company_name', 'url', 'captured_at', 'path', 'page_status',
+              'article_count', 'size_bytes', 'compressed_bytes'}, ...]
+        """
+        if not (self.root / INDEX_FILENAME).exists():
+            return []
+
+        clauses, params = [], []
+        if tickers:
+            clauses.append(f"ticker_symbol IN ({','.join('?' * len(tickers))})")
+            params.extend(t.upper() for t in tickers)
+        if since:
+            clauses.append('captured_at >= ?')
+            params.append(since.isoformat())
+        if until:
+            clauses.append('captured_at < ?')
+            params.append(until.isoformat())
+        query = 'SELECT * FROM snapshots'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY captured_at, id'
+        if limit:
+            query += f' LIMIT {int(limit)}'
+
+        conn = self._connect()
+        try:
+            return [dict(row) for row in conn.execute(query, params)]
+        finally:
+            conn.close()
+
+    def purge(self, older_than_days: Optional[int] = None) -> int:
+        """
+        보관 기간이 지난 스냅샷 삭제
+
+        Args:
+            older_than_days: 보관 일수 (기본: Config.SNAPSHOT_RETENTION_DAYS)
+
+        Returns:
+            삭제된 스냅샷 수
+        """
+        days = older_than_days if older_than_days is not None else Config.SNAPSHOT_RETENTION_DAYS
+        cutoff = datetime.now(KST).replace(tzinfo=None) - timedelta(days=days)
+        expired = self.list_snapshots(until=cutoff)
+        if not expired:
+            return 0
+
+        for snapshot in expired:
+            try:
+                (self.root / snapshot['path']).unlink()
+            except FileNotFoundError:
+                pass
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute('DELETE FROM snapshots WHERE captured_at < ?', (cutoff.isoformat(),))
+        finally:
+            conn.close()
+
+        # 빈 날짜/티커 디렉터리 정리
+        for directory in sorted((p for p in self.root.glob('*/*') if p.is_dir()), reverse=True):
+            for path in (directory, directory.parent):
+                try:
+                    path.rmdir()
+                except OSError:
+                    pass
+        logger.info(f"Purged {len(expired)} page snapshots older than {days} days")
+        return len(expired)
+
+    def stats(self) -> Dict:
+        """스냅샷 수/원본 크기/압축 크기 합계"""
+        if not (self.root / INDEX_FILENAME).exists():
+            return {'count': 0, 'size_bytes': 0, 'compressed_bytes': 0}
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size_bytes), 0), COALESCE(SUM(compressed_bytes), 0) FROM snapshots'
+            ).fetchone()
+        finally:
+            conn.close()
+        return {'count': row[0], 'size_bytes': row[1], 'compressed_bytes': row[2]}
+
+
+def load_snapshot_html(root: str, relative_path: str) -> str:
+    """스냅샷 파일 압축 해제"""
+    with gzip.open(Path(root) / relative_path, 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+# 프로세스별 파서용 크롤러 (브라우저 없이 bs4 파서만 사용)
+_replay_crawler = None
+
+
+def _replay_one(root: str, snapshot: Dict, max_articles: int) -> Dict:
+    """스냅샷 1개 재파싱 (워커 프로세스에서 실행)"""
+    global _replay_crawler
+    if _replay_crawler is None:
+        from app.services.crawler import InvestingCrawler
+        _replay_crawler = InvestingCrawler()
+
+    started = time.perf_counter()
+    result = {
+        'id': snapshot['id'],
+        'ticker_symbol': snapshot['ticker_symbol'],
+        'captured_at': snapshot['captured_at'],
+        'previous_count': snapshot['article_count'],
+        'articles': [],
+        'error': None
+    }
+    try:
+        html = load_snapshot_html(root, snapshot['path'])
+        result['articles'] = _replay_crawler._parse_news_articles_bs4(
+            html,
+            snapshot['ticker_symbol'],
+            snapshot['company_name'] or snapshot['ticker_symbol'],
+            datetime(1970, 1, 1, tzinfo=timezone.utc),
+            max_articles
+        )
+    except Exception as e:
+        result['error'] = str(e)
+    result['parse_ms'] = int((time.perf_counter() - started) * 1000)
+    return result
+
+
+def _replay_chunk(root: str, snapshots: List[Dict], max_articles: int) -> List[Dict]:
+    return [_replay_one(root, snapshot, max_articles) for snapshot in snapshots]
+
+
+def replay_snapshots(
+    store: SnapshotStore,
+    snapshots: List[Dict],
+    workers: Optional[int] = None,
+    max_articles: int = 200
+) -> Dict:
+    """
+    저장된 페이지를 현재 파서(_parse_news_articles_bs4)로 다시 파싱
+
+    Args:
+        store: 스냅샷 저장소
+        snapshots: list_snapshots 결과
+        workers: 프로세스 수 (기본: CPU 코어 수, 1이면 현재 프로세스에서 실행)
+        max_articles: 페이지당 최대 기사 수
+
+    Returns:
+        {'results': [...], 'snapshots', 'articles', 'empty', 'errors', 'elapsed_seconds', 'pages_per_second'}
+        (empty: 기사를 하나도 찾지 못한 스냅샷 수 - 셀렉터 회귀 확인용)
+    """
+    workers = workers or os.cpu_count() or 1
+    root = str(store.root)
+    started = time.perf_counter()
+
+    if workers <= 1 or len(snapshots) <= 1:
+        results = _replay_chunk(root, snapshots, max_articles)
+    else:
+        # 프로세스 간 전달 비용을 줄이도록 묶음 단위로 분배 (순서 유지)
+        chunk_size = max(1, len(snapshots) // (workers * 4))
+        chunks = [snapshots[i:i + chunk_size] for i in range(0, len(snapshots), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = [
+                result
+                for chunk_results in executor.map(_replay_chunk, [root] * len(chunks), chunks, [max_articles] * len(chunks))
+                for result in chunk_results
+            ]
+
+    elapsed = time.perf_counter() - started
+    return {
+        'results': results,
+        'snapshots': len(results),
+        'articles': sum(len(r['articles']) for r in results),
+        'empty': sum(1 for r in results if r['error'] is None and not r['articles']),
+        'errors': sum(1 for r in results if r['error']),
+        'elapsed_seconds': round(elapsed, 3),
+        'pages_per_second': round(len(results) / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+
+_snapshot_store: Optional[SnapshotStore] = None
+
+
+def get_snapshot_store() -> SnapshotStore:
+    """SnapshotStore 싱글톤 반환"""
+    global _snapshot_store
+    if _snapshot_store is None:
+        _snapshot_store = SnapshotStore()
+    return _snapshot_store
@@ -0,0 +1,700 @@
+"""
+SQLite FTS5 뉴스 저장소
+- NewsStorageBackend 구현 (NEWS_STORAGE_BACKEND=sqlite) - ES/JVM 없이 소규모 설치와 테스트에서 사용
+- news: 원문 JSON + 필터/정렬 컬럼 (티커, 발행 시각 UTC epoch, 감성, source_url)
+- news_fts: 제목/본문 FTS5 인덱스 (rowid = news.rowid, 같은 트랜잭션에서 함께 갱신)
+- 스레드마다 연결 1개 (WAL), 쓰기는 BEGIN IMMEDIATE 트랜잭션
+- 반환 형식은 ES 구현과 동일 (날짜 범위/일별 집계는 ES처럼 UTC 기준, timezone 없는 값은 UTC로 간주)
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dateutil import parser as date_parser
+
+from app.services.news_storage import BACKEND_SQLITE, REQUIRED_FIELDS, NewsStorageBackend
+from app.utils.config import Config
+from app.utils.sqlite_tuning import apply_pragmas
+
+logger = logging.getLogger(__name__)
+
+# IN (...) 한 번에 넣는 값 수 (SQLITE_MAX_VARIABLE_NUMBER 기본값 이하)
+IN_CHUNK_SIZE = 500
+
+# get_recent_news 최대 건수 (ES 구현과 동일)
+RECENT_NEWS_LIMIT = 100
+
+_DAY_SECONDS = 86400
+_TOKEN_RE = re.compile(r'[^\W_]+', re.UNICODE)
+_DATE_ONLY_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS news (
+        rowid INTEGER PRIMARY KEY,
+        news_id TEXT NOT NULL UNIQUE,
+        ticker_symbol TEXT NOT NULL,
+        source_url TEXT,
+        company_name TEXT,
+        published_ts REAL NOT NULL,
+        crawled_ts REAL,
+        sentiment TEXT,
+        sentiment_score REAL,
+        doc TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_news_ticker_published ON news (ticker_symbol, published_ts)",
+    "CREATE INDEX IF NOT EXISTS ix_news_published ON news (published_ts)",
+    "CREATE INDEX IF NOT EXISTS ix_news_source_url ON news (source_url)",
+    # 제목 + 본문 (ES multi_match 대상 필드와 동일)
+    "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(title, content, tokenize='unicode61 remove_diacritics 2')",
+)
+
+
+def to_timestamp(value, end_of_day: bool = False) -> Optional[float]:
+    """
+    날짜 값 -> UTC epoch 초
+
+    Args:
+        value: ISO 문자열 / datetime (timezone 없으면 UTC로 간주 - ES date 필드와 동일)
+        end_of_day: 'YYYY-MM-DD'만 있는 값을 그날의 마지막 시각으로 (ES lte 반올림과 동일)
+
+    Returns:
+        epoch 초 (파싱 실패 시 None)
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        text = str(value).strip()
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            try:
+                parsed = date_parser.parse(text)
+            except (ValueError, OverflowError):
+                return None
+        if end_of_day and _DATE_ONLY_RE.match(text):
+            parsed = parsed + timedelta(days=1) - timedelta(microseconds=1)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def build_match_query(keyword: str) -> str:
+    """
+    검색어 -> FTS5 MATCH 식 (토큰 OR - ES multi_match 기본 연산자와 동일)
+
+    Args:
+        keyword: 사용자 입력 검색어
+
+    Returns:
+        MATCH 식 (토큰이 없으면 빈 문자열)
+    """
+    tokens = dict.fromkeys(token.lower() for token in _TOKEN_RE.findall(keyword or ''))
+    return ' OR '.join(f'"{token}"' for token in tokens)
+
+
+def _chunks(values: List, size: int = IN_CHUNK_SIZE) -> Iterable[List]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class SQLiteNewsStorage(NewsStorageBackend):
+    """SQLite FTS5 뉴스 저장소 (스레드 안전)"""
+
+    backend_name = BACKEND_SQLITE
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        초기화 (DB 파일/테이블 생성)
+
+        Args:
+            path: DB 파일 경로 (기본: Config.NEWS_SQLITE_PATH, ':memory:'면 프로세스 내 공유 메모리 DB)
+        """
+        self.path = path or Config.NEWS_SQLITE_PATH
+        self._memory = self.path == ':memory:'
+        if self._memory:
+            # 스레드별 연결이 같은 DB를 보도록 공유 캐시 메모리 DB 사용 (연결 하나는 계속 유지)
+            self._uri = f"file:news_storage_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        else:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._uri = None
+        self._local = threading.local()
+        # SQLite는 쓰기를 한 번에 하나만 허용하므로 프로세스 안에서는 잠금 대기로 직렬화 (busy 재시도 없음)
+        self._write_lock = threading.Lock()
+        self._keeper = self._connect()
+        self._create_schema(self._keeper)
+        logger.info(f"SQLiteNewsStorage initialized: {self.path}")
+
+    # ==================== 연결 ====================
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._memory:
+            conn = sqlite3.connect(self._uri, uri=True, isolation_level=None, check_same_thread=False)
+            # 공유 캐시는 테이블 잠금이라 읽기가 쓰기와 충돌(SQLITE_LOCKED)하지 않도록 읽기 잠금 생략
+            conn.execute('PRAGMA read_uncommitted = 1')
+        else:
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            apply_pragmas(conn)
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (autocommit 모드, 쓰기는 명시적 트랜잭션)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        try:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        except sqlite3.OperationalError as e:
+            if 'fts5' in str(e):
+                raise RuntimeError(f"SQLite build without FTS5 support ({sqlite3.sqlite_version}): {e}")
+            raise
+
+    def close(self) -> None:
+        """현재 스레드 연결 종료"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ==================== 저장 ====================
+
+    @staticmethod
+    def _prepare(news: Dict, crawled_time: str) -> Tuple:
+        """뉴스 딕셔너리 -> news/news_fts 행 값 (필수 필드 누락/날짜 오류 시 ValueError)"""
+        for field in REQUIRED_FIELDS[1:]:
+            if field not in news:
+                raise ValueError(f"Missing required field: {field}")
+        published_ts = to_timestamp(news['published_date'])
+        if published_ts is None:
+            raise ValueError(f"Invalid published_date: {news['published_date']!r}")
+        if 'crawled_date' not in news:
+            news['crawled_date'] = crawled_time
+
+        sentiment = news.get('sentiment') if isinstance(news.get('sentiment'), dict) else {}
+        score = sentiment.get('score')
+        return (
+            str(news.get('news_id') or uuid.uuid4().hex),
+            news['ticker_symbol'],
+            news.get('source_url') or news.get('url'),
+            news.get('company_name'),
+            published_ts,
+            to_timestamp(news.get('crawled_date')),
+            sentiment.get('classification'),
+            score if isinstance(score, (int, float)) else None,
+            json.dumps(news, ensure_ascii=False, default=str),
+            news.get('title') or '',
+            news.get('content') or '',
+        )
+
+    def _write(self, rows: List[Tuple]) -> None:
+        """news_id가 같은 기존 문서를 지우고 rows 저장 (하나의 쓰기 트랜잭션)"""
+        conn = self.conn
+        with self._write_lock:
+            self._write_transaction(conn, rows)
+
+    @staticmethod
+    def _write_transaction(conn: sqlite3.Connection, rows: List[Tuple]) -> None:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            news_ids = [row[0] for row in rows]
+            for chunk in _chunks(news_ids):
+                marks = ','.join('?' * len(chunk))
+                conn.execute(
+                    f"DELETE FROM news_fts WHERE rowid IN (SELECT rowid FROM news WHERE news_id IN ({marks}))", chunk
+                )
+                conn.execute(f"DELETE FROM news WHERE news_id IN ({marks})", chunk)
+
+            # 쓰기 잠금 안에서 rowid를 직접 배정해 news/news_fts를 executemany로 함께 저장
+            start = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM news").fetchone()[0] + 1
+            conn.executemany(
+                "INSERT INTO news (rowid, news_id, ticker_symbol, source_url, company_name, published_ts, "
+                "crawled_ts, sentiment, sentiment_score, doc) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(start + i,) + row[:9] for i, row in enumerate(rows)]
+            )
+            conn.executemany(
+                "INSERT INTO news_fts (rowid, title, content) VALUES (?, ?, ?)",
+                [(start + i,) + row[9:] for i, row in enumerate(rows)]
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def save_news(self, news_data: Dict) -> bool:
+        """
+        단일 뉴스 저장 (news_id가 같으면 덮어씀)
+
+        Args:
+            news_data (Dict): 뉴스 데이터 (필수: news_id, ticker_symbol, title, content, published_date)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if 'news_id' not in news_data:
+            logger.error("Missing required field: news_id")
+            return False
+        try:
+            self._write([self._prepare(news_data, datetime.now().isoformat())])
+            logger.info(f"News saved successfully: {news_data['news_id']}")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving news: {e}")
+            return False
+
+    def bulk_save_news(self, news_list: List[Dict]) -> Dict:
+        """
+        뉴스 벌크 저장 (news_id가 없으면 생성)
+
+        Args:
+            news_list (List[Dict]): 뉴스 데이터 리스트
+
+        Returns:
+            Dict: {'success', 'failed', 'total', 'errors'}
+        """
+        if not news_list:
+            logger.warning("Empty news list provided")
+            return {"success": 0, "failed": 0, "total": 0, "errors": []}
+
+        crawled_time = datetime.now().isoformat()
+        rows: Dict[str, Tuple] = {}
+        errors = []
+        for news in news_list:
+            try:
+                row = self._prepare(news, crawled_time)
+                rows[row[0]] = row  # 같은 배치 안에서 news_id가 겹치면 마지막 문서 (ES bulk와 동일)
+            except ValueError as e:
+                errors.append(str(e))
+
+        try:
+            if rows:
+                self._write(list(rows.values()))
+        except Exception as e:
+            logger.error(f"Error in bulk save: {e}")
+            return {"success": 0, "failed": len(news_list), "total": len(news_list), "errors": errors + [str(e)]}
+
+        success = len(news_list) - len(errors)
+        logger.info(f"Bulk save completed: {success} success, {len(errors)} failed")
+        return {"success": success, "failed": len(errors), "total": len(news_list), "errors": errors}
+
+    # ==================== 조회 ====================
+
+    def get_news(self, news_id: str) -> Optional[Dict]:
+        """
+        뉴스 ID로 단일 뉴스 조회
+
+        Args:
+            news_id (str): 뉴스 ID
+
+        Returns:
+            Optional[Dict]: 뉴스 데이터 (없으면 None)
+        """
+        try:
+            row = self.conn.execute("SELECT doc FROM news WHERE news_id = ?", (news_id,)).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            logger.error(f"Error retrieving news {news_id}: {e}")
+            return None
+
+    @staticmethod
+    def _where(
+        ticker_symbol: Optional[str] = None,
+        ticker_symbols: Optional[List[str]] = None,
+        from_date=None,
+        to_date=None,
+        sentiment: Optional[str] = None,
+        keyword: Optional[str] = None
+    ) -> Tuple[str, List]:
+        """검색 조건 -> (WHERE 절, 파라미터)"""
+        clauses, params = [], []
+        if ticker_symbols:
+            clauses.append(f"ticker_symbol IN ({','.join('?' * len(ticker_symbols))})")
+            params.extend(ticker_symbols)
+        elif ticker_symbol:
+            clauses.append("ticker_symbol = ?")
+            params.append(ticker_symbol)
+        if sentiment:
+            clauses.append("sentiment = ?")
+            params.append(sentiment)
+        from_ts = to_timestamp(from_date)
+        if from_ts is not None:
+            clauses.append("published_ts >= ?")
+            params.append(from_ts)
+        to_ts = to_timestamp(to_date, end_of_day=True)
+        if to_ts is not None:
+            clauses.append("published_ts <= ?")
+            params.append(to_ts)
+        if keyword is not None:
+            clauses.append("rowid IN (SELECT rowid FROM news_fts WHERE news_fts MATCH ?)")
+            params.append(keyword)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def search_news(
+        self,
+        ticker_symbol: Optional[str] = None,
+        ticker_symbols: Optional[List[str]] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        sentiment: Optional[str] = None,
+        keyword: Optional[str] = None,
+        size: int = 20,
+        page: int = 1
+    ) -> Dict:
+        """
+        뉴스 검색 (발행일 내림차순)
+
+        Args:
+            ticker_symbol (str, optional): 종목 코드
+            ticker_symbols (List[str], optional): 종목 코드 목록 (지정하면 ticker_symbol 무시)
+            from_date (str, optional): 시작 날짜 (ISO format)
+            to_date (str, optional): 종료 날짜 (ISO format)
+            sentiment (str, optional): 감정 분류 (positive/negative/neutral)
+            keyword (str, optional): 검색 키워드 (제목+내용, 단어 하나 이상 일치)
+            size (int): 페이지당 결과 수
+            page (int): 페이지 번호 (1부터 시작)
+
+        Returns:
+            Dict: {'total', 'hits', 'page', 'size', 'pages'}
+        """
+        empty = {"total": 0, "hits": [], "page": page, "size": size, "pages": 0}
+        match = None
+        if keyword:
+            match = build_match_query(keyword)
+            if not match:
+                return empty
+        try:
+            where, params = self._where(ticker_symbol, ticker_symbols, from_date, to_date, sentiment, match)
+            total = self.conn.execute(f"SELECT COUNT(*) FROM news{where}", params).fetchone()[0]
+            rows = self.conn.execute(
+                f"SELECT news_id, doc FROM news{where} ORDER BY published_ts DESC LIMIT ? OFFSET ?",
+                params + [size, (page - 1) * size]
+            ).fetchall()
+        except Exception as e:
+            logger.error(f"Error searching news: {e}")
+            return empty
+
+        hits = []
+        for news_id, doc in rows:
+            news = json.loads(doc)
+            news['_id'] = news_id
+            hits.append(news)
+        logger.info(f"Search completed: {total} results found")
+        return {
+            "total": total,
+            "hits": hits,
+            "page": page,
+            "size": size,
+            "pages": (total + size - 1) // size
+        }
+
+    def count_news(
+        self,
+        ticker_symbols: Optional[List[str]] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        sentiment: Optional[str] = None
+    ) -> int:
+        """
+        조건에 맞는 뉴스 개수 반환
+
+        Args:
+            ticker_symbols: 종목 코드 리스트
+            from_date: 시작 날짜
+            to_date: 종료 날짜
+            sentiment: 감성 분류
+
+        Returns:
+            int: 뉴스 개수
+        """
+        try:
+            where, params = self._where(ticker_symbols=ticker_symbols, from_date=from_date,
+                                        to_date=to_date, sentiment=sentiment)
+            return self.conn.execute(f"SELECT COUNT(*) FROM news{where}", params).fetchone()[0]
+        except Exception as e:
+            logger.error(f"Failed to count news: {e}")
+            return 0
+
+    def get_recent_news(self, ticker_symbol: str, hours: int = 3) -> List[Dict]:
+        """
+        최근 N시간 이내의 뉴스 조회 (FR-035)
+
+        Args:
+            ticker_symbol: 종목 코드
+            hours: 시간 범위 (기본 3시간)
+
+        Returns:
+            List[Dict]: 뉴스 리스트 (최신순, 최대 100건)
+        """
+        try:
+            rows = self.conn.execute(
+                "SELECT news_id, doc FROM news WHERE ticker_symbol = ? AND published_ts >= ? "
+                "ORDER BY published_ts DESC LIMIT ?",
+                (ticker_symbol, time.time() - hours * 3600, RECENT_NEWS_LIMIT)
+            ).fetchall()
+            hits = [{**json.loads(doc), '_id': news_id} for news_id, doc in rows]
+            logger.info(f"Found {len(hits)} recent news for {ticker_symbol} in last {hours} hours")
+            return hits
+        except Exception as e:
+            logger.error(f"Error getting recent news for {ticker_symbol}: {e}")
+            return []
+
+    def check_duplicates(self, urls: List[str], ticker_symbol: Optional[str] = None) -> set:
+        """
+        URL 목록에서 이미 저장된 뉴스 URL 확인
+
+        Args:
+            urls (List[str]): 확인할 URL 리스트
+            ticker_symbol (str, optional): 지정하면 해당 종목 내에서만 중복 확인
+
+        Returns:
+            set: 이미 저장된 URL 집합
+        """
+        if not urls:
+            return set()
+        existing = set()
+        try:
+            for chunk in _chunks(list(dict.fromkeys(urls))):
+                sql = f"SELECT DISTINCT source_url FROM news WHERE source_url IN ({','.join('?' * len(chunk))})"
+                params = list(chunk)
+                if ticker_symbol:
+                    sql += " AND ticker_symbol = ?"
+                    params.append(ticker_symbol)
+                existing.update(row[0] for row in self.conn.execute(sql, params))
+        except Exception as e:
+            logger.error(f"Error checking duplicates: {e}")
+            return set()
+        logger.debug(f"Found {len(existing)} existing URLs out of {len(urls)}")
+        return existing
+
+    # ==================== 통계 ====================
+
+    def get_statistics(self, ticker_symbol: str, days: int = 7) -> Dict:
+        """
+        종목별 뉴스 통계
+
+        Args:
+            ticker_symbol (str): 종목 코드
+            days (int): 기간 (일)
+
+        Returns:
+            Dict: {'total', 'sentiment_distribution': [{'key', 'doc_count'}, ...], 'avg_score'}
+        """
+        now = time.time()
+        try:
+            rows = self.conn.execute(
+                "SELECT sentiment, COUNT(*), AVG(sentiment_score) FROM news "
+                "WHERE ticker_symbol = ? AND published_ts BETWEEN ? AND ? GROUP BY sentiment",
+                (ticker_symbol, now - days * _DAY_SECONDS, now)
+            ).fetchall()
+        except Exception as e:
+            logger.error(f"Error getting statistics: {e}")
+            return {"total": 0, "sentiment_distribution": [], "avg_score": 0}
+
+        total = sum(row[1] for row in rows)
+        scored = [(row[1], row[2]) for row in rows if row[2] is not None]
+        distribution = sorted(
+            ({'key': row[0], 'doc_count': row[1]} for row in rows if row[0] is not None),
+            key=lambda bucket: (-bucket['doc_count'], bucket['key'])
+        )
+        logger.info(f"Statistics retrieved for {ticker_symbol}: {total} news")
+        return {
+            "total": total,
+            "sentiment_distribution": distribution,
+            # 감성 점수가 있는 문서 기준 평균 (ES avg 집계와 동일)
+            "avg_score": (
+                sum(count * avg for count, avg in scored) / sum(count for count, _ in scored) if scored else None
+            )
+        }
+
+    def get_ticker_statistics(self, ticker: str, from_date: str) -> Optional[Dict]:
+        """
+        종목별 통계 조회 (Sprint 9.2)
+
+        Args:
+            ticker: 종목 심볼
+            from_date: 시작 날짜 (YYYY-MM-DD)
+
+        Returns:
+            Dict: {'ticker', 'company_name', 'total', 'positive', 'negative', 'neutral', 'sentiment_avg'}
+                  (뉴스가 없으면 None)
+        """
+        try:
+            params = (ticker, to_timestamp(from_date) or 0)
+            total, positive, negative, neutral, average = self.conn.execute(
+                "SELECT COUNT(*), "
+                "COALESCE(SUM(sentiment = 'positive'), 0), COALESCE(SUM(sentiment = 'negative'), 0), "
+                "COALESCE(SUM(sentiment = 'neutral'), 0), AVG(sentiment_score) "
+                "FROM news WHERE ticker_symbol = ? AND published_ts >= ?",
+                params
+            ).fetchone()
+            if total == 0:
+                return None
+            company = self.conn.execute(
+                "SELECT company_name FROM news WHERE ticker_symbol = ? AND published_ts >= ? "
+                "AND company_name IS NOT NULL GROUP BY company_name ORDER BY COUNT(*) DESC LIMIT 1",
+                params
+            ).fetchone()
+            return {
+                'ticker': ticker,
+                'company_name': company[0] if company else ticker,
+                'total': total,
+                'positive': positive,
+                'negative': negative,
+                'neutral': neutral,
+                'sentiment_avg': round(average or 0, 2)
+            }
+        except Exception as e:
+            logger.error(f"Failed to get ticker statistics for {ticker}: {e}")
+            return None
+
+    def get_date_statistics(self, tickers: List[str], from_date: str) -> List[Dict]:
+        """
+        일별 통계 조회 (Sprint 9.2) - UTC 날짜 기준, 첫 날짜와 마지막 날짜 사이 빈 날짜는 0 (ES date_histogram과 동일)
+
+        Args:
+            tickers: 종목 심볼 리스트
+            from_date: 시작 날짜 (YYYY-MM-DD)
+
+        Returns:
+            List[Dict]: [{'date': 'YYYY-MM-DD', 'count': n}, ...] (최신 날짜부터)
+        """
+        if not tickers:
+            return []
+        try:
+            rows = self.conn.execute(
+                f"SELECT CAST(published_ts / {_DAY_SECONDS} AS INTEGER) AS day, COUNT(*) FROM news "
+                f"WHERE ticker_symbol IN ({','.join('?' * len(tickers))}) AND published_ts >= ? GROUP BY day",
+                list(tickers) + [to_timestamp(from_date) or 0]
+            ).fetchall()
+        except Exception as e:
+            logger.error(f"Failed to get date statistics: {e}")
+            return []
+
+        if not rows:
+            return []
+        counts = dict(rows)
+        first, last = min(counts), max(counts)
+        return [
+            {
+                'date': datetime.fromtimestamp(day * _DAY_SECONDS, tz=timezone.utc).strftime('%Y-%m-%d'),
+                'count': counts.get(day, 0)
+            }
+            for day in range(last, first - 1, -1)
+        ]
+
+    def update_summary(self, news_id: str, summary: Dict[str, str]) -> bool:
+        """
+        언어별 요약 추가/갱신 (기존 언어 요약은 유지)
+
+        Args:
+            news_id (str): 뉴스 ID
+            summary (Dict[str, str]): {'en': '...', ...}
+
+        Returns:
+            bool: 성공 여부 (없는 ID면 False)
+        """
+        conn = self.conn
+        try:
+            with self._write_lock:
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    row = conn.execute("SELECT doc FROM news WHERE news_id = ?", (news_id,)).fetchone()
+                    if row is not None:
+                        doc = json.loads(row[0])
+                        merged = doc.get('summary') if isinstance(doc.get('summary'), dict) else {}
+                        merged.update(summary)
+                        doc['summary'] = merged
+                        conn.execute(
+                            "UPDATE news SET doc = ? WHERE news_id = ?",
+                            (json.dumps(doc, ensure_ascii=False, default=str), news_id)
+                        )
+                    conn.execute('COMMIT')
+                except Exception:
+                    conn.execute('ROLLBACK')
+                    raise
+            return row is not None
+        except Exception as e:
+            logger.error(f"Error updating summary for {news_id}: {e}")
+            return False
+
+    # ==================== 삭제 ====================
+
+    def delete_news(self, news_id: str) -> bool:
+        """
+        뉴스 삭제
+
+        Args:
+            news_id (str): 뉴스 ID
+
+        Returns:
+            bool: 삭제 성공 여부 (없는 ID면 False)
+        """
+        return self._delete("news_id = ?", (news_id,)) > 0
+
+    def delete_old_news(self, cutoff_date: datetime) -> int:
+        """
+        오래된 뉴스 삭제 (FR-028)
+
+        Args:
+            cutoff_date: 기준 날짜 (발행일이 이전인 데이터 삭제)
+
+        Returns:
+            int: 삭제된 문서 수
+        """
+        deleted = self._delete("published_ts < ?", (to_timestamp(cutoff_date),))
+        logger.info(f"Deleted {deleted} old news items before {cutoff_date}")
+        return deleted
+
+    def _delete(self, condition: str, params: Tuple) -> int:
+        conn = self.conn
+        try:
+            with self._write_lock:
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    conn.execute(
+                        f"DELETE FROM news_fts WHERE rowid IN (SELECT rowid FROM news WHERE {condition})", params
+                    )
+                    deleted = conn.execute(f"DELETE FROM news WHERE {condition}", params).rowcount
+                    conn.execute('COMMIT')
+                except Exception:
+                    conn.execute('ROLLBACK')
+                    raise
+            return deleted
+        except Exception as e:
+            logger.error(f"Error deleting news ({condition}): {e}")
+            return 0
+
+    def document_count(self) -> int:
+        """저장된 전체 문서 수"""
+        return self.count_news()
+
+
+_sqlite_storage: Optional[SQLiteNewsStorage] = None
+_sqlite_storage_lock = threading.Lock()
+
+
+def get_sqlite_news_storage() -> SQLiteNewsStorage:
+    """SQLiteNewsStorage 싱글톤 반환"""
+    global _sqlite_storage
+    if _sqlite_storage is None:
+        with _sqlite_storage_lock:
+            if _sqlite_storage is None:
+                _sqlite_storage = SQLiteNewsStorage()
+    return _sqlite_storage
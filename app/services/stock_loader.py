@@ -0,0 +1,282 @@
+"""
+종목 마스터 일괄 적재
+- 거래소 상장 목록 파일(NASDAQ Trader nasdaqlisted.txt / otherlisted.txt 파이프 구분, 일반 CSV)을 스트리밍으로 읽음
+- 기존 stock_master와 비교해 추가/변경/상장폐지 목록 계산
+- 추가/변경분만 배치 단위 executemany 업서트 (INSERT ... ON CONFLICT DO UPDATE) - ORM 행 단위 저장 대비 수십 배 빠름
+- 한국어 회사명은 매핑 파일(ticker,company_name_ko)로 채움 (매핑이 없으면 기존 값 유지)
+"""
+
+import csv
+import logging
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from flask import current_app, has_app_context
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.extensions import db
+from app.models.models import StockMaster, UserStock
+
+logger = logging.getLogger(__name__)
+
+# NASDAQ Trader otherlisted.txt 거래소 코드
+EXCHANGE_CODES = {
+    'A': 'NYSE American',
+    'N': 'NYSE',
+    'P': 'NYSE Arca',
+    'Z': 'Cboe BZX',
+    'V': 'IEX',
+}
+
+# 헤더 이름 -> 표준 필드 (소문자 비교)
+_HEADER_ALIASES = {
+    'ticker': ('symbol', 'ticker', 'ticker_symbol', 'act symbol'),
+    'company_name': ('security name', 'company name', 'company_name', 'name'),
+    'exchange': ('exchange', 'listing exchange'),
+    'sector': ('sector',),
+    'etf': ('etf',),
+    'test_issue': ('test issue',),
+}
+
+_COLUMNS = ('company_name', 'company_name_ko', 'exchange', 'sector')
+
+# 티커 컬럼 길이 (StockMaster.ticker_symbol)
+MAX_TICKER_LENGTH = 10
+
+
+def _clean_company_name(name: str) -> str:
+    """'Apple Inc. - Common Stock' -> 'Apple Inc.' (증권 종류 설명 제거)"""
+    name = (name or '').strip()
+    if ' - ' in name:
+        name = name.split(' - ', 1)[0].strip()
+    return name
+
+
+def iter_listing_rows(path: str) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    상장 목록 파일을 한 행씩 읽어 표준 딕셔너리로 반환 (테스트 종목/푸터/잘못된 행 제외)
+
+    Args:
+        path: nasdaqlisted.txt / otherlisted.txt (파이프 구분) 또는 CSV 파일
+
+    Yields:
+        {'ticker', 'company_name', 'exchange', 'sector'}
+    """
+    file_name = Path(path).name.lower()
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        header_line = f.readline()
+        delimiter = '|' if header_line.count('|') > header_line.count(',') else ','
+        header = next(csv.reader([header_line], delimiter=delimiter))
+        columns = {}
+        for index, name in enumerate(h.strip().lower() for h in header):
+            for field, aliases in _HEADER_ALIASES.items():
+                if name in aliases and field not in columns:
+                    columns[field] = index
+        if 'ticker' not in columns or 'company_name' not in columns:
+            raise ValueError(f"{path}: symbol/name columns not found in header {header}")
+
+        # nasdaqlisted.txt에는 거래소 컬럼이 없음
+        default_exchange = 'NASDAQ' if file_name.startswith('nasdaqlisted') else None
+
+        for row in csv.reader(f, delimiter=delimiter):
+            if not row or row[0].startswith('File Creation Time'):
+                continue
+
+            def value(field):
+                index = columns.get(field)
+                return row[index].strip() if index is not None and index < len(row) else ''
+
+            if value('test_issue').upper() == 'Y':
+                continue
+            ticker = value('ticker').upper()
+            name = _clean_company_name(value('company_name'))
+            if not ticker or not name or len(ticker) > MAX_TICKER_LENGTH:
+                continue
+
+            exchange = value('exchange')
+            yield {
+                'ticker': ticker,
+                'company_name': name,
+                'exchange': EXCHANGE_CODES.get(exchange, exchange) or default_exchange,
+                'sector': value('sector') or ('ETF' if value('etf').upper() == 'Y' else None),
+            }
+
+
+def load_korean_names(path: Optional[str]) -> Dict[str, str]:
+    """
+    한국어 회사명 매핑 파일 읽기
+
+    Args:
+        path: CSV (ticker,company_name_ko - 헤더 선택)
+
+    Returns:
+        {티커: 한국어 회사명}
+    """
+    if not path:
+        return {}
+    names = {}
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.reader(f):
+            if len(row) < 2 or not row[0].strip() or row[0].strip().lower() in ('ticker', 'symbol', 'ticker_symbol'):
+                continue
+            if row[1].strip():
+                names[row[0].strip().upper()] = row[1].strip()
+    return names
+
+
+class StockListingLoader:
+    """상장 목록 -> stock_master 일괄 업서트 (앱 컨텍스트 필요)"""
+
+    def __init__(self, batch_size: int = 1000, korean_names: Optional[Dict[str, str]] = None):
+        """
+        초기화
+
+        Args:
+            batch_size: executemany 1회당 행 수
+            korean_names: {티커: 한국어 회사명} 매핑
+        """
+        self.batch_size = batch_size
+        self.korean_names = korean_names or {}
+
+    def load(
+        self,
+        paths: Iterable[str],
+        dry_run: bool = False,
+        prune: bool = False
+    ) -> Dict:
+        """
+        상장 목록 파일 적재
+
+        Args:
+            paths: 상장 목록 파일 경로들 (앞 파일의 티커 우선)
+            dry_run: True면 비교 결과만 계산하고 저장하지 않음
+            prune: True면 상장폐지 종목 중 관심 종목으로 등록되지 않은 종목 삭제
+
+        Returns:
+            {'added': [...], 'changed': [...], 'delisted': [...], 'deleted': [...], 'unchanged': n,
+             'skipped_duplicates': n, 'total': n, 'elapsed_seconds': s}
+        """
+        started = time.perf_counter()
+        existing = {
+            row[0]: dict(zip(_COLUMNS, row[1:]))
+            for row in db.session.query(
+                StockMaster.ticker_symbol, StockMaster.company_name, StockMaster.company_name_ko,
+                StockMaster.exchange, StockMaster.sector
+            )
+        }
+
+        added: List[str] = []
+        changed: List[str] = []
+        seen = set()
+        exchanges = set()
+        unchanged = 0
+        duplicates = 0
+        batch: List[Dict] = []
+
+        for path in paths:
+            for row in iter_listing_rows(path):
+                ticker = row['ticker']
+                if ticker in seen:
+                    duplicates += 1
+                    continue
+                seen.add(ticker)
+                if row['exchange']:
+                    exchanges.add(row['exchange'])
+
+                values, status = self._merge(row, existing.get(ticker))
+                if status == 'unchanged':
+                    unchanged += 1
+                    continue
+                (added if status == 'added' else changed).append(ticker)
+                if not dry_run:
+                    batch.append(values)
+                    if len(batch) >= self.batch_size:
+                        self._upsert(batch)
+                        batch = []
+
+        if batch:
+            self._upsert(batch)
+
+        # 이번 파일들이 다룬 거래소의 종목 중 목록에 없는 종목 (지수 등 다른 거래소 종목은 제외)
+        delisted = sorted(
+            ticker for ticker, current in existing.items()
+            if ticker not in seen and current['exchange'] in exchanges
+        )
+        deleted: List[str] = []
+        if prune and delisted and not dry_run:
+            deleted = self._delete_unwatched(delisted)
+
+        if not dry_run:
+            db.session.commit()
+            self._invalidate_search_index()
+
+        report = {
+            'added': added,
+            'changed': changed,
+            'delisted': delisted,
+            'deleted': deleted,
+            'unchanged': unchanged,
+            'skipped_duplicates': duplicates,
+            'total': len(seen),
+            'elapsed_seconds': round(time.perf_counter() - started, 3),
+        }
+        logger.info(
+            f"Stock listings {'compared' if dry_run else 'loaded'}: {len(seen)} symbols, "
+            f"{len(added)} added, {len(changed)} changed, {len(delisted)} delisted, "
+            f"{len(deleted)} deleted in {report['elapsed_seconds']}s"
+        )
+        return report
+
+    def _merge(self, row: Dict, current: Optional[Dict]) -> Tuple[Dict, str]:
+        """파일 행 + 기존 값 -> 저장할 값, 상태 (added / changed / unchanged)"""
+        ticker = row['ticker']
+        values = {
+            'ticker_symbol': ticker,
+            'company_name': row['company_name'],
+            # 파일/매핑에 없는 값은 기존 값 유지 (수동 입력한 한국어 이름/섹터 보존)
+            'company_name_ko': self.korean_names.get(ticker) or (current or {}).get('company_name_ko'),
+            'exchange': row['exchange'] or (current or {}).get('exchange'),
+            'sector': row['sector'] or (current or {}).get('sector'),
+        }
+        if current is None:
+            return values, 'added'
+        if all(values[column] == current[column] for column in _COLUMNS):
+            return values, 'unchanged'
+        return values, 'changed'
+
+    def _upsert(self, rows: List[Dict]) -> None:
+        """INSERT ... ON CONFLICT(ticker_symbol) DO UPDATE (executemany)"""
+        dialect = db.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+        statement = insert(StockMaster.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=['ticker_symbol'],
+            set_={column: statement.excluded[column] for column in _COLUMNS}
+        )
+        db.session.execute(statement, rows)
+
+    def _delete_unwatched(self, tickers: List[str]) -> List[str]:
+        """관심 종목으로 등록되지 않은 티커만 삭제"""
+        watched = {
+            row[0] for row in db.session.query(UserStock.ticker_symbol)
+            .filter(UserStock.ticker_symbol.in_(tickers)).distinct()
+        }
+        removable = [ticker for ticker in tickers if ticker not in watched]
+        for start in range(0, len(removable), self.batch_size):
+            chunk = removable[start:start + self.batch_size]
+            db.session.query(StockMaster).filter(StockMaster.ticker_symbol.in_(chunk)).delete(
+                synchronize_session=False
+            )
+        if watched:
+            logger.info(f"Kept {len(watched)} delisted stocks still on watchlists: {sorted(watched)[:20]}")
+        return removable
+
+    @staticmethod
+    def _invalidate_search_index() -> None:
+        # Core 실행은 ORM 이벤트를 거치지 않으므로 자동완성 인덱스를 직접 무효화
+        if has_app_context():
+            from app.services.stock_search import EXTENSION_KEY
+            index = current_app.extensions.get(EXTENSION_KEY)
+            if index is not None:
+                index.invalidate()
@@ -0,0 +1,316 @@
+"""
+종목 자동완성 검색 인덱스
+- 앱 시작 시 stock_master 전체를 메모리에 적재해 정렬된 키 목록으로 구성 (bisect 접두사 검색)
+- 티커 접두사, 영문/한국어 회사명 토큰 접두사 검색 (한글은 음절마다 토큰 시작으로 취급 -> 부분 일치)
+- 순위: 티커 정확 일치 -> 티커 접두사 -> 회사명 일치, 같은 순위는 티커 순 (기존 CASE 정렬과 동일)
+- stock_master 변경 커밋 시 무효화, 다른 프로세스의 변경은 STOCK_SEARCH_REFRESH_SECONDS 주기로 반영
+"""
+
+import logging
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.extensions import db
+from app.models.models import StockMaster
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+EXTENSION_KEY = 'stock_search'
+
+# 검색어 최대 길이 (라우트 입력 제한과 동일, 키도 이 길이로 자름)
+MAX_QUERY_LENGTH = 50
+
+# 자주 입력되는 검색어 결과 캐시 크기 (인덱스 재구성 시 비움)
+CACHE_SIZE = 2048
+
+# 이 길이 이하의 회사명 접두사는 일치 종목(티커 순 상위 SHORT_PREFIX_TOP개)을 미리 계산
+# (2~3글자 검색어는 수천 개 키와 일치해 범위 순회 비용이 큼)
+SHORT_PREFIX_LENGTH = 3
+SHORT_PREFIX_TOP = 64
+
+_TOKEN_RE = re.compile(r'[^\W_]+', re.UNICODE)
+_SPACE_RE = re.compile(r'\s+')
+
+_events_registered = False
+_events_lock = threading.Lock()
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """검색용 정규화 (NFKC, 소문자, 공백 하나로)"""
+    if not text:
+        return ''
+    return _SPACE_RE.sub(' ', unicodedata.normalize('NFKC', text).lower()).strip()
+
+
+def _is_hangul(char: str) -> bool:
+    return '가' <= char <= '힣'
+
+
+def name_keys(name: Optional[str]) -> List[str]:
+    """
+    회사명의 토큰 시작 위치마다 이후 문자열을 키로 생성
+
+    예: 'Bank of America' -> ['bank of america', 'of america', 'america']
+        '뱅크오브아메리카' -> 음절마다 키 생성 (띄어쓰기 없는 한국어 이름의 중간 단어 검색)
+
+    Args:
+        name: 회사명
+
+    Returns:
+        키 목록
+    """
+    normalized = normalize_text(name)
+    starts = set()
+    for match in _TOKEN_RE.finditer(normalized):
+        starts.add(match.start())
+        for offset, char in enumerate(match.group(), start=match.start()):
+            if _is_hangul(char):
+                starts.add(offset)
+    return [normalized[start:start + MAX_QUERY_LENGTH] for start in sorted(starts)]
+
+
+class _IndexData:
+    """한 번 구성된 뒤 변경하지 않는 인덱스 데이터 (재구성 시 통째로 교체)"""
+
+    def __init__(self, stocks: List[Dict]):
+        self.stocks = sorted(stocks, key=lambda s: s['ticker'])
+        ticker_pairs = sorted((s['ticker'].lower(), i) for i, s in enumerate(self.stocks))
+        self.ticker_keys = [key for key, _ in ticker_pairs]
+        self.ticker_ids = [i for _, i in ticker_pairs]
+
+        name_pairs = set()
+        for i, stock in enumerate(self.stocks):
+            for name in (stock['name'], stock['name_ko']):
+                for key in name_keys(name):
+                    name_pairs.add((key, i))
+        name_pairs = sorted(name_pairs)
+        self.name_keys = [key for key, _ in name_pairs]
+        self.name_ids = [i for _, i in name_pairs]
+        self.stock_name_keys: List[List[str]] = [[] for _ in self.stocks]
+        for key, i in name_pairs:
+            self.stock_name_keys[i].append(key)
+
+        short: Dict[str, set] = {}
+        for key, i in name_pairs:
+            for length in range(1, min(len(key), SHORT_PREFIX_LENGTH) + 1):
+                short.setdefault(key[:length], set()).add(i)
+        self.short_prefix_ids = {prefix: sorted(ids)[:SHORT_PREFIX_TOP] for prefix, ids in short.items()}
+        self.short_prefix_truncated = {prefix for prefix, ids in short.items() if len(ids) > SHORT_PREFIX_TOP}
+
+    def name_matches(self, q: str, exclude: set, count: int) -> List[int]:
+        """회사명 토큰 접두사 일치 종목 중 exclude를 뺀 티커 순 상위 count개"""
+        if len(q) <= SHORT_PREFIX_LENGTH:
+            candidates = [i for i in self.short_prefix_ids.get(q, ()) if i not in exclude]
+            if len(candidates) >= count or q not in self.short_prefix_truncated:
+                return candidates[:count]
+
+        lo = bisect_left(self.name_keys, q)
+        hi = bisect_left(self.name_keys, q + '\U0010ffff', lo)
+        if (hi - lo) ** 2 <= count * len(self.stocks):
+            # 일치 키가 적으면 키 범위를 모아 티커 순 정렬
+            return sorted({self.name_ids[i] for i in range(lo, hi)} - exclude)[:count]
+
+        # 일치 키가 많으면(흔한 단어) 티커 순으로 종목을 훑어 count개만 찾음
+        result = []
+        for i, keys in enumerate(self.stock_name_keys):
+            if i not in exclude and any(key.startswith(q) for key in keys):
+                result.append(i)
+                if len(result) >= count:
+                    break
+        return result
+
+
+class StockSearchIndex:
+    """종목 검색 인덱스 (스레드 안전, 읽기는 잠금 없음)"""
+
+    def __init__(self, refresh_seconds: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            refresh_seconds: 이 시간이 지나면 다음 검색 때 DB에서 다시 적재 (기본: Config.STOCK_SEARCH_REFRESH_SECONDS)
+        """
+        self.refresh_seconds = (
+            refresh_seconds if refresh_seconds is not None else Config.STOCK_SEARCH_REFRESH_SECONDS
+        )
+        self._data: Optional[_IndexData] = None
+        self._cache: Dict[tuple, List[Dict]] = {}
+        self._loaded_at = 0.0
+        self._stale = True
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """적재된 종목 수"""
+        return len(self._data.stocks) if self._data else 0
+
+    def build(self, stocks: Iterable) -> None:
+        """
+        종목 목록으로 인덱스 구성
+
+        Args:
+            stocks: StockMaster 또는 {'ticker', 'name', 'name_ko', 'exchange', 'sector'} 딕셔너리
+        """
+        rows = []
+        for stock in stocks:
+            if isinstance(stock, dict):
+                rows.append(stock)
+            else:
+                rows.append({
+                    'ticker': stock.ticker_symbol,
+                    'name': stock.company_name,
+                    'name_ko': stock.company_name_ko,
+                    'exchange': stock.exchange,
+                    'sector': stock.sector
+                })
+        data = _IndexData(rows)
+        with self._lock:
+            self._data = data
+            self._cache = {}
+            self._loaded_at = time.monotonic()
+            self._stale = False
+
+    def load(self) -> int:
+        """
+        stock_master 전체 적재 (앱 컨텍스트 필요)
+
+        Returns:
+            적재된 종목 수
+        """
+        started = time.perf_counter()
+        rows = db.session.query(
+            StockMaster.ticker_symbol, StockMaster.company_name, StockMaster.company_name_ko,
+            StockMaster.exchange, StockMaster.sector
+        ).all()
+        self.build({
+            'ticker': row[0], 'name': row[1], 'name_ko': row[2], 'exchange': row[3], 'sector': row[4]
+        } for row in rows)
+        logger.info(f"Stock search index built: {len(rows)} stocks in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return len(rows)
+
+    def invalidate(self) -> None:
+        """다음 검색 때 다시 적재"""
+        self._stale = True
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        종목 검색
+
+        Args:
+            query: 검색어 (티커/회사명 앞부분)
+            limit: 최대 결과 수
+
+        Returns:
+            [{'ticker', 'name', 'name_ko', 'exchange', 'sector'}, ...] (순위 순)
+        """
+        self._refresh_if_needed()
+        data = self._data
+        q = normalize_text(query)[:MAX_QUERY_LENGTH]
+        if data is None or not q:
+            return []
+
+        cache_key = (q, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 티커 접두사 (티커 순으로 정렬되어 있으므로 정확 일치 -> 접두사 순으로 그대로 사용)
+        exact, prefixed, matched = [], [], set()
+        i = bisect_left(data.ticker_keys, q)
+        while i < len(data.ticker_keys) and data.ticker_keys[i].startswith(q):
+            stock_id = data.ticker_ids[i]
+            (exact if data.ticker_keys[i] == q else prefixed).append(stock_id)
+            matched.add(stock_id)
+            if len(matched) >= limit:
+                break
+            i += 1
+        ranked = exact + prefixed
+
+        # 회사명 토큰 접두사 (stock_id가 티커 순이므로 작은 id부터)
+        if len(ranked) < limit:
+            ranked.extend(data.name_matches(q, matched, limit - len(ranked)))
+
+        results = [data.stocks[stock_id] for stock_id in ranked[:limit]]
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache = {}
+        self._cache[cache_key] = results
+        return results
+
+    def _refresh_if_needed(self) -> None:
+        expired = self.refresh_seconds and time.monotonic() - self._loaded_at > self.refresh_seconds
+        if not (self._stale or expired) or not has_app_context():
+            return
+        try:
+            self.load()
+        except Exception as e:
+            # 적재 실패 시 기존 인덱스 유지 (다음 검색에서 재시도)
+            logger.error(f"Failed to build stock search index: {e}")
+            db.session.rollback()
+
+
+def _mark_changed(mapper, connection, target) -> None:
+    session = Session.object_session(target)
+    if session is not None:
+        session.info['stock_master_changed'] = True
+
+
+def _after_commit(session) -> None:
+    if session.info.pop('stock_master_changed', False) and has_app_context():
+        index = current_app.extensions.get(EXTENSION_KEY)
+        if index is not None:
+            index.invalidate()
+
+
+def _after_rollback(session) -> None:
+    session.info.pop('stock_master_changed', None)
+
+
+def _register_events() -> None:
+    """stock_master 변경 감지 이벤트 등록 (프로세스당 1회)"""
+    global _events_registered
+
+    with _events_lock:
+        if _events_registered:
+            return
+        for name in ('after_insert', 'after_update', 'after_delete'):
+            event.listen(StockMaster, name, _mark_changed)
+        event.listen(Session, 'after_commit', _after_commit)
+        event.listen(Session, 'after_soft_rollback', lambda session, previous: _after_rollback(session))
+        _events_registered = True
+
+
+def init_stock_search(app: Flask) -> None:
+    """
+    Flask 앱에 종목 검색 인덱스 등록 후 적재 (앱 컨텍스트 안에서 호출)
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+    """
+    _register_events()
+    index = StockSearchIndex()
+    app.extensions[EXTENSION_KEY] = index
+    try:
+        index.load()
+    except Exception as e:
+        # 테이블이 아직 없는 등 - 첫 검색에서 다시 적재
+        logger.warning(f"Stock search index not built at startup: {e}")
+        db.session.rollback()
+        index.invalidate()
+
+
+def get_stock_search_index() -> StockSearchIndex:
+    """현재 앱의 StockSearchIndex 반환 (등록되지 않았으면 생성)"""
+    index = current_app.extensions.get(EXTENSION_KEY)
+    if index is None:
+        index = StockSearchIndex()
+        current_app.extensions[EXTENSION_KEY] = index
+    return index
@@ -23,31 +23,130 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = DEBUG
     
+    # SQLite 성능 설정 (파일 DB에만 적용, :memory: 제외)
+    SQLITE_TUNING = os.getenv('SQLITE_TUNING', 'true').lower() == 'true'  # WAL 등 PRAGMA 적용 여부
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '10000'))  # 잠금 대기 시간
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL').upper()  # WAL에서는 NORMAL로 충분
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))  # bytes
+    SQLITE_CACHE_SIZE_KB = int(os.getenv('SQLITE_CACHE_SIZE_KB', str(64 * 1024)))  # 연결당 페이지 캐시
+    SQLITE_POOL_SIZE = int(os.getenv('SQLITE_POOL_SIZE', '10'))
+    SQLITE_MAX_OVERFLOW = int(os.getenv('SQLITE_MAX_OVERFLOW', '10'))
+    SQLITE_POOL_TIMEOUT = int(os.getenv('SQLITE_POOL_TIMEOUT', '30'))  # 풀 대기 시간 (초)
+    
     # ElasticSearch 설정
     ELASTICSEARCH_URL = os.getenv('ELASTICSEARCH_URL', 'http://localhost:9200')
     ELASTICSEARCH_INDEX = os.getenv('ELASTICSEARCH_INDEX', 'news_analysis')
+
+    # 뉴스 저장소 설정 (elasticsearch / sqlite - sqlite는 ES 없이 FTS5 파일 DB 사용)
+    NEWS_STORAGE_BACKEND = os.getenv('NEWS_STORAGE_BACKEND', 'elasticsearch').lower()
+    NEWS_SQLITE_PATH = os.getenv('NEWS_SQLITE_PATH', 'data/news.db')
     
     # OpenAI 설정
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
     OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4')
+    OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL', '')  # 비워두면 api.openai.com (부하 테스트 시 mock 서버 지정)
+
+    # 유사 중복 기사 클러스터링 (대표 기사 1건만 분석하고 요약/감성 공유)
+    NEWS_DEDUP_ENABLED = os.getenv('NEWS_DEDUP_ENABLED', 'true').lower() == 'true'
+    NEWS_DEDUP_MAX_DISTANCE = int(os.getenv('NEWS_DEDUP_MAX_DISTANCE', '3'))  # SimHash 64비트 중 다른 비트 수
+    NEWS_DEDUP_MIN_TOKENS = int(os.getenv('NEWS_DEDUP_MIN_TOKENS', '8'))  # 이보다 짧은 기사는 클러스터링 제외
+    NEWS_DEDUP_WINDOW_HOURS = float(os.getenv('NEWS_DEDUP_WINDOW_HOURS', '48'))  # 분석 결과 공유 기간
+    NEWS_DEDUP_MAX_ENTRIES = int(os.getenv('NEWS_DEDUP_MAX_ENTRIES', '50000'))
+    NEWS_DEDUP_WAIT_SECONDS = float(os.getenv('NEWS_DEDUP_WAIT_SECONDS', '60'))  # 다른 스레드 분석 대기 시간
+
+    # 분석 전 관련도 분류 (full: GPT 분석 / light: 제목 기반 로컬 분석 / skip: 분석/저장 안 함)
+    NEWS_TRIAGE_ENABLED = os.getenv('NEWS_TRIAGE_ENABLED', 'true').lower() == 'true'
+    NEWS_TRIAGE_FULL_THRESHOLD = float(os.getenv('NEWS_TRIAGE_FULL_THRESHOLD', '0.4'))
+    NEWS_TRIAGE_LIGHT_THRESHOLD = float(os.getenv('NEWS_TRIAGE_LIGHT_THRESHOLD', '0.2'))  # 미만이면 skip
+    NEWS_TRIAGE_MIN_CONTENT_CHARS = int(os.getenv('NEWS_TRIAGE_MIN_CONTENT_CHARS', '200'))  # 미만이면 light
+
+    # 요약 언어: 분석 시 종목 구독자 언어만 생성, 나머지는 상세 페이지/이메일에서 처음 필요할 때 생성 후 저장
+    NEWS_SUMMARY_LAZY_ENABLED = os.getenv('NEWS_SUMMARY_LAZY_ENABLED', 'true').lower() == 'true'
+    NEWS_SUMMARY_DEFAULT_LANGUAGE = os.getenv('NEWS_SUMMARY_DEFAULT_LANGUAGE', 'ko')  # 구독자가 없는 종목
     
     # Gmail 설정
     GMAIL_USERNAME = os.getenv('GMAIL_USERNAME', '')
     GMAIL_APP_PASSWORD = os.getenv('GMAIL_APP_PASSWORD', '')
     GMAIL_SMTP_SERVER = os.getenv('GMAIL_SMTP_SERVER', 'smtp.gmail.com')
     GMAIL_SMTP_PORT = int(os.getenv('GMAIL_SMTP_PORT', '587'))
+    GMAIL_SMTP_USE_TLS = os.getenv('GMAIL_SMTP_USE_TLS', 'true').lower() == 'true'  # STARTTLS 사용 여부
     
     # 크롤러 설정
     CRAWLER_TYPE = os.getenv('CRAWLER_TYPE', 'selenium')
     HEADLESS = os.getenv('HEADLESS', 'true').lower() == 'true'
     CRAWL_TIMEOUT = int(os.getenv('CRAWL_TIMEOUT', '45'))
     USER_AGENT = os.getenv('USER_AGENT', 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
+    SLUG_RETRY_HOURS = int(os.getenv('SLUG_RETRY_HOURS', '24'))  # 뉴스 URL 해석 실패 시 재시도 대기 (실패마다 2배)
+    CRAWL_RESOURCE_BLOCKING = os.getenv('CRAWL_RESOURCE_BLOCKING', 'true').lower() == 'true'  # CDP로 불필요한 리소스 요청 차단
+    CRAWL_BLOCKED_RESOURCES = os.getenv('CRAWL_BLOCKED_RESOURCES', 'images,fonts,media,trackers,ads')  # 차단 범주 (stylesheets 추가 가능)
+    CRAWL_BLOCKED_URL_PATTERNS = os.getenv('CRAWL_BLOCKED_URL_PATTERNS', '')  # 추가 차단 URL 패턴 (쉼표 구분, * 와일드카드)
+    CRAWL_BLOCK_BACKOFF_SECONDS = float(os.getenv('CRAWL_BLOCK_BACKOFF_SECONDS', '120'))  # 차단 감지 후 요청 중단 시간 (차단마다 2배)
+    CRAWL_BLOCK_MAX_BACKOFF_SECONDS = float(os.getenv('CRAWL_BLOCK_MAX_BACKOFF_SECONDS', '3600'))
+    PROXY_URLS = os.getenv('PROXY_URLS', '')  # 쉼표 구분 프록시 목록 (direct = 직접 연결)
+    PROXY_MAX_LEASES = int(os.getenv('PROXY_MAX_LEASES', '2'))  # 프록시당 동시 브라우저 수
+    PROXY_QUARANTINE_SECONDS = float(os.getenv('PROXY_QUARANTINE_SECONDS', '60'))  # 첫 격리 시간 (격리마다 2배)
+    PROXY_MAX_QUARANTINE_SECONDS = float(os.getenv('PROXY_MAX_QUARANTINE_SECONDS', '1800'))
+    PROXY_ACQUIRE_TIMEOUT = float(os.getenv('PROXY_ACQUIRE_TIMEOUT', '120'))  # 사용 가능한 프록시 대기 시간
+    
+    SNAPSHOT_ENABLED = os.getenv('SNAPSHOT_ENABLED', 'false').lower() == 'true'  # 크롤링 페이지 원본 HTML 보관 (재파싱용)
+    SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', 'data/snapshots')
+    SNAPSHOT_RETENTION_DAYS = int(os.getenv('SNAPSHOT_RETENTION_DAYS', '30'))
+    
+    # RSS/Atom 피드 수집 (Selenium 크롤링과 함께 실행, ETag/Last-Modified 조건부 요청)
+    NEWS_FEED_ENABLED = os.getenv('NEWS_FEED_ENABLED', 'false').lower() == 'true'
+    NEWS_FEED_URLS = os.getenv(
+        'NEWS_FEED_URLS',
+        'https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US'
+    )  # 쉼표 구분 피드 URL 템플릿 ({ticker} 치환)
+    NEWS_FEED_TIMEOUT = float(os.getenv('NEWS_FEED_TIMEOUT', '10'))
+    NEWS_FEED_POOL_SIZE = int(os.getenv('NEWS_FEED_POOL_SIZE', '10'))  # 호스트별 유지할 HTTP 연결 수
+    NEWS_FEED_MIN_INTERVAL = float(os.getenv('NEWS_FEED_MIN_INTERVAL', '0.1'))  # 피드 요청 시작 간격 (초)
+    
+    # 뉴스 소스 (쉼표 구분, 앞 소스 우선 - 중복 URL은 앞 소스 기사 유지)
+    NEWS_SOURCES = os.getenv('NEWS_SOURCES', 'investing,feed')
+    NEWS_SOURCE_HTTP_CONCURRENCY = int(os.getenv('NEWS_SOURCE_HTTP_CONCURRENCY', '8'))  # HTTP 소스 동시 요청 수 (브라우저 소스는 CRAWL_MAX_CONCURRENCY)
+    
+    # 종목 자동완성 인덱스 (다른 프로세스의 stock_master 변경 반영 주기)
+    STOCK_SEARCH_REFRESH_SECONDS = int(os.getenv('STOCK_SEARCH_REFRESH_SECONDS', '300'))
+    
+    # 백그라운드 작업 (웹에서 실행하는 이메일 발송 등)
+    BACKGROUND_JOB_WORKERS = int(os.getenv('BACKGROUND_JOB_WORKERS', '2'))
+    BACKGROUND_JOB_STALE_MINUTES = int(os.getenv('BACKGROUND_JOB_STALE_MINUTES', '60'))  # 이 시간 넘게 끝나지 않은 작업은 실패 처리
     
     # 스케줄러 설정
     CRAWL_INTERVAL_HOURS = int(os.getenv('CRAWL_INTERVAL_HOURS', '24'))
     CRAWL_LOOKBACK_HOURS = int(os.getenv('CRAWL_LOOKBACK_HOURS', '96'))
     NEWS_RETENTION_DAYS = int(os.getenv('NEWS_RETENTION_DAYS', '730'))  # 2년
-    
+    SCHEDULER_LOCK_TTL_SECONDS = int(os.getenv('SCHEDULER_LOCK_TTL_SECONDS', '90'))  # 리더 리스 유효 시간
+    SCHEDULER_HEARTBEAT_SECONDS = int(os.getenv('SCHEDULER_HEARTBEAT_SECONDS', '30'))  # 리스 갱신 주기
+
+    # 적응형 크롤링 스케줄 설정 (CRAWL_SCHEDULE_MODE=adaptive)
+    CRAWL_SCHEDULE_MODE = os.getenv('CRAWL_SCHEDULE_MODE', 'fixed').lower()  # fixed, adaptive
+    CRAWL_MIN_INTERVAL_MINUTES = int(os.getenv('CRAWL_MIN_INTERVAL_MINUTES', '30'))
+    CRAWL_MAX_INTERVAL_HOURS = int(os.getenv('CRAWL_MAX_INTERVAL_HOURS', '24'))
+    CRAWL_MAX_CONCURRENCY = int(os.getenv('CRAWL_MAX_CONCURRENCY', '2'))  # 동시 브라우저 수 상한 (브라우저 소스 예산)
+    CRAWL_TICKER_CONCURRENCY = int(os.getenv('CRAWL_TICKER_CONCURRENCY', '4'))  # 동시에 수집하는 티커 수 (HTTP 소스는 넓게)
+    CRAWL_DISPATCH_MINUTES = int(os.getenv('CRAWL_DISPATCH_MINUTES', '10'))  # 만기 티커 확인 주기
+    CRAWL_VELOCITY_WINDOW_HOURS = int(os.getenv('CRAWL_VELOCITY_WINDOW_HOURS', '72'))
+    CRAWL_TARGET_ARTICLES_PER_RUN = float(os.getenv('CRAWL_TARGET_ARTICLES_PER_RUN', '3'))
+
+    # 과거 뉴스 백필 설정 (새로 추가된 관심 종목의 이력 수집)
+    BACKFILL_ENABLED = os.getenv('BACKFILL_ENABLED', 'false').lower() == 'true'
+    BACKFILL_DAYS = int(os.getenv('BACKFILL_DAYS', '90'))
+    BACKFILL_MAX_PAGES = int(os.getenv('BACKFILL_MAX_PAGES', '60'))  # 티커당 목록 페이지 상한
+    BACKFILL_MAX_CONCURRENCY = int(os.getenv('BACKFILL_MAX_CONCURRENCY', '2'))  # 동시 브라우저 수 상한
+    BACKFILL_PAGE_DELAY_SECONDS = float(os.getenv('BACKFILL_PAGE_DELAY_SECONDS', '5'))  # 페이지 간 대기 (봇 차단 방지)
+    BACKFILL_INTERVAL_MINUTES = int(os.getenv('BACKFILL_INTERVAL_MINUTES', '30'))  # 미완료 티커 확인 주기
+    BACKFILL_RETRY_HOURS = float(os.getenv('BACKFILL_RETRY_HOURS', '6'))  # 실패 티커 재시도 대기 (실패마다 2배)
+    BACKFILL_MAX_ATTEMPTS = int(os.getenv('BACKFILL_MAX_ATTEMPTS', '5'))  # 연속 실패 시 스케줄러 재시도 중단
+
+    # 메트릭 설정
+    METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')  # 설정 시 /metrics에 Bearer 토큰 필요
+    METRICS_ALLOWED_IPS = os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1')  # 토큰 미설정 시 /metrics 허용 주소 (IP/CIDR)
+    CRAWL_TIMING_RETENTION_DAYS = int(os.getenv('CRAWL_TIMING_RETENTION_DAYS', '30'))
+    SLOW_REQUEST_MS = int(os.getenv('SLOW_REQUEST_MS', '1000'))  # 0이면 느린 요청 로그 비활성화
+    SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'false').lower() == 'true'  # 응답에 Server-Timing 헤더 (개발용)
+
     # 로깅 설정
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_DIR = os.getenv('LOG_DIR', 'logs')
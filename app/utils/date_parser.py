@@ -0,0 +1,222 @@
+"""
+뉴스 날짜 문자열 파서
+- investing.com에서 쓰는 몇 가지 형식만 빠르게 처리 (fromisoformat -> strptime 형식 목록)
+- 소스별로 마지막에 성공한 형식을 기억해 다음 호출에서 먼저 시도
+- 상대 시간("2 hours ago", "Just now")은 미리 컴파일한 정규식 1개로 처리
+- 위 경로로 처리하지 못한 문자열만 dateutil로 파싱 (느리지만 형식 제한 없음)
+- 절대 날짜 문자열의 결과(실패 포함)는 크기 제한 캐시에 보관
+"""
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from dateutil import parser as date_parser
+
+# 시도 순서 = 관찰 빈도 순
+STRPTIME_FORMATS: Tuple[str, ...] = (
+    '%b %d, %Y %I:%M%p',     # Nov 28, 2025 10:30AM
+    '%b %d, %Y',             # Nov 28, 2025
+    '%b %d, %Y %I:%M %p',    # Nov 28, 2025 10:30 AM
+    '%B %d, %Y %I:%M %p',    # November 28, 2025 10:30 AM
+    '%B %d, %Y %I:%M%p',
+    '%B %d, %Y',             # November 28, 2025
+    '%d.%m.%Y %H:%M',        # 28.11.2025 14:30 (유럽 사이트 형식, 일.월.년)
+    '%d.%m.%Y',              # 28.11.2025
+    '%m/%d/%Y %H:%M',        # 11/28/2025 14:30
+    '%m/%d/%Y',              # 11/28/2025
+)
+
+ISO_FORMAT = 'iso'
+
+# 같은 문자열 반복 파싱 결과 캐시 크기 (백필 시 같은 날짜가 페이지마다 반복됨)
+CACHE_SIZE = 4096
+
+_RELATIVE_RE = re.compile(
+    r'^(?:(?P<now>just now|moments ago|now)'
+    r'|(?P<value>\d+|an?|one)\s*(?P<unit>sec|second|min|minute|hr|hour|day|week|month|year)s?\s+ago)$',
+    re.IGNORECASE
+)
+
+_UNIT_SECONDS = {
+    'sec': 1, 'second': 1,
+    'min': 60, 'minute': 60,
+    'hr': 3600, 'hour': 3600,
+    'day': 86400,
+    'week': 7 * 86400,
+    'month': 30 * 86400,
+    'year': 365 * 86400,
+}
+
+# 캐시 미스 표시 (실패 결과 None과 구분)
+_MISSING = object()
+
+# 앞뒤 구분 기호 (예: "\xa0-\xa0Nov 27, 2025 01:00AM")
+_STRIP_CHARS = ' \t\r\n\xa0-–—·|'
+
+
+def _as_utc(parsed: datetime) -> datetime:
+    """timezone-naive인 경우 UTC로 가정"""
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class FastDateParser:
+    """
+    형식 메모이제이션 날짜 파서
+
+    Attributes:
+        stats: 경로별 처리 건수 (iso / strptime / relative / cached / dateutil / failed)
+    """
+
+    def __init__(self, formats: Tuple[str, ...] = STRPTIME_FORMATS):
+        """
+        초기화
+
+        Args:
+            formats: 시도할 strptime 형식 목록 (순서대로 시도)
+        """
+        self.formats = formats
+        # 첫 글자로 후보 형식 제한 (월 이름으로 시작 / 숫자로 시작)
+        self._alpha_formats = tuple(f for f in formats if f.startswith(('%b', '%B')))
+        self._numeric_formats = (ISO_FORMAT,) + tuple(f for f in formats if f not in self._alpha_formats)
+        self._last_format: Dict[str, str] = {}
+        self._cache: Dict[str, Optional[datetime]] = {}
+        self._lock = threading.Lock()
+        self.stats = {'iso': 0, 'strptime': 0, 'relative': 0, 'cached': 0, 'dateutil': 0, 'failed': 0}
+
+    def parse(self, date_str: Optional[str], source: str = 'default',
+              now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        날짜 문자열 파싱
+
+        Args:
+            date_str: 날짜 문자열
+            source: 형식 메모이제이션 키 (사이트/페이지 종류)
+            now: 상대 시간 기준 시각 (기본: 현재 UTC)
+
+        Returns:
+            timezone-aware datetime 또는 None
+        """
+        if not date_str:
+            return None
+        text = date_str.strip(_STRIP_CHARS)
+        if not text:
+            return None
+
+        # 1. 이전에 본 절대 날짜 문자열 (실패 포함, 상대 시간은 캐시하지 않음)
+        # 다른 스레드의 clear()와 경합하지 않도록 조회는 get 한 번 (None도 캐시된 값이므로 sentinel 사용)
+        parsed = self._cache.get(text, _MISSING)
+        if parsed is not _MISSING:
+            self._count('cached' if parsed is not None else 'failed')
+            return parsed
+
+        # 2. 이 소스에서 마지막으로 성공한 형식
+        last = self._last_format.get(source)
+        if last is not None:
+            parsed = self._try_format(text, last)
+            if parsed is not None:
+                self._count(last)
+                return self._remember(text, parsed)
+
+        # 3. 상대 시간 (숫자 + 단위 + ago 형태만 정규식 비용 지불)
+        if text[0].isalpha() or text.endswith(('ago', 'Ago', 'AGO')):
+            relative = self._parse_relative(text, now)
+            if relative is not None:
+                self._count('relative')
+                return relative
+
+        # 4. ISO 8601 -> 알려진 strptime 형식
+        candidates = self._alpha_formats if text[0].isalpha() else self._numeric_formats
+        for fmt in candidates:
+            if fmt == last:
+                continue
+            parsed = self._try_format(text, fmt)
+            if parsed is not None:
+                self._last_format[source] = fmt
+                self._count(fmt)
+                return self._remember(text, parsed)
+
+        # 5. 느린 경로: dateutil
+        try:
+            parsed = _as_utc(date_parser.parse(text))
+            self._count('dateutil')
+        except (ValueError, TypeError, OverflowError):
+            parsed = None
+            self._count('failed')
+        return self._remember(text, parsed)
+
+    def _remember(self, text: str, parsed: Optional[datetime]) -> Optional[datetime]:
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache.clear()
+        self._cache[text] = parsed
+        return parsed
+
+    def _try_format(self, text: str, fmt: str) -> Optional[datetime]:
+        if fmt == ISO_FORMAT:
+            # 숫자로 시작하고 '-' 구분자가 있는 경우만 (불필요한 예외 비용 방지)
+            if not (text[0].isdigit() and text[4:5] == '-'):
+                return None
+            if text.endswith(('Z', 'z')):
+                text = text[:-1] + '+00:00'
+            try:
+                return _as_utc(datetime.fromisoformat(text))
+            except ValueError:
+                return None
+        try:
+            return _as_utc(datetime.strptime(text, fmt))
+        except ValueError:
+            return None
+
+    def _parse_relative(self, text: str, now: Optional[datetime]) -> Optional[datetime]:
+        match = _RELATIVE_RE.match(text)
+        now = now or datetime.now(timezone.utc)
+        if match is None:
+            # "few minutes ago"처럼 숫자 없는 상대 시간은 현재 시각으로 취급
+            if text.lower().endswith(' ago') and not any(c.isdigit() for c in text):
+                return now
+            return None
+        if match.group('now'):
+            return now
+        value = match.group('value').lower()
+        amount = 1 if value in ('a', 'an', 'one') else int(value)
+        return now - timedelta(seconds=amount * _UNIT_SECONDS[match.group('unit').lower()])
+
+    def _count(self, fmt: str) -> None:
+        key = fmt if fmt in self.stats else 'strptime'
+        with self._lock:
+            self.stats[key] += 1
+
+    def reset(self) -> None:
+        """메모이제이션/통계 초기화"""
+        with self._lock:
+            self._last_format.clear()
+            self._cache.clear()
+            for key in self.stats:
+                self.stats[key] = 0
+
+
+_date_parser: Optional[FastDateParser] = None
+
+
+def get_date_parser() -> FastDateParser:
+    """FastDateParser 싱글톤 반환"""
+    global _date_parser
+    if _date_parser is None:
+        _date_parser = FastDateParser()
+    return _date_parser
+
+
+def parse_date(date_str: Optional[str], source: str = 'default') -> Optional[datetime]:
+    """
+    날짜 문자열 파싱 (싱글톤 파서 사용)
+
+    Args:
+        date_str: 날짜 문자열
+        source: 형식 메모이제이션 키
+
+    Returns:
+        timezone-aware datetime 또는 None
+    """
+    return get_date_parser().parse(date_str, source)
@@ -0,0 +1,78 @@
+"""
+SQLite 스키마 마이그레이션 (컬럼/인덱스)
+- db.create_all()은 이미 있는 테이블에 새로 추가된 컬럼/인덱스를 만들지 않으므로
+  모델에 선언된 것 중 없는 것만 추가한다
+- 컬럼은 ALTER TABLE ADD COLUMN (NOT NULL 컬럼은 모델의 스칼라 기본값 사용)
+"""
+import logging
+from typing import List
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+
+def ensure_columns(engine: Engine) -> List[str]:
+    """
+    모델에 선언된 컬럼 중 기존 테이블에 없는 컬럼 추가
+
+    Args:
+        engine: SQLAlchemy 엔진
+
+    Returns:
+        추가한 컬럼 목록 ('table.column')
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+
+    for table in db.Model.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(engine.dialect)}"
+            default = column.default.arg if column.default is not None and column.default.is_scalar else None
+            if default is not None:
+                ddl += f" DEFAULT {int(default) if isinstance(default, bool) else repr(default)}"
+                if not column.nullable:
+                    ddl += " NOT NULL"
+            with engine.begin() as conn:
+                conn.execute(text(ddl))
+            added.append(f"{table.name}.{column.name}")
+            logger.info(f"Added column {column.name} to {table.name}")
+
+    return added
+
+
+def ensure_indexes(engine: Engine) -> List[str]:
+    """
+    모델에 선언된 인덱스 중 DB에 없는 인덱스 생성
+
+    Args:
+        engine: SQLAlchemy 엔진
+
+    Returns:
+        새로 생성한 인덱스 이름 목록
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+
+    for table in db.Model.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            index.create(bind=engine, checkfirst=True)
+            created.append(index.name)
+            logger.info(f"Created index {index.name} on {table.name}")
+
+    return created
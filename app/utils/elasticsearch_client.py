@@ -1,14 +1,28 @@
 """
 ElasticSearch 클라이언트 및 유틸리티
 """
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, Transport
 from typing import Dict, List, Optional
 import logging
+import time
 from datetime import datetime
 
+from app.utils.request_tracing import record_es_call
+
 logger = logging.getLogger(__name__)
 
 
+class TracingTransport(Transport):
+    """요청별 ES 호출 수/시간을 기록하는 Transport"""
+
+    def perform_request(self, method, url, headers=None, params=None, body=None):
+        start = time.perf_counter()
+        try:
+            return super().perform_request(method, url, headers=headers, params=params, body=body)
+        finally:
+            record_es_call(time.perf_counter() - start)
+
+
 class ElasticsearchClient:
     """ElasticSearch 클라이언트 래퍼"""
     
@@ -20,7 +34,7 @@ class ElasticsearchClient:
             url (str): ElasticSearch URL
             index_name (str): 인덱스 이름
         """
-        self.client = Elasticsearch([url])
+        self.client = Elasticsearch([url], transport_class=TracingTransport)
         self.index_name = index_name
         
     def is_connected(self) -> bool:
@@ -65,6 +79,7 @@ class ElasticsearchClient:
                     "content": {"type": "text", "analyzer": "standard"},
                     "source_url": {"type": "keyword"},
                     "source_name": {"type": "keyword"},
+                    "cluster_id": {"type": "keyword"},  # 유사 중복 기사 클러스터
                     "published_date": {"type": "date"},
                     "crawled_date": {"type": "date"},
                     "analyzed_date": {"type": "date"},
@@ -86,7 +101,9 @@ class ElasticsearchClient:
                         "properties": {
                             "word_count": {"type": "integer"},
                             "language": {"type": "keyword"},
-                            "gpt_model": {"type": "keyword"}
+                            "gpt_model": {"type": "keyword"},
+                            "analysis_mode": {"type": "keyword"},  # full / light (관련도 분류)
+                            "relevance": {"type": "float"}
                         }
                     }
                 }
@@ -0,0 +1,220 @@
+"""
+경량 메트릭 레지스트리 (Prometheus 텍스트 포맷)
+- Counter / Histogram (프로세스 메모리 집계)
+- collector: 스크레이프 시점에 외부 데이터(DB 등)로 메트릭 생성
+"""
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# 기본 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    """Prometheus 값 포맷"""
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value) -> str:
+    """라벨 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_labels(labels: Dict[str, object]) -> str:
+    """{key="value",...} 형식의 라벨 문자열"""
+    if not labels:
+        return ''
+    inner = ','.join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+    return '{' + inner + '}'
+
+
+def render_histogram(
+    name: str,
+    labels: Dict[str, object],
+    buckets: Iterable[float],
+    cumulative_counts: Iterable[int],
+    total_sum: float,
+    count: int
+) -> List[str]:
+    """
+    히스토그램 한 시리즈를 Prometheus 텍스트 라인으로 변환
+
+    Args:
+        name: 메트릭 이름
+        labels: 라벨
+        buckets: 버킷 상한 (+Inf 제외)
+        cumulative_counts: 버킷별 누적 개수
+        total_sum: 관측값 합계
+        count: 관측 개수
+
+    Returns:
+        텍스트 라인 리스트
+    """
+    lines = []
+    for bound, bucket_count in zip(buckets, cumulative_counts):
+        bucket_labels = dict(labels, le=_format_value(bound))
+        lines.append(f"{name}_bucket{format_labels(bucket_labels)} {bucket_count}")
+    lines.append(f"{name}_bucket{format_labels(dict(labels, le='+Inf'))} {count}")
+    lines.append(f"{name}_sum{format_labels(labels)} {_format_value(total_sum)}")
+    lines.append(f"{name}_count{format_labels(labels)} {count}")
+    return lines
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """카운터 증가"""
+        key = tuple(str(labels.get(label, '')) for label in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        """현재 값 조회"""
+        key = tuple(str(labels.get(label, '')) for label in self.labelnames)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 라인"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                labels = dict(zip(self.labelnames, key))
+                lines.append(f"{self.name}{format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """고정 버킷 히스토그램"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [버킷별 개수(비누적), 합계, 개수]
+        self._series: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        """관측값 기록"""
+        key = tuple(str(labels.get(label, '')) for label in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [[0] * len(self.buckets), 0.0, 0]
+                self._series[key] = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def get_count(self, **labels) -> int:
+        """관측 개수 조회"""
+        key = tuple(str(labels.get(label, '')) for label in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            return series[2] if series else 0
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 라인"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total_sum, count) in sorted(self._series.items()):
+                cumulative, running = [], 0
+                for bucket_count in counts:
+                    running += bucket_count
+                    cumulative.append(running)
+                labels = dict(zip(self.labelnames, key))
+                lines.extend(render_histogram(self.name, labels, self.buckets, cumulative, total_sum, count))
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], List[str]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        """카운터 조회 (없으면 생성)"""
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Counter(name, documentation, labelnames)
+            return self._metrics[name]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """히스토그램 조회 (없으면 생성)"""
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Histogram(name, documentation, labelnames, buckets)
+            return self._metrics[name]
+
+    def register_collector(self, collector: Callable[[], List[str]]) -> None:
+        """스크레이프 시점에 호출될 collector 등록 (중복 등록 무시)"""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render(self) -> str:
+        """전체 메트릭을 Prometheus 텍스트 포맷으로 변환"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for collector in collectors:
+            lines.extend(collector())
+        return '\n'.join(lines) + '\n'
+
+
+# 싱글톤 인스턴스
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    MetricsRegistry 싱글톤 인스턴스 반환
+
+    Returns:
+        MetricsRegistry: 메트릭 레지스트리
+    """
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+
+    return _registry
@@ -0,0 +1,173 @@
+"""
+요청 단위 지연 시간 추적 미들웨어
+- 엔드포인트별 응답 시간 히스토그램
+- 요청당 SQLAlchemy 쿼리 수/시간 (engine 이벤트)
+- 요청당 ElasticSearch 호출 수/시간 (transport hook)
+- Server-Timing 헤더 (SERVER_TIMING_ENABLED일 때만 - 쿼리 수/시간이 모든 클라이언트에 노출되므로) 및 느린 요청 로그
+"""
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from flask import Flask, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.config import Config
+from app.utils.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# 요청 통계 버킷 (쿼리/호출 수)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+_events_registered = False
+_events_lock = threading.Lock()
+
+
+def _current_stats() -> Optional[Dict[str, float]]:
+    """현재 요청의 통계 (요청 컨텍스트 밖이면 None)"""
+    if not has_request_context():
+        return None
+    return g.get('_request_trace')
+
+
+def record_db_query(seconds: float) -> None:
+    """현재 요청에 DB 쿼리 1건 기록"""
+    stats = _current_stats()
+    if stats is not None:
+        stats['db_count'] += 1
+        stats['db_time'] += seconds
+
+
+def record_es_call(seconds: float) -> None:
+    """현재 요청에 ES 호출 1건 기록"""
+    stats = _current_stats()
+    if stats is not None:
+        stats['es_count'] += 1
+        stats['es_time'] += seconds
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('_query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get('_query_start')
+    if starts:
+        record_db_query(time.perf_counter() - starts.pop())
+
+
+def _handle_db_error(exception_context):
+    # 실패한 쿼리의 시작 시각 정리 (다음 쿼리 측정이 어긋나지 않도록)
+    conn = exception_context.connection
+    if conn is not None:
+        starts = conn.info.get('_query_start')
+        if starts:
+            record_db_query(time.perf_counter() - starts.pop())
+
+
+def _register_engine_events() -> None:
+    """모든 Engine에 쿼리 시간 측정 이벤트 등록 (프로세스당 1회)"""
+    global _events_registered
+
+    with _events_lock:
+        if _events_registered:
+            return
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_db_error)
+        _events_registered = True
+
+
+def _format_server_timing(stats: Dict[str, float], total: float) -> str:
+    """Server-Timing 헤더 값"""
+    return ', '.join([
+        f'db;dur={stats["db_time"] * 1000:.1f};desc="{int(stats["db_count"])} queries"',
+        f'es;dur={stats["es_time"] * 1000:.1f};desc="{int(stats["es_count"])} calls"',
+        f'total;dur={total * 1000:.1f}'
+    ])
+
+
+def init_request_tracing(app: Flask) -> None:
+    """
+    Flask 앱에 요청 추적 미들웨어 등록
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+    """
+    _register_engine_events()
+
+    registry = get_metrics_registry()
+    latency = registry.histogram(
+        'http_request_duration_seconds',
+        'HTTP request latency per endpoint',
+        ('endpoint', 'method', 'status')
+    )
+    db_queries = registry.histogram(
+        'http_request_db_queries',
+        'SQL queries executed per request',
+        ('endpoint',),
+        buckets=COUNT_BUCKETS
+    )
+    db_time = registry.histogram(
+        'http_request_db_seconds',
+        'Time spent in SQL queries per request',
+        ('endpoint',)
+    )
+    es_calls = registry.histogram(
+        'http_request_es_calls',
+        'Elasticsearch calls per request',
+        ('endpoint',),
+        buckets=COUNT_BUCKETS
+    )
+    es_time = registry.histogram(
+        'http_request_es_seconds',
+        'Time spent in Elasticsearch calls per request',
+        ('endpoint',)
+    )
+
+    @app.before_request
+    def start_request_trace():
+        """요청 통계 초기화"""
+        g._request_trace = {
+            'start': time.perf_counter(),
+            'db_count': 0,
+            'db_time': 0.0,
+            'es_count': 0,
+            'es_time': 0.0
+        }
+
+    @app.after_request
+    def finish_request_trace(response):
+        """요청 통계 기록 및 Server-Timing 헤더 추가 (설정 시)"""
+        stats = g.pop('_request_trace', None)
+        if stats is None:
+            return response
+
+        try:
+            total = time.perf_counter() - stats['start']
+            endpoint = request.endpoint or 'unmatched'
+
+            latency.observe(total, endpoint=endpoint, method=request.method, status=response.status_code)
+            db_queries.observe(stats['db_count'], endpoint=endpoint)
+            db_time.observe(stats['db_time'], endpoint=endpoint)
+            es_calls.observe(stats['es_count'], endpoint=endpoint)
+            es_time.observe(stats['es_time'], endpoint=endpoint)
+
+            if Config.SERVER_TIMING_ENABLED:
+                response.headers['Server-Timing'] = _format_server_timing(stats, total)
+
+            threshold_ms = Config.SLOW_REQUEST_MS
+            if threshold_ms and total * 1000 >= threshold_ms:
+                logger.warning(
+                    f"Slow request: {request.method} {request.path} ({endpoint}) "
+                    f"{total * 1000:.0f}ms status={response.status_code} "
+                    f"db={int(stats['db_count'])}q/{stats['db_time'] * 1000:.0f}ms "
+                    f"es={int(stats['es_count'])}c/{stats['es_time'] * 1000:.0f}ms"
+                )
+        except Exception as e:
+            logger.error(f"Failed to record request trace: {e}")
+
+        return response
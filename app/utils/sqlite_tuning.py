@@ -0,0 +1,126 @@
+"""
+SQLite 성능 설정
+- 파일 DB 연결마다 PRAGMA 적용 (WAL, synchronous, busy_timeout, mmap, cache)
+- 스케줄러 쓰기(CrawlLog/EmailLog)와 요청 읽기가 서로 막지 않도록 WAL 사용
+- 연결 풀(QueuePool) 크기 설정
+- :memory: DB(테스트)에는 적용하지 않음
+"""
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, List, Tuple
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+SYNCHRONOUS_MODES = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+_events_registered = False
+_events_lock = threading.Lock()
+
+
+def is_file_sqlite(uri: str) -> bool:
+    """파일 기반 SQLite URI 여부 (:memory: 제외)"""
+    if not uri or not uri.startswith('sqlite'):
+        return False
+    path = uri.split('://', 1)[-1].lstrip('/')
+    return bool(path) and ':memory:' not in path and 'mode=memory' not in path
+
+
+def get_pragmas() -> List[Tuple[str, Any]]:
+    """적용할 PRAGMA 목록 (Config 기준)"""
+    synchronous = Config.SQLITE_SYNCHRONOUS if Config.SQLITE_SYNCHRONOUS in SYNCHRONOUS_MODES else 'NORMAL'
+    return [
+        ('journal_mode', 'WAL'),
+        ('synchronous', synchronous),
+        ('busy_timeout', Config.SQLITE_BUSY_TIMEOUT_MS),
+        ('mmap_size', Config.SQLITE_MMAP_SIZE),
+        ('cache_size', -abs(Config.SQLITE_CACHE_SIZE_KB)),  # 음수 = KiB 단위
+        ('temp_store', 'MEMORY'),
+    ]
+
+
+def apply_pragmas(dbapi_connection) -> None:
+    """
+    DBAPI 연결에 성능 PRAGMA 적용
+
+    Args:
+        dbapi_connection: sqlite3 연결
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in get_pragmas():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _is_memory_connection(dbapi_connection) -> bool:
+    cursor = dbapi_connection.cursor()
+    try:
+        # main DB 파일 경로가 비어 있으면 :memory:
+        rows = cursor.execute("PRAGMA database_list").fetchall()
+        return not any(row[1] == 'main' and row[2] for row in rows)
+    finally:
+        cursor.close()
+
+
+def _on_connect(dbapi_connection, connection_record):
+    if not Config.SQLITE_TUNING or not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    try:
+        if _is_memory_connection(dbapi_connection):
+            return
+        apply_pragmas(dbapi_connection)
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to apply SQLite pragmas: {e}")
+
+
+def _register_engine_events() -> None:
+    """모든 Engine에 연결 시 PRAGMA 적용 이벤트 등록 (프로세스당 1회)"""
+    global _events_registered
+
+    with _events_lock:
+        if _events_registered:
+            return
+        event.listen(Engine, 'connect', _on_connect)
+        _events_registered = True
+
+
+def build_engine_options() -> Dict[str, Any]:
+    """파일 SQLite용 엔진 옵션 (연결 풀 크기/대기 시간)"""
+    return {
+        'poolclass': QueuePool,
+        'pool_size': Config.SQLITE_POOL_SIZE,
+        'max_overflow': Config.SQLITE_MAX_OVERFLOW,
+        'pool_timeout': Config.SQLITE_POOL_TIMEOUT,
+        'connect_args': {
+            'timeout': Config.SQLITE_BUSY_TIMEOUT_MS / 1000.0,
+            'check_same_thread': False
+        }
+    }
+
+
+def init_sqlite_tuning(app: Flask) -> None:
+    """
+    SQLite 성능 설정 등록 (db.init_app 전에 호출)
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+    """
+    _register_engine_events()
+
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI', '')
+    if not Config.SQLITE_TUNING or not is_file_sqlite(uri):
+        return
+
+    # 명시적으로 지정한 엔진 옵션이 우선
+    options = build_engine_options()
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
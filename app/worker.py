@@ -0,0 +1,77 @@
+"""
+스케줄러 워커 프로세스
+- 웹 서버(gunicorn)와 분리된 프로세스에서 크롤링/메일/정리 작업 실행
+- 워커를 여러 개 띄워도 DB 리더 리스(scheduler_locks)를 가진 1개만 작업을 실행하고
+  나머지는 대기하다가 리더가 죽으면 인계받는다
+
+실행:
+    python -m app.worker
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import threading
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    워커 실행 (SIGTERM/SIGINT까지 대기)
+
+    Args:
+        argv: 명령행 인자
+
+    Returns:
+        종료 코드
+    """
+    parser = argparse.ArgumentParser(description='Stock Analysis scheduler worker')
+    parser.add_argument(
+        '--config',
+        default=os.getenv('FLASK_ENV', 'development'),
+        help='설정 환경 (development, production, testing)'
+    )
+    args = parser.parse_args(argv)
+
+    # 이 프로세스는 항상 스케줄러를 실행 (웹 프로세스는 ENABLE_SCHEDULER=false 권장)
+    os.environ['ENABLE_SCHEDULER'] = 'true'
+
+    from app import create_app
+    from app.services.scheduler import SchedulerService
+    from app.utils.config import Config
+
+    Config.validate_config()
+    create_app(args.config)
+
+    scheduler = SchedulerService()
+    if not scheduler.is_running():
+        logger.error("Scheduler failed to start")
+        return 1
+
+    stop_event = threading.Event()
+
+    def _handle_signal(signum, frame):
+        logger.info(f"Received signal {signum}, shutting down worker")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    logger.info(
+        f"Scheduler worker started (pid={os.getpid()}, "
+        f"leader={'yes' if scheduler.is_leader() else 'standby'})"
+    )
+    while not stop_event.wait(timeout=60):
+        pass
+
+    scheduler.shutdown()
+    logger.info("Scheduler worker stopped")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
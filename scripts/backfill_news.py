@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+과거 뉴스 백필 스크립트
+
+investing.com 뉴스 목록을 페이지 단위로 거슬러 올라가 지정한 기간의 뉴스를 수집한다.
+진행 상태는 backfill_checkpoints 테이블에 페이지마다 기록되므로, 중단 후 다시 실행하면
+마지막으로 끝낸 페이지 다음부터 이어서 수집한다.
+
+사용법:
+    python scripts/backfill_news.py                     # 활성 사용자 관심 종목, 최근 90일
+    python scripts/backfill_news.py TSLA NVDA --days 30
+    python scripts/backfill_news.py --status            # 진행 상태만 출력
+    python scripts/backfill_news.py TSLA --base-url http://127.0.0.1:8000 --http   # 로컬 미러
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+import os
+os.environ.setdefault('ENABLE_SCHEDULER', 'false')
+
+from app import create_app
+from app.extensions import db
+from app.services.backfill import BackfillService, HttpPageFetcher, get_backfill_status
+from app.services.scheduler import SchedulerService
+from app.utils.config import Config
+
+
+def main():
+    parser = argparse.ArgumentParser(description='과거 뉴스 백필')
+    parser.add_argument('tickers', nargs='*', help='티커 목록 (생략 시 활성 사용자 관심 종목)')
+    parser.add_argument('--days', type=int, default=Config.BACKFILL_DAYS, help='최근 N일까지 수집')
+    parser.add_argument('--workers', type=int, default=Config.BACKFILL_MAX_CONCURRENCY, help='동시 실행 티커 수')
+    parser.add_argument('--max-pages', type=int, default=Config.BACKFILL_MAX_PAGES, help='티커당 최대 페이지 수')
+    parser.add_argument('--base-url', default=None, help='investing.com 대신 사용할 사이트 주소')
+    parser.add_argument('--http', action='store_true', help='Chrome 대신 requests로 페이지 로딩')
+    parser.add_argument('--status', action='store_true', help='진행 상태만 출력')
+    args = parser.parse_args()
+
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+
+    with app.app_context():
+        tickers = [t.upper() for t in args.tickers] or SchedulerService()._get_active_tickers()
+
+        if args.status:
+            for row in get_backfill_status(db.session, tickers or None):
+                print(f"  {row['ticker_symbol']:<6} {row['status']:<9} page={row['next_page']:<3} "
+                      f"saved={row['articles_saved']:<5} oldest={row['oldest_seen']}")
+            return
+
+    if not tickers:
+        print("No tickers to backfill")
+        return
+
+    backfill = BackfillService(
+        app,
+        fetcher_factory=HttpPageFetcher if args.http else None,
+        base_url=args.base_url,
+        max_pages=args.max_pages
+    )
+    results = backfill.backfill(tickers, days=args.days, max_workers=args.workers)
+
+    for ticker, result in sorted(results.items()):
+        mark = '✓' if result['status'] in ('COMPLETED', 'SKIPPED') else '✗'
+        error = f" ({result['error']})" if result.get('error') else ''
+        print(f"{mark} {ticker}: {result['status']} - {result.get('pages', 0)} pages, {result['saved']} saved{error}")
+
+    if any(r['status'] == 'FAILED' for r in results.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
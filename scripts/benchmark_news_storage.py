@@ -0,0 +1,160 @@
+"""
+뉴스 저장소 벤치마크 (SQLite FTS5 vs ElasticSearch)
+- 같은 합성 뉴스 데이터를 각 저장소에 벌크 저장한 뒤 라우트/크롤러/스케줄러가 쓰는 조회를 반복 실행
+- 적재 시간, 조회별 p50/p95 지연 시간, 저장 크기 비교
+- ES는 --es를 지정하고 연결될 때만 실행 (별도 벤치마크 인덱스를 만들고 끝나면 삭제)
+
+사용법:
+    python scripts/benchmark_news_storage.py --docs 50000 --tickers 100
+    python scripts/benchmark_news_storage.py --docs 200000 --es --es-index news_benchmark
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.sqlite_news_storage import SQLiteNewsStorage
+
+WORDS = (
+    'earnings revenue guidance deliveries recall lawsuit upgrade downgrade merger acquisition '
+    'buyback dividend chip demand supply tariff outlook forecast analyst rating shares rally slump'
+).split()
+# 본문 일반 단어 (검색 대상 단어는 기사마다 몇 개만 포함)
+FILLER = [f'word{i}' for i in range(5000)]
+SENTIMENTS = ('positive', 'negative', 'neutral')
+
+
+def percentile(values, pct):
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(len(ordered) * pct / 100.0 + 0.5) - 1))
+    return ordered[index]
+
+
+def make_documents(count: int, tickers: list, days: int) -> list:
+    """크롤러 저장 형식의 합성 뉴스"""
+    now = datetime.now(timezone.utc)
+    documents = []
+    for i in range(count):
+        ticker = random.choice(tickers)
+        sentiment = random.choice(SENTIMENTS)
+        documents.append({
+            'news_id': f'bench-{i}',
+            'ticker_symbol': ticker,
+            'company_name': f'{ticker} Inc.',
+            'title': f"{ticker} {' '.join(random.sample(WORDS, 2))} {' '.join(random.choices(FILLER, k=6))}",
+            'content': ' '.join(random.choices(FILLER, k=120) + random.sample(WORDS, 2)),
+            'source_url': f'https://example.com/{ticker.lower()}/{i}',
+            'source_name': 'Benchmark',
+            'published_date': (now - timedelta(seconds=random.randint(0, days * 86400))).isoformat(),
+            'summary': {'ko': '요약', 'en': 'summary'},
+            'sentiment': {'classification': sentiment, 'score': random.randint(-100, 100)},
+        })
+    return documents
+
+
+def run_queries(storage, tickers: list, rounds: int) -> dict:
+    """조회별 지연 시간 (초 리스트)"""
+    from_date = (datetime.now(timezone.utc) - timedelta(days=7)).strftime('%Y-%m-%d')
+    watchlist = tickers[:10]
+    queries = {
+        'search ticker p1': lambda: storage.search_news(ticker_symbol=random.choice(tickers), size=20),
+        'search ticker p5': lambda: storage.search_news(ticker_symbol=random.choice(tickers), size=20, page=5),
+        'keyword': lambda: storage.search_news(keyword=random.choice(WORDS), size=20),
+        'keyword+ticker': lambda: storage.search_news(keyword=random.choice(WORDS),
+                                                      ticker_symbol=random.choice(tickers), size=20),
+        'count 7d': lambda: storage.count_news(ticker_symbols=watchlist, from_date=from_date),
+        'ticker stats': lambda: storage.get_ticker_statistics(random.choice(tickers), from_date),
+        'date stats': lambda: storage.get_date_statistics(watchlist, from_date),
+        'recent 3h': lambda: storage.get_recent_news(random.choice(tickers), hours=3),
+        'dup check 50': lambda: storage.check_duplicates(
+            [f'https://example.com/{random.choice(tickers).lower()}/{random.randint(0, 10 ** 6)}' for _ in range(50)]
+        ),
+    }
+    results = {}
+    for name, query in queries.items():
+        latencies = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            query()
+            latencies.append(time.perf_counter() - started)
+        results[name] = latencies
+    return results
+
+
+def load(storage, documents: list, batch_size: int) -> float:
+    """벌크 저장 시간 (초)"""
+    started = time.perf_counter()
+    for start in range(0, len(documents), batch_size):
+        storage.bulk_save_news(documents[start:start + batch_size])
+    return time.perf_counter() - started
+
+
+def print_results(name: str, load_seconds: float, docs: int, size_mb: float, results: dict) -> None:
+    print(f"\n[{name}] load {docs} docs: {load_seconds:.1f}s ({docs / load_seconds:.0f} docs/s), size {size_mb:.1f} MB")
+    print(f"{'query':<18}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for query, latencies in results.items():
+        print(f"{query:<18}{percentile(latencies, 50) * 1000:>10.2f}{percentile(latencies, 95) * 1000:>10.2f}"
+              f"{max(latencies) * 1000:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='News storage benchmark (SQLite FTS5 vs ElasticSearch)')
+    parser.add_argument('--docs', type=int, default=50000, help='뉴스 수')
+    parser.add_argument('--tickers', type=int, default=100, help='종목 수')
+    parser.add_argument('--days', type=int, default=90, help='발행일 분포 기간 (일)')
+    parser.add_argument('--rounds', type=int, default=200, help='조회별 반복 횟수')
+    parser.add_argument('--batch-size', type=int, default=500, help='벌크 저장 크기')
+    parser.add_argument('--es', action='store_true', help='ElasticSearch도 측정')
+    parser.add_argument('--es-index', default='news_benchmark', help='ES 벤치마크 인덱스 (실행 후 삭제)')
+    args = parser.parse_args()
+
+    random.seed(42)
+    tickers = [f'T{i:03d}' for i in range(args.tickers)]
+    documents = make_documents(args.docs, tickers, args.days)
+    print("=" * 60)
+    print(f"News storage benchmark: {args.docs} docs, {args.tickers} tickers, {args.days} days")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'news.db')
+        storage = SQLiteNewsStorage(path)
+        load_seconds = load(storage, [dict(d) for d in documents], args.batch_size)
+        storage.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        results = run_queries(storage, tickers, args.rounds)
+        print_results('sqlite', load_seconds, args.docs, os.path.getsize(path) / 1024 ** 2, results)
+        storage.close()
+
+    if args.es:
+        from app.services.news_storage import NewsStorageAdapter
+        from app.utils.elasticsearch_client import get_es_client
+
+        es_client = get_es_client(index_name=args.es_index)
+        if not es_client.is_connected():
+            print("\n[elasticsearch] not reachable - skipped")
+            return
+        es_client.create_index()
+        try:
+            storage = NewsStorageAdapter()
+            load_seconds = load(storage, [dict(d) for d in documents], args.batch_size)
+            es_client.client.indices.refresh(index=args.es_index)
+            results = run_queries(storage, tickers, args.rounds)
+            stats = es_client.client.indices.stats(index=args.es_index)
+            size_mb = stats['_all']['primaries']['store']['size_in_bytes'] / 1024 ** 2
+            print_results('elasticsearch', load_seconds, args.docs, size_mb, results)
+        finally:
+            es_client.client.indices.delete(index=args.es_index)
+
+
+if __name__ == '__main__':
+    main()
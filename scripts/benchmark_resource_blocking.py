@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+리소스 차단 절감량 측정 스크립트
+
+같은 뉴스 페이지를 리소스 차단 없이/적용해서 각각 새 브라우저로 로딩하고
+페이지별 요청 수, 전송량, DOMContentLoaded/load 시간을 비교한다.
+차단 범주는 CRAWL_BLOCKED_RESOURCES / CRAWL_BLOCKED_URL_PATTERNS 또는 --categories로 지정.
+
+사용법:
+    python scripts/benchmark_resource_blocking.py                 # TSLA NVDA SPY
+    python scripts/benchmark_resource_blocking.py AAPL MSFT --categories images,fonts,media,trackers,ads,stylesheets
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+
+from app.services import resource_blocking
+from app.services.crawler import InvestingCrawler
+from app.services.resource_blocking import collect_page_stats, compare_stats
+
+DEFAULT_TICKERS = ['TSLA', 'NVDA', 'SPY']
+
+
+def measure(tickers, block_resources: bool, settle_seconds: float):
+    """티커별 뉴스 페이지 로딩 통계 (티커마다 새 브라우저 - 캐시 영향 제거)"""
+    results = []
+    for ticker in tickers:
+        with InvestingCrawler(block_resources=block_resources) as crawler:
+            crawler.fetch_page_source(crawler.get_news_url(ticker), settle_seconds=settle_seconds)
+            stats = collect_page_stats(crawler.driver)
+        if stats:
+            print(f"  {ticker:<6} blocking={'on ' if block_resources else 'off'} "
+                  f"requests={stats['requests']:<4} {stats['transfer_bytes'] / 1024:>8.0f} KB "
+                  f"dom={stats['dom_ms']:>6} ms load={stats['load_ms']:>6} ms")
+            results.append(stats)
+        else:
+            print(f"  {ticker:<6} blocking={'on ' if block_resources else 'off'} no stats")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='리소스 차단 절감량 측정')
+    parser.add_argument('tickers', nargs='*', help=f"티커 목록 (기본: {' '.join(DEFAULT_TICKERS)})")
+    parser.add_argument('--categories', default=None, help='차단 범주 (쉼표 구분, 기본: CRAWL_BLOCKED_RESOURCES)')
+    parser.add_argument('--settle', type=float, default=5.0, help='로딩 후 대기 시간 (초)')
+    args = parser.parse_args()
+
+    tickers = [t.upper() for t in args.tickers] or DEFAULT_TICKERS
+    if args.categories:
+        resource_blocking.Config.CRAWL_BLOCKED_RESOURCES = args.categories
+    print(f"Blocked patterns: {len(resource_blocking.build_blocked_patterns())}")
+
+    baseline = measure(tickers, False, args.settle)
+    blocked = measure(tickers, True, args.settle)
+
+    print("\nAverage per page")
+    labels = {'transfer_bytes': 'transfer (bytes)', 'requests': 'requests', 'dom_ms': 'DOMContentLoaded (ms)', 'load_ms': 'load (ms)'}
+    for key, row in compare_stats(baseline, blocked).items():
+        print(f"  {labels[key]:<24} off={row['off']:>10} on={row['on']:>10} saved={row['saved_pct']:>5}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+렉시콘 감성 분석 벤치마크
+- 라벨 평가 세트(tests/fixtures/sentiment/labelled_headlines.csv) 정확도: 렉시콘 vs 기존 키워드 루프
+- 헤드라인 N건 처리량: 기존 키워드 루프, 건별 score(), score_batch() (NumPy 설치 시 NumPy/순수 파이썬 집계 각각)
+
+사용법:
+    python scripts/benchmark_sentiment.py --headlines 50000
+    python scripts/benchmark_sentiment.py --eval path/to/labelled.csv
+"""
+import argparse
+import csv
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.lexicon_sentiment import LexiconSentimentAnalyzer, np
+
+DEFAULT_EVAL = project_root / 'tests' / 'fixtures' / 'sentiment' / 'labelled_headlines.csv'
+
+# 이전 _generate_fallback_analysis의 키워드 루프 (비교용)
+LEGACY_POSITIVE = ['beat', 'growth', 'surge', 'gain', 'soar', 'strong', 'record', 'upgrade', 'outperform', 'buy']
+LEGACY_NEGATIVE = ['miss', 'drop', 'fall', 'decline', 'loss', 'down', 'weak', 'cut', 'downgrade', 'sell', 'bankruptcy']
+
+
+def legacy_classify(text: str) -> str:
+    """기존 부분 문자열 키워드 카운트"""
+    text_lower = text.lower()
+    score = sum(1 for kw in LEGACY_POSITIVE if kw in text_lower)
+    score -= sum(1 for kw in LEGACY_NEGATIVE if kw in text_lower)
+    if score > 0:
+        return 'positive'
+    if score < 0:
+        return 'negative'
+    return 'neutral'
+
+
+def load_labelled(path: Path) -> list:
+    """[(라벨, 제목), ...]"""
+    with open(path, newline='', encoding='utf-8') as f:
+        return [(row['label'], row['title']) for row in csv.DictReader(f)]
+
+
+def evaluate(rows: list, analyzer: LexiconSentimentAnalyzer) -> None:
+    predicted = [result['classification'] for result in analyzer.score_batch([title for _, title in rows])]
+    lexicon_correct = sum(1 for (label, _), guess in zip(rows, predicted) if label == guess)
+    legacy_correct = sum(1 for label, title in rows if legacy_classify(title) == label)
+    print(f"\n[accuracy] {len(rows)} labelled headlines")
+    print(f"  lexicon        {lexicon_correct / len(rows):6.1%}  ({lexicon_correct}/{len(rows)})")
+    print(f"  legacy keyword {legacy_correct / len(rows):6.1%}  ({legacy_correct}/{len(rows)})")
+    for label in ('positive', 'negative', 'neutral'):
+        total = sum(1 for row_label, _ in rows if row_label == label)
+        hits = sum(1 for (row_label, _), guess in zip(rows, predicted) if row_label == label == guess)
+        print(f"  {label:<14} {hits}/{total}")
+
+
+def timed(name: str, count: int, func) -> None:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"  {name:<24}{elapsed * 1000:>10.1f} ms{count / elapsed:>12.0f} headlines/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lexicon sentiment benchmark')
+    parser.add_argument('--headlines', type=int, default=50000, help='처리량 측정 헤드라인 수')
+    parser.add_argument('--eval', type=Path, default=DEFAULT_EVAL, help='라벨 평가 CSV (label,title)')
+    args = parser.parse_args()
+
+    rows = load_labelled(args.eval)
+    analyzer = LexiconSentimentAnalyzer()
+    evaluate(rows, analyzer)
+
+    random.seed(42)
+    titles = [random.choice(rows)[1] for _ in range(args.headlines)]
+    print(f"\n[throughput] {args.headlines} headlines")
+    timed('legacy keyword loop', len(titles), lambda: [legacy_classify(title) for title in titles])
+    timed('score() per item', len(titles), lambda: [analyzer.score(title) for title in titles])
+    python_analyzer = LexiconSentimentAnalyzer(use_numpy=False)
+    timed('score_batch (python)', len(titles), lambda: python_analyzer.score_batch(titles))
+    if np is not None:
+        timed('score_batch (numpy)', len(titles), lambda: analyzer.score_batch(titles))
+    else:
+        print("  score_batch (numpy)     skipped (numpy not installed)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""
+SQLite 동시성 벤치마크
+- 요청 스레드(UserStock 조회)와 스케줄러 스레드(CrawlLog/EmailLog 쓰기)를 동시에 실행
+- 기본 설정(rollback journal, 기본 풀)과 성능 설정(WAL + PRAGMA + QueuePool)의
+  읽기/쓰기 처리량, 지연 시간, "database is locked" 오류 수 비교
+
+사용법:
+    python scripts/benchmark_sqlite.py --readers 8 --writers 2 --duration 10
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.exc import OperationalError
+
+from app.extensions import db
+from app.models.models import CrawlLog, EmailLog, StockMaster, User, UserStock, KST
+from app.utils.sqlite_tuning import apply_pragmas, build_engine_options
+
+TICKERS = ['AAPL', 'MSFT', 'NVDA', 'TSLA', 'AMZN', 'GOOGL', 'META', 'SPY', 'QQQ', 'AMD']
+
+
+def percentile(values, pct):
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(len(ordered) * pct / 100.0 + 0.5) - 1))
+    return ordered[index]
+
+
+def make_engine(path: str, tuned: bool):
+    """벤치마크용 엔진 생성 (tuned면 앱과 같은 PRAGMA/풀 설정)"""
+    uri = f"sqlite:///{path}"
+    if not tuned:
+        return create_engine(uri, connect_args={'check_same_thread': False})
+
+    engine = create_engine(uri, **build_engine_options())
+    event.listen(engine, 'connect', lambda dbapi_connection, record: apply_pragmas(dbapi_connection))
+    return engine
+
+
+def seed(engine, users: int) -> None:
+    """테이블 생성 및 사용자/관심 종목 데이터 준비"""
+    db.Model.metadata.create_all(engine)
+    now = datetime.now(KST)
+    with engine.begin() as conn:
+        conn.execute(insert(StockMaster.__table__), [
+            {'ticker_symbol': t, 'company_name': f'{t} Inc.', 'exchange': 'NASDAQ'} for t in TICKERS
+        ])
+        conn.execute(insert(User.__table__), [
+            {'id': i, 'username': f'user{i}', 'email': f'user{i}@example.com', 'password_hash': 'x',
+             'is_active': True, 'is_admin': False, 'created_at': now, 'updated_at': now}
+            for i in range(1, users + 1)
+        ])
+        conn.execute(insert(UserStock.__table__), [
+            {'user_id': i, 'ticker_symbol': t, 'created_at': now}
+            for i in range(1, users + 1) for t in random.sample(TICKERS, 5)
+        ])
+
+
+def run_workload(engine, readers: int, writers: int, duration: float, users: int) -> dict:
+    """
+    읽기/쓰기 스레드를 duration초 동안 실행
+
+    Returns:
+        {'reads': {...}, 'writes': {...}} 통계
+    """
+    stop = threading.Event()
+    lock = threading.Lock()
+    stats = {
+        'reads': {'count': 0, 'errors': 0, 'latencies': []},
+        'writes': {'count': 0, 'errors': 0, 'latencies': []},
+    }
+    user_stocks = UserStock.__table__
+
+    def record(kind, elapsed, error=False):
+        with lock:
+            stats[kind]['errors' if error else 'count'] += 1
+            if not error:
+                stats[kind]['latencies'].append(elapsed)
+
+    def reader():
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                with engine.connect() as conn:
+                    conn.execute(
+                        select(user_stocks).where(user_stocks.c.user_id == random.randint(1, users))
+                    ).fetchall()
+                record('reads', time.perf_counter() - started)
+            except OperationalError:
+                record('reads', 0, error=True)
+
+    def writer():
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(CrawlLog.__table__).values(
+                        ticker_symbol=random.choice(TICKERS), status='success',
+                        news_count=random.randint(0, 20), crawled_at=datetime.now(KST)
+                    ))
+                    conn.execute(insert(EmailLog.__table__).values(
+                        user_id=random.randint(1, users), status='success',
+                        news_count=random.randint(0, 20), sent_at=datetime.now(KST)
+                    ))
+                record('writes', time.perf_counter() - started)
+            except OperationalError:
+                record('writes', 0, error=True)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    for values in stats.values():
+        latencies = values.pop('latencies')
+        values['ops_per_sec'] = values['count'] / duration
+        values['p50_ms'] = percentile(latencies, 50) * 1000
+        values['p95_ms'] = percentile(latencies, 95) * 1000
+        values['max_ms'] = max(latencies, default=0) * 1000
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite reader/writer concurrency benchmark')
+    parser.add_argument('--readers', type=int, default=8, help='읽기 스레드 수 (요청 처리)')
+    parser.add_argument('--writers', type=int, default=2, help='쓰기 스레드 수 (스케줄러)')
+    parser.add_argument('--duration', type=float, default=10, help='모드별 실행 시간 (초)')
+    parser.add_argument('--users', type=int, default=50, help='시드 사용자 수')
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"SQLite benchmark: {args.readers} readers / {args.writers} writers, {args.duration:.0f}s per mode")
+    print("=" * 78)
+    print(f"{'mode':<10}{'op':<8}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'locked':>10}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for mode in ('default', 'tuned'):
+            path = os.path.join(tmpdir, f'{mode}.db')
+            engine = make_engine(path, tuned=(mode == 'tuned'))
+            random.seed(42)
+            seed(engine, args.users)
+            result = run_workload(engine, args.readers, args.writers, args.duration, args.users)
+            engine.dispose()
+
+            for op in ('reads', 'writes'):
+                values = result[op]
+                print(f"{mode:<10}{op:<8}{values['ops_per_sec']:>10.1f}{values['p50_ms']:>10.2f}"
+                      f"{values['p95_ms']:>10.2f}{values['max_ms']:>10.1f}{values['errors']:>10}")
+
+
+if __name__ == '__main__':
+    main()
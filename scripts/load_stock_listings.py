@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+거래소 상장 목록 일괄 적재 스크립트
+
+NASDAQ Trader 심볼 디렉터리(nasdaqlisted.txt / otherlisted.txt, 파이프 구분) 또는
+Symbol,Name[,Exchange,Sector] CSV를 stock_master에 업서트하고 추가/변경/상장폐지 목록을 출력한다.
+
+사용법:
+    python scripts/load_stock_listings.py nasdaqlisted.txt otherlisted.txt --ko-map names_ko.csv
+    python scripts/load_stock_listings.py nasdaqlisted.txt --dry-run      # 비교만
+    python scripts/load_stock_listings.py nasdaqlisted.txt otherlisted.txt --prune   # 관심 종목이 아닌 상장폐지 종목 삭제
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+import os
+os.environ.setdefault('ENABLE_SCHEDULER', 'false')
+
+from app import create_app
+from app.services.stock_loader import StockListingLoader, load_korean_names
+
+
+def _print_tickers(label, tickers, limit=20):
+    suffix = f" ... (+{len(tickers) - limit})" if len(tickers) > limit else ''
+    print(f"{label}: {len(tickers)}")
+    if tickers:
+        print(f"    {', '.join(tickers[:limit])}{suffix}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='거래소 상장 목록 일괄 적재')
+    parser.add_argument('files', nargs='+', help='상장 목록 파일 (앞 파일의 티커 우선)')
+    parser.add_argument('--ko-map', help='한국어 회사명 매핑 CSV (ticker,company_name_ko)')
+    parser.add_argument('--batch-size', type=int, default=1000, help='업서트 배치 크기')
+    parser.add_argument('--dry-run', action='store_true', help='비교 결과만 출력하고 저장하지 않음')
+    parser.add_argument('--prune', action='store_true', help='관심 종목으로 등록되지 않은 상장폐지 종목 삭제')
+    args = parser.parse_args()
+
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    loader = StockListingLoader(batch_size=args.batch_size, korean_names=load_korean_names(args.ko_map))
+
+    with app.app_context():
+        report = loader.load(args.files, dry_run=args.dry_run, prune=args.prune)
+
+    _print_tickers('Added', report['added'])
+    _print_tickers('Changed', report['changed'])
+    _print_tickers('Delisted', report['delisted'])
+    if args.prune:
+        _print_tickers('Deleted', report['deleted'])
+    print(f"Unchanged: {report['unchanged']}, duplicates skipped: {report['skipped_duplicates']}")
+    print(f"\n{report['total']} symbols {'compared' if args.dry_run else 'loaded'} in {report['elapsed_seconds']}s")
+
+
+if __name__ == '__main__':
+    main()
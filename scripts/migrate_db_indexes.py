@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+SQLite 인덱스 마이그레이션 스크립트
+
+기존 테이블에 모델에 새로 선언된 컬럼 추가 (예: backfill_checkpoints.failure_count)
+기존 운영 DB에 조회/정리 작업용 인덱스 추가:
+- crawl_logs: crawled_at, (ticker_symbol, crawled_at)
+- email_logs: sent_at, (user_id, sent_at)
+- user_settings: (is_notification_enabled, notification_time)
+- user_stocks: (user_id, created_at)
+
+앱 시작 시(create_app)에도 자동 적용되며, 이 스크립트는 적용 결과 확인과
+통계 갱신(ANALYZE)을 함께 수행한다. 배포 전에 실행하면 큰 로그 테이블의 인덱스 생성이
+웹/워커 시작을 지연시키지 않는다.
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+os.environ.setdefault('ENABLE_SCHEDULER', 'false')
+
+from sqlalchemy import inspect
+
+from app import create_app
+from app.extensions import db
+from app.utils.db_migrations import ensure_columns, ensure_indexes
+
+
+def migrate():
+    """누락된 인덱스 생성 후 통계 갱신 (ANALYZE)"""
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+
+    with app.app_context():
+        # create_app에서 이미 생성했다면 빈 목록
+        added = ensure_columns(db.engine)
+        if added:
+            print(f"✓ Added {len(added)} columns: {', '.join(added)}")
+        created = ensure_indexes(db.engine)
+        if created:
+            print(f"✓ Created {len(created)} indexes: {', '.join(created)}")
+
+        inspector = inspect(db.engine)
+        for table in db.Model.metadata.sorted_tables:
+            names = sorted(index['name'] for index in inspector.get_indexes(table.name))
+            if names:
+                print(f"  {table.name}: {', '.join(names)}")
+
+        # 쿼리 플래너가 새 인덱스를 선택하도록 통계 갱신
+        with db.engine.begin() as conn:
+            conn.execute(db.text('ANALYZE'))
+        print("✓ ANALYZE completed")
+
+
+if __name__ == '__main__':
+    migrate()
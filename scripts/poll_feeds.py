@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+RSS/Atom 피드 조회 스크립트
+
+NEWS_FEED_URLS 템플릿으로 티커별 피드를 조회해 수집 항목과 소요 시간을 출력한다.
+같은 프로세스에서 두 번째 조회는 ETag/Last-Modified 조건부 요청이라 변경이 없으면 304로 끝난다.
+
+사용법:
+    python scripts/poll_feeds.py TSLA NVDA                # 최근 6시간 항목
+    python scripts/poll_feeds.py TSLA --hours 24 --repeat 2
+    python scripts/poll_feeds.py TSLA --url 'https://example.com/rss?s={ticker}'
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+import time
+
+from app.services.feed_source import FeedNewsSource
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RSS/Atom 피드 조회')
+    parser.add_argument('tickers', nargs='+', help='티커 목록')
+    parser.add_argument('--hours', type=int, default=6, help='최근 N시간 항목만')
+    parser.add_argument('--repeat', type=int, default=1, help='반복 조회 횟수 (조건부 요청 확인)')
+    parser.add_argument('--url', action='append', default=None, help='피드 URL 템플릿 (기본: NEWS_FEED_URLS)')
+    args = parser.parse_args()
+
+    source = FeedNewsSource(args.url)
+    try:
+        for round_no in range(1, args.repeat + 1):
+            for ticker in args.tickers:
+                started = time.perf_counter()
+                items = source.poll(ticker.upper(), hours_ago=args.hours)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                print(f"[{round_no}] {ticker.upper()}: {len(items)} entries in {elapsed_ms:.0f} ms")
+                for item in items:
+                    print(f"    {item['date'][:16]}  {item['source_name']}: {item['title']}")
+    finally:
+        source.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+페이지 스냅샷 재파싱 스크립트
+
+SNAPSHOT_ENABLED=true로 수집해 둔 원본 HTML(SNAPSHOT_DIR)을 현재 파서
+(_parse_news_articles_bs4)로 CPU 코어 수만큼 병렬 재파싱한다. 브라우저/네트워크 없이
+파서 수정을 검증하고, 같은 스냅샷을 파서 벤치마크 데이터로 사용한다.
+
+사용법:
+    python scripts/replay_snapshots.py                         # 전체 스냅샷
+    python scripts/replay_snapshots.py TSLA NVDA --days 7 --workers 4
+    python scripts/replay_snapshots.py --output parsed.jsonl   # 파싱 결과 저장
+    python scripts/replay_snapshots.py --stats                 # 저장소 크기만 출력
+    python scripts/replay_snapshots.py --purge 30              # 30일 지난 스냅샷 삭제
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+import json
+from datetime import datetime, timedelta
+
+from app.models.models import KST
+from app.services.snapshot_store import SnapshotStore, replay_snapshots
+
+
+def main():
+    parser = argparse.ArgumentParser(description='페이지 스냅샷 재파싱')
+    parser.add_argument('tickers', nargs='*', help='티커 목록 (생략 시 전체)')
+    parser.add_argument('--dir', default=None, help='스냅샷 디렉터리 (기본: SNAPSHOT_DIR)')
+    parser.add_argument('--days', type=int, default=None, help='최근 N일 스냅샷만')
+    parser.add_argument('--limit', type=int, default=None, help='최대 스냅샷 수')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--output', default=None, help='파싱 결과 JSON Lines 파일')
+    parser.add_argument('--stats', action='store_true', help='저장소 크기만 출력')
+    parser.add_argument('--purge', type=int, default=None, metavar='DAYS', help='DAYS일 지난 스냅샷 삭제')
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.dir)
+
+    if args.purge is not None:
+        print(f"Purged {store.purge(args.purge)} snapshots")
+        return
+
+    if args.stats:
+        stats = store.stats()
+        ratio = stats['compressed_bytes'] / stats['size_bytes'] * 100 if stats['size_bytes'] else 0
+        print(f"{stats['count']} snapshots, {stats['size_bytes'] / 1024 / 1024:.1f} MB raw, "
+              f"{stats['compressed_bytes'] / 1024 / 1024:.1f} MB stored ({ratio:.0f}%)")
+        return
+
+    since = datetime.now(KST).replace(tzinfo=None) - timedelta(days=args.days) if args.days else None
+    snapshots = store.list_snapshots([t.upper() for t in args.tickers] or None, since=since, limit=args.limit)
+    if not snapshots:
+        print("No snapshots found")
+        return
+
+    summary = replay_snapshots(store, snapshots, workers=args.workers)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for result in summary['results']:
+                f.write(json.dumps(result, ensure_ascii=False, default=str) + '\n')
+
+    for result in summary['results']:
+        if result['error'] or not result['articles']:
+            print(f"  ✗ #{result['id']} {result['ticker_symbol']} {result['captured_at']}: "
+                  f"{result['error'] or 'no articles'} (captured with {result['previous_count']})")
+
+    print(f"\n{summary['snapshots']} snapshots, {summary['articles']} articles, "
+          f"{summary['empty']} empty, {summary['errors']} errors")
+    print(f"{summary['elapsed_seconds']}s ({summary['pages_per_second']} pages/s)")
+
+
+if __name__ == '__main__':
+    main()
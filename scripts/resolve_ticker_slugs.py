@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+티커 뉴스 URL 사전 해석 스크립트
+
+stock_master의 모든 티커(또는 지정 티커) 중 정적 매핑/저장된 경로가 없는 티커를
+investing.com 검색 페이지에서 한 번 해석해 ticker_slugs 테이블에 저장한다.
+이후 크롤링은 검색 페이지를 거치지 않고 뉴스 페이지로 바로 이동한다.
+
+사용법:
+    python scripts/resolve_ticker_slugs.py              # stock_master 전체
+    python scripts/resolve_ticker_slugs.py PLTR RIVN
+    python scripts/resolve_ticker_slugs.py --invalidate TSLA   # 저장된 경로 무효화
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+import os
+os.environ.setdefault('ENABLE_SCHEDULER', 'false')
+
+from app import create_app
+from app.services.slug_resolver import get_slug_resolver
+
+
+def main():
+    parser = argparse.ArgumentParser(description='티커 뉴스 URL 사전 해석')
+    parser.add_argument('tickers', nargs='*', help='티커 목록 (생략 시 stock_master 전체)')
+    parser.add_argument('--invalidate', action='store_true', help='지정 티커의 저장된 경로 무효화')
+    args = parser.parse_args()
+
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    resolver = get_slug_resolver()
+
+    with app.app_context():
+        if args.invalidate:
+            for ticker in args.tickers:
+                resolver.invalidate(ticker)
+                print(f"✓ {ticker.upper()}: invalidated")
+            return
+
+        results = resolver.resolve_all(args.tickers or None)
+
+    for ticker, path in sorted(results.items()):
+        print(f"{'✓' if path else '✗'} {ticker}: {path or 'unresolved'}")
+    unresolved = [ticker for ticker, path in results.items() if not path]
+    print(f"\n{len(results) - len(unresolved)}/{len(results)} tickers resolved")
+
+
+if __name__ == '__main__':
+    main()
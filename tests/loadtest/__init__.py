@@ -0,0 +1,10 @@
+"""
+오프라인 부하 테스트 하네스
+- fake_es: NewsStorageAdapter가 사용하는 ES REST API 부분집합을 구현한 로컬 서버
+- mock_openai: 지연/429 비율을 설정할 수 있는 OpenAI Chat Completions mock 서버
+- smtp_sink: 수신 메일을 메모리에 보관하는 로컬 SMTP 서버
+- harness: create_app('testing') + 위 stand-in으로 파이프라인/라우트 부하 실행
+
+실행:
+    python -m tests.loadtest.harness --concurrency 8 --iterations 100
+"""
@@ -0,0 +1,496 @@
+"""
+로컬 ElasticSearch stand-in
+- 실제 elasticsearch-py 클라이언트가 그대로 붙을 수 있도록 REST API를 흉내낸다
+- 구현 범위: ping/info, 인덱스 생성/존재 확인, 문서 index/get/update/delete,
+  _bulk, _search, _count, _delete_by_query
+- 쿼리: match_all, bool(must/filter/should/must_not), term, terms, range,
+  match, multi_match, exists
+- 집계: filter, avg, terms, date_histogram(day)
+"""
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from dateutil import parser as date_parser
+
+ES_VERSION = '7.17.9'
+
+
+def _get_field(doc: Dict, path: str) -> Any:
+    """점(.) 경로로 필드 값 조회 (.keyword 서브필드는 원본 필드로 취급)"""
+    if path.endswith('.keyword'):
+        path = path[:-len('.keyword')]
+    value: Any = doc
+    for part in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    """날짜 문자열을 UTC aware datetime으로 변환"""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = date_parser.isoparse(value)
+    except (ValueError, TypeError):
+        try:
+            parsed = date_parser.parse(value)
+        except (ValueError, TypeError, OverflowError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _comparable(value):
+    """range 비교용 값 (날짜 문자열은 datetime, 나머지는 그대로)"""
+    if isinstance(value, (int, float)):
+        return value
+    parsed = _as_datetime(value)
+    return parsed if parsed is not None else value
+
+
+def _values(doc: Dict, field: str) -> List[Any]:
+    value = _get_field(doc, field)
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _tokens(text: str) -> List[str]:
+    return [t for t in ''.join(c.lower() if c.isalnum() else ' ' for c in str(text)).split() if t]
+
+
+def matches(doc: Dict, query: Optional[Dict]) -> bool:
+    """문서가 쿼리에 일치하는지 판정"""
+    if not query:
+        return True
+
+    (kind, body), = query.items()
+
+    if kind == 'match_all':
+        return True
+
+    if kind == 'bool':
+        must = body.get('must', []) + body.get('filter', [])
+        must = must if isinstance(must, list) else [must]
+        if not all(matches(doc, q) for q in must):
+            return False
+        must_not = body.get('must_not', [])
+        must_not = must_not if isinstance(must_not, list) else [must_not]
+        if any(matches(doc, q) for q in must_not):
+            return False
+        should = body.get('should', [])
+        should = should if isinstance(should, list) else [should]
+        if should:
+            minimum = body.get('minimum_should_match', 0 if must else 1)
+            return sum(1 for q in should if matches(doc, q)) >= int(minimum)
+        return True
+
+    if kind == 'term':
+        (field, expected), = body.items()
+        if isinstance(expected, dict):
+            expected = expected.get('value')
+        return expected in _values(doc, field)
+
+    if kind == 'terms':
+        (field, expected), = body.items()
+        return any(value in expected for value in _values(doc, field))
+
+    if kind == 'range':
+        (field, bounds), = body.items()
+        for value in _values(doc, field):
+            value = _comparable(value)
+            try:
+                if 'gte' in bounds and not value >= _comparable(bounds['gte']):
+                    continue
+                if 'gt' in bounds and not value > _comparable(bounds['gt']):
+                    continue
+                if 'lte' in bounds and not value <= _comparable(bounds['lte']):
+                    continue
+                if 'lt' in bounds and not value < _comparable(bounds['lt']):
+                    continue
+            except TypeError:
+                continue
+            return True
+        return False
+
+    if kind == 'exists':
+        return bool(_values(doc, body['field']))
+
+    if kind == 'match':
+        (field, expected), = body.items()
+        if isinstance(expected, dict):
+            expected = expected.get('query')
+        wanted = set(_tokens(expected))
+        return any(wanted & set(_tokens(value)) for value in _values(doc, field))
+
+    if kind == 'multi_match':
+        wanted = set(_tokens(body.get('query', '')))
+        for field in body.get('fields', []):
+            field = field.split('^')[0]
+            if any(wanted & set(_tokens(value)) for value in _values(doc, field)):
+                return True
+        return False
+
+    raise ValueError(f"Unsupported query type: {kind}")
+
+
+def _sort_docs(docs: List[Dict], sort) -> List[Dict]:
+    """sort 절 적용 (마지막 키부터 안정 정렬)"""
+    if not sort:
+        return docs
+    if isinstance(sort, (str, dict)):
+        sort = [sort]
+
+    for clause in reversed(sort):
+        if isinstance(clause, str):
+            field, _, order = clause.partition(':')
+            order = order or 'asc'
+        else:
+            (field, spec), = clause.items()
+            order = spec.get('order', 'asc') if isinstance(spec, dict) else spec
+
+        def key(doc, field=field):
+            values = _values(doc['_source'], field)
+            if not values:
+                return (1, 0)
+            return (0, _comparable(values[0]))
+
+        try:
+            docs = sorted(docs, key=key, reverse=(order == 'desc'))
+        except TypeError:
+            pass
+    return docs
+
+
+def _aggregate(docs: List[Dict], aggs: Dict) -> Dict:
+    """집계 실행 (filter / avg / terms / date_histogram)"""
+    results = {}
+    for name, spec in (aggs or {}).items():
+        sub_aggs = spec.get('aggs') or spec.get('aggregations')
+
+        if 'filter' in spec:
+            subset = [doc for doc in docs if matches(doc, spec['filter'])]
+            result = {'doc_count': len(subset)}
+            if sub_aggs:
+                result.update(_aggregate(subset, sub_aggs))
+
+        elif 'avg' in spec:
+            values = [v for doc in docs for v in _values(doc, spec['avg']['field'])
+                      if isinstance(v, (int, float))]
+            result = {'value': sum(values) / len(values) if values else None}
+
+        elif 'terms' in spec:
+            counts: Dict[Any, int] = {}
+            for doc in docs:
+                for value in set(_values(doc, spec['terms']['field'])):
+                    counts[value] = counts.get(value, 0) + 1
+            buckets = sorted(counts.items(), key=lambda kv: (-kv[1], str(kv[0])))
+            buckets = buckets[:spec['terms'].get('size', 10)]
+            result = {
+                'doc_count_error_upper_bound': 0,
+                'sum_other_doc_count': 0,
+                'buckets': [{'key': key, 'doc_count': count} for key, count in buckets]
+            }
+
+        elif 'date_histogram' in spec:
+            field = spec['date_histogram']['field']
+            counts = {}
+            for doc in docs:
+                for value in _values(doc, field):
+                    parsed = _as_datetime(value)
+                    if parsed is not None:
+                        day = parsed.date().isoformat()
+                        counts[day] = counts.get(day, 0) + 1
+            order = spec['date_histogram'].get('order', {}).get('_key', 'asc')
+            buckets = []
+            for day in sorted(counts, reverse=(order == 'desc')):
+                epoch = datetime.fromisoformat(day).replace(tzinfo=timezone.utc).timestamp()
+                buckets.append({'key_as_string': day, 'key': int(epoch * 1000), 'doc_count': counts[day]})
+            result = {'buckets': buckets}
+
+        else:
+            raise ValueError(f"Unsupported aggregation: {list(spec)}")
+
+        results[name] = result
+    return results
+
+
+class FakeElasticsearch:
+    """메모리 문서 저장소 + 쿼리 엔진"""
+
+    def __init__(self):
+        self.indices: Dict[str, Dict[str, Dict]] = {}
+        self.lock = threading.Lock()
+        self.request_count = 0
+
+    def _index(self, name: str) -> Dict[str, Dict]:
+        return self.indices.setdefault(name, {})
+
+    def index_doc(self, index: str, doc_id: Optional[str], source: Dict) -> str:
+        doc_id = doc_id or uuid.uuid4().hex
+        with self.lock:
+            self._index(index)[doc_id] = source
+        return doc_id
+
+    def search(self, index: str, body: Dict, params: Dict) -> Dict:
+        query = body.get('query')
+        size = int(body.get('size', params.get('size', 10)))
+        from_ = int(body.get('from', params.get('from', 0)))
+        sort = body.get('sort') or (params['sort'].split(',') if params.get('sort') else None)
+        source_filter = body.get('_source', params.get('_source'))
+        if isinstance(source_filter, str) and source_filter not in ('true', 'false'):
+            source_filter = source_filter.split(',')
+
+        with self.lock:
+            docs = [
+                {'_index': name, '_id': doc_id, '_source': source}
+                for name in self._resolve(index)
+                for doc_id, source in self.indices.get(name, {}).items()
+            ]
+        hits = [doc for doc in docs if matches(doc['_source'], query)]
+        hits = _sort_docs(hits, sort)
+
+        page = []
+        for doc in hits[from_:from_ + size]:
+            source = doc['_source']
+            if isinstance(source_filter, list):
+                source = {k: v for k, v in source.items() if k in source_filter}
+            page.append({'_index': doc['_index'], '_type': '_doc', '_id': doc['_id'],
+                         '_score': None, '_source': source})
+
+        response = {
+            'took': 1,
+            'timed_out': False,
+            '_shards': {'total': 1, 'successful': 1, 'skipped': 0, 'failed': 0},
+            'hits': {'total': {'value': len(hits), 'relation': 'eq'}, 'max_score': None, 'hits': page}
+        }
+        aggs = body.get('aggs') or body.get('aggregations')
+        if aggs:
+            response['aggregations'] = _aggregate([doc['_source'] for doc in hits], aggs)
+        return response
+
+    def count(self, index: str, body: Dict) -> int:
+        with self.lock:
+            docs = [source for name in self._resolve(index) for source in self.indices.get(name, {}).values()]
+        return sum(1 for doc in docs if matches(doc, body.get('query')))
+
+    def delete_by_query(self, index: str, body: Dict) -> int:
+        deleted = 0
+        with self.lock:
+            for name in self._resolve(index):
+                docs = self.indices.get(name, {})
+                for doc_id in [i for i, source in docs.items() if matches(source, body.get('query'))]:
+                    del docs[doc_id]
+                    deleted += 1
+        return deleted
+
+    def _resolve(self, index: str) -> List[str]:
+        if index in ('', '_all', '*'):
+            return list(self.indices)
+        return [name for name in index.split(',') if name]
+
+    def total_docs(self) -> int:
+        with self.lock:
+            return sum(len(docs) for docs in self.indices.values())
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server: 'FakeElasticsearchServer'
+
+    def log_message(self, format, *args):
+        pass
+
+    # ----- 응답 -----
+
+    def _send(self, status: int, payload: Optional[Dict] = None) -> None:
+        body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('X-Elastic-Product', 'Elasticsearch')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _json_body(self) -> Dict:
+        raw = self._read_body()
+        return json.loads(raw) if raw else {}
+
+    # ----- 라우팅 -----
+
+    def _dispatch(self) -> None:
+        store = self.server.store
+        with store.lock:
+            store.request_count += 1
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000.0 * random.uniform(0.5, 1.5))
+
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        parts = [p for p in url.path.split('/') if p]
+        method = self.command
+
+        try:
+            if not parts:
+                if method == 'HEAD':
+                    return self._send(200)
+                return self._send(200, {
+                    'name': 'fake-es', 'cluster_name': 'loadtest',
+                    'version': {'number': ES_VERSION, 'build_flavor': 'default'},
+                    'tagline': 'You Know, for Search'
+                })
+
+            if parts[-1] == '_bulk':
+                return self._bulk(parts[0] if len(parts) > 1 else None)
+
+            index = parts[0]
+            action = parts[1] if len(parts) > 1 else None
+
+            if action is None:
+                if method == 'HEAD':
+                    return self._send(200 if index in store.indices else 404)
+                if method == 'PUT':
+                    self._read_body()
+                    with store.lock:
+                        store._index(index)
+                    return self._send(200, {'acknowledged': True, 'index': index})
+                if method == 'DELETE':
+                    with store.lock:
+                        store.indices.pop(index, None)
+                    return self._send(200, {'acknowledged': True})
+
+            if action == '_search':
+                return self._send(200, store.search(index, self._json_body(), params))
+
+            if action == '_count':
+                return self._send(200, {'count': store.count(index, self._json_body())})
+
+            if action == '_delete_by_query':
+                deleted = store.delete_by_query(index, self._json_body())
+                return self._send(200, {'deleted': deleted, 'total': deleted, 'failures': []})
+
+            if action == '_refresh':
+                return self._send(200, {'_shards': {'total': 1, 'successful': 1, 'failed': 0}})
+
+            if action in ('_doc', '_create'):
+                doc_id = parts[2] if len(parts) > 2 else None
+                if method in ('PUT', 'POST'):
+                    doc_id = store.index_doc(index, doc_id, self._json_body())
+                    return self._send(201, {'_index': index, '_id': doc_id, 'result': 'created'})
+                if method in ('GET', 'HEAD'):
+                    with store.lock:
+                        source = store.indices.get(index, {}).get(doc_id)
+                    if source is None:
+                        return self._send(404, {'_index': index, '_id': doc_id, 'found': False})
+                    return self._send(200, {'_index': index, '_id': doc_id, 'found': True, '_source': source})
+                if method == 'DELETE':
+                    with store.lock:
+                        found = store.indices.get(index, {}).pop(doc_id, None) is not None
+                    return self._send(200 if found else 404, {'_index': index, '_id': doc_id,
+                                                              'result': 'deleted' if found else 'not_found'})
+
+            if action == '_update' and len(parts) > 2:
+                doc_id = parts[2]
+                partial = self._json_body().get('doc', {})
+                with store.lock:
+                    source = store.indices.get(index, {}).get(doc_id)
+                    if source is not None:
+                        _deep_merge(source, partial)
+                if source is None:
+                    return self._send(404, {'error': {'type': 'document_missing_exception'}, 'status': 404})
+                return self._send(200, {'_index': index, '_id': doc_id, 'result': 'updated'})
+
+            self._send(400, {'error': {'type': 'unsupported', 'reason': f"{method} {url.path}"}, 'status': 400})
+
+        except ValueError as e:
+            self._send(400, {'error': {'type': 'parsing_exception', 'reason': str(e)}, 'status': 400})
+
+    def _bulk(self, default_index: Optional[str]) -> None:
+        store = self.server.store
+        lines = [line for line in self._read_body().decode('utf-8').splitlines() if line.strip()]
+        items = []
+        i = 0
+        while i < len(lines):
+            action = json.loads(lines[i])
+            (op, meta), = action.items()
+            index = meta.get('_index', default_index)
+            doc_id = meta.get('_id')
+            if op == 'delete':
+                with store.lock:
+                    store.indices.get(index, {}).pop(doc_id, None)
+                items.append({op: {'_index': index, '_id': doc_id, 'status': 200, 'result': 'deleted'}})
+                i += 1
+                continue
+            source = json.loads(lines[i + 1])
+            if op == 'update':
+                with store.lock:
+                    existing = store._index(index).setdefault(doc_id, {})
+                    _deep_merge(existing, source.get('doc', {}))
+            else:
+                doc_id = store.index_doc(index, doc_id, source)
+            items.append({op: {'_index': index, '_id': doc_id, 'status': 201, 'result': 'created'}})
+            i += 2
+        self._send(200, {'took': 1, 'errors': False, 'items': items})
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _dispatch
+
+
+def _deep_merge(target: Dict, updates: Dict) -> None:
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _deep_merge(target[key], value)
+        else:
+            target[key] = value
+
+
+class FakeElasticsearchServer(ThreadingHTTPServer):
+    """
+    로컬 ES stand-in 서버
+
+    Usage:
+        with FakeElasticsearchServer() as es:
+            Config.ELASTICSEARCH_URL = es.url
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0):
+        super().__init__((host, port), _Handler)
+        self.store = FakeElasticsearch()
+        self.latency_ms = latency_ms
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+    def start(self) -> 'FakeElasticsearchServer':
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,484 @@
+"""
+End-to-end 부하 테스트 하네스
+- create_app('testing') + 로컬 stand-in(ES / OpenAI / SMTP)으로 외부 의존성 없이 실행
+- 시나리오
+  - pipeline: 저장된 investing.com 페이지 파싱 -> 중복 체크 -> 분석 -> ES 저장
+  - email: 관심 종목 최근 뉴스 조회 -> 보고서 렌더링 -> SMTP 발송
+  - routes: 로그인 사용자로 대시보드/뉴스 API 호출
+- 시나리오별 처리량과 p50/p95/p99 지연 시간 보고
+
+실행:
+    python -m tests.loadtest.harness --concurrency 8 --iterations 200 \\
+        --openai-latency-ms 300 --openai-429-ratio 0.05
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from tests.loadtest.fake_es import FakeElasticsearchServer
+from tests.loadtest.mock_openai import MockOpenAIServer
+from tests.loadtest.smtp_sink import SMTPSink
+
+FIXTURE_DIR = project_root / 'tests' / 'fixtures' / 'investing'
+
+# 티커 -> (회사명, 파싱할 fixture 페이지)
+TICKERS = {
+    'TSLA': ('Tesla Inc', 'stock_tsla.html'),
+    'NVDA': ('NVIDIA Corp', 'stock_nvda_relative.html'),
+    'SPY': ('SPDR S&P 500 ETF Trust', 'etf_spy.html'),
+}
+
+ROUTES = [
+    '/dashboard',
+    '/news/api/latest',
+    '/news/api/history?page=1',
+    '/news/api/statistics?period=7d',
+    '/news/',
+]
+
+SCENARIOS = ('pipeline', 'email', 'routes')
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 리스트의 백분위 값 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(-(-pct * len(sorted_values) // 100)) - 1))
+    return sorted_values[index]
+
+
+class LatencyRecorder:
+    """작업별 지연 시간/오류 수집 (스레드 안전)"""
+
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, ok: bool = True) -> None:
+        with self._lock:
+            self._samples.setdefault(name, []).append(seconds)
+            if not ok:
+                self._errors[name] = self._errors.get(name, 0) + 1
+
+    def summary(self, wall_seconds: float) -> Dict[str, Dict]:
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+            errors = dict(self._errors)
+
+        result = {}
+        for name, values in samples.items():
+            result[name] = {
+                'count': len(values),
+                'errors': errors.get(name, 0),
+                'throughput': round(len(values) / wall_seconds, 2) if wall_seconds else 0.0,
+                'p50_ms': round(percentile(values, 50) * 1000, 1),
+                'p95_ms': round(percentile(values, 95) * 1000, 1),
+                'p99_ms': round(percentile(values, 99) * 1000, 1),
+                'max_ms': round(values[-1] * 1000, 1),
+            }
+        return result
+
+
+class LoadTestHarness:
+    """
+    오프라인 부하 테스트 하네스
+
+    Usage:
+        with LoadTestHarness(concurrency=4) as harness:
+            report = harness.run(iterations=50)
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        users: int = 5,
+        articles_per_crawl: int = 10,
+        openai_latency_ms: float = 0,
+        openai_rate_limit_ratio: float = 0.0,
+        es_latency_ms: float = 0,
+        smtp_latency_ms: float = 0
+    ):
+        """
+        초기화
+
+        Args:
+            concurrency: 동시 실행 워커 수
+            users: 생성할 테스트 사용자 수 (이메일/라우트 시나리오)
+            articles_per_crawl: pipeline 1회당 파싱할 기사 수
+            openai_latency_ms: OpenAI mock 평균 지연
+            openai_rate_limit_ratio: OpenAI mock 429 비율
+            es_latency_ms: ES stand-in 요청당 지연
+            smtp_latency_ms: SMTP sink 메시지당 지연
+        """
+        self.concurrency = max(1, concurrency)
+        self.users = max(1, users)
+        self.articles_per_crawl = articles_per_crawl
+
+        self.es_server = FakeElasticsearchServer(latency_ms=es_latency_ms)
+        self.openai_server = MockOpenAIServer(
+            latency_ms=openai_latency_ms,
+            rate_limit_ratio=openai_rate_limit_ratio
+        )
+        self.smtp_sink = SMTPSink(latency_ms=smtp_latency_ms)
+
+        self.app = None
+        self._tmp_dir: Optional[str] = None
+        self._saved_config: Dict = {}
+        self._saved_env: Dict = {}
+        self._pages = {ticker: (FIXTURE_DIR / page).read_text() for ticker, (_, page) in TICKERS.items()}
+        self._user_ids: List[int] = []
+
+    # ===== 환경 구성 =====
+
+    def start(self) -> 'LoadTestHarness':
+        """stand-in 서버 시작, 설정 주입, 앱 생성 및 시드 데이터 구성"""
+        self.es_server.start()
+        self.openai_server.start()
+        self.smtp_sink.start()
+
+        from app.utils.config import Config, TestingConfig
+
+        self._tmp_dir = tempfile.mkdtemp(prefix='loadtest-')
+        overrides = {
+            (Config, 'ELASTICSEARCH_URL'): self.es_server.url,
+            (Config, 'OPENAI_API_KEY'): 'sk-loadtest',
+            (Config, 'OPENAI_BASE_URL'): self.openai_server.base_url,
+            (Config, 'OPENAI_MODEL'): 'gpt-4o-mini',
+            (Config, 'GMAIL_SMTP_SERVER'): self.smtp_sink.host,
+            (Config, 'GMAIL_SMTP_PORT'): self.smtp_sink.port,
+            (Config, 'GMAIL_SMTP_USE_TLS'): False,
+            (Config, 'GMAIL_USERNAME'): 'loadtest@example.com',
+            (Config, 'GMAIL_APP_PASSWORD'): 'loadtest',
+            (Config, 'SLOW_REQUEST_MS'): 0,
+            (Config, 'LOG_LEVEL'): 'WARNING',
+            # 스레드 간 공유 가능한 파일 DB (:memory:는 단일 커넥션)
+            (TestingConfig, 'SQLALCHEMY_DATABASE_URI'): f"sqlite:///{os.path.join(self._tmp_dir, 'loadtest.db')}",
+        }
+        for (cls, key), value in overrides.items():
+            self._saved_config[(cls, key)] = cls.__dict__.get(key, getattr(cls, key))
+            setattr(cls, key, value)
+
+        self._saved_env['ENABLE_SCHEDULER'] = os.environ.get('ENABLE_SCHEDULER')
+        os.environ['ENABLE_SCHEDULER'] = 'false'
+
+        self._reset_singletons()
+
+        from app import create_app
+        self.app = create_app('testing')
+        logging.getLogger().setLevel(logging.WARNING)
+
+        with self.app.app_context():
+            from app.utils.elasticsearch_client import get_es_client
+            get_es_client().create_index()
+            self._seed()
+
+        return self
+
+    def stop(self) -> None:
+        """설정 복원 및 서버 종료"""
+        for (cls, key), value in self._saved_config.items():
+            setattr(cls, key, value)
+        for key, value in self._saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        self._reset_singletons()
+
+        if self.app is not None:
+            from app.extensions import db
+            with self.app.app_context():
+                db.session.remove()
+                db.engine.dispose()
+
+        self.es_server.stop()
+        self.openai_server.stop()
+        self.smtp_sink.stop()
+        if self._tmp_dir:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @staticmethod
+    def _reset_singletons() -> None:
+        """ES/저장소/분석기 싱글톤이 stand-in 주소를 다시 읽도록 초기화"""
+        import app.utils.elasticsearch_client as es_module
+        import app.services.news_storage as storage_module
+        import app.services.news_analyzer as analyzer_module
+        es_module._es_client = None
+        storage_module._storage_adapter = None
+        analyzer_module._analyzer = None
+
+    def _seed(self) -> None:
+        """종목 / 사용자 / 관심 종목 / 알림 설정 생성"""
+        from datetime import time as dt_time
+        from app.extensions import db
+        from app.models.models import StockMaster, User, UserSetting, UserStock
+
+        for ticker, (company_name, _) in TICKERS.items():
+            db.session.add(StockMaster(ticker_symbol=ticker, company_name=company_name))
+
+        for i in range(self.users):
+            user = User(username=f'loaduser{i}', email=f'loaduser{i}@example.com')
+            user.set_password('loadtest-password')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(UserSetting(
+                user_id=user.id,
+                notification_time=dt_time(9, 0),
+                language=('ko', 'en', 'es', 'ja')[i % 4],
+                is_notification_enabled=True
+            ))
+            for ticker in TICKERS:
+                db.session.add(UserStock(user_id=user.id, ticker_symbol=ticker))
+            self._user_ids.append(user.id)
+
+        db.session.commit()
+
+    # ===== 작업 =====
+
+    def _pipeline_op(self, recorder: LatencyRecorder, index: int) -> None:
+        """크롤링(저장된 페이지 파싱) -> 중복 체크 -> 분석 -> 저장"""
+        from app.extensions import db
+        from app.services.crawl_metrics import crawl_trace
+        from app.services.crawler import InvestingCrawler
+        from app.services.crawler_service import CrawlerService
+        from app.services.news_analyzer import NewsAnalyzer
+        from app.services.news_storage import NewsStorageAdapter
+
+        ticker = list(TICKERS)[index % len(TICKERS)]
+        company_name = TICKERS[ticker][0]
+
+        with self.app.app_context():
+            start = time.perf_counter()
+            ok = True
+            try:
+                with crawl_trace(ticker) as trace:
+                    parse_start = time.perf_counter()
+                    items = InvestingCrawler()._parse_news_articles_bs4(
+                        self._pages[ticker], ticker, company_name,
+                        datetime(2000, 1, 1, tzinfo=timezone.utc), max_articles=self.articles_per_crawl
+                    )
+                    recorder.record('pipeline.parse', time.perf_counter() - parse_start)
+
+                    # 매 회 새 기사로 취급되도록 URL을 고유하게 (일부는 중복 유지)
+                    run_id = uuid.uuid4().hex[:8]
+                    for n, item in enumerate(items):
+                        if n % 4:
+                            item['source_url'] = f"{item['source_url']}?run={run_id}"
+                        item['news_id'] = uuid.uuid5(uuid.NAMESPACE_URL, item['source_url']).hex
+
+                    service = CrawlerService(db.session, NewsStorageAdapter(), NewsAnalyzer())
+                    service.save_news_items(ticker, items, company_name)
+
+                for stage, seconds in trace.totals().items():
+                    recorder.record(f"pipeline.{stage}", seconds)
+            except Exception as e:
+                ok = False
+                logging.getLogger(__name__).warning(f"pipeline op failed: {e}")
+            recorder.record('pipeline', time.perf_counter() - start, ok)
+
+    def _email_op(self, recorder: LatencyRecorder, index: int) -> None:
+        """관심 종목 최근 뉴스 조회 -> 보고서 발송"""
+        from app.extensions import db
+        from app.models.models import User, UserSetting, UserStock
+        from app.services.email_sender import EmailSender
+        from app.services.news_storage import NewsStorageAdapter
+
+        user_id = self._user_ids[index % len(self._user_ids)]
+
+        with self.app.app_context():
+            start = time.perf_counter()
+            ok = True
+            try:
+                user = db.session.get(User, user_id)
+                setting = UserSetting.query.filter_by(user_id=user_id).first()
+                storage = NewsStorageAdapter()
+
+                news_by_stock = {}
+                for stock in UserStock.query.filter_by(user_id=user_id).all():
+                    news_list = storage.get_recent_news(stock.ticker_symbol, hours=24 * 365 * 5)
+                    if news_list:
+                        news_by_stock[stock.ticker_symbol] = news_list[:10]
+
+                if news_by_stock:
+                    ok, _ = EmailSender().send_stock_report(user, news_by_stock, language=setting.language)
+                else:
+                    ok, _ = EmailSender().send_no_news_notification(user, language=setting.language)
+            except Exception as e:
+                ok = False
+                logging.getLogger(__name__).warning(f"email op failed: {e}")
+            recorder.record('email', time.perf_counter() - start, ok)
+
+    def _route_client(self, index: int):
+        """워커별 로그인된 테스트 클라이언트"""
+        local = self._local
+        client = getattr(local, 'client', None)
+        if client is None:
+            from app.extensions import db
+            from app.models.models import User
+
+            client = self.app.test_client()
+            user_id = self._user_ids[index % len(self._user_ids)]
+            with self.app.app_context():
+                user = db.session.get(User, user_id)
+                with client.session_transaction() as sess:
+                    sess['user_id'] = user.id
+                    sess['username'] = user.username
+                    sess['is_admin'] = user.is_admin
+            local.client = client
+        return client
+
+    def _route_op(self, recorder: LatencyRecorder, index: int) -> None:
+        """뉴스/대시보드 라우트 호출"""
+        client = self._route_client(index)
+        path = ROUTES[index % len(ROUTES)]
+        start = time.perf_counter()
+        try:
+            response = client.get(path)
+            ok = response.status_code < 400
+        except Exception:
+            ok = False
+        recorder.record(f"route {path.split('?')[0]}", time.perf_counter() - start, ok)
+
+    # ===== 실행 =====
+
+    def _run_scenario(self, op: Callable[[LatencyRecorder, int], None], iterations: int) -> Dict:
+        recorder = LatencyRecorder()
+        self._local = threading.local()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(op, recorder, i) for i in range(iterations)]
+            for future in futures:
+                future.result()
+        wall = time.perf_counter() - start
+
+        return {'wall_seconds': round(wall, 3), 'operations': recorder.summary(wall)}
+
+    def run(self, iterations: int = 50, scenarios=SCENARIOS) -> Dict:
+        """
+        시나리오 실행
+
+        Args:
+            iterations: 시나리오별 작업 수
+            scenarios: 실행할 시나리오 (pipeline / email / routes)
+
+        Returns:
+            보고서 딕셔너리
+        """
+        ops = {'pipeline': self._pipeline_op, 'email': self._email_op, 'routes': self._route_op}
+        report = {
+            'concurrency': self.concurrency,
+            'iterations': iterations,
+            'scenarios': {}
+        }
+        for name in scenarios:
+            report['scenarios'][name] = self._run_scenario(ops[name], iterations)
+
+        report['stand_ins'] = {
+            'openai': dict(self.openai_server.counters),
+            'elasticsearch': {
+                'requests': self.es_server.store.request_count,
+                'documents': self.es_server.store.total_docs()
+            },
+            'smtp': {'messages': self.smtp_sink.message_count}
+        }
+        return report
+
+
+def format_report(report: Dict) -> str:
+    """보고서를 표 형식 문자열로 변환"""
+    lines = [
+        f"Load test: concurrency={report['concurrency']}, iterations/scenario={report['iterations']}",
+        ''
+    ]
+    header = f"{'operation':<36}{'count':>7}{'err':>5}{'ops/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    for scenario, result in report['scenarios'].items():
+        lines.append(f"[{scenario}] wall {result['wall_seconds']:.2f}s")
+        lines.append(header)
+        for name, stats in sorted(result['operations'].items()):
+            lines.append(
+                f"{name:<36}{stats['count']:>7}{stats['errors']:>5}{stats['throughput']:>9.2f}"
+                f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}{stats['max_ms']:>9.1f}"
+            )
+        lines.append('')
+
+    stand_ins = report['stand_ins']
+    lines.append(
+        f"openai: {stand_ins['openai']['requests']} requests, "
+        f"{stand_ins['openai']['rate_limited']} rate limited (429)"
+    )
+    lines.append(
+        f"elasticsearch: {stand_ins['elasticsearch']['requests']} requests, "
+        f"{stand_ins['elasticsearch']['documents']} documents"
+    )
+    lines.append(f"smtp: {stand_ins['smtp']['messages']} messages")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='오프라인 end-to-end 부하 테스트')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 워커 수')
+    parser.add_argument('--iterations', type=int, default=50, help='시나리오별 작업 수')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='실행할 시나리오 (쉼표 구분)')
+    parser.add_argument('--users', type=int, default=5, help='테스트 사용자 수')
+    parser.add_argument('--articles', type=int, default=10, help='pipeline 1회당 기사 수')
+    parser.add_argument('--openai-latency-ms', type=float, default=200, help='OpenAI mock 평균 지연')
+    parser.add_argument('--openai-429-ratio', type=float, default=0.0, help='OpenAI mock 429 비율 (0~1)')
+    parser.add_argument('--es-latency-ms', type=float, default=0, help='ES stand-in 요청당 지연')
+    parser.add_argument('--smtp-latency-ms', type=float, default=0, help='SMTP sink 메시지당 지연')
+    parser.add_argument('--json', dest='json_path', help='보고서를 JSON 파일로 저장')
+    args = parser.parse_args(argv)
+
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    with LoadTestHarness(
+        concurrency=args.concurrency,
+        users=args.users,
+        articles_per_crawl=args.articles,
+        openai_latency_ms=args.openai_latency_ms,
+        openai_rate_limit_ratio=args.openai_429_ratio,
+        es_latency_ms=args.es_latency_ms,
+        smtp_latency_ms=args.smtp_latency_ms
+    ) as harness:
+        report = harness.run(iterations=args.iterations, scenarios=scenarios)
+
+    print(format_report(report))
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2))
+        print(f"\nReport saved to {args.json_path}")
+
+    failed = sum(
+        stats['errors']
+        for result in report['scenarios'].values()
+        for stats in result['operations'].values()
+    )
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+OpenAI Chat Completions mock 서버
+- POST /v1/chat/completions 에 NewsAnalyzer가 기대하는 JSON 분석 결과 반환
+- 응답 지연(latency_ms ± jitter)과 429 비율(rate_limit_ratio) 설정 가능
+"""
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+_TITLE_RE = re.compile(r'^Title:\s*(.*)$', re.MULTILINE)
+
+
+def build_analysis(prompt: str) -> Dict:
+    """프롬프트의 제목으로부터 결정적인 분석 결과 생성"""
+    match = _TITLE_RE.search(prompt)
+    title = match.group(1).strip() if match else 'news'
+    digest = int(hashlib.md5(title.encode('utf-8')).hexdigest(), 16)
+    score = digest % 21 - 10
+    classification = 'Positive' if score > 2 else 'Negative' if score < -2 else 'Neutral'
+    return {
+        'summary_ko': f"[ko] {title}",
+        'summary_en': f"[en] {title}",
+        'summary_es': f"[es] {title}",
+        'summary_ja': f"[ja] {title}",
+        'sentiment': {'classification': classification, 'score': score}
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server: 'MockOpenAIServer'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        request = json.loads(self.rfile.read(length) or b'{}')
+
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            return self._send(404, {'error': {'message': f"Unknown path {self.path}", 'type': 'invalid_request_error'}})
+
+        self.server.record('requests')
+        if self.server.latency_ms:
+            jitter = self.server.latency_ms * self.server.jitter
+            time.sleep(max(0.0, self.server.latency_ms + random.uniform(-jitter, jitter)) / 1000.0)
+
+        if self.server.rate_limit_ratio and random.random() < self.server.rate_limit_ratio:
+            self.server.record('rate_limited')
+            return self._send(429, {
+                'error': {
+                    'message': 'Rate limit reached for requests',
+                    'type': 'requests',
+                    'code': 'rate_limit_exceeded'
+                }
+            }, headers={'retry-after-ms': str(self.server.retry_after_ms)})
+
+        prompt = ''
+        for message in request.get('messages', []):
+            if message.get('role') == 'user':
+                prompt = message.get('content', '')
+
+        self.server.record('completed')
+        self._send(200, {
+            'id': f"chatcmpl-{random.getrandbits(48):x}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'gpt-4o-mini'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': json.dumps(build_analysis(prompt), ensure_ascii=False)},
+                'finish_reason': 'stop'
+            }],
+            'usage': {'prompt_tokens': len(prompt) // 4, 'completion_tokens': 200,
+                      'total_tokens': len(prompt) // 4 + 200}
+        })
+
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    """
+    OpenAI mock 서버
+
+    Args:
+        latency_ms: 평균 응답 지연 (ms)
+        jitter: 지연 변동 비율 (0.2 -> ±20%)
+        rate_limit_ratio: 429 응답 비율 (0~1)
+        retry_after_ms: 429 응답의 retry-after-ms 헤더 값
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency_ms: float = 0,
+        jitter: float = 0.2,
+        rate_limit_ratio: float = 0.0,
+        retry_after_ms: int = 50
+    ):
+        super().__init__((host, port), _Handler)
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after_ms = retry_after_ms
+        self.counters = {'requests': 0, 'completed': 0, 'rate_limited': 0}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}/v1"
+
+    def record(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def start(self) -> 'MockOpenAIServer':
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
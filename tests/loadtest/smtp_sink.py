@@ -0,0 +1,133 @@
+"""
+로컬 SMTP sink
+- EHLO/HELO, AUTH(PLAIN/LOGIN, 무조건 허용), MAIL/RCPT/DATA, RSET, NOOP, QUIT
+- 수신한 메시지를 메모리에 보관 (STARTTLS 미지원 -> GMAIL_SMTP_USE_TLS=false로 사용)
+"""
+import socketserver
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: 'SMTPSink'
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write((line + '\r\n').encode('utf-8'))
+        self.wfile.flush()
+
+    def _readline(self) -> Optional[str]:
+        raw = self.rfile.readline()
+        if not raw:
+            return None
+        return raw.decode('utf-8', errors='replace').rstrip('\r\n')
+
+    def handle(self):
+        self._reply('220 localhost SMTP sink ready')
+        sender, recipients = None, []
+
+        while True:
+            line = self._readline()
+            if line is None:
+                return
+            command = line.split(' ', 1)[0].upper()
+
+            if command in ('EHLO', 'HELO'):
+                if command == 'EHLO':
+                    self._reply('250-localhost')
+                    self._reply('250-AUTH PLAIN LOGIN')
+                    self._reply('250 8BITMIME')
+                else:
+                    self._reply('250 localhost')
+            elif command == 'AUTH':
+                args = line.split()
+                if len(args) >= 2 and args[1].upper() == 'LOGIN':
+                    # 사용자명/비밀번호 2단계 (인라인 사용자명 포함 가능)
+                    if len(args) < 3:
+                        self._reply('334 VXNlcm5hbWU6')
+                        self._readline()
+                    self._reply('334 UGFzc3dvcmQ6')
+                    self._readline()
+                elif len(args) == 2:
+                    self._reply('334 ')
+                    self._readline()
+                self._reply('235 2.7.0 Authentication successful')
+            elif command == 'MAIL':
+                sender, recipients = line.split(':', 1)[1].strip(), []
+                self._reply('250 OK')
+            elif command == 'RCPT':
+                recipients.append(line.split(':', 1)[1].strip())
+                self._reply('250 OK')
+            elif command == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                lines = []
+                while True:
+                    data_line = self._readline()
+                    if data_line is None or data_line == '.':
+                        break
+                    lines.append(data_line[1:] if data_line.startswith('..') else data_line)
+                if self.server.latency_ms:
+                    time.sleep(self.server.latency_ms / 1000.0)
+                self.server.deliver(sender, recipients, '\n'.join(lines))
+                self._reply('250 OK: queued')
+            elif command == 'RSET':
+                sender, recipients = None, []
+                self._reply('250 OK')
+            elif command == 'NOOP':
+                self._reply('250 OK')
+            elif command == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('502 Command not implemented')
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """
+    수신 메일을 보관하는 SMTP 서버
+
+    Args:
+        latency_ms: DATA 처리 지연 (ms)
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0):
+        super().__init__((host, port), _Handler)
+        self.latency_ms = latency_ms
+        self.messages: List[Dict] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def deliver(self, sender: str, recipients: List[str], data: str) -> None:
+        with self._lock:
+            self.messages.append({'from': sender, 'to': recipients, 'data': data})
+
+    @property
+    def message_count(self) -> int:
+        with self._lock:
+            return len(self.messages)
+
+    def start(self) -> 'SMTPSink':
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
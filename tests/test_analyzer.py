@@ -305,13 +305,13 @@ class TestFallbackAnalysis:
         assert 'summary' in fallback
         assert 'sentiment' in fallback
         
-        # fallback은 모든 언어에 동일한 요약 사용
-        assert fallback['summary']['ko'] is not None
-        assert fallback['summary']['en'] is not None
+        # fallback 요약은 원문 언어(en)만 - 다른 언어는 조회 시 생성
+        assert fallback['summary']['en'].startswith('Tesla Stock Rises')
+        assert set(fallback['summary']) == {'en'}
         
-        # 기본 sentiment
-        assert fallback['sentiment']['classification'] == 'Neutral'
-        assert fallback['sentiment']['score'] == 0
+        # 렉시콘 sentiment (rises/strong/beat -> 호재)
+        assert fallback['sentiment']['classification'] == 'positive'
+        assert 0 < fallback['sentiment']['score'] <= 10
     
     def test_fallback_with_long_title(self):
         """긴 제목 fallback 처리"""
@@ -327,7 +327,7 @@ class TestFallbackAnalysis:
         )
         
         # 길이 제한 확인
-        assert len(fallback['summary']['ko']) <= 203  # 200 + "..."
+        assert len(fallback['summary']['en']) <= 203  # 200 + "..."
 
 
 if __name__ == '__main__':
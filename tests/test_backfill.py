@@ -0,0 +1,365 @@
+"""
+과거 뉴스 백필 테스트
+- 로컬 HTTP 서버로 investing.com 형식의 페이지 목록(/equities/{slug}-news, /2, /3 ...) 제공
+- 목표 날짜 도달 시 중단, 목록 끝 처리, 체크포인트 기반 재개, 병렬 실행
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import http.server
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models.models import BackfillCheckpoint, StockMaster, KST
+from app.services.backfill import BackfillService, HttpPageFetcher, get_backfill_status
+from app.services.crawler import InvestingCrawler
+from app.utils.config import Config, TestingConfig
+
+ARTICLES_PER_PAGE = 10
+ARTICLE_INTERVAL = timedelta(hours=12)  # 페이지당 5일
+PAGES = {'tesla-motors': 6, 'nvidia-corp': 4}
+
+ARTICLE_HTML = """
+    <article data-test="article-item" class="news-analysis-v2_article">
+      <div class="block w-full">
+        <a data-test="article-title-link" class="title" href="/news/stock-market-news/{slug}-{index}">{slug} news {index}</a>
+        <p data-test="article-description">Article {index} description.</p>
+        <ul><li><time data-test="article-publish-date" datetime="{date}">{date}</time></li></ul>
+      </div>
+    </article>"""
+
+
+def _build_site(now):
+    """경로 -> HTML (기사 시각은 now에서 ARTICLE_INTERVAL 간격으로 과거로)"""
+    site = {}
+    for slug, pages in PAGES.items():
+        for page in range(1, pages + 1):
+            articles = []
+            for offset in range(ARTICLES_PER_PAGE):
+                index = (page - 1) * ARTICLES_PER_PAGE + offset
+                date = (now - timedelta(hours=1) - index * ARTICLE_INTERVAL).strftime('%Y-%m-%d %H:%M:%S')
+                articles.append(ARTICLE_HTML.format(slug=slug, index=index, date=date))
+            path = f"/equities/{slug}-news" + (f"/{page}" if page > 1 else '')
+            site[path] = f"<html><body><div>{''.join(articles)}</div></body></html>"
+    return site
+
+
+@pytest.fixture
+def fixture_site():
+    """페이지별 HTML을 제공하고 요청 경로를 기록하는 로컬 서버"""
+    site = _build_site(datetime.utcnow())
+    requested = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            body = site.get(self.path, '<html><body><p>No more news</p></body></html>').encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", requested
+    server.shutdown()
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """워커 스레드가 공유할 수 있는 파일 DB 앱"""
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'backfill.db'}")
+    monkeypatch.setenv('ENABLE_SCHEDULER', 'false')
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([
+            StockMaster(ticker_symbol='TSLA', company_name='Tesla Inc'),
+            StockMaster(ticker_symbol='NVDA', company_name='NVIDIA Corp'),
+        ])
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+        db.engine.dispose()
+
+
+class FakeStorage:
+    """URL 기준 중복 체크 + bulk 저장 기록"""
+
+    def __init__(self):
+        self.saved = {}
+        self.bulk_calls = 0
+        self._lock = threading.Lock()
+
+    def check_duplicates(self, urls, ticker_symbol=None):
+        with self._lock:
+            return {url for url in urls if url in self.saved}
+
+    def bulk_save_news(self, news_list):
+        with self._lock:
+            self.bulk_calls += 1
+            for item in news_list:
+                self.saved[item['url']] = item
+        return {'success': len(news_list), 'failed': 0}
+
+
+class PassthroughAnalyzer:
+    def batch_analyze(self, items):
+        return items
+
+
+class Crash(BaseException):
+    """프로세스 강제 종료 흉내 (except Exception으로 잡히지 않음)"""
+
+
+def _service(app, base_url, storage, fetcher_factory=HttpPageFetcher, **kwargs):
+    return BackfillService(
+        app,
+        news_storage=storage,
+        news_analyzer=PassthroughAnalyzer(),
+        fetcher_factory=fetcher_factory,
+        base_url=base_url,
+        page_delay=0,
+        **kwargs
+    )
+
+
+def _pages(requested, slug):
+    prefix = f"/equities/{slug}-news"
+    return [int(p[len(prefix) + 1:] or 1) if p != prefix else 1 for p in requested if p.startswith(prefix)]
+
+
+def test_page_urls():
+    crawler = InvestingCrawler()
+    assert crawler.get_news_page_url('TSLA', 1) == 'https://www.investing.com/equities/tesla-motors-news'
+    assert crawler.get_news_page_url('TSLA', 3) == 'https://www.investing.com/equities/tesla-motors-news/3'
+    assert crawler.get_news_page_url('SPY', 2) == 'https://www.investing.com/etfs/spdr-s-p-500-news/2'
+    assert crawler.get_news_page_url('UNKNOWN', 2) is None
+
+
+def test_stops_at_target_date(app, fixture_site):
+    """12일 전까지: 3페이지에서 목표 도달, 범위 밖 기사는 저장 안 함"""
+    base_url, requested = fixture_site
+    storage = FakeStorage()
+
+    results = _service(app, base_url, storage).backfill(['TSLA'], days=12)
+
+    assert results['TSLA']['status'] == 'COMPLETED'
+    assert _pages(requested, 'tesla-motors') == [1, 2, 3]
+    # 0h, 12h, ... 276h (23 * 12 + 1 < 288)
+    assert len(storage.saved) == 24
+    assert storage.bulk_calls == 3
+
+    checkpoint = db.session.get(BackfillCheckpoint, 'TSLA')
+    assert checkpoint.next_page == 3
+    assert checkpoint.articles_saved == 24
+    assert checkpoint.oldest_seen >= checkpoint.target_date
+
+
+def test_stops_at_end_of_listing(app, fixture_site):
+    """목록이 목표 날짜보다 짧으면 빈 페이지에서 완료"""
+    base_url, requested = fixture_site
+    storage = FakeStorage()
+
+    results = _service(app, base_url, storage).backfill(['NVDA'], days=90)
+
+    assert results['NVDA']['status'] == 'COMPLETED'
+    assert _pages(requested, 'nvidia-corp') == [1, 2, 3, 4, 5]
+    assert len(storage.saved) == 40
+
+
+def test_max_pages_limit(app, fixture_site):
+    base_url, requested = fixture_site
+
+    results = _service(app, base_url, FakeStorage(), max_pages=2).backfill(['TSLA'], days=90)
+
+    assert results['TSLA']['status'] == 'COMPLETED'
+    assert _pages(requested, 'tesla-motors') == [1, 2]
+
+
+def test_resume_after_crash(app, fixture_site):
+    """3페이지 처리 중 중단 -> 재실행 시 1~2페이지는 다시 읽지 않음"""
+    base_url, requested = fixture_site
+    storage = FakeStorage()
+
+    class CrashingFetcher(HttpPageFetcher):
+        def fetch(self, url):
+            if url.endswith('/3'):
+                raise Crash()
+            return super().fetch(url)
+
+    target = datetime.now(KST) - timedelta(days=25)
+    with pytest.raises(Crash):
+        _service(app, base_url, storage, CrashingFetcher).backfill_ticker('TSLA', target)
+
+    checkpoint = db.session.get(BackfillCheckpoint, 'TSLA')
+    db.session.refresh(checkpoint)
+    assert checkpoint.status == 'RUNNING'
+    assert checkpoint.next_page == 3
+    assert len(storage.saved) == 20
+
+    requested.clear()
+    result = _service(app, base_url, storage).backfill_ticker('TSLA', target)
+
+    assert result['status'] == 'COMPLETED'
+    assert _pages(requested, 'tesla-motors') == [3, 4, 5, 6]
+    assert len(storage.saved) == 50
+
+
+def test_failed_page_is_retried_next_run(app, fixture_site):
+    """HTTP 오류 -> FAILED 기록, 다음 실행에서 같은 페이지부터"""
+    base_url, requested = fixture_site
+    storage = FakeStorage()
+    fail = {'/equities/tesla-motors-news/2'}
+
+    class FlakyFetcher(HttpPageFetcher):
+        def fetch(self, url):
+            if any(url.endswith(path) for path in fail):
+                raise ConnectionError('connection reset')
+            return super().fetch(url)
+
+    results = _service(app, base_url, storage, FlakyFetcher).backfill(['TSLA'], days=8)
+    assert results['TSLA']['status'] == 'FAILED'
+    assert 'page 2' in results['TSLA']['error']
+    assert db.session.get(BackfillCheckpoint, 'TSLA').next_page == 2
+
+    fail.clear()
+    requested.clear()
+    results = _service(app, base_url, storage, FlakyFetcher).backfill(['TSLA'], days=8)
+    assert results['TSLA']['status'] == 'COMPLETED'
+    assert _pages(requested, 'tesla-motors') == [2]
+    assert len(storage.saved) == 16
+
+
+def test_completed_ticker_is_skipped_and_extended(app, fixture_site):
+    """완료된 기간은 건너뛰고, 더 과거까지 요청하면 마지막 페이지부터 이어서 수집"""
+    base_url, requested = fixture_site
+    storage = FakeStorage()
+    service = _service(app, base_url, storage)
+
+    service.backfill(['TSLA'], days=7)
+    requested.clear()
+    assert service.backfill(['TSLA'], days=7)['TSLA']['status'] == 'SKIPPED'
+    assert requested == []
+
+    results = service.backfill(['TSLA'], days=12)
+    assert results['TSLA']['status'] == 'COMPLETED'
+    assert _pages(requested, 'tesla-motors') == [2, 3]
+    assert len(storage.saved) == 24
+
+
+def test_parallel_tickers_and_pending(app, fixture_site):
+    """티커별 병렬 실행 후 미완료 티커 조회"""
+    base_url, _ = fixture_site
+    storage = FakeStorage()
+    service = _service(app, base_url, storage)
+
+    results = service.backfill(['TSLA', 'NVDA', 'AAPL'], days=12, max_workers=3)
+
+    assert results['TSLA']['status'] == 'COMPLETED'
+    assert results['NVDA']['status'] == 'COMPLETED'
+    assert results['AAPL']['status'] == 'FAILED'  # stock_master에 없음
+    assert len(storage.saved) == 48
+
+    target = datetime.now(KST) - timedelta(days=12)
+    assert service.get_pending_tickers(['TSLA', 'NVDA', 'MSFT'], target) == ['MSFT']
+    assert service.get_pending_tickers(['TSLA'], target - timedelta(days=30)) == ['TSLA']
+    assert [row['ticker_symbol'] for row in get_backfill_status(db.session)] == ['NVDA', 'TSLA']
+
+
+def test_empty_first_page_fails(app, fixture_site):
+    """첫 페이지에 기사가 없으면 (차단/레이아웃 변경) 완료로 기록하지 않음"""
+    base_url, _ = fixture_site
+
+    result = _service(app, f"{base_url}/blocked", FakeStorage()).backfill(['TSLA'], days=12)
+
+    assert result['TSLA']['status'] == 'FAILED'
+    assert db.session.get(BackfillCheckpoint, 'TSLA').next_page == 1
+
+
+def test_failed_ticker_backoff(app, fixture_site, monkeypatch):
+    """실패한 티커는 대기 시간(실패마다 2배) 후에만 다시 대상, 최대 횟수 이후 제외, 성공 시 초기화"""
+    monkeypatch.setattr(Config, 'BACKFILL_RETRY_HOURS', 6)
+    monkeypatch.setattr(Config, 'BACKFILL_MAX_ATTEMPTS', 3)
+    base_url, _ = fixture_site
+    service = _service(app, base_url, FakeStorage())
+    target = datetime.now(KST) - timedelta(days=12)
+
+    def backdate(hours):
+        checkpoint = db.session.get(BackfillCheckpoint, 'TSLA')
+        checkpoint.updated_at = checkpoint.updated_at - timedelta(hours=hours)
+        db.session.commit()
+
+    _service(app, f"{base_url}/blocked", FakeStorage()).backfill(['TSLA'], days=12)
+    assert db.session.get(BackfillCheckpoint, 'TSLA').failure_count == 1
+    assert service.get_pending_tickers(['TSLA'], target) == []
+    backdate(7)
+    assert service.get_pending_tickers(['TSLA'], target) == ['TSLA']
+
+    # 두 번째 실패: 12시간 대기
+    _service(app, f"{base_url}/blocked", FakeStorage()).backfill(['TSLA'], days=12)
+    assert db.session.get(BackfillCheckpoint, 'TSLA').failure_count == 2
+    backdate(7)
+    assert service.get_pending_tickers(['TSLA'], target) == []
+    backdate(6)
+    assert service.get_pending_tickers(['TSLA'], target) == ['TSLA']
+
+    # 최대 횟수 도달: 오래 지나도 스케줄러 대상에서 제외
+    _service(app, f"{base_url}/blocked", FakeStorage()).backfill(['TSLA'], days=12)
+    backdate(24 * 30)
+    assert service.get_pending_tickers(['TSLA'], target) == []
+
+    # 직접 실행은 재시도, 성공하면 초기화
+    assert service.backfill(['TSLA'], days=12)['TSLA']['status'] == 'COMPLETED'
+    assert db.session.get(BackfillCheckpoint, 'TSLA').failure_count == 0
+
+
+def test_ensure_columns_adds_failure_count(app):
+    """기존 DB의 backfill_checkpoints에 failure_count 컬럼 추가"""
+    from sqlalchemy import inspect, text
+    from app.utils.db_migrations import ensure_columns
+
+    db.session.add(BackfillCheckpoint(ticker_symbol='TSLA', target_date=datetime(2025, 1, 1), next_page=1,
+                                      pages_crawled=0, articles_found=0, articles_saved=0))
+    db.session.commit()
+    db.session.close()
+    with db.engine.begin() as conn:
+        conn.execute(text("ALTER TABLE backfill_checkpoints DROP COLUMN failure_count"))
+
+    assert ensure_columns(db.engine) == ['backfill_checkpoints.failure_count']
+    assert 'failure_count' in {c['name'] for c in inspect(db.engine).get_columns('backfill_checkpoints')}
+    assert db.session.get(BackfillCheckpoint, 'TSLA').failure_count == 0
+    assert ensure_columns(db.engine) == []
+
+
+def test_storage_failure_keeps_page(app, fixture_site):
+    """저장소가 배치를 저장하지 못하면 FAILED로 기록하고 같은 페이지부터 재시도"""
+    base_url, requested = fixture_site
+
+    class FailingStorage(FakeStorage):
+        def bulk_save_news(self, news_list):
+            return {'success': 0, 'failed': len(news_list), 'total': len(news_list), 'errors': ['disk full']}
+
+    result = _service(app, base_url, FailingStorage()).backfill(['TSLA'], days=8)['TSLA']
+    assert result['status'] == 'FAILED'
+    assert 'page 1' in result['error']
+    checkpoint = db.session.get(BackfillCheckpoint, 'TSLA')
+    assert (checkpoint.next_page, checkpoint.failure_count) == (1, 1)
+
+    requested.clear()
+    storage = FakeStorage()
+    assert _service(app, base_url, storage).backfill(['TSLA'], days=8)['TSLA']['status'] == 'COMPLETED'
+    assert _pages(requested, 'tesla-motors') == [1, 2]
+    assert len(storage.saved) == 16
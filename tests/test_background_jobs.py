@@ -0,0 +1,262 @@
+"""
+백그라운드 작업 테스트
+- 작업 실행/진행 상황 기록, 중복 실행 방지, 실패/중단 작업 처리
+- 관리자 이메일 수동 발송/사용자 테스트 메일이 요청을 막지 않고 작업 ID 반환
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import threading
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models.models import KST, BackgroundJob, StockMaster, User, UserSetting, UserStock
+from app.services import background_jobs as jobs_module
+from app.services.background_jobs import BackgroundJobRunner, get_job
+from app.services.scheduler import SchedulerService
+from app.utils.config import TestingConfig
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """작업 스레드가 공유할 수 있는 파일 DB 앱"""
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'jobs.db'}")
+    monkeypatch.setenv('ENABLE_SCHEDULER', 'false')
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        for name, is_admin in (('admin', True), ('alice', False), ('bob', False)):
+            user = User(username=name, email=f'{name}@example.com', is_admin=is_admin)
+            user.set_password('password123')
+            db.session.add(user)
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    runner = BackgroundJobRunner(max_workers=2)
+    monkeypatch.setattr(jobs_module, '_job_runner', runner)
+    return runner
+
+
+def _login(app, username):
+    client = app.test_client()
+    user = User.query.filter_by(username=username).first()
+    with client.session_transaction() as sess:
+        sess['user_id'] = user.id
+        sess['username'] = user.username
+        sess['is_admin'] = user.is_admin
+    return client, user
+
+
+def _refresh(job_id):
+    db.session.expire_all()
+    return get_job(job_id)
+
+
+class TestRunner:
+    def test_progress_and_completion(self, app, runner):
+        def work(progress):
+            progress.set_total(3)
+            progress.sent()
+            progress.sent()
+            progress.failed()
+            return {'success': True, 'message': '2 sent'}
+
+        job, created = runner.enqueue(app, 'email_all', work, created_by=1)
+        runner.wait(job.id, timeout=10)
+
+        job = _refresh(job.id)
+        assert created
+        assert job.to_dict()['status'] == 'COMPLETED'
+        assert (job.total, job.sent, job.failed, job.remaining) == (3, 2, 1, 0)
+        assert job.message == '2 sent' and job.started_at and job.finished_at
+
+    def test_active_job_is_reused(self, app, runner):
+        release = threading.Event()
+        started = threading.Event()
+
+        def work(progress):
+            progress.set_total(5)
+            started.set()
+            release.wait(10)
+            return {'success': True}
+
+        first, created = runner.enqueue(app, 'email_all', work)
+        assert started.wait(10)
+        second, created_again = runner.enqueue(app, 'email_all', work)
+        assert second.id == first.id and created and not created_again
+        assert _refresh(first.id).remaining == 5
+
+        release.set()
+        runner.wait(first.id, timeout=10)
+        third, created_third = runner.enqueue(app, 'email_all', lambda progress: None)
+        runner.wait(third.id, timeout=10)
+        assert created_third and third.id != first.id
+
+    def test_failures_are_recorded(self, app, runner):
+        def boom(progress):
+            raise RuntimeError('smtp down')
+
+        crashed, _ = runner.enqueue(app, 'email_all', boom)
+        runner.wait(crashed.id, timeout=10)
+        failed, _ = runner.enqueue(app, 'test_email', lambda progress: {'success': False, 'error': 'bad auth'})
+        runner.wait(failed.id, timeout=10)
+
+        assert (_refresh(crashed.id).status, _refresh(crashed.id).error_message) == ('FAILED', 'smtp down')
+        assert (_refresh(failed.id).status, _refresh(failed.id).error_message) == ('FAILED', 'bad auth')
+
+    def test_stale_running_job_does_not_block(self, app, runner):
+        stale = BackgroundJob(id='stale', job_type='email_all', status='RUNNING',
+                              created_at=datetime.now() - timedelta(days=1))
+        db.session.add(stale)
+        db.session.commit()
+
+        job, created = runner.enqueue(app, 'email_all', lambda progress: None)
+        runner.wait(job.id, timeout=10)
+
+        assert created and job.id != 'stale'
+        assert _refresh('stale').status == 'FAILED'
+
+
+class TestEmailJobs:
+    """실제 send_email_now/_run_email_job (SMTP 발송만 대체)"""
+
+    @pytest.fixture
+    def recipients(self, app, monkeypatch):
+        """alice: 발송 성공, bob: 발송 실패, admin: 관심 종목 없음 (모두 현재 시각 알림)"""
+        notify_at = time(datetime.now(KST).hour, 0)
+        db.session.add_all([StockMaster(ticker_symbol='TSLA', company_name='Tesla, Inc.'),
+                            StockMaster(ticker_symbol='AAPL', company_name='Apple Inc.')])
+        for user in User.query.all():
+            db.session.add(UserSetting(user_id=user.id, language='ko', notification_time=notify_at))
+        for username, ticker in (('alice', 'TSLA'), ('bob', 'AAPL')):
+            user = User.query.filter_by(username=username).first()
+            db.session.add(UserStock(user_id=user.id, ticker_symbol=ticker))
+        db.session.commit()
+
+        reports = []
+
+        def fake_send_stock_report(self, user, news_by_stock, language='ko'):
+            reports.append(user.username)
+            return (True, None) if user.username == 'alice' else (False, 'mailbox full')
+
+        monkeypatch.setattr(SchedulerService, '_app', app)
+        monkeypatch.setattr('app.services.email_sender.EmailSender.__init__', lambda self: None)
+        monkeypatch.setattr('app.services.email_sender.EmailSender.send_stock_report', fake_send_stock_report)
+        monkeypatch.setattr(
+            'app.services.news_storage.NewsStorageService.get_recent_news',
+            lambda self, ticker, hours=3: [{'title': f'{ticker} news', 'summary': {'ko': '요약'}}]
+        )
+        return reports
+
+    def test_send_email_now_progress(self, app, runner, recipients):
+        job, _ = runner.enqueue(app, 'email_all', SchedulerService().send_email_now)
+        runner.wait(job.id, timeout=10)
+
+        job = _refresh(job.id)
+        assert job.status == 'COMPLETED'
+        assert (job.total, job.sent, job.failed, job.skipped, job.remaining) == (3, 1, 1, 1, 0)
+        assert sorted(recipients) == ['alice', 'bob']
+
+    def test_scheduled_email_job_sends(self, app, recipients):
+        SchedulerService()._run_email_job()
+
+        assert sorted(recipients) == ['alice', 'bob']
+
+
+class TestEndpoints:
+    def test_trigger_email_returns_immediately(self, app, runner, monkeypatch):
+        release = threading.Event()
+
+        def fake_send_email_now(self, progress=None):
+            progress.set_total(2)
+            progress.sent()
+            release.wait(10)
+            progress.failed()
+            return {'success': True, 'message': '1명에게 이메일을 발송했습니다.', 'sent': 1, 'failed': 1}
+
+        monkeypatch.setattr(SchedulerService, '_app', app)
+        monkeypatch.setattr(SchedulerService, 'send_email_now', fake_send_email_now)
+        client, _ = _login(app, 'admin')
+
+        response = client.post('/admin/api/trigger/email')
+        assert response.status_code == 202
+        job_id = response.get_json()['job_id']
+
+        status = client.get(f'/admin/api/jobs/{job_id}').get_json()['job']
+        assert status['status'] in ('PENDING', 'RUNNING')
+
+        # 진행 중에는 새 작업을 만들지 않음
+        again = client.post('/admin/api/trigger/email')
+        assert again.status_code == 200 and again.get_json()['job_id'] == job_id
+
+        release.set()
+        runner.wait(job_id, timeout=10)
+        status = client.get(f'/admin/api/jobs/{job_id}').get_json()['job']
+        assert (status['status'], status['sent'], status['failed'], status['remaining']) == ('COMPLETED', 1, 1, 0)
+        assert client.get('/admin/api/jobs/missing').status_code == 404
+
+    def test_settings_test_email_job(self, app, runner, monkeypatch):
+        sent_to = []
+
+        def fake_send_test_email(self, user):
+            sent_to.append(user.email)
+            return True, None
+
+        monkeypatch.setattr('app.services.email_sender.EmailSender.__init__', lambda self: None)
+        monkeypatch.setattr('app.services.email_sender.EmailSender.send_test_email', fake_send_test_email)
+        client, _ = _login(app, 'alice')
+
+        response = client.post('/settings/test-email')
+        assert response.status_code == 202
+        job_id = response.get_json()['job_id']
+        runner.wait(job_id, timeout=10)
+
+        status = client.get(f'/settings/api/jobs/{job_id}').get_json()['job']
+        assert status['status'] == 'COMPLETED' and status['sent'] == 1
+        assert sent_to == ['alice@example.com']
+
+        # 다른 사용자의 작업은 조회 불가
+        other, _ = _login(app, 'bob')
+        assert other.get(f'/settings/api/jobs/{job_id}').status_code == 404
+
+    def test_admin_test_email_records_admin(self, app, runner, monkeypatch):
+        """관리자 테스트 메일: 요청한 관리자를 기록, 중복은 수신자 기준, 수신자는 작업 조회 불가"""
+        release = threading.Event()
+        sent_to = []
+
+        def fake_send_test_email(self, user):
+            release.wait(10)
+            sent_to.append(user.email)
+            return True, None
+
+        monkeypatch.setattr('app.services.email_sender.EmailSender.__init__', lambda self: None)
+        monkeypatch.setattr('app.services.email_sender.EmailSender.send_test_email', fake_send_test_email)
+        client, admin = _login(app, 'admin')
+        alice = User.query.filter_by(username='alice').first()
+        bob = User.query.filter_by(username='bob').first()
+
+        first = client.post('/admin/api/test-email', json={'user_id': alice.id}).get_json()['job_id']
+        again = client.post('/admin/api/test-email', json={'user_id': alice.id}).get_json()['job_id']
+        other = client.post('/admin/api/test-email', json={'user_id': bob.id}).get_json()['job_id']
+        assert first == again and first != other
+        assert _refresh(first).created_by == admin.id
+
+        release.set()
+        runner.wait(first, timeout=10)
+        runner.wait(other, timeout=10)
+        assert sorted(sent_to) == ['alice@example.com', 'bob@example.com']
+        assert client.get(f'/admin/api/jobs/{first}').get_json()['job']['status'] == 'COMPLETED'
+
+        recipient, _ = _login(app, 'alice')
+        assert recipient.get(f'/settings/api/jobs/{first}').status_code == 404
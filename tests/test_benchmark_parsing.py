@@ -0,0 +1,265 @@
+"""
+크롤러 파싱 벤치마크
+- 저장된 investing.com 페이지(tests/fixtures/investing)로 _parse_news_articles_bs4 측정
+- 수집되는 날짜 형식 전체에 대한 _parse_date 측정
+- 백필처럼 서로 다른 날짜 문자열이 많을 때 FastDateParser vs dateutil 비교
+- 로컬 정적 서버에서 Selenium / JS 추출 경로 비교 (Chrome 드라이버가 있을 때만)
+
+기본 실행에서는 파싱 결과(기사 수, 날짜 파싱 성공 여부)만 검증한다 (부하가 있는 CI에서 시간 측정이
+흔들리므로). BENCHMARK=1이면 시간을 측정해 머신 속도 보정을 위한 calibration 루프 대비 비율로 비교하고,
+tests/fixtures/benchmark_baseline.json 의 기준값보다 BENCHMARK_TOLERANCE 이상 느려지면 실패한다.
+
+시간 측정 포함 실행:
+    BENCHMARK=1 python -m pytest tests/test_benchmark_parsing.py -s
+
+기준값 갱신:
+    BENCHMARK_UPDATE_BASELINE=1 python -m pytest tests/test_benchmark_parsing.py
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import functools
+import http.server
+import json
+import os
+import shutil
+import statistics
+import threading
+import time
+import warnings
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from dateutil import parser as date_parser
+
+from app.services.crawler import InvestingCrawler
+from app.utils.date_parser import FastDateParser
+
+
+FIXTURE_DIR = project_root / 'tests' / 'fixtures' / 'investing'
+BASELINE_FILE = project_root / 'tests' / 'fixtures' / 'benchmark_baseline.json'
+
+UPDATE_BASELINE = os.getenv('BENCHMARK_UPDATE_BASELINE', '').lower() in ('1', 'true', 'yes')
+# 시간 측정/비교는 명시적으로 켠 경우만 (기준값 갱신 시 포함)
+RUN_TIMING = UPDATE_BASELINE or os.getenv('BENCHMARK', '').lower() in ('1', 'true', 'yes')
+TOLERANCE = float(os.getenv('BENCHMARK_TOLERANCE', '0.5'))  # 기준 대비 허용 감속 비율
+MIN_SLACK = 1.0  # 1ms 미만 측정값의 잡음 흡수용 (calibration 배수)
+
+CUTOFF = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+# 페이지별 기대 파싱 결과 수 (max_articles=100 기준)
+FIXTURE_PAGES = {
+    'stock_tsla.html': 40,
+    'stock_nvda_relative.html': 30,
+    'etf_spy.html': 36,
+    'challenge.html': 0,
+}
+
+# 크롤링 중 관찰된 날짜 형식 (입력, 파싱 성공 여부)
+DATE_FORMATS = [
+    ('2025-11-28T14:30:00Z', True),
+    ('2025-11-28T14:30:00+00:00', True),
+    ('2025-11-28T14:30:00.123456+09:00', True),
+    ('2025-11-28 14:30:00', True),
+    ('2025-11-28', True),
+    ('Nov 28, 2025', True),
+    ('Nov 28, 2025 10:30AM', True),
+    ('November 28, 2025 10:30 AM', True),
+    ('\xa0-\xa0Nov 27, 2025 01:00AM', True),
+    ('28.11.2025', True),
+    ('Just now', True),
+    ('Moments ago', True),
+    ('30 seconds ago', True),
+    ('15 minutes ago', True),
+    ('1 hour ago', True),
+    ('2 hours ago', True),
+    ('3 days ago', True),
+    ('1 week ago', True),
+    ('2 months ago', True),
+    ('', False),
+    ('Sponsored', False),
+]
+
+
+def _calibrate() -> float:
+    """머신 속도 기준 (순수 Python 루프 1회 소요 시간의 중앙값)"""
+    def workload():
+        total = 0
+        for i in range(20000):
+            total += (i * i) % 7
+        return ' '.join(str(i) for i in range(2000)).split()
+
+    return _measure(workload, rounds=7)
+
+
+def _measure(func, rounds: int = 5, warmup: int = 1) -> float:
+    """func 1회 실행 시간의 중앙값 (초)"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+class BenchmarkBaseline:
+    """기준값 비교 / 갱신 (RUN_TIMING이 아니면 측정하지 않음)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.data = json.loads(path.read_text()) if path.exists() else {}
+        self.updated = dict(self.data)
+        self.calibration = _calibrate() if RUN_TIMING else None
+
+    def check(self, name: str, func, rounds: int = 5) -> None:
+        """func 실행 시간을 측정해 기준값 대비 회귀 여부 확인 (UPDATE 모드에서는 기록만)"""
+        if not RUN_TIMING:
+            return
+        seconds = _measure(func, rounds=rounds)
+        ratio = seconds / self.calibration
+        print(f"\n[benchmark] {name}: {seconds * 1000:.2f}ms (x{ratio:.2f} calibration)")
+
+        if UPDATE_BASELINE:
+            self.updated[name] = round(ratio, 3)
+            return
+
+        baseline = self.data.get(name)
+        if baseline is None:
+            warnings.warn(f"No benchmark baseline for {name}; run with BENCHMARK_UPDATE_BASELINE=1")
+            return
+
+        limit = baseline * (1 + TOLERANCE) + MIN_SLACK
+        assert ratio <= limit, (
+            f"{name} regressed: x{ratio:.2f} calibration (baseline x{baseline:.2f}, limit x{limit:.2f})"
+        )
+
+    def save(self) -> None:
+        """UPDATE 모드일 때 기준값 파일 저장"""
+        if UPDATE_BASELINE:
+            self.path.write_text(json.dumps(self.updated, indent=2, sort_keys=True) + '\n')
+
+
+@pytest.fixture(scope='module')
+def baseline():
+    """모듈 단위 기준값 (종료 시 UPDATE 모드면 저장)"""
+    baseline = BenchmarkBaseline(BASELINE_FILE)
+    yield baseline
+    baseline.save()
+
+
+@pytest.fixture(scope='module')
+def crawler():
+    """드라이버 없는 크롤러 (파서만 사용)"""
+    return InvestingCrawler(headless=True)
+
+
+class TestParseBenchmark:
+    """BeautifulSoup 파서 벤치마크"""
+
+    @pytest.mark.parametrize('page,expected', sorted(FIXTURE_PAGES.items()))
+    def test_parse_news_articles_bs4(self, crawler, baseline, page, expected):
+        html = (FIXTURE_DIR / page).read_text()
+
+        items = crawler._parse_news_articles_bs4(html, 'TEST', 'Test Inc', CUTOFF, max_articles=100)
+        assert len(items) == expected
+        assert all(item['title'] and item['source_url'].startswith('https://') for item in items)
+
+        baseline.check(
+            f"parse_bs4[{page}]",
+            lambda: crawler._parse_news_articles_bs4(html, 'TEST', 'Test Inc', CUTOFF, max_articles=100)
+        )
+
+    def test_parse_date_formats(self, crawler, baseline):
+        for value, parseable in DATE_FORMATS:
+            parsed = crawler._parse_date(value)
+            assert (parsed is not None) == parseable, value
+            if parsed is not None:
+                assert parsed.tzinfo is not None, value
+
+        def parse_all():
+            for _ in range(20):
+                for value, _ in DATE_FORMATS:
+                    crawler._parse_date(value)
+
+        baseline.check('parse_date[all_formats_x20]', parse_all)
+
+    def test_parse_date_distinct_vs_dateutil(self, baseline):
+        """서로 다른 날짜 500개 (캐시 미적중): 결과가 dateutil과 같고, BENCHMARK=1이면 3배 이상 빨라야 함"""
+        start = datetime(2025, 1, 1, 9, 0)
+        values = []
+        for i in range(250):
+            moment = start + timedelta(minutes=37 * i)
+            values.append(moment.strftime('%Y-%m-%d %H:%M:%S'))
+            values.append(moment.strftime('%b %d, %Y %I:%M%p'))
+
+        def parse_fast():
+            parser = FastDateParser()
+            for value in values:
+                parser.parse(value, source='investing')
+
+        def parse_dateutil():
+            for value in values:
+                date_parser.parse(value)
+
+        parser = FastDateParser()
+        for value in values:
+            assert parser.parse(value, source='investing') == date_parser.parse(value).replace(tzinfo=timezone.utc)
+
+        if not RUN_TIMING:
+            return
+        fast = _measure(parse_fast)
+        legacy = _measure(parse_dateutil)
+        print(f"\n[benchmark] dateutil: {legacy * 1000:.2f}ms, fast: {fast * 1000:.2f}ms (x{legacy / fast:.1f})")
+        assert fast * 3 < legacy
+        baseline.check('parse_date[distinct_x500]', parse_fast)
+
+
+def _chrome_available() -> bool:
+    return bool(os.environ.get('CHROMEDRIVER_PATH') or shutil.which('chromedriver'))
+
+
+@pytest.fixture(scope='module')
+def static_server():
+    """fixtures 디렉토리를 서빙하는 로컬 HTTP 서버"""
+    class QuietHandler(http.server.SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    handler = functools.partial(QuietHandler, directory=str(FIXTURE_DIR))
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.mark.skipif(not _chrome_available(), reason="Chrome WebDriver not available")
+class TestBrowserExtractionBenchmark:
+    """Selenium / JS 추출 경로 벤치마크"""
+
+    @pytest.fixture(scope='class')
+    def browser(self):
+        with InvestingCrawler(headless=True) as browser:
+            yield browser
+
+    def test_selenium_vs_js_extraction(self, browser, baseline, static_server):
+        browser.driver.get(f"{static_server}/stock_tsla.html")
+
+        selenium_items = browser._parse_news_articles('TEST', 'Test Inc', CUTOFF, max_articles=20)
+        js_items = browser._parse_news_articles_js('TEST', 'Test Inc', CUTOFF, max_articles=20)
+
+        assert len(selenium_items) == 20
+        assert [i['title'] for i in selenium_items] == [i['title'] for i in js_items]
+
+        baseline.check(
+            'extract_selenium[stock_tsla.html]',
+            lambda: browser._parse_news_articles('TEST', 'Test Inc', CUTOFF, max_articles=20), rounds=3
+        )
+        baseline.check(
+            'extract_js[stock_tsla.html]',
+            lambda: browser._parse_news_articles_js('TEST', 'Test Inc', CUTOFF, max_articles=20), rounds=3
+        )
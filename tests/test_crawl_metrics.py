@@ -0,0 +1,216 @@
+"""
+크롤링 파이프라인 계측 테스트
+- 단계별 span 기록 / crawl_stage_timings 저장
+- Prometheus 텍스트 포맷 및 /metrics 엔드포인트
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from unittest.mock import MagicMock
+from werkzeug.security import generate_password_hash
+
+from app import create_app
+from app.extensions import db
+from app.models.models import CrawlStageTiming, StockMaster, User
+from app.services.crawl_metrics import (
+    crawl_trace, crawl_stage, record_stage, current_trace, save_trace,
+    collect_stage_histograms, get_stage_summary, get_recent_runs, TOTAL_STAGE
+)
+from app.services.crawler_service import CrawlerService
+from app.utils.config import Config
+from app.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱"""
+    app = create_app('testing')
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    """테스트 클라이언트"""
+    return app.test_client()
+
+
+def _save_run(ticker, stages, status='SUCCESS'):
+    with crawl_trace(ticker) as trace:
+        for stage, seconds in stages.items():
+            record_stage(stage, seconds)
+    save_trace(db.session, trace, status)
+    return trace
+
+
+class TestTrace:
+    """trace / span 기록 테스트"""
+
+    def test_stage_without_trace_is_noop(self):
+        with crawl_stage('parse'):
+            pass
+        record_stage('throttle_wait', 1.0)
+        assert current_trace() is None
+
+    def test_repeated_stages_are_summed(self):
+        with crawl_trace('TSLA') as trace:
+            record_stage('retry_wait', 2.0)
+            record_stage('retry_wait', 3.0)
+            with crawl_stage('parse'):
+                pass
+
+        totals = trace.totals()
+        assert totals['retry_wait'] == pytest.approx(5.0)
+        assert 'parse' in totals
+        assert current_trace() is None
+
+    def test_save_trace_persists_total(self, app):
+        trace = _save_run('TSLA', {'page_load': 1.5, 'parse': 0.25})
+
+        rows = {t.stage: t for t in CrawlStageTiming.query.filter_by(run_id=trace.run_id)}
+        assert set(rows) == {'page_load', 'parse', TOTAL_STAGE}
+        assert rows['page_load'].duration_ms == 1500
+        assert rows['parse'].status == 'SUCCESS'
+
+
+class TestAggregation:
+    """집계 테스트"""
+
+    def test_stage_summary_percentiles(self, app):
+        for seconds in (1, 2, 3, 4, 10):
+            _save_run('AAPL', {'page_load': seconds})
+
+        summary = {s['stage']: s for s in get_stage_summary(days=1)}
+        page_load = summary['page_load']
+        assert page_load['count'] == 5
+        assert page_load['p50_ms'] == 3000
+        assert page_load['p95_ms'] == 10000
+        assert page_load['max_ms'] == 10000
+        assert get_stage_summary(days=1)[0]['stage'] == TOTAL_STAGE
+
+    def test_recent_runs(self, app):
+        _save_run('AAPL', {'parse': 0.1})
+        _save_run('TSLA', {'parse': 0.2}, status='FAILED')
+
+        runs = get_recent_runs(limit=1)
+        assert len(runs) == 1
+        assert runs[0]['stages']['parse'] in (100, 200)
+
+    def test_collect_stage_histograms(self, app):
+        _save_run('AAPL', {'page_load': 0.3})
+        _save_run('AAPL', {'page_load': 7.0})
+
+        text = '\n'.join(collect_stage_histograms())
+        assert '# TYPE crawl_stage_duration_seconds histogram' in text
+        assert 'crawl_stage_duration_seconds_bucket{stage="page_load",le="0.5"} 1' in text
+        assert 'crawl_stage_duration_seconds_bucket{stage="page_load",le="10"} 2' in text
+        assert 'crawl_stage_duration_seconds_bucket{stage="page_load",le="+Inf"} 2' in text
+        assert 'crawl_stage_duration_seconds_count{stage="page_load"} 2' in text
+
+
+class TestRegistry:
+    """메트릭 레지스트리 테스트"""
+
+    def test_histogram_render_is_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram('demo_seconds', 'Demo', ('kind',), buckets=(1.0, 5.0))
+        histogram.observe(0.5, kind='a')
+        histogram.observe(3.0, kind='a')
+        histogram.observe(9.0, kind='a')
+
+        text = registry.render()
+        assert 'demo_seconds_bucket{kind="a",le="1"} 1' in text
+        assert 'demo_seconds_bucket{kind="a",le="5"} 2' in text
+        assert 'demo_seconds_bucket{kind="a",le="+Inf"} 3' in text
+        assert 'demo_seconds_sum{kind="a"} 12.5' in text
+
+    def test_counter(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('demo_total', 'Demo', ('status',))
+        counter.inc(status='ok')
+        counter.inc(2, status='ok')
+
+        assert counter.get(status='ok') == 3
+        assert 'demo_total{status="ok"} 3' in registry.render()
+
+
+class TestCrawlerServiceInstrumentation:
+    """CrawlerService 계측 테스트"""
+
+    def test_crawl_ticker_records_stages(self, app, monkeypatch):
+        db.session.add(StockMaster(ticker_symbol='TSLA', company_name='Tesla Inc'))
+        db.session.commit()
+
+        crawler = MagicMock()
+        crawler.__enter__.return_value = crawler
+        crawler.crawl_with_retry.return_value = ([{'url': 'https://example.com/a', 'title': 'A'}], None)
+        monkeypatch.setattr('app.services.news_sources.InvestingCrawler', lambda: crawler)
+
+        storage = MagicMock()
+        storage.check_duplicates.return_value = set()
+        storage.bulk_save_news.return_value = {'success': 1}
+        analyzer = MagicMock()
+        analyzer.batch_analyze.side_effect = lambda items: items
+
+        service = CrawlerService(db.session, storage, analyzer)
+        result = service.crawl_ticker('TSLA')
+
+        assert result['status'] == 'SUCCESS'
+        stages = {t.stage for t in CrawlStageTiming.query.filter_by(ticker_symbol='TSLA')}
+        assert {'dedup', 'analyze', 'store', TOTAL_STAGE} <= stages
+
+
+class TestMetricsEndpoint:
+    """/metrics 엔드포인트 테스트"""
+
+    def test_metrics_exposes_stage_histograms(self, app, client):
+        _save_run('TSLA', {'parse': 0.2})
+
+        response = client.get('/metrics')
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain')
+        assert b'crawl_stage_duration_seconds_count{stage="parse"} 1' in response.data
+
+    def test_metrics_token(self, client, monkeypatch):
+        monkeypatch.setattr(Config, 'METRICS_TOKEN', 'secret')
+
+        assert client.get('/metrics').status_code == 401
+        response = client.get('/metrics', headers={'Authorization': 'Bearer secret'})
+        assert response.status_code == 200
+
+    def test_metrics_without_token_allows_only_listed_addresses(self, client, monkeypatch):
+        """토큰이 없으면 허용 주소(기본 루프백)만, 목록이 비면 모두 거부"""
+        assert client.get('/metrics').status_code == 200
+        assert client.get('/metrics', environ_base={'REMOTE_ADDR': '203.0.113.7'}).status_code == 401
+
+        monkeypatch.setattr(Config, 'METRICS_ALLOWED_IPS', '10.0.0.0/8')
+        assert client.get('/metrics', environ_base={'REMOTE_ADDR': '10.1.2.3'}).status_code == 200
+        assert client.get('/metrics').status_code == 401
+
+        monkeypatch.setattr(Config, 'METRICS_ALLOWED_IPS', '')
+        assert client.get('/metrics').status_code == 401
+
+    def test_admin_page(self, app, client):
+        admin = User(
+            username='admin', email='admin@example.com',
+            password_hash=generate_password_hash('password'), is_admin=True
+        )
+        db.session.add(admin)
+        db.session.commit()
+        _save_run('TSLA', {'page_load': 1.0})
+
+        with client.session_transaction() as sess:
+            sess['user_id'] = admin.id
+            sess['username'] = admin.username
+            sess['is_admin'] = True
+
+        response = client.get('/admin/crawl-metrics')
+        assert response.status_code == 200
+        assert 'page_load' in response.get_data(as_text=True)
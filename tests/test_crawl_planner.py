@@ -0,0 +1,124 @@
+"""
+적응형 크롤링 스케줄 테스트
+- 티커별 velocity 계산 / 주기 범위 제한 / 만기 티커 선정
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from app import create_app
+from app.extensions import db
+from app.models.models import CrawlLog
+from app.services.crawl_planner import AdaptiveCrawlPlanner
+
+
+NOW = datetime(2025, 11, 28, 12, 0, 0)
+
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱"""
+    app = create_app('testing')
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def planner():
+    """30분 ~ 24시간, 24시간 윈도우, 목표 3건/회"""
+    return AdaptiveCrawlPlanner(
+        min_interval=timedelta(minutes=30),
+        max_interval=timedelta(hours=24),
+        window_hours=24,
+        target_articles=3
+    )
+
+
+def _add_log(ticker, hours_ago, count, status='SUCCESS'):
+    db.session.add(CrawlLog(
+        ticker_symbol=ticker,
+        crawled_at=NOW - timedelta(hours=hours_ago),
+        status=status,
+        news_count=count
+    ))
+    db.session.commit()
+
+
+class TestComputeInterval:
+    """주기 계산 테스트"""
+
+    def test_zero_velocity_uses_max_interval(self, planner):
+        assert planner.compute_interval(0) == timedelta(hours=24)
+
+    def test_interval_inverse_to_velocity(self, planner):
+        # 시간당 1건 -> 3건 모이는 데 3시간
+        assert planner.compute_interval(1.0) == timedelta(hours=3)
+
+    def test_interval_clamped_to_min(self, planner):
+        assert planner.compute_interval(1000.0) == timedelta(minutes=30)
+
+    def test_interval_clamped_to_max(self, planner):
+        assert planner.compute_interval(0.01) == timedelta(hours=24)
+
+
+class TestVelocity:
+    """velocity 계산 테스트"""
+
+    def test_velocity_from_crawl_logs(self, app, planner):
+        _add_log('TSLA', 2, 12)
+        _add_log('TSLA', 10, 12)
+        _add_log('TSLA', 30, 100)  # 윈도우 밖
+        _add_log('TSLA', 1, 50, status='FAILED')  # 실패 로그 제외
+        _add_log('TSLA,AAPL', 1, 50, status='success')  # 집계 로그 제외
+
+        assert planner.get_velocity(db.session, 'TSLA', now=NOW) == pytest.approx(1.0)
+
+    def test_velocity_uses_es_when_higher(self, app, planner):
+        _add_log('AAPL', 2, 24)
+        storage = MagicMock()
+        storage.count_news.return_value = 48
+
+        assert planner.get_velocity(db.session, 'AAPL', storage, now=NOW) == pytest.approx(2.0)
+        storage.count_news.assert_called_once()
+
+    def test_velocity_ignores_es_errors(self, app, planner):
+        storage = MagicMock()
+        storage.count_news.side_effect = ConnectionError("ES down")
+
+        assert planner.get_velocity(db.session, 'AAPL', storage, now=NOW) == 0
+
+
+class TestDueTickers:
+    """만기 티커 선정 테스트"""
+
+    def test_never_crawled_ticker_is_due(self, app, planner):
+        assert planner.get_due_tickers(db.session, ['NVDA'], now=NOW) == ['NVDA']
+
+    def test_busy_ticker_due_before_quiet_ticker(self, app, planner):
+        # 바쁜 종목: 시간당 2건 -> 1.5시간 주기 / 조용한 종목: 0건 -> 24시간 주기
+        _add_log('TSLA', 2, 48)
+        _add_log('KO', 2, 0)
+
+        due = planner.get_due_tickers(db.session, ['TSLA', 'KO'], now=NOW)
+        assert due == ['TSLA']
+
+    def test_mark_crawled_schedules_next_run(self, app, planner):
+        _add_log('TSLA', 1, 24)
+
+        interval = planner.mark_crawled(db.session, 'TSLA', now=NOW)
+        assert interval == timedelta(hours=3)
+        assert planner.get_due_tickers(db.session, ['TSLA'], now=NOW + timedelta(hours=2)) == []
+        assert planner.get_due_tickers(db.session, ['TSLA'], now=NOW + timedelta(hours=3)) == ['TSLA']
+
+        schedule = planner.get_schedule()
+        assert schedule[0]['ticker'] == 'TSLA'
+        assert schedule[0]['interval_minutes'] == 180
@@ -0,0 +1,144 @@
+"""
+날짜 파서 정확성 테스트
+- 수집되는 날짜 형식 corpus에 대해 기존 dateutil 결과와 동일한지 확인
+- 상대 시간 / 형식 메모이제이션 / 캐시 / 파싱 불가 문자열
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from dateutil import parser as date_parser
+
+from app.utils.date_parser import FastDateParser, parse_date
+
+
+NOW = datetime(2025, 11, 28, 12, 0, 0, tzinfo=timezone.utc)
+KST = timezone(timedelta(hours=9))
+
+# (입력, 기대값) - 절대 날짜
+ABSOLUTE_CORPUS = [
+    ('2025-11-28T14:30:00Z', datetime(2025, 11, 28, 14, 30, tzinfo=timezone.utc)),
+    ('2025-11-28T14:30:00+00:00', datetime(2025, 11, 28, 14, 30, tzinfo=timezone.utc)),
+    ('2025-11-28T14:30:00.123456+09:00', datetime(2025, 11, 28, 14, 30, 0, 123456, tzinfo=KST)),
+    ('2025-11-28T14:30:00.123+09:00', datetime(2025, 11, 28, 14, 30, 0, 123000, tzinfo=KST)),
+    ('2025-11-28 23:00:00', datetime(2025, 11, 28, 23, 0, tzinfo=timezone.utc)),
+    ('2025-11-28', datetime(2025, 11, 28, tzinfo=timezone.utc)),
+    ('Nov 28, 2025', datetime(2025, 11, 28, tzinfo=timezone.utc)),
+    ('Nov 28, 2025 10:30AM', datetime(2025, 11, 28, 10, 30, tzinfo=timezone.utc)),
+    ('Nov 28, 2025 10:30PM', datetime(2025, 11, 28, 22, 30, tzinfo=timezone.utc)),
+    ('Nov 28, 2025 12:05AM', datetime(2025, 11, 28, 0, 5, tzinfo=timezone.utc)),
+    ('Nov 28, 2025 10:30 AM', datetime(2025, 11, 28, 10, 30, tzinfo=timezone.utc)),
+    ('November 28, 2025 10:30 AM', datetime(2025, 11, 28, 10, 30, tzinfo=timezone.utc)),
+    ('November 28, 2025', datetime(2025, 11, 28, tzinfo=timezone.utc)),
+    ('Sep 3, 2025', datetime(2025, 9, 3, tzinfo=timezone.utc)),
+    ('\xa0-\xa0Nov 27, 2025 01:00AM', datetime(2025, 11, 27, 1, 0, tzinfo=timezone.utc)),
+    (' - Nov 27, 2025 01:00AM ', datetime(2025, 11, 27, 1, 0, tzinfo=timezone.utc)),
+    ('28.11.2025', datetime(2025, 11, 28, tzinfo=timezone.utc)),
+    ('28.11.2025 14:30', datetime(2025, 11, 28, 14, 30, tzinfo=timezone.utc)),
+    ('11/28/2025', datetime(2025, 11, 28, tzinfo=timezone.utc)),
+    ('Friday, November 28, 2025', datetime(2025, 11, 28, tzinfo=timezone.utc)),  # dateutil 경로
+]
+
+# (입력, 기준 시각으로부터의 차이)
+RELATIVE_CORPUS = [
+    ('Just now', timedelta(0)),
+    ('Moments ago', timedelta(0)),
+    ('30 seconds ago', timedelta(seconds=30)),
+    ('1 minute ago', timedelta(minutes=1)),
+    ('15 minutes ago', timedelta(minutes=15)),
+    ('15 mins ago', timedelta(minutes=15)),
+    ('1 hour ago', timedelta(hours=1)),
+    ('an hour ago', timedelta(hours=1)),
+    ('13 hours ago', timedelta(hours=13)),
+    ('3 days ago', timedelta(days=3)),
+    ('a day ago', timedelta(days=1)),
+    ('1 week ago', timedelta(weeks=1)),
+    ('2 months ago', timedelta(days=60)),
+    ('\xa0-\xa09 hours ago', timedelta(hours=9)),
+    ('few minutes ago', timedelta(0)),
+]
+
+UNPARSEABLE = [None, '', '   ', '\xa0-\xa0', 'Sponsored', 'Read more', 'hours ago 2x']
+
+
+@pytest.fixture
+def parser():
+    return FastDateParser()
+
+
+@pytest.mark.parametrize('value, expected', ABSOLUTE_CORPUS)
+def test_absolute_formats(parser, value, expected):
+    """절대 날짜: 기대값과 일치, 항상 timezone-aware"""
+    parsed = parser.parse(value)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize('value, _', ABSOLUTE_CORPUS)
+def test_matches_dateutil(parser, value, _):
+    """기존 구현(dateutil + naive는 UTC)과 같은 결과"""
+    legacy = date_parser.parse(value.strip('\xa0- '))
+    if legacy.tzinfo is None:
+        legacy = legacy.replace(tzinfo=timezone.utc)
+    assert parser.parse(value) == legacy
+
+
+@pytest.mark.parametrize('value, delta', RELATIVE_CORPUS)
+def test_relative_formats(parser, value, delta):
+    """상대 시간: 기준 시각에서 뺀 값"""
+    assert parser.parse(value, now=NOW) == NOW - delta
+
+
+@pytest.mark.parametrize('value', UNPARSEABLE)
+def test_unparseable(parser, value):
+    assert parser.parse(value) is None
+
+
+def test_relative_is_not_cached(parser):
+    """상대 시간은 호출 시각 기준으로 매번 계산"""
+    first = parser.parse('2 hours ago', now=NOW)
+    later = parser.parse('2 hours ago', now=NOW + timedelta(hours=1))
+    assert later - first == timedelta(hours=1)
+
+
+def test_memoizes_last_format_per_source(parser):
+    """소스별로 마지막 성공 형식을 먼저 시도"""
+    parser.parse('Nov 28, 2025 10:30AM', source='investing')
+    parser.parse('2025-11-28T14:30:00Z', source='feed')
+    assert parser._last_format == {'investing': '%b %d, %Y %I:%M%p', 'feed': 'iso'}
+
+    parser.parse('Nov 27, 2025 09:15AM', source='investing')
+    assert parser.stats['strptime'] == 2
+    assert parser.stats['dateutil'] == 0
+
+
+def test_repeated_strings_hit_cache(parser):
+    """같은 문자열은 캐시에서 반환 (실패 포함)"""
+    parser.parse('Nov 28, 2025 10:30AM')
+    parser.parse('Nov 28, 2025 10:30AM')
+    parser.parse('Sponsored')
+    parser.parse('Sponsored')
+    assert parser.stats['cached'] == 1
+    assert parser.stats['failed'] == 2
+
+
+def test_cache_lookup_survives_concurrent_clear(parser):
+    """조회 도중 다른 스레드가 캐시를 비워도 KeyError 없이 다시 파싱"""
+    class ClearingCache(dict):
+        # 'in' 확인 직후 clear()가 끼어드는 상황 재현
+        def __contains__(self, key):
+            found = super().__contains__(key)
+            self.clear()
+            return found
+
+    parser._cache = ClearingCache()
+    parser.parse('Nov 28, 2025 10:30AM')
+    assert parser.parse('Nov 28, 2025 10:30AM') == datetime(2025, 11, 28, 10, 30, tzinfo=timezone.utc)
+    assert parser.stats['cached'] == 1
+
+def test_module_parse_date():
+    """싱글톤 헬퍼"""
+    assert parse_date('2025-11-28') == datetime(2025, 11, 28, tzinfo=timezone.utc)
@@ -0,0 +1,251 @@
+"""
+RSS/Atom 피드 수집 테스트 (로컬 HTTP 서버 + 피드 fixture, 외부 네트워크 없음)
+- 항목 정규화 (InvestingCrawler와 같은 딕셔너리 형태), 기간/중복 필터
+- ETag/Last-Modified 조건부 요청 -> 304, feed_states 저장
+- CrawlerService가 피드 항목을 save_news_items로 저장
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models.models import FeedState, StockMaster
+from app.services.crawler_service import CrawlerService
+from app.services.feed_source import FeedNewsSource, parse_feed_entries
+from app.services.news_sources import InvestingSource, SourceCoordinator
+from app.utils.config import Config
+
+FIXTURE_DIR = project_root / 'tests' / 'fixtures' / 'feeds'
+ITEM_KEYS = {'title', 'content', 'source_url', 'source_name', 'date', 'ticker', 'company_name'}
+
+
+def _render(name):
+    """fixture의 {recent_N} 자리에 최근 시각 채우기 (RSS: RFC 822, Atom: ISO 8601)"""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    recent = [now - timedelta(hours=1), now - timedelta(hours=2)]
+    text = (FIXTURE_DIR / name).read_text()
+    for i, value in enumerate(recent, start=1):
+        formatted = format_datetime(value) if name.endswith('rss.xml') else value.isoformat()
+        text = text.replace(f'{{recent_{i}}}', formatted)
+    return text.encode('utf-8')
+
+
+class FeedServer:
+    """ETag 또는 Last-Modified로 조건부 응답하는 로컬 피드 서버"""
+
+    def __init__(self):
+        self.feeds = {'/TSLA': _render('tsla_rss.xml'), '/NVDA': _render('nvda_atom.xml')}
+        self.mode = 'etag'
+        self.version = 1
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                body = server.feeds.get(self.path)
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                etag = f'"v{server.version}"'
+                modified = format_datetime(datetime(2026, 1, server.version, tzinfo=timezone.utc), usegmt=True)
+                if server.mode == 'etag' and self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                if server.mode == 'last_modified' and self.headers.get('If-Modified-Since') == modified:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/rss+xml')
+                if server.mode == 'etag':
+                    self.send_header('ETag', etag)
+                else:
+                    self.send_header('Last-Modified', modified)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def statuses(self):
+        return [headers.get('If-None-Match') or headers.get('If-Modified-Since') for _, headers in self.requests]
+
+
+@pytest.fixture
+def server():
+    server = FeedServer()
+    server.thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+@pytest.fixture
+def source(server):
+    source = FeedNewsSource([server.url + '/{ticker}'], timeout=5)
+    yield source
+    source.close()
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv('ENABLE_SCHEDULER', 'false')
+    app = create_app('testing')
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+class TestParse:
+    def test_rss_entries_match_crawler_shape(self):
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=6)
+        items = parse_feed_entries(_render('tsla_rss.xml'), 'TSLA', 'Tesla Inc', cutoff)
+
+        assert [i['source_url'].rsplit('/', 1)[1] for i in items] == [
+            'tesla-deliveries-beat-estimates-120000.html', 'tesla-panasonic-battery-093000.html'
+        ]
+        assert all(set(item) == ITEM_KEYS for item in items)
+        first, second = items
+        assert first['content'] == 'Tesla reported record quarterly deliveries.'
+        assert first['source_name'] == 'Yahoo! Finance: TSLA News'
+        assert second['title'] == 'Tesla & Panasonic expand battery partnership'
+        assert second['source_name'] == 'Reuters'
+        assert datetime.fromisoformat(first['date']) > cutoff
+        assert (first['ticker'], first['company_name']) == ('TSLA', 'Tesla Inc')
+
+    def test_atom_entries(self):
+        items = parse_feed_entries(_render('nvda_atom.xml'), 'NVDA', None,
+                                   datetime.now(timezone.utc) - timedelta(hours=6))
+        assert [i['title'] for i in items] == ['NVIDIA unveils next-generation data center GPU',
+                                               'NVIDIA stock hits all-time high']
+        assert items[0]['content'] == 'The new chip targets AI training workloads.'
+        assert items[0]['company_name'] == 'NVDA'
+
+    def test_invalid_content(self):
+        assert parse_feed_entries(b'', 'TSLA') == []
+        assert parse_feed_entries(b'<html><body>not a feed', 'TSLA') == []
+
+
+class TestConditionalGet:
+    def test_etag_returns_304_until_feed_changes(self, server, source):
+        assert len(source.poll('TSLA', 'Tesla Inc', hours_ago=6)) == 2
+        assert source.poll('TSLA', 'Tesla Inc', hours_ago=6) == []
+
+        server.version = 2
+        assert len(source.poll('TSLA', 'Tesla Inc', hours_ago=6)) == 2
+        assert server.statuses() == [None, '"v1"', '"v1"']
+
+    def test_last_modified(self, server, source):
+        server.mode = 'last_modified'
+        assert len(source.poll('nvda', hours_ago=6)) == 2
+        assert source.poll('NVDA', hours_ago=6) == []
+        assert server.statuses()[1] == 'Thu, 01 Jan 2026 00:00:00 GMT'
+
+    def test_state_persists_across_instances(self, app, server, source):
+        source.poll('TSLA', hours_ago=6)
+
+        state = db.session.get(FeedState, f'{server.url}/TSLA')
+        assert (state.ticker_symbol, state.etag, state.last_status, state.failure_count) == ('TSLA', '"v1"', 200, 0)
+
+        fresh = FeedNewsSource([server.url + '/{ticker}'])
+        assert fresh.poll('TSLA', hours_ago=6) == []
+        assert db.session.get(FeedState, f'{server.url}/TSLA').last_status == 304
+
+    def test_errors_are_counted(self, app, server, source):
+        assert source.poll('MISSING') == []
+        assert source.poll('MISSING') == []
+        assert db.session.get(FeedState, f'{server.url}/MISSING').failure_count == 2
+
+        unreachable = FeedNewsSource(['http://127.0.0.1:9/{ticker}'], timeout=1)
+        assert unreachable.poll('TSLA') == []
+
+
+class TestCrawlerServiceFeeds:
+    def test_feed_items_are_saved(self, app, server, source, monkeypatch):
+        monkeypatch.setattr(Config, 'NEWS_FEED_ENABLED', True)
+        db.session.add(StockMaster(ticker_symbol='TSLA', company_name='Tesla Inc'))
+        db.session.commit()
+
+        crawler = MagicMock()
+        crawler.__enter__.return_value = crawler
+        crawler.crawl_with_retry.return_value = ([{
+            'title': 'Investing story', 'content': '', 'source_url': 'https://www.investing.com/news/a',
+            'source_name': 'Investing.com', 'date': datetime.now(timezone.utc).isoformat(),
+            'ticker': 'TSLA', 'company_name': 'Tesla Inc'
+        }], None)
+        monkeypatch.setattr('app.services.news_sources.InvestingCrawler', lambda: crawler)
+
+        storage = MagicMock()
+        storage.check_duplicates.return_value = set()
+        storage.bulk_save_news.side_effect = lambda items: {'success': len(items)}
+        analyzer = MagicMock()
+        analyzer.batch_analyze.side_effect = lambda items: items
+
+        coordinator = SourceCoordinator([InvestingSource(), source])
+        service = CrawlerService(db.session, storage, analyzer, coordinator=coordinator)
+        result = service.crawl_ticker('TSLA', hours_ago=6)
+
+        assert result['status'] == 'SUCCESS' and result['count'] == 3
+        saved = storage.bulk_save_news.call_args[0][0]
+        assert [item['source_name'] for item in saved] == ['Investing.com', 'Yahoo! Finance: TSLA News', 'Reuters']
+        assert all(item['published_date'] for item in saved)
+
+        # 브라우저 크롤링이 실패해도 피드 항목은 저장 (변경 없는 피드는 304 -> 저장할 항목 없음)
+        crawler.crawl_with_retry.return_value = ([], 'blocked')
+        server.version = 2
+        result = service.crawl_ticker('TSLA', hours_ago=6)
+        assert (result['status'], result['count'], result['error']) == ('PARTIAL', 2, 'investing: blocked')
+        coordinator.shutdown()
+
+    def test_validators_kept_until_items_are_saved(self, app, server, source, monkeypatch):
+        """저장 실패 시 새 ETag를 반영하지 않아 다음 수집에서 본문을 다시 받아 저장"""
+        monkeypatch.setattr(Config, 'NEWS_FEED_ENABLED', True)
+        db.session.add(StockMaster(ticker_symbol='TSLA', company_name='Tesla Inc'))
+        db.session.commit()
+
+        storage = MagicMock()
+        storage.check_duplicates.return_value = set()
+        storage.bulk_save_news.return_value = {'success': 0, 'failed': 2, 'total': 2, 'errors': ['database is locked']}
+        analyzer = MagicMock()
+        analyzer.batch_analyze.side_effect = lambda items: items
+
+        coordinator = SourceCoordinator([source])
+        service = CrawlerService(db.session, storage, analyzer, coordinator=coordinator)
+        assert service.crawl_ticker('TSLA', hours_ago=6)['status'] == 'FAILED'
+        assert db.session.get(FeedState, f'{server.url}/TSLA').etag is None
+
+        storage.bulk_save_news.return_value = None
+        storage.bulk_save_news.side_effect = lambda items: {'success': len(items)}
+        result = service.crawl_ticker('TSLA', hours_ago=6)
+        assert (result['status'], result['count']) == ('SUCCESS', 2)
+        assert db.session.get(FeedState, f'{server.url}/TSLA').etag == '"v1"'
+
+        # 저장 후에는 조건부 요청 -> 304
+        assert service.crawl_ticker('TSLA', hours_ago=6)['count'] == 0
+        assert server.statuses() == [None, None, '"v1"']
+        coordinator.shutdown()
+
+    def test_disabled_by_default(self, source):
+        assert Config.NEWS_FEED_ENABLED is False
+        assert not source.enabled()
@@ -0,0 +1,125 @@
+"""
+렉시콘 감성 분석 테스트
+- 토큰 단위 매칭, 부정어 범위, 구 우선 매칭
+- score_batch (NumPy/순수 파이썬 집계 결과 일치)
+- 라벨 평가 세트 정확도
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import csv
+
+import pytest
+
+from app.services.lexicon_sentiment import LexiconSentimentAnalyzer, get_lexicon_sentiment
+
+EVAL_SET = project_root / 'tests' / 'fixtures' / 'sentiment' / 'labelled_headlines.csv'
+
+
+@pytest.fixture
+def analyzer():
+    return LexiconSentimentAnalyzer()
+
+
+class TestMatching:
+    """용어 매칭"""
+
+    def test_no_substring_matches(self, analyzer):
+        """'cut'이 'execute'에, 'down'이 'download'에 매칭되지 않음"""
+        assert analyzer.matched_terms('Nvidia executes stock split; app downloads climb') == [('climb', 1.0)]
+        assert analyzer.score('Nvidia executes stock split as planned')['classification'] == 'neutral'
+
+    def test_phrase_preferred_over_word(self, analyzer):
+        assert analyzer.matched_terms('Apple beats estimates') == [('beats estimates', 3.0)]
+        assert analyzer.matched_terms('Intel cuts guidance') == [('cuts guidance', -3.0)]
+
+    def test_hyphenated_and_curly_apostrophe(self, analyzer):
+        assert analyzer.matched_terms('Shares hit an all-time high') == [('all-time high', 2.5)]
+        assert analyzer.matched_terms('Netflix doesn’t expect growth')[0][1] < 0
+
+    def test_negation_window(self, analyzer):
+        assert analyzer.matched_terms('Micron is not seeing a rebound') == [('rebound', -1.125)]
+        # 윈도 밖 용어는 반전하지 않음
+        assert analyzer.matched_terms('No comment was given by the company on growth') == [('growth', 1.5)]
+
+    def test_negation_reset_at_clause_break(self, analyzer):
+        hits = analyzer.matched_terms('Not a surprise. Revenue surged')
+        assert hits == [('surged', 2.0)]
+        hits = analyzer.matched_terms('no recall, but shares plunge')
+        assert hits == [('recall', 1.5), ('plunge', -2.5)]
+
+    def test_custom_lexicon(self):
+        custom = LexiconSentimentAnalyzer(lexicon={'moon': 3.0, 'Rug Pull': -3.0})
+        assert custom.score('Token goes to the moon')['classification'] == 'positive'
+        assert custom.score('Another rug   pull')['classification'] == 'negative'
+
+
+class TestScoring:
+    """점수/분류"""
+
+    def test_score_range_and_shape(self, analyzer):
+        result = analyzer.score('Stock soars, surges, jumps and rallies to record high on record revenue')
+        assert result['classification'] == 'positive'
+        assert 0 < result['score'] <= 10
+        assert -1.0 <= result['compound'] <= 1.0
+
+    def test_title_weighted_over_content(self, analyzer):
+        result = analyzer.score('Tesla shares plunge', 'Analysts noted some growth in other segments.')
+        assert result['classification'] == 'negative'
+
+    def test_empty_text_is_neutral(self, analyzer):
+        assert analyzer.score('', None) == {'classification': 'neutral', 'score': 0, 'compound': 0.0}
+        assert analyzer.score_batch([]) == []
+
+    def test_batch_matches_single(self, analyzer):
+        titles = ['Apple beats estimates', 'Nike misses estimates', 'Apple to hold conference']
+        contents = ['Strong quarter.', '', None]
+        batch = analyzer.score_batch(titles, contents)
+        assert batch == [analyzer.score(t, c) for t, c in zip(titles, contents)]
+
+    def test_batch_length_mismatch(self, analyzer):
+        with pytest.raises(ValueError):
+            analyzer.score_batch(['a', 'b'], ['only one'])
+
+    def test_numpy_and_python_aggregation_agree(self):
+        with open(EVAL_SET, newline='', encoding='utf-8') as f:
+            titles = [row['title'] for row in csv.DictReader(f)]
+        assert LexiconSentimentAnalyzer().use_numpy
+        vectorized = LexiconSentimentAnalyzer(use_numpy=True).score_batch(titles)
+        pure = LexiconSentimentAnalyzer(use_numpy=False).score_batch(titles)
+        assert [r['score'] for r in vectorized] == [r['score'] for r in pure]
+        assert [r['classification'] for r in vectorized] == [r['classification'] for r in pure]
+
+    def test_singleton(self):
+        assert get_lexicon_sentiment() is get_lexicon_sentiment()
+
+
+class TestEvaluationSet:
+    """라벨 평가 세트"""
+
+    def test_accuracy(self, analyzer):
+        with open(EVAL_SET, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        predicted = analyzer.score_batch([row['title'] for row in rows])
+        correct = sum(1 for row, result in zip(rows, predicted) if row['label'] == result['classification'])
+        assert len(rows) >= 60
+        assert correct / len(rows) >= 0.9
+
+
+class TestAnalyzerFallback:
+    """NewsAnalyzer fallback 연동"""
+
+    def test_fallback_uses_lexicon(self):
+        from app.services.news_analyzer import NewsAnalyzer
+
+        analyzer = NewsAnalyzer(api_key='')
+        result = analyzer.analyze_news(
+            title='Intel shares plunge after company cuts guidance',
+            content='The chipmaker will execute a restructuring plan.',
+            ticker='INTC'
+        )
+        assert result['sentiment']['classification'] == 'negative'
+        assert -10 <= result['sentiment']['score'] < 0
+        assert set(result['sentiment']) == {'classification', 'score'}
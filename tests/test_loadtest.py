@@ -0,0 +1,87 @@
+"""
+오프라인 부하 테스트 하네스 테스트
+- stand-in(ES / OpenAI / SMTP)만으로 crawl -> analyze -> store -> email 파이프라인과
+  뉴스 라우트가 오류 없이 동작하는지 소규모로 확인
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import smtplib
+
+import pytest
+from openai import OpenAI
+
+from tests.loadtest.fake_es import matches
+from tests.loadtest.harness import LoadTestHarness, format_report, percentile
+from tests.loadtest.mock_openai import MockOpenAIServer
+from tests.loadtest.smtp_sink import SMTPSink
+
+
+class TestStandIns:
+    """stand-in 단위 테스트"""
+
+    def test_fake_es_query_subset(self):
+        doc = {
+            'ticker_symbol': 'TSLA',
+            'title': 'Tesla beats estimates',
+            'published_date': '2025-11-28T10:00:00+00:00',
+            'sentiment': {'classification': 'positive', 'score': 5}
+        }
+        query = {'bool': {
+            'must': [
+                {'terms': {'ticker_symbol': ['TSLA', 'AAPL']}},
+                {'range': {'published_date': {'gte': '2025-11-28T09:00:00Z'}}},
+                {'multi_match': {'query': 'beats', 'fields': ['title^2', 'content']}}
+            ],
+            'must_not': [{'term': {'sentiment.classification': 'negative'}}]
+        }}
+        assert matches(doc, query)
+        assert not matches(doc, {'range': {'sentiment.score': {'gt': 5}}})
+
+    def test_mock_openai_rate_limit(self):
+        with MockOpenAIServer(rate_limit_ratio=1.0) as server:
+            client = OpenAI(api_key='sk-test', base_url=server.base_url, max_retries=0)
+            with pytest.raises(Exception) as exc_info:
+                client.chat.completions.create(model='gpt-4o-mini', messages=[{'role': 'user', 'content': 'hi'}])
+            assert getattr(exc_info.value, 'status_code', None) == 429
+            assert server.counters['rate_limited'] == 1
+
+    def test_smtp_sink_receives_mail(self):
+        with SMTPSink() as sink:
+            with smtplib.SMTP(sink.host, sink.port) as smtp:
+                smtp.ehlo()
+                smtp.login('user', 'password')
+                smtp.sendmail('a@example.com', 'b@example.com', 'Subject: hi\r\n\r\nbody')
+            assert sink.message_count == 1
+            assert sink.messages[0]['to'] == ['<b@example.com>']
+
+    def test_percentile(self):
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 95) == 0
+
+
+class TestLoadTestHarness:
+    """하네스 end-to-end 실행"""
+
+    def test_end_to_end_run(self):
+        with LoadTestHarness(concurrency=3, users=2, articles_per_crawl=4, openai_rate_limit_ratio=0.2) as harness:
+            report = harness.run(iterations=6)
+
+        pipeline = report['scenarios']['pipeline']['operations']
+        assert pipeline['pipeline']['count'] == 6
+        assert 'pipeline.analyze' in pipeline and 'pipeline.store' in pipeline
+
+        for result in report['scenarios'].values():
+            for name, stats in result['operations'].items():
+                assert stats['errors'] == 0, name
+                assert stats['p50_ms'] <= stats['p95_ms'] <= stats['p99_ms']
+
+        stand_ins = report['stand_ins']
+        assert stand_ins['elasticsearch']['documents'] > 0
+        assert stand_ins['smtp']['messages'] == 6
+        assert stand_ins['openai']['completed'] > 0
+        assert 'route /news/api/history' in format_report(report)
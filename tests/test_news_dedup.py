@@ -0,0 +1,280 @@
+"""
+유사 중복 기사 클러스터링 테스트
+- SimHash 지문/거리, 배치 내 클러스터링, 최근 클러스터 인덱스
+- batch_analyze: 클러스터당 1회 분석 후 결과 공유
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.news_dedup import (
+    NearDuplicateIndex, cluster_fingerprints, extract_features, fingerprint_item, hamming_distance, simhash
+)
+
+
+TESLA_TITLE = 'Tesla recalls over 2 million vehicles in US over Autopilot safety concerns'
+TESLA_CONTENT = (
+    "Tesla is recalling more than 2 million vehicles in the United States to install new safeguards in its "
+    "Autopilot advanced driver-assistance system, after a two-year investigation by the top U.S. auto safety "
+    "regulator found the system's method of ensuring driver attention can be inadequate and can lead to "
+    "foreseeable misuse of the system. The recall covers nearly all of the vehicles Tesla has sold in the "
+    "United States and was issued on Wednesday."
+)
+NVIDIA_TITLE = 'Nvidia shares rise after earnings beat estimates on data center demand'
+NVIDIA_CONTENT = (
+    "Nvidia reported quarterly revenue that beat Wall Street estimates as demand for its data center chips used "
+    "in artificial intelligence remained strong, sending shares higher in extended trading on Wednesday."
+)
+
+
+def make_item(title, content, ticker, url):
+    return {'title': title, 'content': content, 'ticker': ticker, 'url': url}
+
+
+def fake_analysis(title):
+    return {
+        'summary': {'ko': f'요약: {title}', 'en': f'summary: {title}'},
+        'sentiment': {'classification': 'negative', 'score': -40},
+    }
+
+
+class TestSimHash:
+    """지문/거리"""
+
+    def test_syndicated_variants_are_close(self):
+        base = simhash(extract_features(TESLA_TITLE, TESLA_CONTENT))
+        variants = [
+            (TESLA_TITLE + ' - Reuters', TESLA_CONTENT),
+            (TESLA_TITLE, TESLA_CONTENT + ' Shares fell 1% in premarket trading.'),
+        ]
+        for title, content in variants:
+            assert hamming_distance(base, simhash(extract_features(title, content))) <= 3
+
+    def test_unrelated_stories_are_far(self):
+        tesla = simhash(extract_features(TESLA_TITLE, TESLA_CONTENT))
+        nvidia = simhash(extract_features(NVIDIA_TITLE, NVIDIA_CONTENT))
+        assert hamming_distance(tesla, nvidia) > 10
+
+    def test_fingerprint_is_stable(self):
+        """프로세스 해시 시드와 무관한 지문"""
+        assert simhash(['tesla', 'recall']) == simhash(['tesla', 'recall'])
+        assert simhash([]) == 0
+
+    def test_short_items_not_fingerprinted(self):
+        assert fingerprint_item({'title': 'News 1', 'content': 'Content 1'}) is None
+        assert fingerprint_item({'title': TESLA_TITLE, 'content': TESLA_CONTENT}) is not None
+
+    def test_description_used_when_content_missing(self):
+        item = {'title': TESLA_TITLE, 'description': TESLA_CONTENT}
+        assert fingerprint_item(item) == fingerprint_item({'title': TESLA_TITLE, 'content': TESLA_CONTENT})
+
+
+class TestClusterFingerprints:
+    """배치 내 클러스터링"""
+
+    def test_groups_within_distance(self):
+        base = 0b1011_0000
+        fingerprints = [base, base ^ 0b1, 1 << 63, base ^ 0b11, None]
+        clusters = cluster_fingerprints(fingerprints, max_distance=3)
+        assert clusters == [[0, 1, 3], [2], [4]]
+
+    def test_distance_zero_requires_exact_match(self):
+        clusters = cluster_fingerprints([5, 5, 4], max_distance=0)
+        assert clusters == [[0, 1], [2]]
+
+    def test_transitive_members_join(self):
+        # 0-1, 1-2 거리 2 / 0-2 거리 4 -> 한 클러스터
+        clusters = cluster_fingerprints([0b0000, 0b0011, 0b1111], max_distance=2)
+        assert clusters == [[0, 1, 2]]
+
+
+class TestNearDuplicateIndex:
+    """최근 클러스터 인덱스"""
+
+    def test_claim_then_find(self):
+        index = NearDuplicateIndex(max_distance=3, window_hours=1, max_entries=100)
+        entry, owner = index.claim([0b1010])
+        assert owner is True
+        assert entry.cluster_id == f'{0b1010:016x}'
+
+        again, owner = index.claim([0b1011])
+        assert owner is False
+        assert again is entry
+        assert index.find((1 << 64) - 1) is None
+
+    def test_release_forgets_cluster(self):
+        index = NearDuplicateIndex(max_distance=3, window_hours=1, max_entries=100)
+        entry, _ = index.claim([7, 15])
+        index.release(entry)
+        assert len(index) == 0
+        assert entry.wait(0) is None
+        assert index.claim([7])[1] is True
+
+    def test_expired_entries_pruned(self):
+        index = NearDuplicateIndex(max_distance=3, window_hours=0.0001, max_entries=100)
+        index.claim([1])
+        time.sleep(0.5)
+        assert index.find(1) is None
+        assert len(index) == 0
+
+    def test_max_entries_drops_oldest(self):
+        index = NearDuplicateIndex(max_distance=0, window_hours=1, max_entries=2)
+        for fingerprint in (1, 2, 4):
+            index.claim([fingerprint])
+        index.find(8)
+        assert len(index) == 2
+        assert index.find(1) is None
+        assert index.find(4) is not None
+
+
+class TestBatchAnalyzeDedup:
+    """batch_analyze 클러스터 공유"""
+
+    @pytest.fixture(autouse=True)
+    def no_triage(self, monkeypatch):
+        """관련도 분류 없이 모든 기사를 전체 분석 경로로"""
+        from app.utils.config import Config
+        monkeypatch.setattr(Config, 'NEWS_TRIAGE_ENABLED', False)
+
+    @pytest.fixture
+    def analyzer(self):
+        from app.services.news_analyzer import NewsAnalyzer
+        analyzer = NewsAnalyzer(api_key='test-key', dedup_index=NearDuplicateIndex(max_distance=3))
+        analyzer.analyze_news = Mock(side_effect=lambda title, **kwargs: fake_analysis(title))
+        return analyzer
+
+    def test_cluster_analyzed_once(self, analyzer):
+        items = [
+            make_item(TESLA_TITLE, TESLA_CONTENT, 'TSLA', 'https://a.example/1'),
+            make_item(NVIDIA_TITLE, NVIDIA_CONTENT, 'NVDA', 'https://b.example/1'),
+            make_item(TESLA_TITLE + ' - Reuters', TESLA_CONTENT + ' Shares fell 1%.', 'GM', 'https://c.example/1'),
+            make_item('News 1', 'Content 1', 'AAPL', 'https://d.example/1'),
+        ]
+
+        result = analyzer.batch_analyze(items)
+
+        assert analyzer.analyze_news.call_count == 3
+        assert [item['url'] for item in result] == [item['url'] for item in items]
+        assert result[0]['cluster_id'] == result[2]['cluster_id']
+        assert result[0]['cluster_id'] != result[1]['cluster_id']
+        assert 'cluster_id' not in result[3]
+        # 본문이 긴 기사가 대표로 분석됨
+        analyzed_titles = [call.kwargs['title'] for call in analyzer.analyze_news.call_args_list]
+        assert TESLA_TITLE + ' - Reuters' in analyzed_titles
+        assert TESLA_TITLE not in analyzed_titles
+
+    def test_shared_summary_is_copied(self, analyzer):
+        items = [
+            make_item(TESLA_TITLE, TESLA_CONTENT, 'TSLA', 'https://a.example/1'),
+            make_item(TESLA_TITLE, TESLA_CONTENT, 'F', 'https://b.example/1'),
+        ]
+        result = analyzer.batch_analyze(items)
+
+        assert result[0]['summary'] == result[1]['summary']
+        assert result[0]['summary'] is not result[1]['summary']
+        result[0]['sentiment']['score'] = 0
+        assert result[1]['sentiment']['score'] == -40
+
+    def test_reuses_previous_batch(self, analyzer):
+        analyzer.batch_analyze([make_item(TESLA_TITLE, TESLA_CONTENT, 'TSLA', 'https://a.example/1')])
+        result = analyzer.batch_analyze([
+            make_item(TESLA_TITLE + ' - Reuters', TESLA_CONTENT, 'GM', 'https://c.example/1')
+        ])
+
+        assert analyzer.analyze_news.call_count == 1
+        assert result[0]['sentiment']['classification'] == 'negative'
+
+    def test_failed_cluster_retried_next_batch(self, analyzer):
+        """모델 분석 실패 시 기본 분석을 쓰되 공유하지 않음 -> 다음 배치에서 다시 분석"""
+        analyzer.analyze_news.side_effect = [None, fake_analysis(TESLA_TITLE)]
+        item = make_item(TESLA_TITLE, TESLA_CONTENT, 'TSLA', 'https://a.example/1')
+
+        first = analyzer.batch_analyze([dict(item)])
+        assert set(first[0]['summary']) == {'en'}
+        assert analyzer.analyze_news.call_args.kwargs['fallback'] is False
+
+        second = analyzer.batch_analyze([dict(item)])
+        assert second[0]['summary'] == fake_analysis(TESLA_TITLE)['summary']
+        assert analyzer.analyze_news.call_count == 2
+
+    def test_api_error_fallback_not_shared(self):
+        """GPT 오류로 생긴 기본 분석은 이후 같은 기사에 재사용하지 않음"""
+        from app.services.news_analyzer import SUMMARY_LANGUAGES, NewsAnalyzer
+
+        analyzer = NewsAnalyzer(api_key='test-key', dedup_index=NearDuplicateIndex(max_distance=3))
+        analyzer.client = Mock()
+        analyzer.client.chat.completions.create.side_effect = RuntimeError('rate limited')
+
+        first = analyzer.batch_analyze([make_item(TESLA_TITLE, TESLA_CONTENT, 'TSLA', 'https://a.example/1')])
+        assert set(first[0]['summary']) == {'en'}
+
+        analyzer.client.chat.completions.create.side_effect = None
+        analyzer.client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content=json.dumps({
+                **{f'summary_{language}': 'Tesla recalls vehicles' for language in SUMMARY_LANGUAGES},
+                'sentiment': {'classification': 'Negative', 'score': -4}
+            })), finish_reason='stop')],
+            model='gpt-4o-mini', usage=None
+        )
+        second = analyzer.batch_analyze([make_item(TESLA_TITLE + ' - Reuters', TESLA_CONTENT, 'GM', 'https://c.example/1')])
+
+        assert analyzer.client.chat.completions.create.call_count == 2
+        assert second[0]['summary']['ko'] == 'Tesla recalls vehicles'
+
+    def test_concurrent_threads_wait_for_owner(self):
+        """다른 티커 스레드가 같은 기사를 동시에 분석하면 한 번만 호출"""
+        from app.services.news_analyzer import NewsAnalyzer
+
+        index = NearDuplicateIndex(max_distance=3)
+        started = threading.Event()
+
+        def slow_analysis(title, **kwargs):
+            started.set()
+            time.sleep(0.2)
+            return fake_analysis(title)
+
+        calls = Mock(side_effect=slow_analysis)
+        results = {}
+
+        def run(ticker):
+            analyzer = NewsAnalyzer(api_key='test-key', dedup_index=index)
+            analyzer.analyze_news = calls
+            results[ticker] = analyzer.batch_analyze([
+                make_item(TESLA_TITLE, TESLA_CONTENT, ticker, f'https://{ticker}.example/1')
+            ])
+
+        first = threading.Thread(target=run, args=('TSLA',))
+        first.start()
+        started.wait(5)
+        second = threading.Thread(target=run, args=('GM',))
+        second.start()
+        first.join(5)
+        second.join(5)
+
+        assert calls.call_count == 1
+        assert results['TSLA'][0]['cluster_id'] == results['GM'][0]['cluster_id']
+        assert results['GM'][0]['summary'] == results['TSLA'][0]['summary']
+
+    def test_disabled_analyzes_every_item(self, monkeypatch):
+        from app.services.news_analyzer import NewsAnalyzer
+        from app.utils.config import Config
+
+        monkeypatch.setattr(Config, 'NEWS_DEDUP_ENABLED', False)
+        analyzer = NewsAnalyzer(api_key='test-key')
+        analyzer.analyze_news = Mock(side_effect=lambda title, **kwargs: fake_analysis(title))
+
+        result = analyzer.batch_analyze([
+            make_item(TESLA_TITLE, TESLA_CONTENT, 'TSLA', 'https://a.example/1'),
+            make_item(TESLA_TITLE, TESLA_CONTENT, 'F', 'https://b.example/1'),
+        ])
+
+        assert analyzer.analyze_news.call_count == 2
+        assert all('cluster_id' not in item for item in result)
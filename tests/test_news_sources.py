@@ -0,0 +1,158 @@
+"""
+뉴스 소스 플러그인 / 코디네이터 테스트
+- 소스 우선순위 순 병합과 소스 간 URL 중복 제거
+- 소스별 동시 실행 예산 (브라우저 좁게, HTTP 넓게), 요청 간격
+- 소스 실패 격리, 앱 컨텍스트/계측 trace 전달
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import has_app_context
+
+from app import create_app
+from app.services.crawl_metrics import crawl_trace
+from app.services.news_sources import (
+    COST_BROWSER, COST_HTTP, NewsSource, NewsSourceError, SourceCoordinator,
+    get_default_sources, normalize_url
+)
+from app.utils.config import Config
+
+
+class FakeSource(NewsSource):
+    """호출 시점/동시 실행 수를 기록하는 테스트 소스"""
+
+    def __init__(self, name, cost_class=COST_HTTP, urls=(), delay=0.0, error=None, concurrency=None):
+        self.name = name
+        self.cost_class = cost_class
+        self.urls = list(urls)
+        self.delay = delay
+        self.error = error
+        self.concurrency = concurrency
+        self.active = 0
+        self.peak = 0
+        self.starts = []
+        self.contexts = []
+        self._lock = threading.Lock()
+
+    @property
+    def max_concurrency(self):
+        return self.concurrency or super().max_concurrency
+
+    def fetch(self, ticker, company_name, hours_ago, max_retries=1):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.starts.append(time.monotonic())
+            self.contexts.append(has_app_context())
+        try:
+            time.sleep(self.delay)
+            if self.error:
+                raise self.error
+            return self.urls
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def parse(self, raw, ticker, company_name, hours_ago):
+        return [{'title': url, 'source_url': url, 'source_name': self.name, 'ticker': ticker} for url in raw]
+
+
+@pytest.fixture
+def coordinators():
+    created = []
+
+    def make(sources):
+        coordinator = SourceCoordinator(sources)
+        created.append(coordinator)
+        return coordinator
+
+    yield make
+    for coordinator in created:
+        coordinator.shutdown()
+
+
+def test_normalize_url():
+    assert normalize_url('HTTPS://Example.com/news/a/?utm_source=rss&id=3#top') == 'https://example.com/news/a?id=3'
+    assert normalize_url('https://example.com/news/a') == normalize_url('https://example.com/news/a/')
+    assert normalize_url(None) == ''
+
+
+def test_merge_keeps_priority_order_and_dedups(coordinators):
+    browser = FakeSource('browser', COST_BROWSER, ['https://a.com/1', 'https://a.com/2'])
+    feed = FakeSource('feed', COST_HTTP, ['https://a.com/2/?utm_medium=rss', 'https://b.com/3'])
+
+    result = coordinators([browser, feed]).collect('TSLA', 'Tesla Inc', hours_ago=6)
+
+    assert [item['source_url'] for item in result['items']] == ['https://a.com/1', 'https://a.com/2', 'https://b.com/3']
+    assert result['errors'] == {}
+    assert result['sources']['feed']['count'] == 2 and result['sources']['feed']['duplicates'] == 1
+
+
+def test_source_failures_are_isolated(coordinators):
+    broken = FakeSource('broken', error=NewsSourceError('blocked'))
+    crashing = FakeSource('crashing', error=RuntimeError('boom'))
+    working = FakeSource('working', urls=['https://a.com/1'])
+    disabled = FakeSource('disabled', urls=['https://a.com/2'])
+    disabled.enabled = lambda: False
+
+    result = coordinators([broken, crashing, working, disabled]).collect('TSLA', 'Tesla Inc')
+
+    assert [item['source_url'] for item in result['items']] == ['https://a.com/1']
+    assert result['errors'] == {'broken': 'blocked', 'crashing': 'boom'}
+    assert 'disabled' not in result['sources'] and disabled.starts == []
+
+
+def test_budgets_keep_browsers_narrow_and_http_wide(coordinators, monkeypatch):
+    monkeypatch.setattr(Config, 'CRAWL_MAX_CONCURRENCY', 1)
+    monkeypatch.setattr(Config, 'NEWS_SOURCE_HTTP_CONCURRENCY', 4)
+    browser = FakeSource('browser', COST_BROWSER, ['https://a.com/1'], delay=0.05)
+    feed = FakeSource('feed', COST_HTTP, ['https://b.com/1'], delay=0.05)
+    coordinator = coordinators([browser, feed])
+
+    # 여러 티커 워커가 코디네이터 하나를 공유
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda t: coordinator.collect(t, t), ['A', 'B', 'C', 'D']))
+
+    assert all(len(r['items']) == 2 for r in results)
+    assert browser.peak == 1
+    assert feed.peak > 1
+    budgets = {b['source']: b for b in coordinator.budgets()}
+    assert (budgets['browser']['max_concurrency'], budgets['feed']['max_concurrency']) == (1, 4)
+    assert budgets['browser']['completed'] == 4 and budgets['browser']['in_flight'] == 0
+
+
+def test_min_interval_spaces_requests(coordinators):
+    feed = FakeSource('feed', urls=['https://a.com/1'], concurrency=4)
+    feed.min_interval = 0.05
+    coordinator = coordinators([feed])
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda t: coordinator.collect(t, t), ['A', 'B', 'C']))
+
+    starts = sorted(feed.starts)
+    assert all(b - a >= 0.04 for a, b in zip(starts, starts[1:]))
+
+
+def test_app_context_and_trace_are_propagated(coordinators, monkeypatch):
+    monkeypatch.setenv('ENABLE_SCHEDULER', 'false')
+    app = create_app('testing')
+    source = FakeSource('feed', urls=['https://a.com/1'])
+    coordinator = coordinators([source])
+
+    with app.app_context(), crawl_trace('TSLA') as trace:
+        coordinator.collect('TSLA', 'Tesla Inc')
+
+    assert source.contexts == [True]
+    assert 'source_feed' in trace.totals()
+
+
+def test_default_sources_follow_config(monkeypatch):
+    monkeypatch.setattr(Config, 'NEWS_SOURCES', 'feed, investing, unknown')
+    assert [source.name for source in get_default_sources()] == ['feed', 'investing']
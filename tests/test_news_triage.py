@@ -0,0 +1,215 @@
+"""
+관련도 분류(triage) 테스트
+- 티커/회사명 언급, 모음 기사 제목, 본문 길이에 따른 full/light/skip 경로
+- batch_analyze: full만 GPT 분석, light는 로컬 분석, skip은 결과에서 제외
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.news_triage import (
+    ROUTE_FULL, ROUTE_LIGHT, ROUTE_SKIP, RelevanceTriage, company_aliases
+)
+
+TESLA_BODY = (
+    "Tesla Inc delivered more vehicles than analysts expected in the third quarter, the electric carmaker said "
+    "on Monday, helped by price cuts and cheaper financing. Tesla shares rose 3% in premarket trading after the "
+    "report, which showed deliveries of 435,000 vehicles compared with estimates of 420,000."
+)
+ROUNDUP_BODY = (
+    "U.S. stocks were mixed on Tuesday as investors digested a fresh batch of economic data and awaited the "
+    "Federal Reserve decision. Energy shares led gains while technology names lagged, and bond yields edged "
+    "higher. Treasury auctions this week are expected to draw solid demand, strategists said, while oil prices "
+    "steadied after a two-day slide. Among individual movers, Tesla was little changed after a volatile session earlier in the week."
+)
+
+
+def make_item(title, content, ticker='TSLA', company_name='Tesla, Inc.'):
+    return {'title': title, 'content': content, 'ticker': ticker, 'company_name': company_name,
+            'source_url': f'https://example.com/{abs(hash(title))}'}
+
+
+@pytest.fixture
+def triage():
+    return RelevanceTriage(full_threshold=0.4, light_threshold=0.2, min_content_chars=200)
+
+
+class TestCompanyAliases:
+    """회사명 별칭"""
+
+    def test_strips_legal_suffixes(self):
+        assert company_aliases('Tesla, Inc.') == ['tesla, inc.', 'tesla']
+        assert company_aliases('Alphabet Inc. Class A') == ['alphabet inc. class a', 'alphabet']
+        assert company_aliases('The Coca-Cola Company') == ['the coca-cola company', 'coca-cola']
+
+    def test_empty(self):
+        assert company_aliases(None) == []
+        assert company_aliases('') == []
+
+    def test_brand_alias(self):
+        """헤드라인에서 쓰는 첫 단어/도메인 없는 이름"""
+        assert company_aliases('Amazon.com Inc.')[-1] == 'amazon'
+        assert company_aliases('Meta Platforms Inc.')[-1] == 'meta'
+        assert company_aliases('JPMorgan Chase & Co.')[-1] == 'jpmorgan'
+        # 일반 단어인 첫 단어는 별칭으로 쓰지 않음
+        assert company_aliases('General Motors Company') == ['general motors company', 'general motors']
+
+
+class TestRelevanceScore:
+    """점수/경로"""
+
+    def test_company_story_full(self, triage):
+        decision = triage.score(make_item('Tesla deliveries beat estimates', TESLA_BODY))
+        assert decision['route'] == ROUTE_FULL
+        assert 'title_mention' in decision['reasons']
+        assert 'lead_mention' in decision['reasons']
+
+    def test_empty_content_is_light(self, triage):
+        """JS 파서처럼 본문 없이 제목만 수집된 기사"""
+        decision = triage.score(make_item('Tesla deliveries beat estimates', ''))
+        assert decision['route'] == ROUTE_LIGHT
+        assert 'short_content' in decision['reasons']
+
+    def test_roundup_with_passing_mention_skipped(self, triage):
+        decision = triage.score(make_item('Stock market today: Dow slips as Fed meeting looms', ROUNDUP_BODY))
+        assert decision['route'] == ROUTE_SKIP
+        assert 'roundup_title' in decision['reasons']
+
+    def test_multi_ticker_title_penalized(self, triage):
+        title = 'Apple (AAPL), Nvidia (NVDA) and Microsoft (MSFT) lead tech rebound'
+        decision = triage.score(make_item(title, ROUNDUP_BODY))
+        assert 'other_tickers=3' in decision['reasons']
+        assert decision['route'] == ROUTE_SKIP
+
+    def test_ticker_match_is_case_sensitive_word(self, triage):
+        """짧은 티커가 일반 단어/다른 단어 일부에 매칭되지 않음"""
+        item = make_item('Ford recalls trucks', 'The company on Monday said it will recall trucks. ' * 5,
+                         ticker='F', company_name=None)
+        assert triage.score(item)['reasons'] == []
+        item['title'] = 'Ford Motor (F) recalls trucks'
+        assert 'title_mention' in triage.score(item)['reasons']
+
+    def test_body_mentions_without_title_still_full(self, triage):
+        decision = triage.score(make_item('Musk says robotaxi launch is on track', TESLA_BODY))
+        assert decision['route'] == ROUTE_FULL
+
+    def test_unrelated_body_is_light(self, triage):
+        body = 'The report covered a range of topics across the automotive industry. ' * 5
+        decision = triage.score(make_item('Automakers face new emissions rules', body))
+        assert decision['route'] == ROUTE_LIGHT
+        assert decision['score'] == pytest.approx(0.2)
+
+    @pytest.mark.parametrize('ticker, company_name, title', [
+        # scripts/init_db.py 기본 종목
+        ('AMZN', 'Amazon.com Inc.', 'Amazon beats estimates as AWS growth accelerates'),
+        ('META', 'Meta Platforms Inc.', 'Meta unveils new AI glasses, shares jump'),
+        ('NVDA', 'NVIDIA Corporation', 'Nvidia tops forecasts on data center demand'),
+        ('GOOGL', 'Alphabet Inc.', 'Alphabet to spin off Waymo stake'),
+        ('JPM', 'JPMorgan Chase & Co.', 'JPMorgan profit rises on trading revenue'),
+        ('MSFT', 'Microsoft Corporation', 'Microsoft raises cloud outlook'),
+        ('TSLA', 'Tesla Inc.', 'Tesla to join S&P 500'),
+        ('DOW', 'Dow Inc.', 'Dow cuts dividend as chemical demand weakens'),
+    ])
+    def test_seeded_company_headlines_full(self, triage, ticker, company_name, title):
+        decision = triage.score(make_item(title, TESLA_BODY, ticker=ticker, company_name=company_name))
+        assert 'title_mention' in decision['reasons']
+        assert 'roundup_title' not in decision['reasons']
+        assert decision['route'] == ROUTE_FULL
+
+    def test_bare_ticker_is_uppercase_only(self, triage):
+        """일반 단어와 겹치는 티커(NOW, CAT)는 대문자 단독 표기나 $/괄호/거래소 표기만 매칭"""
+        item = make_item('Apple is now the biggest company', '', ticker='NOW', company_name=None)
+        assert 'title_mention' not in triage.score(item)['reasons']
+        for title in ('NOW shares jump on AI demand', 'Why $now could rally', 'ServiceNow (now) beats',
+                      'Nasdaq: now hits record'):
+            item['title'] = title
+            assert 'title_mention' in triage.score(item)['reasons'], title
+        item = make_item('The cat is out of the bag for retailers', '', ticker='CAT', company_name=None)
+        assert 'title_mention' not in triage.score(item)['reasons']
+        item = make_item('GE Vernova wins order', '', ticker='GE', company_name=None)
+        assert 'title_mention' in triage.score(item)['reasons']
+        item['title'] = 'Ge Vernova wins order'
+        assert 'title_mention' not in triage.score(item)['reasons']
+
+    def test_index_move_is_roundup(self, triage):
+        decision = triage.score(make_item('Dow Jones slips as Fed meeting looms', ROUNDUP_BODY))
+        assert 'roundup_title' in decision['reasons']
+
+    def test_thresholds_configurable(self):
+        strict = RelevanceTriage(full_threshold=0.9, light_threshold=0.5, min_content_chars=0)
+        assert strict.score(make_item('Tesla deliveries beat estimates', TESLA_BODY))['route'] == ROUTE_LIGHT
+        assert strict.score(make_item('Automakers face new rules', ''))['route'] == ROUTE_SKIP
+
+
+class TestBatchAnalyzeTriage:
+    """batch_analyze 경로 분리"""
+
+    @pytest.fixture
+    def analyzer(self, triage):
+        from app.services.news_analyzer import NewsAnalyzer
+        from app.services.news_dedup import NearDuplicateIndex
+
+        analyzer = NewsAnalyzer(api_key='test-key', dedup_index=NearDuplicateIndex(), triage=triage)
+        analyzer.analyze_news = Mock(return_value={
+            'summary': {'ko': '요약', 'en': 'summary', 'es': 'resumen', 'ja': '要約'},
+            'sentiment': {'classification': 'positive', 'score': 6},
+        })
+        return analyzer
+
+    def test_routes_items(self, analyzer):
+        from app.utils.metrics import get_metrics_registry
+
+        counter = get_metrics_registry().counter(
+            'news_triage_items_total', 'News items routed by relevance triage before analysis', ('route',)
+        )
+        before = {route: counter.get(route=route) for route in ('full', 'light', 'skip')}
+
+        items = [
+            make_item('Tesla deliveries beat estimates', TESLA_BODY),
+            make_item('Stock market today: Dow slips as Fed meeting looms', ROUNDUP_BODY),
+            make_item('Tesla shares jump on delivery beat', ''),
+        ]
+        result = analyzer.batch_analyze(items)
+
+        assert analyzer.analyze_news.call_count == 1
+        assert [item['title'] for item in result] == [items[0]['title'], items[2]['title']]
+        full, light = result
+        assert full['metadata']['analysis_mode'] == 'full'
+        assert full['sentiment'] == {'classification': 'positive', 'score': 6}
+        assert light['metadata']['analysis_mode'] == 'light'
+        assert light['metadata']['gpt_model'] is None
+        assert light['sentiment']['classification'] == 'positive'
+        assert light['summary']['en'].startswith('Tesla shares jump')
+        # 다른 언어는 조회 시 생성 (fill_missing_summaries)
+        assert set(light['summary']) == {'en'}
+        assert 0 <= light['metadata']['relevance'] <= 1
+
+        assert counter.get(route='full') - before['full'] == 1
+        assert counter.get(route='light') - before['light'] == 1
+        assert counter.get(route='skip') - before['skip'] == 1
+
+    def test_disabled_sends_everything_to_full(self, monkeypatch):
+        from app.services.news_analyzer import NewsAnalyzer
+        from app.services.news_dedup import NearDuplicateIndex
+        from app.utils.config import Config
+
+        monkeypatch.setattr(Config, 'NEWS_TRIAGE_ENABLED', False)
+        analyzer = NewsAnalyzer(api_key='test-key', dedup_index=NearDuplicateIndex())
+        analyzer.analyze_news = Mock(return_value={
+            'summary': {'ko': '요약', 'en': 'summary', 'es': 'resumen', 'ja': '要約'},
+            'sentiment': {'classification': 'neutral', 'score': 0},
+        })
+
+        result = analyzer.batch_analyze([
+            make_item('Stock market today: Dow slips as Fed meeting looms', ROUNDUP_BODY),
+            make_item('Tesla shares jump on delivery beat', ''),
+        ])
+
+        assert analyzer.analyze_news.call_count == 2
+        assert len(result) == 2
+        assert 'relevance' not in result[0]['metadata']
@@ -0,0 +1,143 @@
+"""
+차단/캡차 페이지 감지 테스트
+- 페이지 분류 (정상/캡차/동의 화면/404/빈 페이지)
+- 캡차 페이지 수신 시 대기/파싱/재시도 없이 즉시 중단, 연결별 백오프
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import crawler as crawler_module
+from app.services.crawler import (
+    BlockBackoff, CrawlBlockedError, InvestingCrawler, classify_page,
+    PAGE_CHALLENGE, PAGE_CONSENT, PAGE_EMPTY, PAGE_NORMAL, PAGE_NOT_FOUND
+)
+
+FIXTURE_DIR = project_root / 'tests' / 'fixtures' / 'investing'
+CHALLENGE_HTML = (FIXTURE_DIR / 'challenge.html').read_text()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestClassifyPage:
+    @pytest.mark.parametrize('fixture', ['stock_tsla.html', 'etf_spy.html', 'stock_nvda_relative.html'])
+    def test_news_pages_are_normal(self, fixture):
+        assert classify_page((FIXTURE_DIR / fixture).read_text()) == PAGE_NORMAL
+
+    def test_challenge_by_title_and_markers(self):
+        assert classify_page(CHALLENGE_HTML) == PAGE_CHALLENGE
+        # 제목이 바뀌어도 DOM 표식으로 감지
+        assert classify_page('<html><body><div class="cf-turnstile"></div></body></html>') == PAGE_CHALLENGE
+        assert classify_page('<html><body></body></html>', title='Just a moment...') == PAGE_CHALLENGE
+
+    def test_recaptcha_script_on_news_page_is_not_challenge(self):
+        html = (FIXTURE_DIR / 'stock_tsla.html').read_text().replace(
+            '</body>', '<div class="g-recaptcha"></div></body>'
+        )
+        assert classify_page(html) == PAGE_NORMAL
+
+    def test_consent_not_found_and_empty(self):
+        consent = '<html><body><div id="onetrust-banner-sdk">We use cookies</div></body></html>'
+        assert classify_page(consent) == PAGE_CONSENT
+        assert classify_page('<html><body></body></html>', title='404 - Page Not Found') == PAGE_NOT_FOUND
+        assert classify_page('<html><body><div id="app"></div></body></html>') == PAGE_EMPTY
+        assert classify_page(None) == PAGE_EMPTY
+
+
+class TestBlockBackoff:
+    def test_exponential_per_connection(self):
+        clock = FakeClock()
+        backoff = BlockBackoff(base_seconds=60, max_seconds=200, clock=clock)
+
+        assert backoff.record_block('http://a:1') == 60
+        assert backoff.remaining('http://a:1') == 60
+        assert backoff.remaining(None) == 0
+        assert backoff.record_block('http://a:1') == 120
+        assert backoff.record_block('http://a:1') == 200
+
+        clock.now += 200
+        assert backoff.remaining('http://a:1') == 0
+        backoff.record_success('http://a:1')
+        assert backoff.record_block('http://a:1') == 60
+
+
+class TestEarlyAbort:
+    @pytest.fixture
+    def backoff(self, monkeypatch):
+        backoff = BlockBackoff(base_seconds=60, max_seconds=600, clock=FakeClock())
+        monkeypatch.setattr(crawler_module, 'block_backoff', backoff)
+        return backoff
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr('app.services.crawler.time.sleep', sleeps.append)
+        monkeypatch.setattr('app.services.crawler.WebDriverWait', MagicMock())
+        return sleeps
+
+    def _crawler(self, html, title):
+        crawler = InvestingCrawler(proxy='http://a:1')
+        crawler.driver = MagicMock()
+        crawler.driver.page_source = html
+        crawler.driver.title = title
+        crawler._parse_news_articles = MagicMock(return_value=[])
+        crawler._parse_news_articles_bs4 = MagicMock(return_value=[])
+        crawler._parse_news_articles_js = MagicMock(return_value=[])
+        return crawler
+
+    def test_challenge_aborts_before_settle_and_parse(self, backoff, sleeps):
+        crawler = self._crawler(CHALLENGE_HTML, 'Just a moment...')
+
+        with pytest.raises(CrawlBlockedError) as exc_info:
+            crawler.fetch_news('TSLA', 'Tesla', add_delay=False)
+
+        assert exc_info.value.proxy == 'http://a:1'
+        assert crawler.last_page_status == 'blocked'
+        assert sleeps == []
+        crawler._parse_news_articles.assert_not_called()
+        crawler._parse_news_articles_bs4.assert_not_called()
+        assert backoff.remaining('http://a:1') == 60
+
+    def test_backoff_skips_page_load(self, backoff, sleeps):
+        backoff.record_block('http://a:1')
+        crawler = self._crawler(CHALLENGE_HTML, 'Just a moment...')
+        crawler.request_count = 1
+
+        with pytest.raises(CrawlBlockedError):
+            crawler.fetch_news('TSLA', 'Tesla')
+
+        crawler.driver.get.assert_not_called()
+        assert sleeps == []
+
+    def test_crawl_with_retry_does_not_retry_blocks(self, backoff, sleeps):
+        crawler = self._crawler(CHALLENGE_HTML, 'Just a moment...')
+        crawler.fetch_news = MagicMock(side_effect=CrawlBlockedError('Blocked by bot challenge'))
+
+        articles, error = crawler.crawl_with_retry('TSLA', 'Tesla', max_retries=3)
+
+        assert (articles, error) == ([], 'Blocked by bot challenge')
+        assert crawler.fetch_news.call_count == 1
+        assert sleeps == []
+
+    def test_normal_page_resets_backoff(self, backoff, sleeps):
+        html = (FIXTURE_DIR / 'stock_tsla.html').read_text()
+        crawler = self._crawler(html, 'Tesla News | Investing.com')
+        crawler._parse_news_articles_bs4 = MagicMock(return_value=[{'title': 't'}])
+        backoff.record_block('http://a:1')
+        backoff.clock.now += 60
+
+        assert crawler.fetch_news('TSLA', 'Tesla', add_delay=False) == [{'title': 't'}]
+        assert crawler.last_page_status == 'ok'
+        # 다음 차단은 다시 첫 단계부터
+        assert backoff.record_block('http://a:1') == 60
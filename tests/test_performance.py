@@ -50,6 +50,9 @@ class PerformanceTest:
         # 5. 동시 요청 처리 테스트
         self.test_concurrent_requests()
         
+        # 6. End-to-end 부하 테스트 (로컬 ES / OpenAI / SMTP stand-in)
+        self.test_end_to_end_load()
+        
         # 결과 요약
         self.print_summary()
     
@@ -245,6 +248,28 @@ class PerformanceTest:
         print(f"  평균 응답 시간: {avg_time:.2f}ms")
         print(f"  목표: 동시 3명 지원 - {'✓ PASS' if success_count == 3 else '✗ FAIL'}")
     
+    def test_end_to_end_load(self):
+        """End-to-end 부하 테스트 (crawl -> analyze -> store -> email, 뉴스 라우트)"""
+        print("\n[6] End-to-end 부하 테스트 (stand-in)")
+        print("-" * 40)
+        
+        from tests.loadtest.harness import LoadTestHarness, format_report
+        
+        with LoadTestHarness(concurrency=3, openai_latency_ms=100, openai_rate_limit_ratio=0.05) as harness:
+            report = harness.run(iterations=15)
+        
+        print('  ' + format_report(report).replace('\n', '\n  '))
+        
+        self.results['e2e_errors'] = sum(
+            stats['errors']
+            for result in report['scenarios'].values()
+            for stats in result['operations'].values()
+        )
+        self.results['e2e_route_p95'] = max(
+            stats['p95_ms'] for stats in report['scenarios']['routes']['operations'].values()
+        )
+        print("\n  더 큰 부하: python -m tests.loadtest.harness --help")
+    
     def print_summary(self):
         """테스트 결과 요약"""
         print("\n" + "="*60)
@@ -259,6 +284,10 @@ class PerformanceTest:
              self.results.get('es_p95_query') is None or self.results.get('es_p95_query', 0) < 1000),
             ("NFR-004: 동시 3명 지원", 
              self.results.get('concurrent_success', 0) == 3),
+            ("E2E 부하 테스트 오류 없음 (동시 3 워커)",
+             self.results.get('e2e_errors', 1) == 0),
+            ("E2E 라우트 p95 3초 이내",
+             self.results.get('e2e_route_p95', 0) < 3000),
         ]
         
         pass_count = 0
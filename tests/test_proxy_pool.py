@@ -0,0 +1,202 @@
+"""
+프록시 풀 테스트
+- 상태 점수 가중 선택, 프록시별 동시 사용 제한, 차단/연속 실패 격리와 지수 백오프
+- crawl_single_stock의 결과 보고 (캡차 페이지 -> 격리)
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import random
+import threading
+import time
+from collections import Counter
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services import proxy_pool as proxy_module
+from app.services.crawler import CrawlBlockedError, crawl_single_stock, is_challenge_html
+from app.services.proxy_pool import ProxyPool, ProxyUnavailableError
+
+FIXTURE_DIR = project_root / 'tests' / 'fixtures' / 'investing'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _pool(clock, proxies=('http://a:1', 'http://b:1'), **kwargs):
+    kwargs.setdefault('max_leases', 2)
+    return ProxyPool(list(proxies), quarantine_seconds=60, max_quarantine_seconds=600,
+                     clock=clock, rng=random.Random(7), **kwargs)
+
+
+def _state(pool, name):
+    return next(s for s in pool.snapshot() if s['proxy'] == name)
+
+
+def test_selection_weighted_by_health(clock):
+    """실패가 잦고 느린 프록시는 덜 선택됨"""
+    pool = _pool(clock, max_leases=100)
+    for _ in range(5):
+        pool.acquire(timeout=0).success(latency=2)
+    slow = [s for s in pool._states if s.proxy == 'http://b:1'][0]
+    slow.success_rate, slow.latency = 0.3, 40
+
+    picks = Counter(pool.choose() for _ in range(1000))
+    assert picks['http://a:1'] > picks['http://b:1'] * 3
+    assert picks['http://b:1'] > 0
+
+
+def test_per_proxy_lease_limit(clock):
+    pool = _pool(clock, proxies=['http://a:1'])
+    first = pool.acquire(timeout=0)
+    second = pool.acquire(timeout=0)
+    with pytest.raises(ProxyUnavailableError):
+        pool.acquire(timeout=0)
+
+    first.success()
+    assert pool.acquire(timeout=0).proxy == 'http://a:1'
+    assert _state(pool, 'http://a:1')['active'] == 2
+    second.failure()
+    assert _state(pool, 'http://a:1')['active'] == 1
+
+
+def test_blocked_proxy_quarantined_with_exponential_backoff(clock):
+    pool = _pool(clock, proxies=['http://a:1', None], max_leases=5)
+    blocked = pool._states[0]
+
+    def block_once():
+        lease = pool.acquire(timeout=0)
+        while lease.proxy != 'http://a:1':
+            lease.success()
+            lease = pool.acquire(timeout=0)
+        lease.blocked()
+
+    block_once()
+    assert blocked.quarantined_until == clock.now + 60
+    assert {pool.choose() for _ in range(50)} == {None}
+
+    clock.now += 61
+    block_once()
+    assert blocked.quarantined_until == clock.now + 120
+    assert _state(pool, 'http://a:1')['blocks'] == 2
+
+    # 성공하면 백오프 초기화
+    clock.now += 121
+    lease = pool.acquire(timeout=0)
+    while lease.proxy != 'http://a:1':
+        lease.success()
+        lease = pool.acquire(timeout=0)
+    lease.success()
+    block_once()
+    assert blocked.quarantined_until == clock.now + 60
+
+
+def test_quarantine_capped(clock):
+    pool = _pool(clock, proxies=['http://a:1'])
+    for _ in range(6):
+        pool.acquire(timeout=0).blocked()
+        clock.now = pool._states[0].quarantined_until
+    pool.acquire(timeout=0).blocked()
+    assert pool._states[0].quarantined_until - clock.now == 600
+
+
+def test_consecutive_failures_quarantine(clock):
+    pool = _pool(clock, proxies=['http://a:1'], failure_threshold=3)
+    for _ in range(2):
+        pool.acquire(timeout=0).failure()
+    assert pool.choose() == 'http://a:1'
+    pool.acquire(timeout=0).failure()
+    with pytest.raises(ProxyUnavailableError):
+        pool.acquire(timeout=0)
+
+
+def test_lease_context_reports_exceptions(clock):
+    pool = _pool(clock, proxies=['http://a:1'])
+    with pytest.raises(ValueError):
+        with pool.acquire(timeout=0):
+            raise ValueError('boom')
+    with pool.acquire(timeout=0):
+        pass
+    state = _state(pool, 'http://a:1')
+    assert (state['failures'], state['successes'], state['active']) == (1, 1, 0)
+
+
+def test_waiting_acquire_wakes_on_release():
+    """한도 초과 시 대기 -> 다른 스레드가 반납하면 획득"""
+    pool = ProxyPool(['http://a:1'], max_leases=1, quarantine_seconds=60, max_quarantine_seconds=600)
+    lease = pool.acquire(timeout=0)
+    acquired = []
+
+    def waiter():
+        acquired.append(pool.acquire(timeout=5).proxy)
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    time.sleep(0.05)
+    assert acquired == []
+    lease.success()
+    thread.join(timeout=5)
+    assert acquired == ['http://a:1']
+
+
+def test_is_challenge_html():
+    assert is_challenge_html((FIXTURE_DIR / 'challenge.html').read_text())
+    assert not is_challenge_html((FIXTURE_DIR / 'stock_tsla.html').read_text())
+    assert not is_challenge_html(None)
+
+
+class TestCrawlSingleStock:
+    @pytest.fixture
+    def pool(self, clock, monkeypatch):
+        pool = _pool(clock, proxies=['http://a:1'])
+        monkeypatch.setattr(proxy_module, '_proxy_pool', pool)
+        return pool
+
+    def _crawler(self, articles, status):
+        crawler = MagicMock()
+        crawler.__enter__.return_value = crawler
+        crawler.fetch_news.return_value = articles
+        crawler.last_page_status = status
+        return crawler
+
+    def test_success_records_health(self, pool):
+        crawler = self._crawler([{'title': 't', 'source_url': 'u'}], 'ok')
+        with patch('app.services.crawler.InvestingCrawler', return_value=crawler) as cls:
+            ticker, articles, error = crawl_single_stock('TSLA', 'Tesla')
+
+        cls.assert_called_once_with(proxy='http://a:1')
+        assert (ticker, len(articles), error) == ('TSLA', 1, None)
+        assert _state(pool, 'http://a:1')['successes'] == 1
+
+    def test_challenge_page_quarantines_proxy(self, pool):
+        crawler = self._crawler([], 'blocked')
+        crawler.fetch_news.side_effect = CrawlBlockedError('Blocked by bot challenge', proxy='http://a:1')
+        with patch('app.services.crawler.InvestingCrawler', return_value=crawler):
+            _, articles, error = crawl_single_stock('TSLA', 'Tesla')
+            assert articles == [] and 'Blocked' in error
+
+            # 격리 중 -> 대기 후 실패 (브라우저 실행 안 함)
+            with patch.object(proxy_module.Config, 'PROXY_ACQUIRE_TIMEOUT', 0):
+                _, _, error = crawl_single_stock('NVDA', 'NVIDIA')
+        assert 'No proxy available' in error
+        assert crawler.fetch_news.call_count == 1
+        assert _state(pool, 'http://a:1')['blocks'] == 1
+
+    def test_empty_parse_counts_as_failure(self, pool):
+        crawler = self._crawler([], 'empty')
+        with patch('app.services.crawler.InvestingCrawler', return_value=crawler):
+            crawl_single_stock('TSLA', 'Tesla')
+        assert _state(pool, 'http://a:1')['failures'] == 1
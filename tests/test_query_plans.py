@@ -0,0 +1,194 @@
+"""
+쿼리 플랜 테스트 (EXPLAIN QUERY PLAN)
+- 스케줄러/관리자 화면의 자주 실행되는 쿼리가 인덱스를 사용하는지 검증
+- 실제 함수를 실행하면서 발생한 SQL을 캡처해 플랜을 확인하므로
+  쿼리나 인덱스가 바뀌어 로그 테이블 전체 스캔으로 돌아가면 실패한다
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import re
+from contextlib import contextmanager
+from datetime import datetime, time as dt_time, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app
+from app.extensions import db
+from app.models.models import (
+    User, UserSetting, UserStock, StockMaster, EmailLog, CrawlLog, KST
+)
+from app.services.crawl_planner import AdaptiveCrawlPlanner
+from app.services.scheduler import SchedulerService
+
+_FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱 (쿼리 플래너가 인덱스를 고를 만큼의 데이터 포함)"""
+    app = create_app('testing')
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    with app.app_context():
+        db.create_all()
+        _seed()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def _seed():
+    now = datetime.now(KST)
+    tickers = ['AAPL', 'MSFT', 'NVDA', 'TSLA']
+    db.session.add_all([StockMaster(ticker_symbol=t, company_name=f'{t} Inc.') for t in tickers])
+    for i in range(20):
+        user = User(username=f'user{i}', email=f'user{i}@example.com', password_hash='x', is_active=i % 5 != 0)
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(UserSetting(
+            user_id=user.id,
+            notification_time=dt_time(i % 24, 0),
+            is_notification_enabled=i % 2 == 0
+        ))
+        db.session.add_all([UserStock(user_id=user.id, ticker_symbol=t) for t in tickers[:i % 4 + 1]])
+        db.session.add(EmailLog(user_id=user.id, status='success', news_count=3, sent_at=now - timedelta(days=i)))
+    db.session.add_all([
+        CrawlLog(ticker_symbol=tickers[i % 4], status='SUCCESS', news_count=i % 7,
+                 crawled_at=now - timedelta(hours=i))
+        for i in range(200)
+    ])
+    db.session.commit()
+    db.session.execute(db.text('ANALYZE'))
+
+
+@contextmanager
+def capture_sql():
+    """실행된 SELECT/DELETE/UPDATE 문과 파라미터 캡처"""
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(('SELECT', 'DELETE', 'UPDATE')):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', _capture)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', _capture)
+
+
+def query_plan(statement, parameters):
+    """EXPLAIN QUERY PLAN 결과의 detail 목록"""
+    rows = db.session.connection().exec_driver_sql(
+        f'EXPLAIN QUERY PLAN {statement}', tuple(parameters or ())
+    ).fetchall()
+    return [row[-1] for row in rows]
+
+
+def assert_uses_index(statements, table, index):
+    """table을 읽는 문이 최소 1개 있고, 모두 index를 사용하며 전체 스캔/임시 정렬이 없는지 확인"""
+    checked = 0
+    for statement, parameters in statements:
+        if not re.search(rf'\b{table}\b', statement):
+            continue
+        plan = query_plan(statement, parameters)
+        touching = [detail for detail in plan if re.search(rf'\b{table}\b', detail)]
+        if not touching:
+            continue
+        checked += 1
+        for detail in touching:
+            assert not _FULL_SCAN.match(detail), f"Full scan on {table}: {plan}\n{statement}"
+        assert any(index in detail for detail in touching), f"{index} not used: {plan}\n{statement}"
+        assert not any('TEMP B-TREE' in detail for detail in plan), f"Temp sort: {plan}\n{statement}"
+    assert checked, f"No query on {table} captured"
+
+
+def test_crawler_status_uses_crawled_at_index(app):
+    """관리자 화면: 마지막 크롤링 로그"""
+    from app.routes.admin import _get_crawler_status
+
+    with capture_sql() as statements:
+        status = _get_crawler_status()
+    assert status['status'] == 'SUCCESS'
+    assert_uses_index(statements, 'crawl_logs', 'ix_crawl_logs_crawled_at')
+
+
+def test_email_status_uses_sent_at_and_notification_indexes(app):
+    """관리자 화면: 마지막 메일 로그 + 발송 대상 수"""
+    from app.routes.admin import _get_email_status
+
+    with capture_sql() as statements:
+        status = _get_email_status()
+    assert status['pending_count'] == 10
+    assert_uses_index(statements, 'email_logs', 'ix_email_logs_sent_at')
+    assert_uses_index(statements, 'user_settings', 'ix_user_settings_notification')
+
+
+def test_crawl_log_cleanup_uses_crawled_at_index(app):
+    """정리 작업: 보관 기간 지난 크롤링 로그 삭제"""
+    with capture_sql() as statements:
+        SchedulerService()._cleanup_crawl_logs(days=5)
+    assert CrawlLog.query.count() < 200
+    assert_uses_index(statements, 'crawl_logs', 'ix_crawl_logs_crawled_at')
+
+
+def test_email_log_cleanup_uses_sent_at_index(app):
+    """정리 작업: 보관 기간 지난 메일 로그 삭제"""
+    with capture_sql() as statements:
+        SchedulerService()._cleanup_old_logs(days=10)
+    assert EmailLog.query.count() == 10
+    assert_uses_index(statements, 'email_logs', 'ix_email_logs_sent_at')
+
+
+def test_users_to_notify_uses_notification_index(app):
+    """메일 작업: 현재 시각 알림 대상 조회"""
+    with capture_sql() as statements:
+        results = SchedulerService()._get_users_to_notify(dt_time(4, 0))
+    assert [user.username for user, _ in results] == ['user4']
+    assert_uses_index(statements, 'user_settings', 'ix_user_settings_notification')
+
+
+def test_tickers_by_user_single_query(app):
+    """메일 작업: 사용자별 관심 종목을 사용자마다가 아니라 1회 조회"""
+    user_ids = [user.id for user in User.query.all()]
+    with capture_sql() as statements:
+        tickers_by_user = SchedulerService()._get_tickers_by_user(user_ids)
+    assert len(statements) == 1
+    assert sum(len(tickers) for tickers in tickers_by_user.values()) == UserStock.query.count()
+    # unique_user_stock (user_id, ticker_symbol) 제약은 SQLite 자동 인덱스로 생성됨
+    assert_uses_index(statements, 'user_stocks', 'sqlite_autoindex_user_stocks')
+
+
+def test_active_tickers_single_query(app):
+    """크롤링 작업: 활성 사용자 관심 종목 (JOIN + DISTINCT 1회)"""
+    with capture_sql() as statements:
+        tickers = SchedulerService()._get_active_tickers()
+    assert len(statements) == 1
+    assert sorted(tickers) == ['AAPL', 'MSFT', 'NVDA', 'TSLA']
+
+
+def test_adaptive_planner_uses_ticker_index(app):
+    """적응형 스케줄: 티커별 velocity / 마지막 크롤링 시각"""
+    planner = AdaptiveCrawlPlanner(window_hours=24)
+    with capture_sql() as statements:
+        planner._restore_next_run(db.session, 'NVDA', datetime.now(KST).replace(tzinfo=None))
+    assert len(statements) == 2
+    assert_uses_index(statements, 'crawl_logs', 'ix_crawl_logs_ticker_crawled_at')
+
+
+def test_stock_list_uses_user_created_at_index(app):
+    """종목 관리 화면: 사용자 관심 종목 최신순"""
+    user = User.query.filter_by(username='user3').first()
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = user.id
+        sess['username'] = user.username
+
+    with capture_sql() as statements:
+        response = client.get('/stocks/')
+    assert response.status_code == 200
+    statements = [(s, p) for s, p in statements if 'JOIN stock_master' in s]
+    assert_uses_index(statements, 'user_stocks', 'ix_user_stocks_user_created_at')
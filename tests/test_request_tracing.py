@@ -0,0 +1,115 @@
+"""
+요청 지연 시간 추적 미들웨어 테스트
+- Server-Timing 헤더 / DB·ES 호출 집계 / 느린 요청 로그
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import logging
+import time
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models.models import StockMaster
+from app.utils.config import Config
+from app.utils.elasticsearch_client import ElasticsearchClient
+from app.utils.metrics import get_metrics_registry
+
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱 (추적 확인용 라우트 포함)"""
+    app = create_app('testing')
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+
+    @app.route('/_trace/db')
+    def trace_db():
+        for _ in range(3):
+            StockMaster.query.filter_by(ticker_symbol='TSLA').first()
+        return 'ok'
+
+    @app.route('/_trace/es')
+    def trace_es():
+        es = ElasticsearchClient('http://127.0.0.1:1')
+        es.client.transport.max_retries = 0
+        es.is_connected()
+        return 'ok'
+
+    @app.route('/_trace/slow')
+    def trace_slow():
+        time.sleep(0.02)
+        return 'ok'
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    """테스트 클라이언트"""
+    return app.test_client()
+
+
+def _timing(response):
+    entries = {}
+    for part in response.headers['Server-Timing'].split(','):
+        name, *params = [p.strip() for p in part.split(';')]
+        entries[name] = dict(p.split('=', 1) for p in params)
+    return entries
+
+
+class TestServerTiming:
+    """Server-Timing 헤더 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def server_timing(self, monkeypatch):
+        monkeypatch.setattr(Config, 'SERVER_TIMING_ENABLED', True)
+
+    def test_disabled_by_default(self, client, monkeypatch):
+        monkeypatch.setattr(Config, 'SERVER_TIMING_ENABLED', False)
+        assert 'Server-Timing' not in client.get('/_trace/db').headers
+
+    def test_counts_db_queries(self, client):
+        timing = _timing(client.get('/_trace/db'))
+        assert timing['db']['desc'] == '"3 queries"'
+        assert timing['es']['desc'] == '"0 calls"'
+        assert float(timing['total']['dur']) >= float(timing['db']['dur'])
+
+    def test_counts_es_calls(self, client):
+        timing = _timing(client.get('/_trace/es'))
+        assert timing['es']['desc'] == '"1 calls"'
+
+    def test_queries_outside_request_not_counted(self, app, client):
+        # 요청 밖 쿼리는 다음 요청에 섞이지 않음
+        StockMaster.query.all()
+        timing = _timing(client.get('/health'))
+        assert timing['db']['desc'] == '"1 queries"'
+
+
+class TestLatencyMetrics:
+    """엔드포인트 히스토그램 / 느린 요청 로그 테스트"""
+
+    def test_endpoint_histogram(self, client):
+        client.get('/_trace/db')
+
+        text = get_metrics_registry().render()
+        assert 'http_request_duration_seconds_count{endpoint="trace_db",method="GET",status="200"}' in text
+        assert 'http_request_db_queries_bucket{endpoint="trace_db",le="5"}' in text
+
+    def test_slow_request_logged(self, client, monkeypatch, caplog):
+        monkeypatch.setattr(Config, 'SLOW_REQUEST_MS', 10)
+
+        with caplog.at_level(logging.WARNING, logger='app.utils.request_tracing'):
+            client.get('/_trace/slow')
+            client.get('/_trace/db')
+
+        slow = [r.getMessage() for r in caplog.records if 'Slow request' in r.getMessage()]
+        assert len(slow) == 1
+        assert 'trace_slow' in slow[0]
@@ -0,0 +1,118 @@
+"""
+Chrome 리소스 차단 테스트
+- 범주별 차단 패턴 (기사 목록에 필요한 문서/스크립트는 통과)
+- 드라이버 생성 시 CDP 적용, 페이지 통계 수집/히스토그램 기록, 절감률 계산
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fnmatch import fnmatchcase
+from unittest.mock import MagicMock
+
+from app.services import crawler as crawler_module
+from app.services.crawler import InvestingCrawler
+from app.services.resource_blocking import (
+    apply_resource_blocking, build_blocked_patterns, collect_page_stats, compare_stats, record_page_stats
+)
+from app.utils import metrics as metrics_module
+from app.utils.metrics import MetricsRegistry
+
+
+def _blocked(url, patterns):
+    # setBlockedURLs와 같은 '*' 와일드카드 매칭
+    return any(fnmatchcase(url, pattern) for pattern in patterns)
+
+
+class TestBlockedPatterns:
+    def test_default_categories_keep_article_list(self):
+        patterns = build_blocked_patterns(['images', 'fonts', 'media', 'trackers', 'ads'], [])
+
+        for url in (
+            'https://www.investing.com/equities/tesla-motors-news',
+            'https://i-invdn-com.investing.com/redesign/js/main.js?v=3',
+            'https://www.investing.com/_next/static/css/app.css',
+            'https://challenges.cloudflare.com/turnstile/v0/api.js',
+        ):
+            assert not _blocked(url, patterns), url
+
+        for url in (
+            'https://i-invdn-com.investing.com/news/LYNXMPEB_S.jpg',
+            'https://fonts.gstatic.com/s/roboto/v30/font.woff2',
+            'https://www.googletagmanager.com/gtm.js?id=GTM-1',
+            'https://securepubads.g.doubleclick.net/tag/js/gpt.js',
+            'https://cdn.taboola.com/libtrc/investing/loader.js',
+            'https://video.investing.com/clip.mp4',
+        ):
+            assert _blocked(url, patterns), url
+
+    def test_stylesheets_and_extra_patterns(self):
+        patterns = build_blocked_patterns(['stylesheets', 'unknown'], ['*/sponsored/*'])
+        assert _blocked('https://www.investing.com/_next/static/css/app.css', patterns)
+        assert _blocked('https://www.investing.com/sponsored/widget.js', patterns)
+        assert not _blocked('https://www.investing.com/equities/tesla-motors-news', patterns)
+
+    def test_config_defaults(self, monkeypatch):
+        monkeypatch.setattr(crawler_module.Config, 'CRAWL_BLOCKED_RESOURCES', 'fonts')
+        monkeypatch.setattr(crawler_module.Config, 'CRAWL_BLOCKED_URL_PATTERNS', '*adbox*, *promo*')
+        patterns = build_blocked_patterns()
+        assert '*.woff2' in patterns and '*adbox*' in patterns and '*promo*' in patterns
+        assert '*.png' not in patterns
+
+
+class TestDriverIntegration:
+    def _init(self, monkeypatch, block_resources):
+        driver = MagicMock()
+        monkeypatch.setattr(crawler_module.webdriver, 'Chrome', MagicMock(return_value=driver))
+        crawler = InvestingCrawler(block_resources=block_resources)
+        crawler._init_driver()
+        return [call.args[0] for call in driver.execute_cdp_cmd.call_args_list], driver
+
+    def test_init_driver_applies_blocking(self, monkeypatch):
+        commands, driver = self._init(monkeypatch, True)
+        assert 'Network.setBlockedURLs' in commands
+        blocked_call = next(c for c in driver.execute_cdp_cmd.call_args_list if c.args[0] == 'Network.setBlockedURLs')
+        assert '*doubleclick.net*' in blocked_call.args[1]['urls']
+
+    def test_blocking_disabled(self, monkeypatch):
+        commands, _ = self._init(monkeypatch, False)
+        assert 'Network.setBlockedURLs' not in commands
+
+    def test_cdp_failure_is_not_fatal(self):
+        driver = MagicMock()
+        driver.execute_cdp_cmd.side_effect = RuntimeError('not a chromium driver')
+        assert apply_resource_blocking(driver, ['*.woff']) is False
+
+
+class TestPageStats:
+    def test_collect_page_stats(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = {'requests': 42, 'transfer_bytes': 812345.0, 'dom_ms': 1800, 'load_ms': None}
+        assert collect_page_stats(driver) == {'requests': 42, 'transfer_bytes': 812345, 'dom_ms': 1800, 'load_ms': 0}
+
+        driver.execute_script.return_value = []
+        assert collect_page_stats(driver) is None
+        driver.execute_script.side_effect = RuntimeError('no page')
+        assert collect_page_stats(driver) is None
+
+    def test_record_page_stats_by_blocking_label(self, monkeypatch):
+        registry = MetricsRegistry()
+        monkeypatch.setattr(metrics_module, '_registry', registry)
+
+        record_page_stats({'requests': 40, 'transfer_bytes': 900000, 'dom_ms': 900, 'load_ms': 2500}, blocking=True)
+        record_page_stats({'requests': 180, 'transfer_bytes': 4200000, 'dom_ms': 2100, 'load_ms': 7400}, blocking=False)
+
+        body = registry.render()
+        assert 'crawl_page_transfer_bytes_count{resource_blocking="on"} 1' in body
+        assert 'crawl_page_load_seconds_sum{resource_blocking="off"} 7.4' in body
+
+    def test_compare_stats(self):
+        baseline = [{'requests': 200, 'transfer_bytes': 4000000, 'dom_ms': 2000, 'load_ms': 8000}]
+        blocked = [{'requests': 50, 'transfer_bytes': 1000000, 'dom_ms': 1500, 'load_ms': 3000}]
+
+        result = compare_stats(baseline, blocked)
+
+        assert result['transfer_bytes'] == {'off': 4000000, 'on': 1000000, 'saved_pct': 75.0}
+        assert result['load_ms']['saved_pct'] == 62.5
+        assert compare_stats([], [])['requests']['saved_pct'] == 0.0
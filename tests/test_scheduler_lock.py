@@ -0,0 +1,110 @@
+"""
+스케줄러 리더 리스 테스트
+- 리스 획득/갱신/만료 후 인계/해제
+- 리더가 아닌 프로세스의 작업 건너뛰기
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from app import create_app
+from app.extensions import db
+from app.models.models import SchedulerLock
+from app.services.scheduler import SchedulerService
+from app.services.scheduler_lock import LeaderElection, get_lock_status, _now_kst
+
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱"""
+    app = create_app('testing')
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    with app.app_context():
+        db.create_all()
+        db.session.query(SchedulerLock).delete()
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def _election(owner_id, ttl_seconds=60):
+    return LeaderElection(db.session, name='test-lock', ttl_seconds=ttl_seconds, owner_id=owner_id)
+
+
+def test_first_process_acquires_and_second_waits(app):
+    """첫 프로세스만 리스 획득, 두 번째는 대기"""
+    leader = _election('web-1')
+    standby = _election('worker-1')
+
+    assert leader.try_acquire() is True
+    assert leader.is_leader
+    assert standby.try_acquire() is False
+    assert not standby.is_leader
+
+    status = get_lock_status(db.session, 'test-lock')
+    assert status['owner_id'] == 'web-1'
+    assert status['active'] is True
+
+
+def test_renew_keeps_acquired_at(app):
+    """리더의 재획득은 만료 시각만 연장"""
+    leader = _election('worker-1')
+    leader.try_acquire()
+    first = db.session.get(SchedulerLock, 'test-lock')
+    acquired_at, expires_at = first.acquired_at, first.expires_at
+
+    assert leader.try_acquire() is True
+    db.session.expire_all()
+    renewed = db.session.get(SchedulerLock, 'test-lock')
+    assert renewed.acquired_at == acquired_at
+    assert renewed.expires_at >= expires_at
+
+
+def test_expired_lease_is_taken_over(app):
+    """리더 리스가 만료되면 대기 프로세스가 인계"""
+    leader = _election('worker-1')
+    standby = _election('worker-2')
+    leader.try_acquire()
+
+    lock = db.session.get(SchedulerLock, 'test-lock')
+    lock.expires_at = _now_kst() - timedelta(seconds=1)
+    db.session.commit()
+
+    assert standby.try_acquire() is True
+    assert db.session.get(SchedulerLock, 'test-lock').owner_id == 'worker-2'
+    # 이전 리더는 다음 갱신에서 리더십을 잃음
+    assert leader.try_acquire() is False
+    assert not leader.is_leader
+
+
+def test_release_hands_over_immediately(app):
+    """해제하면 TTL을 기다리지 않고 인계"""
+    leader = _election('worker-1', ttl_seconds=3600)
+    standby = _election('worker-2', ttl_seconds=3600)
+    leader.try_acquire()
+
+    leader.release()
+
+    assert not leader.is_leader
+    assert standby.try_acquire() is True
+
+
+def test_leader_only_skips_job_when_not_leader(app, monkeypatch):
+    """리더가 아니면 스케줄 작업을 실행하지 않음"""
+    service = SchedulerService()
+    job = MagicMock(__name__='fake_job', return_value='ran')
+    wrapped = service._leader_only(job)
+
+    monkeypatch.setattr(service, '_renew_leadership', lambda: False)
+    assert wrapped() is None
+    job.assert_not_called()
+
+    monkeypatch.setattr(service, '_renew_leadership', lambda: True)
+    assert wrapped() == 'ran'
+    job.assert_called_once()
@@ -0,0 +1,202 @@
+"""
+티커 뉴스 URL 해석기 테스트
+- 검색 결과 파싱, 해석 결과 저장/재사용, 404 무효화, 실패 백오프, 사전 해석
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models.models import StockMaster, TickerSlug
+from app.services import slug_resolver as slug_module
+from app.services.crawler import InvestingCrawler
+from app.services.slug_resolver import SlugResolver, parse_search_results
+
+SEARCH_HTML = """
+<html><body>
+  <div class="js-inner-all-results-quotes-wrapper">
+    <a class="js-inner-all-results-quote-item row" href="/equities/rivian-automotive">
+      <span class="second">RIVN</span><span class="third">Rivian Automotive Inc</span><span class="fourth">Stock - NASDAQ</span>
+    </a>
+    <a class="js-inner-all-results-quote-item row" href="/equities/palantir-technologies-inc">
+      <span class="second">PLTR</span><span class="third">Palantir Technologies Inc</span><span class="fourth">Stock - NYSE</span>
+    </a>
+    <a href="/etfs/ark-innovation">
+      <span class="second">ARKK</span><span class="third">ARK Innovation ETF</span>
+    </a>
+    <a href="/news/stock-market-news/palantir-earnings-123">PLTR earnings</a>
+  </div>
+</body></html>
+"""
+
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱"""
+    app = create_app('testing')
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    """새 해석기를 싱글톤으로 등록 (크롤러가 같은 인스턴스 사용)"""
+    resolver = SlugResolver(retry_hours=24)
+    monkeypatch.setattr(slug_module, '_slug_resolver', resolver)
+    return resolver
+
+
+class TestParseSearchResults:
+    def test_prefers_exact_symbol(self):
+        assert parse_search_results(SEARCH_HTML, 'PLTR') == '/equities/palantir-technologies-inc'
+        assert parse_search_results(SEARCH_HTML, 'arkk') == '/etfs/ark-innovation'
+
+    def test_no_matching_symbol_returns_none(self):
+        """티커가 없는 결과의 첫 종목(다른 회사)을 저장하지 않음"""
+        assert parse_search_results(SEARCH_HTML, 'XYZ') is None
+
+    def test_absolute_links_and_no_results(self):
+        html = '<a href="https://www.investing.com/equities/gamestop-corp">GME GameStop</a>'
+        assert parse_search_results(html, 'GME') == '/equities/gamestop-corp'
+        assert parse_search_results('<html><body>No results</body></html>', 'GME') is None
+        assert parse_search_results('', 'GME') is None
+
+
+class TestSlugResolver:
+    def test_static_mapping_without_network(self, app, resolver):
+        fetch = MagicMock()
+        assert resolver.lookup('TSLA') == '/equities/tesla-motors-news'
+        assert resolver.lookup('spy') == '/etfs/spdr-s-p-500-news'
+        assert not resolver.needs_resolution('TSLA')
+        fetch.assert_not_called()
+
+    def test_resolve_persists_and_is_reused(self, app, resolver):
+        fetch = MagicMock(return_value=SEARCH_HTML)
+        assert resolver.needs_resolution('RIVN')
+
+        path = resolver.resolve('RIVN', fetch, 'https://www.investing.com')
+
+        assert path == '/equities/rivian-automotive-news'
+        fetch.assert_called_once_with('https://www.investing.com/search/?q=RIVN')
+        row = db.session.get(TickerSlug, 'RIVN')
+        assert row.source == 'search' and row.failure_count == 0
+
+        # 다른 프로세스(새 해석기)도 DB에서 재사용
+        other = SlugResolver()
+        assert other.lookup('RIVN') == path
+        assert not other.needs_resolution('RIVN')
+
+    def test_failure_backs_off_exponentially(self, app, resolver):
+        fetch = MagicMock(return_value='<html><body></body></html>')
+        assert resolver.resolve('ZZZZ', fetch, 'https://www.investing.com') is None
+        assert not resolver.needs_resolution('ZZZZ')
+
+        row = db.session.get(TickerSlug, 'ZZZZ')
+        row.resolved_at -= timedelta(hours=25)
+        db.session.commit()
+        assert resolver.needs_resolution('ZZZZ')
+
+        fetch.side_effect = ConnectionError('timeout')
+        resolver.resolve('ZZZZ', fetch, 'https://www.investing.com')
+        row = db.session.get(TickerSlug, 'ZZZZ')
+        assert row.failure_count == 2
+        row.resolved_at -= timedelta(hours=25)
+        db.session.commit()
+        # 2회 실패 -> 48시간 대기
+        assert not resolver.needs_resolution('ZZZZ')
+
+    def test_invalidate_overrides_static_mapping(self, app, resolver):
+        assert resolver.lookup('TSLA')
+        resolver.invalidate('TSLA')
+
+        assert resolver.lookup('TSLA') is None
+        assert resolver.needs_resolution('TSLA')
+
+        fetch = MagicMock(return_value='<a href="/equities/tesla-inc">TSLA Tesla</a>')
+        assert resolver.resolve('TSLA', fetch, 'https://www.investing.com') == '/equities/tesla-inc-news'
+        assert resolver.lookup('TSLA') == '/equities/tesla-inc-news'
+
+    def test_resolve_all_only_fetches_unmapped(self, app, resolver):
+        db.session.add_all([
+            StockMaster(ticker_symbol='TSLA', company_name='Tesla Inc'),
+            StockMaster(ticker_symbol='PLTR', company_name='Palantir'),
+            StockMaster(ticker_symbol='RIVN', company_name='Rivian'),
+        ])
+        db.session.commit()
+        # PLTR은 정적 매핑에 있음
+        fetched = []
+
+        class FakeFetcher:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def fetch(self, url):
+                fetched.append(url)
+                return SEARCH_HTML
+
+        results = resolver.resolve_all(fetcher_factory=FakeFetcher, base_url='http://local')
+
+        assert results == {
+            'PLTR': '/equities/palantir-technologies-inc-news',
+            'RIVN': '/equities/rivian-automotive-news',
+            'TSLA': '/equities/tesla-motors-news',
+        }
+        assert fetched == ['http://local/search/?q=RIVN']
+
+        # 두 번째 실행은 페이지 로딩 없음
+        resolver.resolve_all(fetcher_factory=FakeFetcher, base_url='http://local')
+        assert len(fetched) == 1
+
+
+class TestCrawlerIntegration:
+    def test_get_news_url_uses_resolved_path(self, app, resolver):
+        crawler = InvestingCrawler()
+        assert '/search/' in crawler.get_news_url('RIVN')
+
+        resolver.resolve('RIVN', MagicMock(return_value=SEARCH_HTML), crawler.BASE_URL)
+        assert crawler.get_news_url('RIVN') == 'https://www.investing.com/equities/rivian-automotive-news'
+        assert crawler.get_news_page_url('RIVN', 2) == 'https://www.investing.com/equities/rivian-automotive-news/2'
+
+    def test_fetch_news_invalidates_on_404(self, app, resolver, monkeypatch):
+        monkeypatch.setattr('app.services.crawler.WebDriverWait', MagicMock())
+        crawler = InvestingCrawler()
+        crawler.driver = MagicMock()
+        crawler.driver.title = '404 - Page Not Found | Investing.com'
+
+        assert crawler.fetch_news('TSLA', 'Tesla', add_delay=False) == []
+        assert db.session.get(TickerSlug, 'TSLA').source == 'invalidated'
+        assert '/search/' in crawler.get_news_url('TSLA')
+
+    def test_fetch_news_resolves_unmapped_ticker_once(self, app, resolver, monkeypatch):
+        monkeypatch.setattr('app.services.crawler.WebDriverWait', MagicMock())
+        monkeypatch.setattr('app.services.crawler.time.sleep', lambda s: None)
+        crawler = InvestingCrawler()
+        crawler.driver = MagicMock()
+        crawler.driver.title = 'Rivian News | Investing.com'
+        crawler.driver.page_source = SEARCH_HTML
+        crawler.driver.find_elements.return_value = []
+        crawler.driver.execute_script.return_value = []
+
+        crawler.fetch_news('RIVN', 'Rivian', add_delay=False)
+        crawler.fetch_news('RIVN', 'Rivian', add_delay=False)
+
+        loaded = [call.args[0] for call in crawler.driver.get.call_args_list]
+        assert loaded == [
+            'https://www.investing.com/search/?q=RIVN',
+            'https://www.investing.com/equities/rivian-automotive-news',
+            'https://www.investing.com/equities/rivian-automotive-news',
+        ]
@@ -0,0 +1,120 @@
+"""
+페이지 스냅샷 저장소 테스트
+- gzip 저장/인덱스 조회, 보관 기간 정리
+- 저장된 페이지 병렬 재파싱 (브라우저 없이 bs4 파서)
+- fetch_news의 스냅샷 저장 (SNAPSHOT_ENABLED)
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import snapshot_store as snapshot_module
+from app.services.crawler import InvestingCrawler
+from app.services.snapshot_store import SnapshotStore, replay_snapshots
+from app.utils.config import Config
+
+FIXTURE_DIR = project_root / 'tests' / 'fixtures' / 'investing'
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path / 'snapshots'))
+
+
+def _fixture(name):
+    return (FIXTURE_DIR / name).read_text()
+
+
+def test_save_and_load_roundtrip(store):
+    html = _fixture('stock_tsla.html')
+    snapshot_id = store.save('tsla', 'https://www.investing.com/equities/tesla-motors-news', html,
+                             'Tesla Inc', 'ok', 10)
+
+    [snapshot] = store.list_snapshots(['TSLA'])
+    assert snapshot['id'] == snapshot_id
+    assert snapshot['ticker_symbol'] == 'TSLA' and snapshot['article_count'] == 10
+    assert snapshot['path'].startswith('TSLA/') and snapshot['path'].endswith('.html.gz')
+    assert snapshot['compressed_bytes'] < snapshot['size_bytes']
+    assert store.load(snapshot) == html
+
+
+def test_list_filters_by_ticker_and_time(store):
+    now = datetime(2026, 10, 1, 12, 0)
+    store.save('TSLA', 'u1', '<html>1</html>', captured_at=now - timedelta(days=3))
+    store.save('NVDA', 'u2', '<html>2</html>', captured_at=now - timedelta(days=1))
+    store.save('TSLA', 'u3', '<html>3</html>', captured_at=now)
+
+    assert [s['url'] for s in store.list_snapshots()] == ['u1', 'u2', 'u3']
+    assert [s['url'] for s in store.list_snapshots(['tsla'])] == ['u1', 'u3']
+    assert [s['url'] for s in store.list_snapshots(since=now - timedelta(days=2))] == ['u2', 'u3']
+    assert [s['url'] for s in store.list_snapshots(limit=1)] == ['u1']
+    assert store.save('TSLA', 'u4', '') is None
+
+
+def test_purge_removes_files_and_rows(store):
+    old = datetime.now() - timedelta(days=40)
+    store.save('TSLA', 'old', '<html>old</html>', captured_at=old)
+    store.save('TSLA', 'new', '<html>new</html>')
+
+    assert store.purge(30) == 1
+    assert [s['url'] for s in store.list_snapshots()] == ['new']
+    assert not (store.root / 'TSLA' / old.strftime('%Y%m%d')).exists()
+    assert store.stats()['count'] == 1
+
+
+def test_empty_store(tmp_path):
+    store = SnapshotStore(str(tmp_path / 'missing'))
+    assert store.list_snapshots() == []
+    assert store.stats() == {'count': 0, 'size_bytes': 0, 'compressed_bytes': 0}
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_replay_reparses_stored_pages(store, workers):
+    store.save('TSLA', 'u1', _fixture('stock_tsla.html'), 'Tesla Inc', 'ok', 10)
+    store.save('SPY', 'u2', _fixture('etf_spy.html'), 'SPDR S&P 500', 'ok', 10)
+    store.save('NVDA', 'u3', _fixture('challenge.html'), 'NVIDIA', 'blocked', 0)
+
+    summary = replay_snapshots(store, store.list_snapshots(), workers=workers)
+
+    by_ticker = {r['ticker_symbol']: r for r in summary['results']}
+    assert [r['ticker_symbol'] for r in summary['results']] == ['TSLA', 'SPY', 'NVDA']
+    assert len(by_ticker['TSLA']['articles']) > 10
+    assert by_ticker['TSLA']['articles'][0]['ticker'] == 'TSLA'
+    assert by_ticker['NVDA']['articles'] == []
+    assert summary['empty'] == 1 and summary['errors'] == 0
+    assert summary['articles'] == sum(len(r['articles']) for r in summary['results'])
+
+
+def test_replay_reports_missing_file(store):
+    store.save('TSLA', 'u1', '<html></html>')
+    [snapshot] = store.list_snapshots()
+    (store.root / snapshot['path']).unlink()
+
+    summary = replay_snapshots(store, [snapshot], workers=1)
+    assert summary['errors'] == 1
+
+
+def test_fetch_news_saves_snapshot(store, monkeypatch):
+    monkeypatch.setattr(snapshot_module, '_snapshot_store', store)
+    monkeypatch.setattr(Config, 'SNAPSHOT_ENABLED', True)
+    monkeypatch.setattr('app.services.crawler.WebDriverWait', MagicMock())
+    monkeypatch.setattr('app.services.crawler.time.sleep', lambda s: None)
+
+    crawler = InvestingCrawler()
+    crawler.driver = MagicMock()
+    crawler.driver.title = 'Tesla News | Investing.com'
+    crawler.driver.page_source = _fixture('stock_tsla.html')
+    crawler._parse_news_articles = MagicMock(return_value=[])
+
+    items = crawler.fetch_news('TSLA', 'Tesla Inc', hours_ago=0, add_delay=False)
+
+    [snapshot] = store.list_snapshots(['TSLA'])
+    assert snapshot['url'].endswith('/equities/tesla-motors-news')
+    assert snapshot['page_status'] == 'ok' and snapshot['article_count'] == len(items) > 0
+    assert store.load(snapshot) == crawler.driver.page_source
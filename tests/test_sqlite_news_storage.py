@@ -0,0 +1,223 @@
+"""
+SQLite FTS5 뉴스 저장소 테스트
+- 저장/덮어쓰기/벌크 저장, 필터 검색과 페이지, 키워드(FTS5) 검색
+- 중복 URL 확인, 종목/일별/기간 통계, 보관 기간 삭제
+- 설정에 따른 저장소 선택, 스레드 동시 쓰기
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services import news_storage
+from app.services.news_storage import NewsStorageBackend, create_news_storage
+from app.services.sqlite_news_storage import SQLiteNewsStorage, build_match_query, to_timestamp
+from app.utils.config import Config
+
+
+def _news(i, ticker='TSLA', published=None, sentiment='neutral', score=0, **extra):
+    news = {
+        'news_id': f'news-{i}',
+        'ticker_symbol': ticker,
+        'company_name': f'{ticker} Inc.',
+        'title': f'{ticker} headline {i}',
+        'content': f'Body of article {i}',
+        'source_url': f'https://example.com/{ticker.lower()}/{i}',
+        'published_date': published or f'2025-11-{10 + i % 10:02d}T12:00:00+00:00',
+        'sentiment': {'classification': sentiment, 'score': score},
+        'summary': {'ko': f'요약 {i}'},
+    }
+    news.update(extra)
+    return news
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = SQLiteNewsStorage(str(tmp_path / 'news.db'))
+    yield storage
+    storage.close()
+
+
+class TestSaveAndSearch:
+    def test_save_get_and_overwrite(self, storage):
+        assert storage.save_news(_news(1)) is True
+        assert storage.get_news('news-1')['summary'] == {'ko': '요약 1'}
+        assert storage.get_news_by_id('missing') is None
+
+        assert storage.save_news(_news(1, title='Updated title')) is True
+        assert storage.get_news('news-1')['title'] == 'Updated title'
+        assert storage.count_news() == 1
+        # 덮어쓴 문서의 이전 제목은 키워드 검색에서 빠짐
+        assert storage.search_news(keyword='headline')['total'] == 0
+        assert storage.search_news(keyword='updated')['total'] == 1
+
+    def test_save_rejects_missing_fields(self, storage):
+        news = _news(1)
+        del news['content']
+        assert storage.save_news(news) is False
+        assert storage.save_news({'title': 'no id'}) is False
+
+    def test_bulk_save_generates_ids_and_reports_failures(self, storage):
+        items = [_news(i) for i in range(5)]
+        for item in items[:2]:
+            del item['news_id']  # 크롤러 수집 기사에는 news_id가 없음
+        items[4]['published_date'] = 'not a date'
+
+        result = storage.bulk_save_news(items)
+
+        assert (result['success'], result['failed'], result['total']) == (4, 1, 5)
+        hits = storage.search_news(size=10)['hits']
+        assert len(hits) == 4 and all(hit['_id'] for hit in hits)
+        assert all('crawled_date' in hit for hit in hits)
+        assert storage.bulk_save_news([]) == {'success': 0, 'failed': 0, 'total': 0, 'errors': []}
+
+    def test_filters_sort_and_paging(self, storage):
+        storage.bulk_save_news(
+            [_news(i, sentiment='positive' if i % 2 else 'negative') for i in range(10)]
+            + [_news(i, ticker='NVDA') for i in range(10, 13)]
+        )
+
+        page = storage.search_news(ticker_symbol='TSLA', size=3, page=2)
+        assert (page['total'], page['pages']) == (10, 4)
+        assert [hit['_id'] for hit in page['hits']] == ['news-6', 'news-5', 'news-4']
+
+        assert storage.search_news(ticker_symbols=['TSLA', 'NVDA'])['total'] == 13
+        assert storage.search_news(ticker_symbol='TSLA', sentiment='positive')['total'] == 5
+        # 날짜만 있는 종료일은 그날 전체 포함
+        dated = storage.search_news(ticker_symbol='TSLA', from_date='2025-11-12', to_date='2025-11-14')
+        assert sorted(hit['_id'] for hit in dated['hits']) == ['news-2', 'news-3', 'news-4']
+        assert storage.count_news(ticker_symbols=['NVDA'], from_date='2025-11-11T00:00:00') == 2
+
+    def test_keyword_search(self, storage):
+        storage.bulk_save_news([
+            _news(1, title='Tesla recalls Cybertruck', content='Safety regulators ...'),
+            _news(2, title='Quarterly deliveries beat', content='Tesla delivered more vehicles'),
+            _news(3, ticker='NVDA', title='Nvidia earnings', content='Data center revenue'),
+            _news(4, title='테슬라 리콜 발표', content='사이버트럭 리콜'),
+        ])
+
+        assert {hit['_id'] for hit in storage.search_news(keyword='tesla')['hits']} == {'news-1', 'news-2'}
+        # 단어 중 하나만 일치해도 검색 (ES multi_match 기본 OR)
+        assert storage.search_news(keyword='recalls earnings')['total'] == 2
+        assert storage.search_news(keyword='Tesla', ticker_symbol='NVDA')['total'] == 0
+        assert [hit['_id'] for hit in storage.search_news(keyword='리콜')['hits']] == ['news-4']
+        # FTS5 연산자/따옴표는 검색어로만 처리
+        assert storage.search_news(keyword='"tesla" OR NOT (')['total'] == 2
+        assert storage.search_news(keyword='!!!')['total'] == 0
+
+    def test_check_duplicates(self, storage):
+        storage.bulk_save_news([_news(1), _news(2, ticker='NVDA', url='https://example.com/shared', source_url=None)])
+        urls = ['https://example.com/tsla/1', 'https://example.com/shared', 'https://example.com/new']
+
+        assert storage.check_duplicates(urls) == {'https://example.com/tsla/1', 'https://example.com/shared'}
+        assert storage.check_duplicates(urls, 'TSLA') == {'https://example.com/tsla/1'}
+        assert storage.check_duplicates([]) == set()
+
+    def test_recent_news(self, storage):
+        now = datetime.now(timezone.utc)
+        storage.bulk_save_news([
+            _news(1, published=(now - timedelta(hours=1)).isoformat()),
+            _news(2, published=(now - timedelta(hours=5)).isoformat()),
+            # timezone 없는 값은 UTC
+            _news(3, published=(now - timedelta(minutes=10)).replace(tzinfo=None).isoformat()),
+        ])
+
+        assert [news['news_id'] for news in storage.get_recent_news('TSLA', hours=3)] == ['news-3', 'news-1']
+
+
+class TestStatistics:
+    def test_ticker_statistics(self, storage):
+        storage.bulk_save_news([
+            _news(1, sentiment='positive', score=80),
+            _news(2, sentiment='positive', score=60),
+            _news(3, sentiment='negative', score=-40),
+            _news(4, sentiment='neutral', score=0, published='2025-10-01T00:00:00Z'),
+        ])
+
+        assert storage.get_ticker_statistics('TSLA', '2025-11-01') == {
+            'ticker': 'TSLA', 'company_name': 'TSLA Inc.', 'total': 3,
+            'positive': 2, 'negative': 1, 'neutral': 0, 'sentiment_avg': 33.33
+        }
+        assert storage.get_ticker_statistics('AAPL', '2025-11-01') is None
+
+    def test_date_statistics_fill_gaps(self, storage):
+        storage.bulk_save_news([
+            _news(1, published='2025-11-20T01:00:00Z'),
+            _news(2, published='2025-11-20T23:00:00Z'),
+            _news(3, ticker='NVDA', published='2025-11-18T10:00:00+09:00'),  # UTC 11-18 01:00
+            _news(4, ticker='AAPL', published='2025-11-19T10:00:00Z'),
+        ])
+
+        assert storage.get_date_statistics(['TSLA', 'NVDA'], '2025-11-01') == [
+            {'date': '2025-11-20', 'count': 2},
+            {'date': '2025-11-19', 'count': 0},
+            {'date': '2025-11-18', 'count': 1},
+        ]
+        assert storage.get_date_statistics(['MSFT'], '2025-11-01') == []
+
+    def test_period_statistics(self, storage):
+        now = datetime.now(timezone.utc)
+        storage.bulk_save_news([
+            _news(i, published=(now - timedelta(days=i)).isoformat(),
+                  sentiment='positive' if i < 3 else 'negative', score=10 * i)
+            for i in range(1, 6)
+        ])
+
+        stats = storage.get_statistics('TSLA', days=7)
+        assert stats['total'] == 5
+        assert stats['sentiment_distribution'] == [
+            {'key': 'negative', 'doc_count': 3}, {'key': 'positive', 'doc_count': 2}
+        ]
+        assert stats['avg_score'] == pytest.approx(30)
+
+
+class TestRetention:
+    def test_delete_old_and_single_news(self, storage):
+        storage.bulk_save_news([_news(i, published=f'2025-0{i}-15T00:00:00Z') for i in range(1, 6)])
+
+        assert storage.delete_old_news(datetime(2025, 3, 1)) == 2
+        assert sorted(hit['_id'] for hit in storage.search_news()['hits']) == ['news-3', 'news-4', 'news-5']
+        assert storage.delete_news('news-3') is True
+        assert storage.delete_news('news-3') is False
+        assert storage.search_news(keyword='headline')['total'] == 2
+        # FTS 인덱스도 함께 정리
+        assert storage.conn.execute('SELECT COUNT(*) FROM news_fts').fetchone()[0] == 2
+
+
+class TestBackendSelection:
+    def test_config_selects_sqlite(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(Config, 'NEWS_STORAGE_BACKEND', 'sqlite')
+        monkeypatch.setattr(Config, 'NEWS_SQLITE_PATH', str(tmp_path / 'selected.db'))
+        monkeypatch.setattr('app.services.sqlite_news_storage._sqlite_storage', None)
+        monkeypatch.setattr(news_storage, '_storage_adapter', None)
+
+        storage = create_news_storage()
+        assert isinstance(storage, SQLiteNewsStorage) and isinstance(storage, NewsStorageBackend)
+        assert create_news_storage() is storage
+        assert news_storage.get_news_storage() is storage
+        assert storage.path == str(tmp_path / 'selected.db')
+
+    def test_memory_database_is_shared_across_threads(self):
+        storage = SQLiteNewsStorage(':memory:')
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda t: storage.bulk_save_news([_news(i, ticker=t) | {'news_id': f'{t}-{i}'} for i in range(20)]),
+                ['TSLA', 'NVDA', 'AAPL', 'MSFT']
+            ))
+
+        assert all(result['success'] == 20 for result in results)
+        assert storage.count_news() == 80
+        assert storage.conn.execute('SELECT COUNT(*) FROM news_fts').fetchone()[0] == 80
+
+
+def test_helpers():
+    assert build_match_query('Tesla, "recall" OR cyber-truck') == '"tesla" OR "recall" OR "or" OR "cyber" OR "truck"'
+    assert to_timestamp('2025-11-20') == to_timestamp('2025-11-20T00:00:00+00:00')
+    assert to_timestamp('2025-11-20', end_of_day=True) == pytest.approx(to_timestamp('2025-11-21') - 1e-6)
+    assert to_timestamp('Nov 20, 2025 10:30AM') == to_timestamp('2025-11-20T10:30:00Z')
+    assert to_timestamp('garbage') is None
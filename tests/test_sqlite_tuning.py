@@ -0,0 +1,70 @@
+"""
+SQLite 성능 설정 테스트
+- 파일 DB 연결에 WAL/busy_timeout 등 PRAGMA 적용, QueuePool 사용
+- :memory: DB에는 적용하지 않음
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from sqlalchemy.pool import QueuePool
+
+from app import create_app
+from app.extensions import db
+from app.utils.config import Config, TestingConfig
+from app.utils.sqlite_tuning import is_file_sqlite
+
+
+def _pragma(name):
+    return db.session.execute(db.text(f'PRAGMA {name}')).scalar()
+
+
+@pytest.fixture
+def file_app(tmp_path, monkeypatch):
+    """파일 SQLite를 사용하는 테스트 앱"""
+    monkeypatch.setenv('ENABLE_SCHEDULER', 'false')
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'app.db'}")
+    app = create_app('testing')
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.mark.parametrize('uri, expected', [
+    ('sqlite:////app/data/app.db', True),
+    ('sqlite:///data/app.db', True),
+    ('sqlite:///:memory:', False),
+    ('sqlite://', False),
+    ('sqlite:///file:test?mode=memory&uri=true', False),
+    ('postgresql://localhost/app', False),
+])
+def test_is_file_sqlite(uri, expected):
+    """파일 SQLite URI 판별"""
+    assert is_file_sqlite(uri) is expected
+
+
+def test_file_database_gets_pragmas(file_app):
+    """파일 DB 연결에 PRAGMA 적용"""
+    assert _pragma('journal_mode') == 'wal'
+    assert _pragma('synchronous') == 1  # NORMAL
+    assert _pragma('busy_timeout') == Config.SQLITE_BUSY_TIMEOUT_MS
+    assert _pragma('cache_size') == -Config.SQLITE_CACHE_SIZE_KB
+
+
+def test_file_database_uses_sized_pool(file_app):
+    """파일 DB는 설정된 크기의 QueuePool 사용"""
+    pool = db.engine.pool
+    assert isinstance(pool, QueuePool)
+    assert pool.size() == Config.SQLITE_POOL_SIZE
+
+
+def test_memory_database_is_untouched(monkeypatch):
+    """:memory: DB에는 WAL을 적용하지 않음"""
+    monkeypatch.setenv('ENABLE_SCHEDULER', 'false')
+    app = create_app('testing')
+    with app.app_context():
+        assert _pragma('journal_mode') == 'memory'
+        assert 'poolclass' not in (app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
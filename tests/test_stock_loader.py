@@ -0,0 +1,160 @@
+"""
+종목 마스터 일괄 적재 테스트
+- NASDAQ Trader 심볼 디렉터리/CSV 파싱 (테스트 종목, 푸터, 중복 제외)
+- 업서트와 추가/변경/상장폐지 비교, 한국어 이름 매핑, 기존 값 보존
+- 관심 종목 보호 삭제, dry-run, 검색 인덱스 무효화, 대량 적재 시간
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models.models import StockMaster, User, UserStock
+from app.services.stock_loader import StockListingLoader, iter_listing_rows, load_korean_names
+from app.services.stock_search import get_stock_search_index
+
+FIXTURES = project_root / 'tests' / 'fixtures' / 'listings'
+NASDAQ = str(FIXTURES / 'nasdaqlisted.txt')
+OTHER = str(FIXTURES / 'otherlisted.txt')
+CUSTOM = str(FIXTURES / 'custom.csv')
+NAMES_KO = str(FIXTURES / 'names_ko.csv')
+
+
+class TestParsing:
+    def test_nasdaq_listing(self):
+        rows = list(iter_listing_rows(NASDAQ))
+
+        assert [r['ticker'] for r in rows] == ['AAPL', 'MSFT', 'NVDA', 'QQQ', 'TSLA']
+        assert rows[0] == {'ticker': 'AAPL', 'company_name': 'Apple Inc.', 'exchange': 'NASDAQ', 'sector': None}
+        assert rows[3]['company_name'] == 'Invesco QQQ Trust, Series 1' and rows[3]['sector'] == 'ETF'
+
+    def test_other_listing_exchange_codes(self):
+        rows = {r['ticker']: r for r in iter_listing_rows(OTHER)}
+
+        assert set(rows) == {'BAC', 'GM', 'SPY', 'AAPL'}
+        assert rows['BAC']['exchange'] == 'NYSE'
+        assert rows['SPY']['exchange'] == 'NYSE Arca'
+
+    def test_csv_listing_skips_invalid_rows(self):
+        assert list(iter_listing_rows(CUSTOM)) == [
+            {'ticker': 'SHOP', 'company_name': 'Shopify Inc.', 'exchange': 'NYSE', 'sector': 'Technology'}
+        ]
+
+    def test_korean_names(self):
+        assert load_korean_names(NAMES_KO) == {'AAPL': '애플', 'TSLA': '테슬라', 'BAC': '뱅크오브아메리카'}
+        assert load_korean_names(None) == {}
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv('ENABLE_SCHEDULER', 'false')
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def _loader(**kwargs):
+    return StockListingLoader(korean_names=load_korean_names(NAMES_KO), **kwargs)
+
+
+class TestLoad:
+    def test_initial_load(self, app):
+        # 수동 입력한 값이 있는 기존 종목
+        db.session.add(StockMaster(ticker_symbol='MSFT', company_name='Microsoft Corp.',
+                                   company_name_ko='마이크로소프트', exchange='NASDAQ', sector='Technology'))
+        db.session.commit()
+
+        report = _loader(batch_size=2).load([NASDAQ, OTHER])
+
+        assert sorted(report['added']) == ['AAPL', 'BAC', 'GM', 'NVDA', 'QQQ', 'SPY', 'TSLA']
+        assert report['changed'] == ['MSFT']
+        assert report['delisted'] == [] and report['skipped_duplicates'] == 1
+        assert StockMaster.query.count() == 8
+
+        aapl = db.session.get(StockMaster, 'AAPL')
+        assert (aapl.company_name, aapl.company_name_ko, aapl.exchange) == ('Apple Inc.', '애플', 'NASDAQ')
+        assert aapl.created_at is not None
+        msft = db.session.get(StockMaster, 'MSFT')
+        # 파일에 없는 한국어 이름/섹터는 유지
+        assert (msft.company_name, msft.company_name_ko, msft.sector) == (
+            'Microsoft Corporation', '마이크로소프트', 'Technology'
+        )
+
+    def test_reload_reports_diff(self, app, tmp_path):
+        _loader().load([NASDAQ, OTHER])
+        # 다른 거래소 종목은 상장폐지로 보지 않음
+        db.session.add(StockMaster(ticker_symbol='^GSPC', company_name='S&P 500', exchange='INDEX'))
+        db.session.commit()
+
+        listing = tmp_path / 'nasdaqlisted.txt'
+        listing.write_text(
+            'Symbol|Security Name|Market Category|Test Issue|Financial Status|Round Lot Size|ETF|NextShares\n'
+            'AAPL|Apple Inc. - Common Stock|Q|N|N|100|N|N\n'
+            'MSFT|Microsoft Corporation - Common Stock|Q|N|N|100|N|N\n'
+            'NVDA|NVIDIA Corp - Common Stock|Q|N|N|100|N|N\n'
+            'PLTR|Palantir Technologies Inc. - Class A Common Stock|Q|N|N|100|N|N\n'
+        )
+
+        report = _loader().load([str(listing)])
+
+        assert report['added'] == ['PLTR']
+        assert report['changed'] == ['NVDA']
+        assert report['delisted'] == ['QQQ', 'TSLA']
+        assert report['unchanged'] == 2 and report['deleted'] == []
+        assert db.session.get(StockMaster, 'NVDA').company_name == 'NVIDIA Corp'
+        # prune 없이는 삭제하지 않음
+        assert db.session.get(StockMaster, 'TSLA') is not None
+
+    def test_prune_keeps_watched_stocks(self, app, tmp_path):
+        _loader().load([NASDAQ])
+        user = User(username='alice', email='alice@example.com')
+        user.set_password('password123')
+        db.session.add(user)
+        db.session.commit()
+        db.session.add(UserStock(user_id=user.id, ticker_symbol='TSLA'))
+        db.session.commit()
+
+        listing = tmp_path / 'nasdaqlisted.txt'
+        listing.write_text('Symbol|Security Name\nAAPL|Apple Inc. - Common Stock\n')
+        report = _loader().load([str(listing)], prune=True)
+
+        assert report['delisted'] == ['MSFT', 'NVDA', 'QQQ', 'TSLA']
+        assert report['deleted'] == ['MSFT', 'NVDA', 'QQQ']
+        assert sorted(s.ticker_symbol for s in StockMaster.query) == ['AAPL', 'TSLA']
+
+    def test_dry_run_does_not_write(self, app):
+        report = _loader().load([NASDAQ, OTHER], dry_run=True, prune=True)
+
+        assert len(report['added']) == 8
+        assert StockMaster.query.count() == 0
+
+    def test_search_index_sees_loaded_stocks(self, app):
+        index = get_stock_search_index()
+        assert index.search('nvid') == []
+
+        _loader().load([NASDAQ])
+
+        assert [s['ticker'] for s in index.search('nvid')] == ['NVDA']
+        assert [s['ticker'] for s in index.search('테슬')] == ['TSLA']
+
+    def test_large_listing_loads_in_seconds(self, app, tmp_path):
+        listing = tmp_path / 'otherlisted.txt'
+        lines = ['ACT Symbol|Security Name|Exchange|CQS Symbol|ETF|Round Lot Size|Test Issue|NASDAQ Symbol']
+        lines += [f'S{i:05d}|Stock {i} Common Stock|N|S{i:05d}|N|100|N|S{i:05d}' for i in range(12000)]
+        listing.write_text('\n'.join(lines) + '\n')
+
+        report = _loader().load([str(listing)])
+        assert len(report['added']) == 12000
+        assert StockMaster.query.count() == 12000
+        assert report['elapsed_seconds'] < 5
+
+        # 변경 없는 재적재는 쓰기 없이 비교만
+        report = _loader().load([str(listing)])
+        assert report['unchanged'] == 12000 and report['added'] == [] and report['changed'] == []
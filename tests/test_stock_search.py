@@ -0,0 +1,145 @@
+"""
+종목 자동완성 인덱스 테스트
+- 티커 접두사 / 회사명 토큰 접두사 / 한국어 부분 검색
+- 순위 (티커 정확 일치 -> 티커 접두사 -> 회사명, 같은 순위는 티커 순)
+- stock_master 변경 시 재적재, 검색 API
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import time
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models.models import StockMaster, User, UserStock
+from app.services.stock_search import StockSearchIndex, get_stock_search_index, name_keys
+
+STOCKS = [
+    {'ticker': 'A', 'name': 'Agilent Technologies Inc.', 'name_ko': '애질런트 테크놀로지스', 'exchange': 'NYSE', 'sector': 'Healthcare'},
+    {'ticker': 'AAPL', 'name': 'Apple Inc.', 'name_ko': '애플', 'exchange': 'NASDAQ', 'sector': 'Technology'},
+    {'ticker': 'AMAT', 'name': 'Applied Materials Inc.', 'name_ko': '어플라이드 머티어리얼즈', 'exchange': 'NASDAQ', 'sector': 'Technology'},
+    {'ticker': 'APP', 'name': 'AppLovin Corp.', 'name_ko': None, 'exchange': 'NASDAQ', 'sector': 'Technology'},
+    {'ticker': 'APPN', 'name': 'Appian Corp.', 'name_ko': None, 'exchange': 'NASDAQ', 'sector': 'Technology'},
+    {'ticker': 'BAC', 'name': 'Bank of America Corp.', 'name_ko': '뱅크오브아메리카', 'exchange': 'NYSE', 'sector': 'Financials'},
+    {'ticker': 'GM', 'name': 'General Motors Co.', 'name_ko': '제너럴 모터스', 'exchange': 'NYSE', 'sector': 'Consumer'},
+    {'ticker': 'MSFT', 'name': 'Microsoft Corp.', 'name_ko': '마이크로소프트', 'exchange': 'NASDAQ', 'sector': 'Technology'},
+    {'ticker': 'T', 'name': 'AT&T Inc.', 'name_ko': 'AT&T', 'exchange': 'NYSE', 'sector': 'Telecom'},
+    {'ticker': 'TSLA', 'name': 'Tesla Inc.', 'name_ko': '테슬라', 'exchange': 'NASDAQ', 'sector': 'Consumer'},
+]
+
+
+@pytest.fixture
+def index():
+    index = StockSearchIndex(refresh_seconds=0)
+    index.build(STOCKS)
+    return index
+
+
+def _tickers(results):
+    return [r['ticker'] for r in results]
+
+
+class TestIndex:
+    def test_ranking_matches_case_order(self, index):
+        # 티커 정확 일치(APP) -> 티커 접두사(APPN) -> 회사명 일치(티커 순)
+        assert _tickers(index.search('app')) == ['APP', 'APPN', 'AAPL', 'AMAT']
+        assert _tickers(index.search('APP', limit=2)) == ['APP', 'APPN']
+
+    def test_token_prefix_on_names(self, index):
+        assert _tickers(index.search('motors')) == ['GM']
+        assert _tickers(index.search('bank of am')) == ['BAC']
+        assert _tickers(index.search('at&t')) == ['T']
+        assert _tickers(index.search('  Tesla   INC ')) == ['TSLA']
+        # 단어 중간 문자열은 일치하지 않음
+        assert index.search('esla') == []
+
+    def test_korean_names(self, index):
+        assert _tickers(index.search('테슬')) == ['TSLA']
+        assert _tickers(index.search('모터스')) == ['GM']
+        # 띄어쓰기 없는 한국어 이름도 중간 단어로 검색
+        assert _tickers(index.search('아메리카')) == ['BAC']
+        assert _tickers(index.search('소프트')) == ['MSFT']
+
+    def test_result_fields(self, index):
+        [result] = index.search('msft')
+        assert result == STOCKS[7]
+
+    def test_name_keys(self):
+        assert name_keys('Bank of America') == ['bank of america', 'of america', 'america']
+        assert name_keys('애플') == ['애플', '플']
+        assert name_keys(None) == []
+
+    def test_large_index_answers_in_microseconds(self):
+        stocks = [
+            {'ticker': f'T{i:04d}', 'name': f'Company {i} Holdings Group', 'name_ko': f'회사{i}',
+             'exchange': 'NYSE', 'sector': None}
+            for i in range(10000)
+        ]
+        index = StockSearchIndex(refresh_seconds=0)
+        index.build(stocks)
+        queries = [f't{i:03d}' for i in range(1000)] + [f'company {i}' for i in range(1000)]
+
+        started = time.perf_counter()
+        for query in queries:
+            index.search(query)
+        per_query = (time.perf_counter() - started) / len(queries)
+
+        assert _tickers(index.search('t0012')) == ['T0012']
+        assert _tickers(index.search('holdings', limit=3)) == ['T0000', 'T0001', 'T0002']
+        assert _tickers(index.search('company 1', limit=4)) == ['T0001', 'T0010', 'T0011', 'T0012']
+        assert per_query < 0.001
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv('ENABLE_SCHEDULER', 'false')
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        for stock in STOCKS:
+            db.session.add(StockMaster(ticker_symbol=stock['ticker'], company_name=stock['name'],
+                                       company_name_ko=stock['name_ko'], exchange=stock['exchange'],
+                                       sector=stock['sector']))
+        user = User(username='alice', email='alice@example.com')
+        user.set_password('password123')
+        db.session.add(user)
+        db.session.commit()
+        db.session.add(UserStock(user_id=user.id, ticker_symbol='TSLA'))
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+class TestSearchApi:
+    def _client(self, app):
+        client = app.test_client()
+        user = User.query.filter_by(username='alice').first()
+        with client.session_transaction() as sess:
+            sess['user_id'] = user.id
+            sess['username'] = user.username
+        return client
+
+    def test_search_endpoint(self, app):
+        client = self._client(app)
+
+        stocks = client.get('/stocks/api/search?q=tes').get_json()['stocks']
+        assert stocks == [{**STOCKS[9], 'is_watchlist': True}]
+        assert client.get('/stocks/api/search?q=t').get_json() == {'stocks': []}
+
+    def test_index_reloads_after_stock_master_change(self, app):
+        index = get_stock_search_index()
+        assert _tickers(index.search('nvid')) == []
+
+        db.session.add(StockMaster(ticker_symbol='NVDA', company_name='NVIDIA Corp.', company_name_ko='엔비디아'))
+        db.session.commit()
+        assert _tickers(index.search('nvid')) == ['NVDA']
+
+        db.session.delete(db.session.get(StockMaster, 'NVDA'))
+        db.session.commit()
+        assert _tickers(index.search('엔비')) == []
+        assert index.size == len(STOCKS)
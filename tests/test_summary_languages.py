@@ -0,0 +1,222 @@
+"""
+요약 언어 지연 생성 테스트
+- 프롬프트/검증/출력 토큰 예산이 요청 언어만 포함
+- 종목 구독자 언어 조회 (구독자 없는 종목은 기본 언어)
+- batch_analyze: 클러스터 멤버 종목 언어의 합집합으로 분석
+- fill_missing_summaries: 없는 언어만 생성해 기사와 저장소에 반영
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import json
+from datetime import time
+from unittest.mock import Mock
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models.models import StockMaster, User, UserSetting, UserStock
+from app.services.news_analyzer import (
+    SUMMARY_LANGUAGES, NewsAnalyzer, fill_missing_summaries, get_subscriber_languages, normalize_languages
+)
+from app.services.sqlite_news_storage import SQLiteNewsStorage
+from app.utils.config import Config
+
+CONTENT = (
+    "Tesla Inc delivered more vehicles than analysts expected in the third quarter, the electric carmaker said "
+    "on Monday, helped by price cuts and cheaper financing. Tesla shares rose 3% in premarket trading."
+)
+
+
+def _completion(payload):
+    """OpenAI chat.completions 응답 형태"""
+    message = Mock(content=json.dumps(payload))
+    return Mock(choices=[Mock(message=message, finish_reason='stop')], model='gpt-4o-mini', usage=None)
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.setattr(Config, 'NEWS_TRIAGE_ENABLED', False)
+    analyzer = NewsAnalyzer(api_key='test-key', dedup_index=None)
+    analyzer.client = Mock()
+    return analyzer
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv('ENABLE_SCHEDULER', 'false')
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([StockMaster(ticker_symbol='TSLA', company_name='Tesla, Inc.'),
+                            StockMaster(ticker_symbol='GM', company_name='General Motors Company'),
+                            StockMaster(ticker_symbol='F', company_name='Ford Motor Company')])
+        for name, language, tickers, active in (
+            ('alice', 'en', ['TSLA'], True),
+            ('bob', 'ja', ['TSLA', 'GM'], True),
+            ('carol', None, ['TSLA'], True),
+            ('dave', 'es', ['F'], False),
+        ):
+            user = User(username=name, email=f'{name}@example.com', is_active=active)
+            user.set_password('password123')
+            db.session.add(user)
+            db.session.flush()
+            if language:
+                db.session.add(UserSetting(user_id=user.id, language=language, notification_time=time(9, 0)))
+            for ticker in tickers:
+                db.session.add(UserStock(user_id=user.id, ticker_symbol=ticker))
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+class TestPrompt:
+    """프롬프트/검증"""
+
+    def test_normalize_languages(self):
+        assert normalize_languages(None) == SUMMARY_LANGUAGES
+        assert normalize_languages(['ja', 'xx', 'en', 'en']) == ('en', 'ja')
+        assert normalize_languages([]) == ()
+
+    def test_prompt_only_requested_languages(self, analyzer):
+        prompt = analyzer._build_prompt('Tesla deliveries beat', CONTENT, 'TSLA', 'Tesla', ['en'])
+        assert '1. Summary in English' in prompt
+        assert '2. Sentiment Analysis' in prompt
+        assert '"summary_en"' in prompt
+        assert 'Korean' not in prompt and '"summary_ko"' not in prompt
+
+    def test_default_prompt_has_all_languages(self, analyzer):
+        prompt = analyzer._build_prompt('Tesla deliveries beat', CONTENT, 'TSLA', 'Tesla')
+        for language in SUMMARY_LANGUAGES:
+            assert f'"summary_{language}"' in prompt
+        assert '5. Sentiment Analysis' in prompt
+
+    def test_validate_requires_only_requested(self, analyzer):
+        result = {'summary_ja': '要約', 'sentiment': {'classification': 'Positive', 'score': 4}}
+        assert analyzer._validate_result(result, ['ja'])['summary'] == {'ja': '要約'}
+        assert analyzer._validate_result(result, ['ja', 'en']) is None
+
+    def test_completion_budget_scales_with_languages(self, analyzer):
+        analyzer.client.chat.completions.create.return_value = _completion({
+            'summary_ko': '요약', 'sentiment': {'classification': 'Neutral', 'score': 0}
+        })
+        result = analyzer.analyze_news('Tesla deliveries beat', CONTENT, 'TSLA', languages=['ko'])
+
+        assert result['summary'] == {'ko': '요약'}
+        kwargs = analyzer.client.chat.completions.create.call_args.kwargs
+        assert kwargs['max_completion_tokens'] == 320
+
+        analyzer.client.chat.completions.create.return_value = _completion({
+            **{f'summary_{language}': 'text' for language in SUMMARY_LANGUAGES},
+            'sentiment': {'classification': 'Neutral', 'score': 0}
+        })
+        analyzer.analyze_news('Tesla deliveries beat', CONTENT, 'TSLA')
+        assert analyzer.client.chat.completions.create.call_args.kwargs['max_completion_tokens'] == 800
+
+
+class TestSubscriberLanguages:
+    """구독자 언어"""
+
+    def test_languages_per_ticker(self, app):
+        languages = get_subscriber_languages(['TSLA', 'GM', 'F', 'AAPL'])
+        # 설정이 없는 사용자(carol)는 ko
+        assert languages['TSLA'] == ('ko', 'en', 'ja')
+        assert languages['GM'] == ('ja',)
+        # 비활성 사용자만 구독한 종목, 구독자 없는 종목은 기본 언어
+        assert languages['F'] == ('ko',)
+        assert languages['AAPL'] == ('ko',)
+
+    def test_all_languages_without_app_context(self):
+        assert get_subscriber_languages(['TSLA']) == {'TSLA': SUMMARY_LANGUAGES}
+
+    def test_all_languages_when_disabled(self, app, monkeypatch):
+        monkeypatch.setattr(Config, 'NEWS_SUMMARY_LAZY_ENABLED', False)
+        assert get_subscriber_languages(['GM']) == {'GM': SUMMARY_LANGUAGES}
+
+    def test_batch_uses_cluster_language_union(self, app, analyzer):
+        from app.services.news_dedup import NearDuplicateIndex
+
+        analyzer.dedup_index = NearDuplicateIndex()
+        analyzer.analyze_news = Mock(return_value={
+            'summary': {'ja': '要約'}, 'sentiment': {'classification': 'positive', 'score': 5}
+        })
+        items = [
+            {'title': 'Automakers rally on strong deliveries', 'content': CONTENT, 'ticker': ticker,
+             'source_url': f'https://{ticker.lower()}.example/1'}
+            for ticker in ('GM', 'F')
+        ]
+        result = analyzer.batch_analyze(items)
+
+        assert analyzer.analyze_news.call_count == 1
+        assert analyzer.analyze_news.call_args.kwargs['languages'] == ('ko', 'ja')
+        assert [item['summary'] for item in result] == [{'ja': '要約'}, {'ja': '要約'}]
+
+
+class TestFillMissingSummaries:
+    """조회 시 요약 생성"""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        storage = SQLiteNewsStorage(str(tmp_path / 'news.db'))
+        storage.save_news({
+            'news_id': 'news-1', 'ticker_symbol': 'TSLA', 'title': 'Tesla deliveries beat', 'content': CONTENT,
+            'published_date': '2025-11-10T12:00:00+00:00', 'summary': {'ko': '요약'}
+        })
+        yield storage
+        storage.close()
+
+    def test_fills_and_caches(self, analyzer, storage):
+        analyzer.client.chat.completions.create.return_value = _completion({'summary_en': 'Summary'})
+        news = storage.get_recent_news('TSLA', hours=24 * 3650)[0]
+
+        assert fill_missing_summaries([news], ['en'], storage, analyzer) == 1
+        assert news['summary'] == {'ko': '요약', 'en': 'Summary'}
+        assert storage.get_news('news-1')['summary'] == {'ko': '요약', 'en': 'Summary'}
+        kwargs = analyzer.client.chat.completions.create.call_args.kwargs
+        assert '"summary_en"' in kwargs['messages'][1]['content']
+        assert kwargs['max_completion_tokens'] == 160
+
+        # 이미 있는 언어는 다시 생성하지 않음
+        assert fill_missing_summaries([storage.get_news('news-1')], ['ko', 'en'], storage, analyzer) == 0
+        assert analyzer.client.chat.completions.create.call_count == 1
+
+    def test_failure_keeps_existing_summary(self, analyzer, storage):
+        analyzer.client.chat.completions.create.side_effect = RuntimeError('timeout')
+        news = storage.get_news('news-1')
+
+        assert fill_missing_summaries([news], ['es'], storage, analyzer) == 0
+        assert news['summary'] == {'ko': '요약'}
+
+    def test_no_client_is_noop(self, storage):
+        news = storage.get_news('news-1')
+        assert fill_missing_summaries([news], ['ja'], storage, NewsAnalyzer(api_key='')) == 0
+        assert news['summary'] == {'ko': '요약'}
+
+    def test_light_analysis_gets_translated_summary(self, analyzer):
+        """로컬 분석 요약은 en만 저장 -> 다른 언어는 조회 시 생성"""
+        item = {'title': 'Tesla shares jump on delivery beat', 'content': '', 'ticker': 'TSLA'}
+        analyzer._analyze_light([item], [0], {})
+        assert set(item['summary']) == {'en'}
+
+        analyzer.client.chat.completions.create.return_value = _completion({'summary_ko': '테슬라 주가 상승'})
+        assert fill_missing_summaries([item], ['ko'], Mock(), analyzer) == 1
+        assert item['summary']['ko'] == '테슬라 주가 상승'
+
+    def test_fallback_email_uses_available_summary(self):
+        """템플릿 렌더링 실패 시 폴백 HTML도 사용자 언어 -> ko -> 있는 요약 순서"""
+        from app.services.email_sender import EmailSender
+
+        sender = EmailSender(username='bot@example.com', password='secret')
+        news = {'title': 'Tesla deliveries beat', 'summary': {'en': 'Tesla beat estimates'},
+                'sentiment': {'classification': 'Positive', 'score': 5}, 'url': 'https://example.com/1'}
+        html = sender._generate_fallback_html(Mock(username='carol'), {'TSLA': [news]}, 'ko', '2025-11-28', 1, 1, 0, 0)
+
+        assert 'Tesla beat estimates' in html
+        assert '요약 없음' not in html
+
+    def test_update_summary_unknown_id(self, storage):
+        assert storage.update_summary('missing', {'en': 'Summary'}) is False